@@ -27,14 +27,28 @@ bl_info = {
     "category": "Animation",
 }
 
+import os
 import re
 import math
+import zlib
+import hashlib
+import random
+from contextlib import contextmanager
 
 import bpy
+from bpy.app.handlers import persistent
 from bpy.types import Camera, Context
-from .action_utils import action_to_python_data_text, ensure_shake_in_action, action_slot_frame_range, ensure_action
-from .shake_data import SHAKE_LIST
+from .action_utils import sample_action_slot, write_shake_literal, write_shake_binary, ensure_shake_in_action, ensure_procedural_shake_in_action, ensure_action, find_id_fcurve
+from .shake_data import SHAKE_DATA_PATH, load_shake_index, shake_index, get_shake, clear_shake_cache, is_builtin_shake, write_shake_file
+from .capture_import import import_capture
+from .decimate import format_decimation_report, DEFAULT_LOCATION_TOLERANCE, DEFAULT_ROTATION_TOLERANCE
+from .spectral import is_procedural, spectra, synthesize, PERIOD as PROCEDURAL_PERIOD
+from .track_export import export_shake_track, FORMATS as TRACK_EXPORT_FORMATS
 from .farm_script import ensure_farm_script
+from .bake import bake_frames, bake_many_camera_shakes, remove_shake_property_fcurves, shake_normalization
+from .transform_cache import BASE_DELTA_PROP, store_base_delta, reset_base_delta, restore_base_delta, refresh_camera_cache, apply_camera_shake, clear_transform_caches
+from . import profiling
+from . import shake_stats
 
 
 # Note: the ".v#" number at the end is *not* the addon version.  This number is
@@ -103,8 +117,16 @@ class CameraShakifyPanel(bpy.types.Panel):
             col.alignment = 'RIGHT'
             col.use_property_split = True
             col.prop(shake, "shake_type", text="Shake")
+            if shake.shake_type in spectra():
+                col.prop(shake, "source")
+                if shake.source == 'PROCEDURAL':
+                    col.prop(shake, "seed")
             col.separator()
             col.prop(shake, "influence", slider=True)
+            col.prop(shake, "normalize")
+            if shake.shake_type in shake_index():
+                stats = shake_stats.shake_stats(shake.shake_type, lambda: get_shake(shake.shake_type))
+                col.label(text=shake_stats.describe(stats))
             col.separator()
             col.prop(shake, "scale")
             col.separator()
@@ -115,6 +137,12 @@ class CameraShakifyPanel(bpy.types.Panel):
                 col.prop(shake, "speed")
                 col.prop(shake, "offset")
 
+        if len(camera.camera_shakes) > 0 and unit_scale_too_small(context.scene):
+            layout.label(text="Unit scale is very small, so strong shakes are limited", icon='ERROR')
+        if len(camera.camera_shakes) > 0 and context.scene.camera_shakify_rig_layout == 'CACHED' \
+            and camera_rig_layout(camera, context.scene) != 'CACHED':
+            layout.label(text="Camera has other constraints or an axis-angle rotation, so it uses the Per Camera layout", icon='INFO')
+
         col.separator(factor=2.0)
 
         row = layout.row()
@@ -128,8 +156,34 @@ class CameraShakifyPanel(bpy.types.Panel):
 
         col = layout.column()
         if wm.camera_shake_show_utils:
-            col.operator("object.camera_shakes_fix_global")
+            col.operator("object.camera_shakes_fix_global").mode = 'REPAIR'
+            col.operator("object.camera_shakes_fix_global", text="Rebuild All Camera Shakes").mode = 'REBUILD'
             col.operator("wm.camera_shakify_prep_file_for_farm")
+            col.operator("object.camera_shakes_bake")
+            col.separator()
+            col.label(text="Selected Cameras:")
+            col.operator("object.camera_shakes_batch_add", text="Add Shake")
+            col.operator("object.camera_shakes_batch_remove", text="Remove Shakes")
+            col.operator("object.camera_shakes_batch_retype", text="Change Shake Type")
+            col.operator("object.camera_shakes_randomize_offsets", text="Randomize Offsets")
+            col.operator("object.camera_shakes_export_tracks", text="Export Shake Tracks")
+            col.separator()
+            row = col.row(align=True)
+            row.operator("wm.camera_shakify_import_capture", text="Import Shake")
+            row.operator("wm.camera_shakify_remove_imported_shake", text="", icon='TRASH')
+            col.separator()
+            if profiling.is_enabled():
+                col.operator("wm.camera_shakify_profiling_report")
+            col.prop(context.scene, "camera_shakify_rig_layout")
+            row = col.row()
+            row.active = context.scene.camera_shakify_rig_layout == 'PER_SHAKE'
+            row.prop(context.scene, "camera_shakify_share_empties")
+            col.prop(context.scene, "camera_shakify_decimate")
+            sub = col.column(align=True)
+            sub.active = context.scene.camera_shakify_decimate
+            sub.prop(context.scene, "camera_shakify_location_tolerance")
+            sub.prop(context.scene, "camera_shakify_rotation_tolerance")
+            sub.operator("wm.camera_shakify_decimation_report", text="Decimation Report")
 
 
 class OBJECT_UL_camera_shake_items(bpy.types.UIList):
@@ -138,10 +192,13 @@ class OBJECT_UL_camera_shake_items(bpy.types.UIList):
         # draw_item must handle the three layout types... Usually 'DEFAULT' and 'COMPACT' can share the same code.
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
             col = layout.column()
-            col.label(
-                text=str(item.shake_type).replace("_", " ").title(),
-                icon='FCURVE_SNAPSHOT',
-            )
+            if is_shake_type_available(item):
+                col.label(
+                    text=str(item.shake_type).replace("_", " ").title(),
+                    icon='FCURVE_SNAPSHOT',
+                )
+            else:
+                col.label(text="Unavailable Shake", icon='ERROR')
 
             col = layout.column()
             col.alignment = 'RIGHT'
@@ -154,41 +211,204 @@ class OBJECT_UL_camera_shake_items(bpy.types.UIList):
 
 #========================================================
 
-# Creates a camera shake setup for the given camera and
-# shake item index, using the given collection to store
-# shake empties.
-def build_single_shake(camera, shake_item_index, collection, context):
-    shake = camera.camera_shakes[shake_item_index]
-    shake_data = SHAKE_LIST[shake.shake_type]
+# Driver expressions.
+#
+# These are all written to be evaluable by Blender's built-in simple
+# expression evaluator, so that they're evaluated without Python (and thus
+# without the GIL) and also work when auto-run of Python scripts is disabled.
+# That means: only arithmetic, driver variables, `frame`, and a few built-in
+# functions like `floor()`, and no numbers in exponent notation, which is why
+# the scaling constants are used as divisors rather than as (tiny) factors.
+LOC_INFLUENCE_EXPRESSION = "influence * location_scale / (unit_scale * {!r})".format(UNIT_SCALE_MAX * INFLUENCE_MAX * SCALE_MAX)
+ROT_INFLUENCE_EXPRESSION = "influence / {!r}".format(INFLUENCE_MAX)
+
+# The influence expressions for a shake item whose influence is scaled by
+# `normalization` (see `bake.shake_normalization()`).  The factor is folded
+# into the divisors, so the expressions stay as simple as the plain ones.
+def loc_influence_expression(normalization=1.0):
+    if normalization == 1.0:
+        return LOC_INFLUENCE_EXPRESSION
+    return "influence * location_scale / (unit_scale * {!r})".format(UNIT_SCALE_MAX * INFLUENCE_MAX * SCALE_MAX / normalization)
+
+
+def rot_influence_expression(normalization=1.0):
+    if normalization == 1.0:
+        return ROT_INFLUENCE_EXPRESSION
+    return "influence / {!r}".format(INFLUENCE_MAX / normalization)
+
+# Returns the expression for a shake's eval-time driver, which maps the
+# (possibly manual) shake time to the [0, 1) range of the shake's loop.
+#
+# `x - floor(x)` stands in for `x % 1.0`, and `manual` (0 or 1) blends between
+# the manual and automatic timing instead of a conditional.
+def eval_time_expression(shake_length, shake_fps, scene):
+    scene_fps = scene.render.fps / scene.render.fps_base
+    loop_duration = shake_length * (scene_fps / shake_fps)
+    time = "(manual * time + (1 - manual) * (frame - frame_offset) * speed) / {!r}".format(float(loop_duration))
+    return "{0} - floor({0})".format(time)
 
-    shake_name = shake.shake_type.lower()
-    shake_object_name = BASE_NAME + "_" + camera.name + "_" + str(shake_item_index)
 
-    # Ensure the needed action and shake slot exist.
-    action = ensure_action(ACTION_NAME)
-    slot = ensure_shake_in_action(
-        shake_name,
-        action,
-        shake_data[2],
-        INFLUENCE_MAX,
-        INFLUENCE_MAX * SCALE_MAX * UNIT_SCALE_MAX
-    )
+# Name of the shake empty for the given camera and shake item index.
+def shake_object_name(camera, shake_item_index):
+    return BASE_NAME + "_" + camera.name + "_" + str(shake_item_index)
 
-    # Ensure the needed shake object exists.
-    shake_object = None
-    if shake_object_name in bpy.data.objects:
-        shake_object = bpy.data.objects[shake_object_name]
-    else:
-        shake_object = bpy.data.objects.new(shake_object_name, None)
+def loc_constraint_name(shake_item_index):
+    return BASE_NAME + "_loc_" + str(shake_item_index)
 
-    # Make sure the shake object is linked into our collection.
-    if shake_object.name not in collection.objects:
-        collection.objects.link(shake_object)
+def rot_constraint_name(shake_item_index):
+    return BASE_NAME + "_rot_" + str(shake_item_index)
 
-    #----------------
-    # Set up the constraints and drivers on the shake object.
-    #----------------
+# Back-references from a camera to its own shake empties, stored in an ID
+# property group on the camera that maps keys (see `rig_object_key()`) to
+# objects.  This lets rebuilds find a camera's shake empties without searching
+# through all objects.
+#
+# The references are only a cache: an object found through them is only used
+# if it still has the expected name, since e.g. duplicating a camera also
+# duplicates the references.  Otherwise the object is looked up by name as
+# usual.
+#
+# The leading underscore keeps the property out of the camera's Custom
+# Properties panel.
+RIG_OBJECTS_PROP = "_camera_shakify_rig_objects"
+STACK_RIG_OBJECT_KEY = "stack"
+
+def rig_object_key(shake_item_index):
+    return str(shake_item_index)
+
+# Returns the camera's shake empty with the given key and expected name, if
+# there's a valid back-reference to it.
+def get_rig_object(camera, key, expected_name):
+    group = camera.get(RIG_OBJECTS_PROP)
+    if group is None:
+        return None
+    obj = group.get(key)
+    if obj is None or obj.name != expected_name or obj.library is not None:
+        return None
+    return obj
+
+def set_rig_object(camera, key, obj):
+    if RIG_OBJECTS_PROP not in camera:
+        camera[RIG_OBJECTS_PROP] = {}
+    group = camera[RIG_OBJECTS_PROP]
+    if group.get(key) != obj:
+        group[key] = obj
+
+
+# Name of the single shake empty that evaluates a camera's whole shake stack,
+# in the per-camera rig layout.
+def shake_stack_object_name(camera):
+    return BASE_NAME + "_" + camera.name + "_stack"
+
+# Names of the camera's constraints in the per-camera rig layout.
+STACK_LOC_CONSTRAINT_NAME = BASE_NAME + "_loc"
+STACK_ROT_CONSTRAINT_NAME = BASE_NAME + "_rot"
+
+
+# Returns the variable specifications for a single-property driver variable
+# reading a property of the given shake item, in the form used by
+# `ensure_driver()`.
+def shake_property_variable(name, camera, shake_item_index, prop):
+    return (name, 'OBJECT', camera, 'camera_shakes[{}].{}'.format(shake_item_index, prop))
+
+
+def driver_variables_match(driver, variables):
+    if len(driver.variables) != len(variables):
+        return False
+    for var, (name, id_type, id, data_path) in zip(driver.variables, variables):
+        target = var.targets[0]
+        if var.name != name \
+            or var.type != 'SINGLE_PROP' \
+            or target.id_type != id_type \
+            or target.id != id \
+            or target.data_path != data_path:
+            return False
+    return True
+
+
+# Returns the driver F-curve of `prop` on `owner`, if any.
+def find_driver(owner, prop):
+    anim_data = owner.id_data.animation_data
+    if anim_data is None:
+        return None
+    return anim_data.drivers.find(owner.path_from_id(prop))
+
+
+# Returns whether `prop` on `owner` has exactly the driver that
+# `ensure_driver()` would create for the given expression and variables.
+def driver_matches(owner, prop, expression, variables):
+    fcurve = find_driver(owner, prop)
+    return fcurve is not None \
+        and len(fcurve.keyframe_points) == 0 \
+        and fcurve.driver.type == 'SCRIPTED' \
+        and fcurve.driver.expression == expression \
+        and driver_variables_match(fcurve.driver, variables)
+
+
+# Ensures that the given property of `owner` (e.g. a constraint) has a
+# scripted driver with the given expression and variables, where `variables`
+# is a list of (name, id_type, id, data_path) tuples of single-property
+# variables.
+#
+# An existing driver is updated in place if only its expression differs, and is
+# otherwise replaced.
+#
+# Returns whether anything was changed.
+def ensure_driver(owner, prop, expression, variables):
+    fcurve = find_driver(owner, prop)
+
+    if fcurve is not None \
+        and len(fcurve.keyframe_points) == 0 \
+        and fcurve.driver.type == 'SCRIPTED' \
+        and driver_variables_match(fcurve.driver, variables):
+        if fcurve.driver.expression == expression:
+            return False
+        fcurve.driver.expression = expression
+        return True
+
+    if fcurve is not None:
+        owner.driver_remove(prop)
+
+    # Note: we clear the keyframes from the driver's fcurve to dodge some
+    # small-value rounding that Blender does internally when evaluating fcurves.
+    # This way the driver expression evaluation gets used directly, without any
+    # intermediate steps that might interfere.
+    fcurve = owner.driver_add(prop)
+    fcurve.keyframe_points.clear()
+    driver = fcurve.driver
+    driver.type = 'SCRIPTED'
+    driver.expression = expression
+    for name, id_type, id, data_path in variables:
+        var = driver.variables.new()
+        var.name = name
+        var.type = 'SINGLE_PROP'
+        var.targets[0].id_type = id_type
+        var.targets[0].id = id
+        var.targets[0].data_path = data_path
 
+    return True
+
+
+# Ensures that an empty with the given name exists and is linked into the
+# given collection, and returns it.
+#
+# `known_object` is the empty if it's already known (e.g. from a camera's
+# back-references), in which case it's assumed to be set up already.
+def ensure_empty(object_name, collection, known_object=None):
+    if known_object is not None:
+        return known_object
+    obj = bpy.data.objects.get((object_name, None))
+    if obj is None:
+        obj = bpy.data.objects.new(object_name, None)
+        collection.objects.link(obj)
+    elif obj.name not in collection.objects:
+        collection.objects.link(obj)
+    return obj
+
+
+# Clears out all constraints and drivers of a shake empty and resets its
+# transforms, ready for fresh action constraints playing the given action.
+def reset_shake_object(shake_object, action):
     # Clear out all constraints and drivers, and fetch animation data block.
     shake_object.constraints.clear()
     shake_object.animation_data_clear()
@@ -206,158 +426,697 @@ def build_single_shake(camera, shake_item_index, collection, context):
     shake_object.rotation_axis_angle = (0,0,0,0)
     shake_object.scale = (1,1,1)
 
-    # Get action info for calculations below.
-    shake_fps = shake_data[1]
-    shake_range = action_slot_frame_range(action, slot)
-    shake_length = shake_range[1] - shake_range[0]
 
-    # Create the action constraint.
+def new_action_constraint(shake_object, mix_mode):
     constraint = shake_object.constraints.new('ACTION')
     constraint.use_eval_time = True
-    constraint.mix_mode = 'BEFORE'
-    constraint.action = action
-    constraint.action_slot = slot
-    constraint.frame_start = shake_range[0]
-    constraint.frame_end = shake_range[1]
-
-    # Create the driver for the constraint's eval time.
-    driver = constraint.driver_add("eval_time").driver
-    driver.type = 'SCRIPTED'
-    fps_factor = 1.0 / ((context.scene.render.fps / context.scene.render.fps_base) / shake_fps)
-    driver.expression = \
-        "((time if manual else ((-frame_offset + frame) * speed)) * {}) % 1.0" \
-        .format(fps_factor / shake_length)
-
-    manual_timing_var = driver.variables.new()
-    manual_timing_var.name = "manual"
-    manual_timing_var.type = 'SINGLE_PROP'
-    manual_timing_var.targets[0].id_type = 'OBJECT'
-    manual_timing_var.targets[0].id = camera
-    manual_timing_var.targets[0].data_path = 'camera_shakes[{}].use_manual_timing'.format(shake_item_index)
-
-    time_var = driver.variables.new()
-    time_var.name = "time"
-    time_var.type = 'SINGLE_PROP'
-    time_var.targets[0].id_type = 'OBJECT'
-    time_var.targets[0].id = camera
-    time_var.targets[0].data_path = 'camera_shakes[{}].time'.format(shake_item_index)
-
-    speed_var = driver.variables.new()
-    speed_var.name = "speed"
-    speed_var.type = 'SINGLE_PROP'
-    speed_var.targets[0].id_type = 'OBJECT'
-    speed_var.targets[0].id = camera
-    speed_var.targets[0].data_path = 'camera_shakes[{}].speed'.format(shake_item_index)
-
-    offset_var = driver.variables.new()
-    offset_var.name = "frame_offset"
-    offset_var.type = 'SINGLE_PROP'
-    offset_var.targets[0].id_type = 'OBJECT'
-    offset_var.targets[0].id = camera
-    offset_var.targets[0].data_path = 'camera_shakes[{}].offset'.format(shake_item_index)
+    constraint.mix_mode = mix_mode
+    return constraint
+
+
+# (Re)targets an action constraint at the given action slot, only touching the
+# properties that differ.
+def retarget_action_constraint(constraint, action, slot, shake_range):
+    if constraint.action != action:
+        constraint.action = action
+    if constraint.action_slot != slot:
+        constraint.action_slot = slot
+    if constraint.frame_start != shake_range[0]:
+        constraint.frame_start = shake_range[0]
+    if constraint.frame_end != shake_range[1]:
+        constraint.frame_end = shake_range[1]
+
+
+# Ensures that the shake empty with the given name is set up to play the given
+# action slot over `shake_range`, with an eval-time driver using the given
+# expression and variables, creating it if needed.  If it already exists with
+# the right structure, only the parts that differ are updated.
+#
+# `known_object` is passed on to `ensure_empty()`.
+def ensure_shake_object(object_name, collection, action, slot, shake_range, expression, variables, known_object=None):
+    shake_object = ensure_empty(object_name, collection, known_object)
+
+    if len(shake_object.constraints) == 1 and shake_object.constraints[0].type == 'ACTION':
+        constraint = shake_object.constraints[0]
+    else:
+        reset_shake_object(shake_object, action)
+        constraint = new_action_constraint(shake_object, 'BEFORE')
+
+    retarget_action_constraint(constraint, action, slot, shake_range)
+    ensure_driver(constraint, "eval_time", expression, variables)
+
+    return shake_object
+
+
+# Removes a shake empty, along with its driver and animation data.
+def remove_shake_object(obj):
+    if len(obj.constraints) > 0:
+        obj.constraints[0].driver_remove("eval_time")
+    obj.animation_data_clear()
+    bpy.data.objects.remove(obj)
+
+
+# Shared shake empties.
+#
+# When enabled for a scene, shakes that play back identically on different
+# cameras (same shake type, speed, frame offset, and scene frame rate, with
+# automatic timing) use a single shared shake empty instead of each having
+# their own.  The timing of a shared empty is baked into its eval-time driver
+# as constants, so its driver doesn't depend on any particular camera.
+#
+# This only applies to the per-shake rig layout.
+#
+# A shared empty is in use as long as any camera's shake location constraint
+# targets it, and is removed when the last one goes away.  Its users are
+# recorded on it (see `SHARED_USERS_PROP`), but since duplicating or appending
+# a camera copies its constraints without Camera Shakify knowing about it,
+# that record is only a cache: it's checked against the recorded cameras'
+# constraints, and only if none of them still uses the empty are all cameras
+# searched.
+#
+# Note: shakes with manual timing, or with animated timing properties, are
+# never shared, since their timing depends on the camera's own properties.
+
+# Marks a shake empty as shared.
+SHARED_PROP = "camera_shakify_shared"
+
+# The names of the cameras known to use a shared shake empty, as the keys of an
+# ID property group on the empty.  Names rather than object references, since
+# those would keep deleted cameras around.
+SHARED_USERS_PROP = "_camera_shakify_shared_users"
+
+# Returns the key identifying the shared shake empty that the given shake item
+# should use, or None if it needs its own shake empty.
+def shared_shake_key(camera, shake_item_index, scene):
+    if not scene.camera_shakify_share_empties:
+        return None
+    shake = camera.camera_shakes[shake_item_index]
+    if shake.use_manual_timing:
+        return None
+    for prop in ["use_manual_timing", "offset"]:
+        if find_id_fcurve(camera, "camera_shakes[{}].{}".format(shake_item_index, prop)) is not None:
+            return None
+    scene_fps = scene.render.fps / scene.render.fps_base
+    if is_procedural(shake):
+        return (shake.shake_type, shake.speed, shake.offset, scene_fps, 'PROCEDURAL', shake.seed)
+    return (shake.shake_type, shake.speed, shake.offset, scene_fps)
+
+
+def shared_shake_object_name(share_key):
+    digest = hashlib.md5(repr(share_key).encode("utf-8")).hexdigest()[:8]
+    return "{}_shared_{}_{}".format(BASE_NAME, share_key[0].lower(), digest)
+
+
+# Like `eval_time_expression()`, but with automatic timing and the given speed
+# and frame offset baked in.
+def shared_eval_time_expression(shake_length, shake_fps, scene, speed, frame_offset):
+    scene_fps = scene.render.fps / scene.render.fps_base
+    loop_duration = shake_length * (scene_fps / shake_fps)
+    time = "((frame - {!r}) * {!r} / {!r})".format(float(frame_offset), float(speed), loop_duration)
+    return "{0} - floor({0})".format(time)
+
+
+def is_shared_shake_object(obj):
+    return obj is not None and SHARED_PROP in obj
+
+
+def add_shared_shake_user(obj, camera):
+    if obj.library is not None:
+        return
+    if SHARED_USERS_PROP not in obj:
+        obj[SHARED_USERS_PROP] = {}
+    users = obj[SHARED_USERS_PROP]
+    if camera.name not in users:
+        users[camera.name] = 1
+
+
+# Returns whether one of the camera's shake location constraints targets the
+# given shake empty.
+def camera_uses_shake_object(camera, obj):
+    if camera.type != 'CAMERA':
+        return False
+    for constraint in camera.constraints:
+        if constraint.type == 'COPY_LOCATION' and constraint.target == obj and starts_with_any_base_name(constraint.name):
+            return True
+    return False
+
+
+# Returns whether any camera's shake location constraint targets the given
+# shake empty.  The recorded users are checked first, forgetting those that no
+# longer use it, and only if none does are all cameras searched (recording the
+# users found).
+def is_shake_object_used(obj):
+    users = obj.get(SHARED_USERS_PROP)
+    if users is not None:
+        for name in list(users.keys()):
+            camera = bpy.data.objects.get(name)
+            if camera is not None and camera_uses_shake_object(camera, obj):
+                return True
+            if obj.library is None:
+                del users[name]
+
+    used = False
+    for camera in bpy.data.objects:
+        if camera_uses_shake_object(camera, obj):
+            add_shared_shake_user(obj, camera)
+            used = True
+    return used
+
+
+# Removes a shared shake empty if no camera uses it anymore.
+def release_shared_shake_object(obj):
+    if not is_shake_object_used(obj):
+        remove_shake_object(obj)
+
+
+# Removes a shake constraint (and its driver) from a camera.
+#
+# If `release` is False, the shared shake empty the constraint targeted is
+# left alone, for cameras (e.g. copies) that never held a use of it.
+def remove_camera_constraint(camera, constraint, release=True):
+    constraint.driver_remove("influence")
+    target = constraint.target
+    camera.constraints.remove(constraint)
+    if release and is_shared_shake_object(target):
+        release_shared_shake_object(target)
+
+
+# Ensures that a shake constraint with the given name and type exists on the
+# camera and targets the given shake object.  Returns the constraint.
+def ensure_camera_constraint(camera, name, type, shake_object):
+    constraint = camera.constraints.get(name)
+    if constraint is not None and constraint.type != type:
+        remove_camera_constraint(camera, constraint)
+        constraint = None
+
+    if constraint is None:
+        constraint = camera.constraints.new(type=type)
+        constraint.name = name
+        constraint.show_expanded = False
+        constraint.target_space = 'WORLD'
+        constraint.owner_space = 'LOCAL'
+        if type == 'COPY_LOCATION':
+            constraint.use_offset = True
+        else:
+            constraint.mix_mode = 'AFTER'
+
+    if constraint.target != shake_object:
+        previous_target = constraint.target
+        constraint.target = shake_object
+        if is_shared_shake_object(previous_target):
+            release_shared_shake_object(previous_target)
+
+    return constraint
+
+
+# What the rig of a shake item should look like.  These are shared by the
+# functions that build rigs and the ones that verify them.
+
+LOC_FACTOR = INFLUENCE_MAX * SCALE_MAX * UNIT_SCALE_MAX
+ROT_FACTOR = INFLUENCE_MAX
+
+def shake_frame_range(shake_info):
+    return (shake_info.frame_start, shake_info.frame_end)
+
+def shake_timing_variables(camera, shake_item_index):
+    return [
+        shake_property_variable("manual", camera, shake_item_index, "use_manual_timing"),
+        shake_property_variable("time", camera, shake_item_index, "time"),
+        shake_property_variable("speed", camera, shake_item_index, "speed"),
+        shake_property_variable("frame_offset", camera, shake_item_index, "offset"),
+    ]
+
+def loc_influence_variables(camera, shake_item_index, scene):
+    return [
+        shake_property_variable("influence", camera, shake_item_index, "influence"),
+        shake_property_variable("location_scale", camera, shake_item_index, "scale"),
+        ("unit_scale", 'SCENE', scene, 'unit_settings.scale_length'),
+    ]
+
+def rot_influence_variables(camera, shake_item_index):
+    return [shake_property_variable("influence", camera, shake_item_index, "influence")]
+
+
+# Returns (share_key, object_name, expression, variables) describing the shake
+# empty that a shake item uses in the per-shake rig layout, where `share_key`
+# is as returned by `shared_shake_key()`, and `expression` and `variables` are
+# for its eval-time driver.
+def single_shake_object_spec(camera, shake_item_index, shake_info, scene):
+    shake = camera.camera_shakes[shake_item_index]
+    shake_range = shake_item_frame_range(shake, shake_info)
+    shake_length = shake_range[1] - shake_range[0]
+    share_key = shared_shake_key(camera, shake_item_index, scene)
+    if share_key is None:
+        return (
+            None,
+            shake_object_name(camera, shake_item_index),
+            eval_time_expression(shake_length, shake_info.fps, scene),
+            shake_timing_variables(camera, shake_item_index),
+        )
+    return (
+        share_key,
+        shared_shake_object_name(share_key),
+        shared_eval_time_expression(shake_length, shake_info.fps, scene, shake.speed, shake.offset),
+        [],
+    )
+
+
+# Returns the action constraints that a shake item gets on the shake stack
+# empty in the per-camera rig layout, as a list of (constraint name,
+# data path prefix, influence expression, influence variables) tuples.  Parts
+# the shake doesn't have (e.g. location for 2D shakes) are left out.
+def shake_stack_parts(camera, shake_item_index, shake_info, scene):
+    normalization = shake_normalization(camera.camera_shakes[shake_item_index])
+    parts = [
+        (
+            loc_constraint_name(shake_item_index),
+            "location",
+            loc_influence_expression(normalization),
+            loc_influence_variables(camera, shake_item_index, scene),
+        ),
+        (
+            rot_constraint_name(shake_item_index),
+            "rotation",
+            rot_influence_expression(normalization),
+            rot_influence_variables(camera, shake_item_index),
+        ),
+    ]
+    return [
+        part for part in parts
+        if any(data_path.startswith(part[1]) for data_path, _ in shake_info.channels)
+    ]
+
+
+# The name of the action slot holding a shake's animation.  `decimation` is
+# the result of `shake_decimation()`, so that each decimation tolerance gets
+# its own slot.
+def shake_slot_name(shake_info, data_path_prefix="", decimation=None):
+    name = shake_info.id.lower() + SHAKE_CURVES_VERSION_TAG
+    if data_path_prefix != "":
+        name += "_" + data_path_prefix
+    if decimation is not None:
+        name += DECIMATED_SLOT_TAG + hashlib.md5(repr(decimation).encode("utf-8")).hexdigest()[:8]
+    return name
+
+DECIMATED_SLOT_TAG = "_dec"
+
+# Tags the slot names with the version of how shake curves are keyed (see
+# `ensure_shake_in_action()`), so that a file's shake rigs never keep playing
+# curves keyed by an older version: verify finds them playing a slot with an
+# outdated name, and repair rebuilds them and removes the old slots.
+#
+# Versions:
+# 1. (no tag) Keyed with the user's preferred auto smoothing for new curves.
+# 2. Keyed without auto smoothing.
+SHAKE_CURVES_VERSION_TAG = "_v2"
+
+
+# Returns the (location tolerance, rotation tolerance) that shake curves are
+# decimated to in the given scene, or None if they aren't decimated.
+def shake_decimation(scene):
+    if not scene.camera_shakify_decimate:
+        return None
+    return (scene.camera_shakify_location_tolerance, scene.camera_shakify_rotation_tolerance)
+
+
+# The frame range of the shake animation that a shake item plays.
+def shake_item_frame_range(shake, shake_info):
+    if is_procedural(shake):
+        return (0, PROCEDURAL_PERIOD)
+    return shake_frame_range(shake_info)
+
+
+# The name of the action slot holding the animation a shake item plays.
+# Procedural shakes get a slot per seed, and aren't decimated since they have
+# no keys to speak of.
+def shake_item_slot_name(shake, shake_info, data_path_prefix="", decimation=None):
+    if is_procedural(shake):
+        return shake_slot_name(shake_info, data_path_prefix) + PROCEDURAL_SLOT_TAG + str(shake.seed)
+    return shake_slot_name(shake_info, data_path_prefix, decimation)
+
+PROCEDURAL_SLOT_TAG = "_proc"
+
+
+# Ensures that the animation a shake item plays is available, either from the
+# linked shake library or in the local shake action `action`.
+#
+# Returns (action, slot) of the animation.
+def ensure_shake_item_in_action(shake, shake_info, action, decimation, data_path_prefix=""):
+    slot_name = shake_item_slot_name(shake, shake_info, data_path_prefix, decimation)
+    library_slot = shake_library_slot(slot_name)
+    if library_slot is not None:
+        return library_slot
+    return (action, ensure_local_shake_item(shake, shake_info, action, slot_name, data_path_prefix, decimation))
+
+
+def ensure_local_shake_item(shake, shake_info, action, slot_name, data_path_prefix, decimation):
+    if is_procedural(shake):
+        seed = shake.seed
+        return ensure_procedural_shake_in_action(
+            slot_name,
+            action,
+            lambda: synthesize(spectra()[shake_info.id], seed),
+            PROCEDURAL_PERIOD,
+            ROT_FACTOR,
+            LOC_FACTOR,
+            data_path_prefix=data_path_prefix,
+        )
+    return ensure_shake_in_action(
+        slot_name,
+        action,
+        lambda: get_shake(shake_info.id)[2],
+        ROT_FACTOR,
+        LOC_FACTOR,
+        data_path_prefix=data_path_prefix,
+        decimation=decimation,
+    )
+
+
+#========================================================
+# Linked shake library.
+#
+# Rather than every file carrying its own copy of the shake animation, it can
+# be linked from a shared library .blend, written by the addon itself (see
+# `write_shake_library()`) and set in the addon preferences.  The library holds
+# the undecimated animation of every built-in captured shake, in the same
+# slots as the local shake action.  Anything it doesn't have (decimated,
+# procedural, and imported shakes) is still built in the local shake action.
+#
+# The library is versioned by the shake data and the way shakes are
+# constructed, so a library written by a different version of the addon is
+# ignored.  A library that's missing or out of date means shakes are simply
+# built locally again, as without one.
+
+LIBRARY_ACTION_NAME = BASE_NAME + " Shake Library"
+LIBRARY_VERSION_PROP = "camera_shakify_library_version"
+
+_shake_library_version = None
+
+def shake_library_version():
+    global _shake_library_version
+    if _shake_library_version is None:
+        digest = hashlib.md5(repr((BASE_NAME, SHAKE_CURVES_VERSION_TAG, LOC_FACTOR, ROT_FACTOR)).encode("utf-8"))
+        with open(SHAKE_DATA_PATH, "rb") as f:
+            digest.update(f.read())
+        _shake_library_version = digest.hexdigest()
+    return _shake_library_version
+
+
+def shake_library_path():
+    prefs = addon_preferences()
+    if prefs is None or prefs.shake_library_path == "":
+        return None
+    return os.path.normpath(bpy.path.abspath(prefs.shake_library_path))
+
+
+# Returns the shake library's action, or None if there's no usable shake
+# library.  If `link` is set, the library is linked into the file first if
+# needed.  Otherwise (e.g. for verifying rigs, which mustn't change anything)
+# only an already linked library is used.
+def shake_library_action(link=True):
+    path = shake_library_path()
+    if path is None:
+        return None
+
+    action = None
+    for library in bpy.data.libraries:
+        if os.path.normpath(bpy.path.abspath(library.filepath)) == path:
+            action = bpy.data.actions.get((LIBRARY_ACTION_NAME, library.filepath))
+            break
+    if action is None:
+        if not link or not os.path.isfile(path):
+            return None
+        with bpy.data.libraries.load(path, link=True, relative=bpy.data.filepath != "") as (data_from, data_to):
+            if LIBRARY_ACTION_NAME in data_from.actions:
+                data_to.actions = [LIBRARY_ACTION_NAME]
+        if len(data_to.actions) == 0 or data_to.actions[0] is None:
+            print("Camera Shakify: \"{}\" is not a shake library.".format(path))
+            return None
+        action = data_to.actions[0]
+        if action.get(LIBRARY_VERSION_PROP) != shake_library_version():
+            print("Camera Shakify: shake library \"{}\" is from a different version of the addon, and isn't used. Write it again to update it.".format(path))
+
+    if action.is_missing or action.get(LIBRARY_VERSION_PROP) != shake_library_version() \
+        or len(action.layers) == 0 or len(action.layers[0].strips) == 0:
+        return None
+    return action
+
+
+# Returns (action, slot) of the given shake slot in the shake library, or None
+# if there's no usable shake library or it doesn't have that slot.  `link` is
+# as for `shake_library_action()`.
+def shake_library_slot(slot_name, link=True):
+    action = shake_library_action(link)
+    if action is None:
+        return None
+    slot = action.slots.get("OB" + slot_name)
+    if slot is None or action.layers[0].strips[0].channelbag(slot) is None:
+        return None
+    return (action, slot)
+
+
+# Writes a shake library .blend with the animation of all built-in shakes.
+def write_shake_library(path):
+    action = ensure_action(LIBRARY_ACTION_NAME)
+    try:
+        for info in shake_index().values():
+            if not is_builtin_shake(info):
+                continue
+            for data_path_prefix in ["", "location", "rotation"]:
+                if not any(data_path.startswith(data_path_prefix) for data_path, _ in info.channels):
+                    continue
+                ensure_shake_in_action(
+                    shake_slot_name(info, data_path_prefix),
+                    action,
+                    lambda info=info: get_shake(info.id)[2],
+                    ROT_FACTOR,
+                    LOC_FACTOR,
+                    data_path_prefix=data_path_prefix,
+                )
+        action[LIBRARY_VERSION_PROP] = shake_library_version()
+        bpy.data.libraries.write(path, {action}, fake_user=True, compress=True)
+    finally:
+        bpy.data.actions.remove(action)
+
+    # Pick up the new library in this file right away, if it's in use.
+    for library in bpy.data.libraries:
+        if os.path.normpath(bpy.path.abspath(library.filepath)) == os.path.normpath(path):
+            library.reload()
+
+
+def on_shake_library_update(prefs, context):
+    print_repaired_cameras(repair_camera_shakes_globally(context))
+    remove_unused_shake_slots()
+
+
+# Whether the shake's type is available on this machine.
+#
+# Shakes whose type isn't available (e.g. an imported shake that was imported
+# on another machine) are neither built nor verified: whatever rig they already
+# have is left alone, since it still works from the shake animation stored in
+# the file.
+def is_shake_type_available(shake):
+    return shake.shake_type in shake_index()
+
+
+# The names of the camera constraints of a shake in the per-shake rig layout
+# that should be kept, which is none if the shake's type isn't available and it
+# doesn't already have a complete set of constraints.
+def single_shake_constraint_names(camera, shake_item_index):
+    names = [loc_constraint_name(shake_item_index), rot_constraint_name(shake_item_index)]
+    if is_shake_type_available(camera.camera_shakes[shake_item_index]) \
+        or all(name in camera.constraints for name in names):
+        return names
+    return []
+
+
+# Ensures that a complete camera shake setup exists for the given camera and
+# shake item index, using the given collection to store shake empties.
+#
+# Parts of the setup that already exist and are correct are left alone, and
+# parts that exist but are set up for a different shake (e.g. after the shake
+# type was changed or shakes were reordered) are just retargeted.
+#
+# `action` is the shake action, if already known.
+#
+# Returns whether the shake uses a shared shake empty.
+def build_single_shake(camera, shake_item_index, collection, context, action=None):
+    scene = context.scene
+    shake = camera.camera_shakes[shake_item_index]
+    shake_info = shake_index()[shake.shake_type]
+
+    # Ensure the needed action and shake slot exist.
+    if action is None:
+        action = ensure_action(ACTION_NAME)
+    shake_action, slot = ensure_shake_item_in_action(shake, shake_info, action, shake_decimation(scene))
+
+    #----------------
+    # Set up the shake object, with its constraint and driver.
+    #----------------
+
+    share_key, object_name, expression, variables = single_shake_object_spec(camera, shake_item_index, shake_info, scene)
+    if share_key is None:
+        key = rig_object_key(shake_item_index)
+        shake_object = ensure_shake_object(
+            object_name,
+            collection,
+            shake_action,
+            slot,
+            shake_item_frame_range(shake, shake_info),
+            expression,
+            variables,
+            get_rig_object(camera, key, object_name),
+        )
+        set_rig_object(camera, key, shake_object)
+    else:
+        shake_object = ensure_shake_object(
+            object_name,
+            collection,
+            shake_action,
+            slot,
+            shake_item_frame_range(shake, shake_info),
+            expression,
+            variables,
+        )
+        if SHARED_PROP not in shake_object:
+            shake_object[SHARED_PROP] = True
+        add_shared_shake_user(shake_object, camera)
 
     #----------------
     # Set up the constraints and drivers on the camera object.
     #----------------
 
-    loc_constraint_name = BASE_NAME + "_loc_" + str(shake_item_index)
-    rot_constraint_name = BASE_NAME + "_rot_" + str(shake_item_index)
-
-    # Create the new constraints.
-    loc_constraint = camera.constraints.new(type='COPY_LOCATION')
-    rot_constraint = camera.constraints.new(type='COPY_ROTATION')
-    loc_constraint.name = loc_constraint_name
-    rot_constraint.name = rot_constraint_name
-    loc_constraint.show_expanded = False
-    rot_constraint.show_expanded = False
-
-    # Set up location constraint.
-    loc_constraint.target = shake_object
-    loc_constraint.target_space = 'WORLD'
-    loc_constraint.owner_space = 'LOCAL'
-    loc_constraint.use_offset = True
-
-    # Set up rotation constraint.
-    rot_constraint.target = shake_object
-    rot_constraint.target_space = 'WORLD'
-    rot_constraint.owner_space = 'LOCAL'
-    rot_constraint.mix_mode = 'AFTER'
-
-    # Set up the location constraint driver.
-    #
-    # Note: we clear the keyframes from the driver's fcurve to dodge some
-    # small-value rounding that Blender does internally when evaluating fcurves.
-    # This way the driver expression evaluation gets used directly, without any
-    # intermediate steps that might interfere.
-    fcurve = loc_constraint.driver_add("influence")
-    fcurve.keyframe_points.clear()
-    driver = fcurve.driver
-    driver.type = 'SCRIPTED'
-    driver.expression = "{} * influence * location_scale / unit_scale * int(\"1\")".format(1.0 / (UNIT_SCALE_MAX * INFLUENCE_MAX * SCALE_MAX))
-    if "influence" not in driver.variables:
-        var = driver.variables.new()
-        var.name = "influence"
-        var.type = 'SINGLE_PROP'
-        var.targets[0].id_type = 'OBJECT'
-        var.targets[0].id = camera
-        var.targets[0].data_path = 'camera_shakes[{}].influence'.format(shake_item_index)
-    if "location_scale" not in driver.variables:
-        var = driver.variables.new()
-        var.name = "location_scale"
-        var.type = 'SINGLE_PROP'
-        var.targets[0].id_type = 'OBJECT'
-        var.targets[0].id = camera
-        var.targets[0].data_path = 'camera_shakes[{}].scale'.format(shake_item_index)
-    if "unit_scale" not in driver.variables:
-        var = driver.variables.new()
-        var.name = "unit_scale"
-        var.type = 'SINGLE_PROP'
-        var.targets[0].id_type = 'SCENE'
-        var.targets[0].id = context.scene
-        var.targets[0].data_path ='unit_settings.scale_length'
+    loc_constraint = ensure_camera_constraint(camera, loc_constraint_name(shake_item_index), 'COPY_LOCATION', shake_object)
+    rot_constraint = ensure_camera_constraint(camera, rot_constraint_name(shake_item_index), 'COPY_ROTATION', shake_object)
 
-    # Set up the rotation constraint driver.
-    #
-    # Note: see further-above note for why we clear the keyframes here.
-    fcurve = rot_constraint.driver_add("influence")
-    fcurve.keyframe_points.clear()
-    driver = fcurve.driver
-    driver.type = 'SCRIPTED'
-    driver.expression = "influence * {}".format(1.0 / INFLUENCE_MAX)
-    if "influence" not in driver.variables:
-        var = driver.variables.new()
-        var.name = "influence"
-        var.type = 'SINGLE_PROP'
-        var.targets[0].id_type = 'OBJECT'
-        var.targets[0].id = camera
-        var.targets[0].data_path = 'camera_shakes[{}].influence'.format(shake_item_index)
+    normalization = shake_normalization(shake)
+    ensure_driver(
+        loc_constraint,
+        "influence",
+        loc_influence_expression(normalization),
+        loc_influence_variables(camera, shake_item_index, scene),
+    )
+    ensure_driver(
+        rot_constraint,
+        "influence",
+        rot_influence_expression(normalization),
+        rot_influence_variables(camera, shake_item_index),
+    )
+
+    return share_key is not None
+
+
+# The names of the existing shake stack constraints of a shake whose type isn't
+# available, which are kept as they are.
+def unavailable_stack_constraint_names(stack_object, shake_item_index):
+    names = [loc_constraint_name(shake_item_index), rot_constraint_name(shake_item_index)]
+    return [name for name in names if name in stack_object.constraints]
+
+
+# Ensures that a complete per-camera rig layout exists for the given camera,
+# using the given collection to store the shake stack empty.
+#
+# Rather than one shake empty and two camera constraints per shake, the whole
+# shake stack is evaluated by a single empty, with two action constraints per
+# shake: one playing a location-only slot of the shake, and one a
+# rotation-only slot, each with its own influence.  The constraints use the
+# "after, split channels" mix mode, so the locations add up and the rotations
+# are applied one after the other, exactly as the per-shake camera constraints
+# would.  The camera then only needs a single location and rotation constraint,
+# however many shakes it has.
+#
+# As with `build_single_shake()`, parts of the setup that already exist are
+# only updated where they differ.
+def build_shake_stack(camera, collection, context, action=None):
+    scene = context.scene
+    if action is None:
+        action = ensure_action(ACTION_NAME)
+    object_name = shake_stack_object_name(camera)
+    stack_object = ensure_empty(object_name, collection, get_rig_object(camera, STACK_RIG_OBJECT_KEY, object_name))
+    set_rig_object(camera, STACK_RIG_OBJECT_KEY, stack_object)
+    if stack_object.animation_data is None \
+        or any(constraint.type != 'ACTION' for constraint in stack_object.constraints):
+        reset_shake_object(stack_object, action)
+
+    decimation = shake_decimation(scene)
+    constraint_names = []
+    for shake_item_index, shake in enumerate(camera.camera_shakes):
+        if not is_shake_type_available(shake):
+            constraint_names += unavailable_stack_constraint_names(stack_object, shake_item_index)
+            continue
+        shake_info = shake_index()[shake.shake_type]
+        shake_range = shake_item_frame_range(shake, shake_info)
+        eval_time = eval_time_expression(shake_range[1] - shake_range[0], shake_info.fps, scene)
+        timing_variables = shake_timing_variables(camera, shake_item_index)
+
+        for name, data_path_prefix, influence_expression, influence_variables in shake_stack_parts(camera, shake_item_index, shake_info, scene):
+            shake_action, slot = ensure_shake_item_in_action(shake, shake_info, action, decimation, data_path_prefix)
+
+            constraint = stack_object.constraints.get(name)
+            if constraint is None:
+                constraint = new_action_constraint(stack_object, 'AFTER_SPLIT')
+                constraint.name = name
+            retarget_action_constraint(constraint, shake_action, slot, shake_range)
+            ensure_driver(constraint, "eval_time", eval_time, timing_variables)
+            ensure_driver(constraint, "influence", influence_expression, influence_variables)
+            constraint_names += [name]
+
+    # Remove constraints for shakes that no longer exist, and make sure the
+    # rest are in shake order.
+    remove_list = [constraint for constraint in stack_object.constraints if constraint.name not in constraint_names]
+    for constraint in remove_list:
+        constraint.driver_remove("eval_time")
+        constraint.driver_remove("influence")
+        stack_object.constraints.remove(constraint)
+    sort_shake_constraints(stack_object, constraint_names)
+
+    ensure_camera_constraint(camera, STACK_LOC_CONSTRAINT_NAME, 'COPY_LOCATION', stack_object)
+    ensure_camera_constraint(camera, STACK_ROT_CONSTRAINT_NAME, 'COPY_ROTATION', stack_object)
 
 
 # Only for use in rebuilding camera shakes, to ensure that constraints, etc.
 # from previous Camera Shakify versions get removed.
 def starts_with_any_base_name(text):
-    base_names = BASE_NAMES_OLD + [BASE_NAME]
+    return text.startswith(ALL_BASE_NAMES)
 
-    for base_name in base_names:
-        if text.startswith(base_name):
-            return True
+ALL_BASE_NAMES = tuple(BASE_NAMES_OLD + [BASE_NAME])
+
+
+# Removes all shake constraints (and their drivers) from a camera, except for
+# those named in `keep`.  See `remove_camera_constraint()` for `release`.
+def remove_shake_constraints(camera, keep=(), release=True):
+    remove_list = []
+    for constraint in camera.constraints:
+        if starts_with_any_base_name(constraint.name) and constraint.name not in keep:
+            remove_list += [constraint]
+    for constraint in remove_list:
+        remove_camera_constraint(camera, constraint, release)
+
+
+# Ensures that an object's shake constraints are in shake order, relative to
+# each other, since the order in which the shake rotations are applied matters.
+#
+# Shake constraints that are already in order are left where they are, and
+# otherwise they're all moved to the end of the stack in order.
+def sort_shake_constraints(obj, names):
+    current = [constraint.name for constraint in obj.constraints if constraint.name in names]
+    if current == names:
+        return
+    for name in names:
+        obj.constraints.move(obj.constraints.find(name), len(obj.constraints) - 1)
 
-    return False
 
 # Ensure that our camera shakify collection exists and fetch it.
 def ensure_camera_shakify_collection(context):
-    if COLLECTION_NAME in context.scene.collection.children and context.scene.collection.children[COLLECTION_NAME].library == None:
-        return context.scene.collection.children[COLLECTION_NAME]
+    collection = context.scene.collection.children.get(COLLECTION_NAME)
+    if collection is not None and collection.library == None:
+        return collection
 
     # Get the collection.
     #
-    # The song-and-dance here is to make sure we get a *local* collection,
-    # not a library-linked collection.
-    collection = None
-    for col in bpy.data.collections:
-        if col.name == COLLECTION_NAME and col.library == None:
-            collection = col
-            break
+    # Looking it up with a `None` library makes sure we get a *local*
+    # collection, not a library-linked collection.
+    collection = bpy.data.collections.get((COLLECTION_NAME, None))
     if collection == None:
         collection = bpy.data.collections.new(COLLECTION_NAME)
         collection.hide_viewport = True
@@ -373,70 +1132,191 @@ def ensure_camera_shakify_collection(context):
     return collection
 
 
+# Returns the enabled constraints of a camera other than its shake
+# constraints.
+#
+# Shakes are baked into (and the driver-free layout writes them to) the
+# camera's own transform, which Blender applies *before* its constraints,
+# while the shake constraints of the rigs come after all other constraints.
+# So on cameras with other constraints (e.g. Track To or Child Of), those
+# play out differently.
+def non_shake_constraints(camera):
+    return [
+        constraint for constraint in camera.constraints
+        if not constraint.mute and not starts_with_any_base_name(constraint.name)
+    ]
+
+
+# The rig layout that a camera's shakes use in the given scene.
+#
+# The driver-free layout (see `transform_cache.py`) needs a delta rotation,
+# which axis-angle rotations don't have, and applies the shake before the
+# camera's other constraints rather than after them.  So cameras with
+# axis-angle rotations or other constraints use the per-camera layout
+# instead.
+def camera_rig_layout(camera, scene):
+    layout = scene.camera_shakify_rig_layout
+    if layout == 'CACHED' and (camera.rotation_mode == 'AXIS_ANGLE' or len(non_shake_constraints(camera)) > 0):
+        return 'PER_CAMERA'
+    return layout
+
+
+def scene_frame(scene):
+    return scene.frame_current + scene.frame_subframe
+
+
 # The main function that actually does the real work of this addon.
 # It's called whenever anything relevant in the shake list on a
-# camera is changed, and just tears down and completely rebuilds
-# the camera-shake setup for it.
-def rebuild_camera_shakes(camera, context):
+# camera is changed, and brings the camera-shake setup for it up to date.
+#
+# The update is incremental: the current setup is compared against the
+# camera's shake list, and only the parts that are missing, stale, or no
+# longer needed are created, retargeted, or removed.  Since every part of the
+# setup for a shake item refers to that item by index, reordering shakes or
+# changing a shake's type just retargets the affected shake empties.
+#
+# `collection` and `action` are the shake collection and action, if already
+# known.  When the collection is passed in, it's up to the caller to clean it
+# up afterwards with `remove_collection_if_empty()`.
+def rebuild_camera_shakes(camera, context, collection=None, action=None):
     if camera.library != None:
         # Skip library-linked cameras.
         return
 
-    collection = ensure_camera_shakify_collection(context)
+    owns_collection = collection is None
+    if owns_collection:
+        collection = ensure_camera_shakify_collection(context)
+    shake_count = len(camera.camera_shakes)
+    layout = camera_rig_layout(camera, context.scene)
+    per_camera = layout == 'PER_CAMERA'
+    cached = layout == 'CACHED'
+    has_rig_objects = RIG_OBJECTS_PROP in camera
 
     #----------------
-    # First, completely tear down the current setup, if any.
+    # First, remove the parts of the current setup that are no longer needed.
     #----------------
 
-    # Remove shake constraints from the camera.
-    remove_list = []
-    for constraint in camera.constraints:
-        if starts_with_any_base_name(constraint.name):
-            constraint.driver_remove("influence")
-            remove_list += [constraint]
-    for constraint in remove_list:
-        camera.constraints.remove(constraint)
+    # Remove shake constraints from the camera that are for shakes that no
+    # longer exist, are for the other rig layout, or are from previous Camera
+    # Shakify versions.
+    constraint_names = []
+    if cached:
+        pass
+    elif per_camera:
+        if shake_count > 0:
+            constraint_names = [STACK_LOC_CONSTRAINT_NAME, STACK_ROT_CONSTRAINT_NAME]
+    else:
+        for shake_item_index in range(0, shake_count):
+            constraint_names += single_shake_constraint_names(camera, shake_item_index)
+    remove_shake_constraints(camera, keep=constraint_names)
 
-    # Remove shake empties for this camera.
-    name_match = re.compile("{}_[0-9]+".format(re.escape(BASE_NAME + "_" + camera.name)))
-    for obj in collection.objects:
-        if name_match.fullmatch(obj.name) != None:
-            obj.constraints[0].driver_remove("eval_time")
-            obj.animation_data_clear()
-            bpy.data.objects.remove(obj)
+    # Give the camera its delta transforms back if the shakes no longer use
+    # them.
+    if not cached or shake_count == 0:
+        restore_base_delta(camera)
 
     #----------------
-    # Then build the new setup.
+    # Then bring the setup of each shake up to date.
     #----------------
 
-    for shake_item_index in range(0, len(camera.camera_shakes)):
-        build_single_shake(camera, shake_item_index, collection, context)
+    shared_indices = set()
+    if cached:
+        if shake_count > 0:
+            store_base_delta(camera)
+            refresh_camera_cache(camera, context.scene)
+            apply_camera_shake(camera, context.scene, scene_frame(context.scene))
+    elif per_camera:
+        if shake_count > 0:
+            build_shake_stack(camera, collection, context, action)
+    else:
+        for shake_item_index in range(0, shake_count):
+            if not is_shake_type_available(camera.camera_shakes[shake_item_index]):
+                continue
+            if build_single_shake(camera, shake_item_index, collection, context, action):
+                shared_indices.add(shake_item_index)
+    sort_shake_constraints(camera, constraint_names)
+
+    # Remove this camera's own shake empties that are no longer needed: those
+    # for shakes that no longer exist, that now use a shared shake empty
+    # instead, or that are for the other rig layout.
+    def is_needed(key):
+        if key == STACK_RIG_OBJECT_KEY:
+            return per_camera and shake_count > 0
+        if not key.isdigit():
+            return False
+        index = int(key)
+        return layout == 'PER_SHAKE' and index < shake_count and index not in shared_indices
+
+    if has_rig_objects:
+        group = camera[RIG_OBJECTS_PROP]
+        for key in list(group.keys()):
+            if is_needed(key):
+                continue
+            obj = group[key]
+            if key == STACK_RIG_OBJECT_KEY:
+                expected_name = shake_stack_object_name(camera)
+            elif key.isdigit():
+                expected_name = shake_object_name(camera, int(key))
+            else:
+                expected_name = None
+            if obj is not None and obj.name == expected_name and obj.library is None:
+                remove_shake_object(obj)
+            del group[key]
+    else:
+        # The camera's shakes were set up before back-references existed, so
+        # find its shake empties by name.
+        name_match = re.compile("{}_([0-9]+|{})".format(re.escape(BASE_NAME + "_" + camera.name), STACK_RIG_OBJECT_KEY))
+        remove_list = []
+        for obj in collection.objects:
+            m = name_match.fullmatch(obj.name)
+            if m != None and not is_needed(m.group(1)):
+                remove_list += [obj]
+        for obj in remove_list:
+            remove_shake_object(obj)
 
     #----------------
-    # Finally, clean up any data that's no longer needed, up to and
-    # including removing the collection itself if there no shakes left.
+    # Finally, remove the collection itself if there are no shakes left.
     #----------------
 
-    # If there's nothing left in the collection, delete it.
+    if owns_collection:
+        remove_collection_if_empty(collection, context)
+
+
+# Rebuilds the camera shakes of several cameras in one pass, resolving the
+# shake collection and action only once.
+def rebuild_cameras(cameras, context):
+    collection = ensure_camera_shakify_collection(context)
+    action = None
+    if any(len(camera.camera_shakes) > 0 for camera in cameras):
+        action = ensure_action(ACTION_NAME)
+    for camera in cameras:
+        rebuild_camera_shakes(camera, context, collection, action)
+    remove_collection_if_empty(collection, context)
+
+
+# If there's nothing left in the shake collection, delete it.
+def remove_collection_if_empty(collection, context):
     if len(collection.objects) == 0:
         context.scene.collection.children.unlink(collection)
         if collection.users == 0:
             bpy.data.collections.remove(collection)
 
 
-# Fixes camera shake setups across the whole scene.
+# Fixes camera shake setups in all scenes, by rebuilding them from scratch.
 # This can be necessary if e.g. a user has duplicated cameras
 # around, etc.
 def fix_camera_shakes_globally(context):
-    # Delete the collection and everything in it.
-    collection = ensure_camera_shakify_collection(context)
-    for obj in collection.objects:
-        obj.constraints[0].driver_remove("eval_time")
-        obj.animation_data_clear()
-        bpy.data.objects.remove(obj)
-    context.scene.collection.children.unlink(collection)
-    if collection.users == 0:
-        bpy.data.collections.remove(collection)
+    # Delete the collection and everything in it, unlinking it from every
+    # scene, since the shake empties of all scenes are in it.
+    collection = bpy.data.collections.get((COLLECTION_NAME, None))
+    if collection is not None:
+        for obj in list(collection.objects):
+            remove_shake_object(obj)
+        for scene in bpy.data.scenes:
+            if scene.library is None and collection.name in scene.collection.children:
+                scene.collection.children.unlink(collection)
+        if collection.users == 0:
+            bpy.data.collections.remove(collection)
 
     # Remove shake channelbags in the shake action, to force them to get
     # re-built.
@@ -444,31 +1324,476 @@ def fix_camera_shakes_globally(context):
     for channelbag in action.layers[0].strips[0].channelbags:
         action.layers[0].strips[0].channelbags.remove(channelbag)
 
-    # Loop through all cameras and re-build their camera shakes.
-    for obj in context.scene.objects:
+    # Loop through all cameras of all scenes and re-build their camera
+    # shakes.  As with `repair_camera_shakes_globally()`, a camera that's in
+    # several scenes is built for the first one.
+    seen = set()
+    for scene in bpy.data.scenes:
+        if scene.library is not None:
+            continue
+        cameras = []
+        for obj in scene.objects:
+            if obj.type == 'CAMERA' and obj.name not in seen:
+                seen.add(obj.name)
+                cameras += [obj]
+        if len(cameras) > 0:
+            with context.temp_override(scene=scene):
+                rebuild_cameras(cameras, bpy.context)
+
+
+#========================================================
+# Verification and repair.
+#
+# These check that the shake rigs of cameras are set up exactly as a rebuild
+# would set them up, without changing anything, so that only broken rigs need
+# to be rebuilt.
+
+
+# Checks an action constraint of a shake empty.  Returns a list of problems.
+def verify_action_constraint(constraint, action, slot_name, shake_range, expression, variables):
+    library_slot = shake_library_slot(slot_name, link=False)
+    if library_slot is not None:
+        action = library_slot[0]
+    problems = []
+    slot = constraint.action_slot
+    if constraint.action != action:
+        problems += ["plays the wrong action"]
+    elif slot is None or slot.identifier != "OB" + slot_name:
+        problems += ["plays the wrong shake"]
+    elif action.layers[0].strips[0].channelbag(slot) is None:
+        problems += ["shake animation is missing"]
+    if (constraint.frame_start, constraint.frame_end) != shake_range:
+        problems += ["has the wrong frame range"]
+    if not driver_matches(constraint, "eval_time", expression, variables):
+        problems += ["timing driver is missing or out of date"]
+    return problems
+
+
+def verify_single_shake(camera, shake_item_index, scene, action):
+    shake = camera.camera_shakes[shake_item_index]
+    shake_info = shake_index()[shake.shake_type]
+    loc_constraint = camera.constraints[loc_constraint_name(shake_item_index)]
+    rot_constraint = camera.constraints[rot_constraint_name(shake_item_index)]
+    problems = []
+
+    if loc_constraint.type != 'COPY_LOCATION' or rot_constraint.type != 'COPY_ROTATION':
+        return ["constraints have the wrong type"]
+    normalization = shake_normalization(shake)
+    if not driver_matches(loc_constraint, "influence", loc_influence_expression(normalization), loc_influence_variables(camera, shake_item_index, scene)):
+        problems += ["location influence driver is missing or out of date"]
+    if not driver_matches(rot_constraint, "influence", rot_influence_expression(normalization), rot_influence_variables(camera, shake_item_index)):
+        problems += ["rotation influence driver is missing or out of date"]
+
+    share_key, object_name, expression, variables = single_shake_object_spec(camera, shake_item_index, shake_info, scene)
+    shake_object = loc_constraint.target
+    if shake_object is None or rot_constraint.target != shake_object:
+        return problems + ["constraints don't target the shake empty"]
+    if shake_object.name != object_name:
+        return problems + ["constraints target the wrong shake empty"]
+    if len(shake_object.constraints) != 1 or shake_object.constraints[0].type != 'ACTION':
+        return problems + ["shake empty is not set up"]
+    problems += verify_action_constraint(
+        shake_object.constraints[0],
+        action,
+        shake_item_slot_name(shake, shake_info, decimation=shake_decimation(scene)),
+        shake_item_frame_range(shake, shake_info),
+        expression,
+        variables,
+    )
+    return problems
+
+
+def verify_shake_stack(camera, scene, action):
+    stack_object = camera.constraints[STACK_LOC_CONSTRAINT_NAME].target
+    if stack_object is None or camera.constraints[STACK_ROT_CONSTRAINT_NAME].target != stack_object:
+        return ["constraints don't target the shake stack empty"]
+    if stack_object.name != shake_stack_object_name(camera):
+        return ["constraints target the wrong shake stack empty"]
+
+    decimation = shake_decimation(scene)
+    problems = []
+    expected_names = []
+    for shake_item_index, shake in enumerate(camera.camera_shakes):
+        if not is_shake_type_available(shake):
+            expected_names += unavailable_stack_constraint_names(stack_object, shake_item_index)
+            continue
+        shake_info = shake_index()[shake.shake_type]
+        shake_range = shake_item_frame_range(shake, shake_info)
+        eval_time = eval_time_expression(shake_range[1] - shake_range[0], shake_info.fps, scene)
+        timing_variables = shake_timing_variables(camera, shake_item_index)
+        for name, data_path_prefix, influence_expression, influence_variables in shake_stack_parts(camera, shake_item_index, shake_info, scene):
+            expected_names += [name]
+            constraint = stack_object.constraints.get(name)
+            if constraint is None or constraint.type != 'ACTION' or constraint.mix_mode != 'AFTER_SPLIT':
+                problems += ["shake {}: constraint {} is missing".format(shake_item_index + 1, name)]
+                continue
+            problems += [
+                "shake {}: {} {}".format(shake_item_index + 1, name, problem)
+                for problem in verify_action_constraint(
+                    constraint,
+                    action,
+                    shake_item_slot_name(shake, shake_info, data_path_prefix, decimation),
+                    shake_range,
+                    eval_time,
+                    timing_variables,
+                )
+            ]
+            if not driver_matches(constraint, "influence", influence_expression, influence_variables):
+                problems += ["shake {}: {} influence driver is missing or out of date".format(shake_item_index + 1, name)]
+
+    if [constraint.name for constraint in stack_object.constraints] != expected_names:
+        problems += ["shake stack empty has missing, extra, or misordered constraints"]
+    return problems
+
+
+# Checks whether the camera's shake rig is set up exactly as
+# `rebuild_camera_shakes()` would set it up in the given scene, without
+# changing anything.
+#
+# `action` is the local shake action, or None if there isn't one.
+#
+# Returns a list of human-readable problems, which is empty if the rig is fine.
+def verify_camera_shakes(camera, scene, action):
+    shake_count = len(camera.camera_shakes)
+    layout = camera_rig_layout(camera, scene)
+    per_camera = layout == 'PER_CAMERA'
+
+    expected_names = []
+    if layout == 'CACHED':
+        pass
+    elif per_camera:
+        if shake_count > 0:
+            expected_names = [STACK_LOC_CONSTRAINT_NAME, STACK_ROT_CONSTRAINT_NAME]
+    else:
+        for shake_item_index in range(0, shake_count):
+            expected_names += single_shake_constraint_names(camera, shake_item_index)
+    names = [constraint.name for constraint in camera.constraints if starts_with_any_base_name(constraint.name)]
+    if names != expected_names:
+        return ["shake constraints are missing, extra, or misordered"]
+    if (layout == 'CACHED' and shake_count > 0) != (BASE_DELTA_PROP in camera):
+        return ["delta transforms are not set up for the shake layout"]
+    if shake_count == 0 or layout == 'CACHED':
+        return []
+
+    if (action is None or len(action.layers) == 0 or len(action.layers[0].strips) == 0) \
+        and shake_library_action(link=False) is None:
+        return ["shake action is missing"]
+
+    if per_camera:
+        return verify_shake_stack(camera, scene, action)
+
+    problems = []
+    for shake_item_index in range(0, shake_count):
+        if not is_shake_type_available(camera.camera_shakes[shake_item_index]):
+            continue
+        problems += [
+            "shake {}: {}".format(shake_item_index + 1, problem)
+            for problem in verify_single_shake(camera, shake_item_index, scene, action)
+        ]
+    return problems
+
+
+# Verifies the shake rigs of all cameras in all scenes, and rebuilds only the
+# ones that have problems.  Shake empties and shake action slots that are no
+# longer used by any camera are removed as well.
+#
+# Returns a list of (camera name, problems) for the cameras that were rebuilt.
+def repair_camera_shakes_globally(context):
+    action = bpy.data.actions.get((ACTION_NAME, None))
+
+    # A camera may be in several scenes, in which case it's checked against
+    # the first one.
+    seen = set()
+    broken = []
+    library_linked = False
+    for scene in bpy.data.scenes:
+        cameras = []
+        for obj in scene.objects:
+            if obj.type != 'CAMERA' or obj.library != None or obj.name in seen:
+                continue
+            seen.add(obj.name)
+            if len(obj.camera_shakes) == 0 and not any(starts_with_any_base_name(c.name) for c in obj.constraints):
+                continue
+            # Verifying doesn't link the shake library, so it's linked here,
+            # before the first camera is verified.  Rigs that should play
+            # from it are then found to need repair.
+            if not library_linked:
+                shake_library_action()
+                library_linked = True
+            problems = verify_camera_shakes(obj, scene, action)
+            if len(problems) > 0:
+                cameras += [(obj, problems)]
+        if len(cameras) > 0:
+            broken += [(scene, cameras)]
+
+    repaired = []
+    for scene, cameras in broken:
+        with context.temp_override(scene=scene):
+            rebuild_cameras([camera for camera, _ in cameras], bpy.context)
+        repaired += [(camera.name, problems) for camera, problems in cameras]
+
+    if len(repaired) > 0:
+        remove_unused_shake_objects()
+        remove_unused_shake_slots()
+
+    return repaired
+
+
+# Removes shake empties that aren't the target of any camera's shake
+# constraints, e.g. those of deleted or renamed cameras.
+def remove_unused_shake_objects():
+    collection = bpy.data.collections.get((COLLECTION_NAME, None))
+    if collection is None:
+        return
+    used = set()
+    for obj in bpy.data.objects:
         if obj.type == 'CAMERA':
-            rebuild_camera_shakes(obj, context)
+            for constraint in obj.constraints:
+                if starts_with_any_base_name(constraint.name) and constraint.target is not None:
+                    used.add(constraint.target.name)
+    for obj in [obj for obj in collection.objects if obj.name not in used]:
+        remove_shake_object(obj)
+
+
+# Removes the slots (and their animation) from the shake action that aren't
+# played by any shake constraint, e.g. those of a previous decimation
+# tolerance.
+def remove_unused_shake_slots():
+    action = bpy.data.actions.get((ACTION_NAME, None))
+    if action is None:
+        return
+    used = set()
+    for obj in bpy.data.objects:
+        for constraint in obj.constraints:
+            if constraint.type == 'ACTION' and constraint.action == action and constraint.action_slot is not None:
+                used.add(constraint.action_slot.identifier)
+    for slot in [slot for slot in action.slots if slot.identifier not in used]:
+        action.slots.remove(slot)
+
+
+# While a batch edit is in progress, property updates don't rebuild camera
+# shakes, since the batch operator rebuilds all affected cameras at the end.
+_batch_edit_depth = 0
+
+@contextmanager
+def batch_edit():
+    global _batch_edit_depth
+    _batch_edit_depth += 1
+    try:
+        yield
+    finally:
+        _batch_edit_depth -= 1
 
 
 def on_shake_type_update(shake_instance, context):
+    if _batch_edit_depth > 0:
+        return
     rebuild_camera_shakes(shake_instance.id_data, context)
 
 
-#class ActionToPythonData(bpy.types.Operator):
-#    """Writes the action on the currently selected object to a text block as Python data"""
-#    bl_idname = "object.action_to_python_data"
-#    bl_label = "Action to Python Data"
-#    bl_options = {'UNDO'}
-#
-#    @classmethod
-#    def poll(cls, context):
-#        return context.active_object is not None \
-#               and context.active_object.animation_data is not None \
-#               and context.active_object.animation_data.action is not None
+# Timing changes only need a rebuild when they can change which shake empty a
+# shake uses.
+def on_shake_timing_update(shake_instance, context):
+    if _batch_edit_depth > 0:
+        return
+    if context.scene.camera_shakify_share_empties:
+        rebuild_camera_shakes(shake_instance.id_data, context)
+    else:
+        apply_cached_shake_parameters(shake_instance.id_data, context)
+
+
+def on_shake_parameter_update(shake_instance, context):
+    if _batch_edit_depth > 0:
+        return
+    apply_cached_shake_parameters(shake_instance.id_data, context)
+
+
+# The rigs' drivers pick up parameter changes by themselves, but driver-free
+# shakes (see `transform_cache.py`) need their offsets re-evaluated.
+def apply_cached_shake_parameters(camera, context):
+    if BASE_DELTA_PROP in camera and camera.library is None:
+        refresh_camera_cache(camera, context.scene)
+        apply_camera_shake(camera, context.scene, scene_frame(context.scene))
+
+
+def on_rig_settings_update(scene, context):
+    rebuild_cameras([obj for obj in scene.objects if obj.type == 'CAMERA' and len(obj.camera_shakes) > 0], context)
+
+
+def on_decimation_update(scene, context):
+    on_rig_settings_update(scene, context)
+    remove_unused_shake_slots()
+
+
+# Enum items for `CameraShakeInstance.shake_type`, built from the shake
+# metadata index in `register()`.
 #
-#    def execute(self, context):
-#        action_to_python_data_text(context.active_object.animation_data.action, "action_output.txt")
-#        return {'FINISHED'}
+# Note: Python must keep references to the strings returned by dynamic enum
+# item callbacks, which is why these are stored in a module-level list rather
+# than being built on each call.  The explicit item numbers are what get stored
+# in blend files, so they must remain stable.
+SHAKE_TYPE_ITEMS = []
+IMPORTED_SHAKE_TYPE_ITEMS = []
+
+# Enum numbers of imported shakes are derived from their ids rather than their
+# position, so that files keep referring to the same shake however many shakes
+# are imported or removed.  They start well above the built-in shakes' numbers.
+IMPORTED_SHAKE_ENUM_BASE = 1000
+IMPORTED_SHAKE_ENUM_RANGE = 1 << 30
+
+def update_shake_type_items():
+    SHAKE_TYPE_ITEMS.clear()
+    IMPORTED_SHAKE_TYPE_ITEMS.clear()
+    used_numbers = set()
+    for number, info in enumerate(shake_index().values()):
+        if not is_builtin_shake(info):
+            number = IMPORTED_SHAKE_ENUM_BASE + zlib.crc32(info.id.encode("utf-8")) % IMPORTED_SHAKE_ENUM_RANGE
+            while number in used_numbers:
+                number += 1
+            IMPORTED_SHAKE_TYPE_ITEMS.append((info.id, info.name, ""))
+        used_numbers.add(number)
+        SHAKE_TYPE_ITEMS.append((info.id, info.name, "", number))
+
+
+#========================================================
+# Imported shakes.
+
+IMPORTED_SHAKES_DIR_NAME = "imported_shakes"
+IMPORTED_SHAKE_ID_PREFIX = "IMPORTED_"
+
+
+# The directory imported shakes are stored in, one packed shake file each.
+def imported_shakes_dir(create=False):
+    try:
+        return bpy.utils.extension_path_user(__package__, path=IMPORTED_SHAKES_DIR_NAME, create=create)
+    except ValueError:
+        # Installed as a legacy addon rather than an extension.
+        return bpy.utils.user_resource('CONFIG', path=os.path.join("camera_shakify", IMPORTED_SHAKES_DIR_NAME), create=create)
+
+
+def imported_shake_paths():
+    directory = imported_shakes_dir()
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(".bin")
+    )
+
+
+# (Re)loads the index of all available shakes, including imported ones, and
+# updates the shake type enum to match.
+def reload_shakes():
+    load_shake_index(imported_shake_paths())
+    shake_stats.clear_computed_stats()
+    update_shake_type_items()
+
+
+def imported_shake_type_items(self, context):
+    return IMPORTED_SHAKE_TYPE_ITEMS
+
+
+# Removes the shake animation of a shake from the local shake action, if it's
+# there, so that it's rebuilt from the shake's current data the next time the
+# shake rigs are repaired.
+def clear_shake_animation(shake_info):
+    action = bpy.data.actions.get((ACTION_NAME, None))
+    if action is None or len(action.layers) == 0 or len(action.layers[0].strips) == 0:
+        return
+    strip = action.layers[0].strips[0]
+    names = ["OB" + shake_slot_name(shake_info, data_path_prefix) for data_path_prefix in ["", "location", "rotation"]]
+    for slot in action.slots:
+        base_identifier = re.sub("({}[0-9a-f]{{8}}|{}[0-9]+)$".format(DECIMATED_SLOT_TAG, PROCEDURAL_SLOT_TAG), "", slot.identifier)
+        if base_identifier not in names:
+            continue
+        channelbag = strip.channelbag(slot)
+        if channelbag is not None:
+            strip.channelbags.remove(channelbag)
+
+def shake_type_items(self, context):
+    return SHAKE_TYPE_ITEMS
+
+
+# Only needed for creating new shakes to add to this addon.  Not for end users,
+# so it's only available when the developer tools are enabled in the addon
+# preferences.
+class ActionToPythonData(bpy.types.Operator):
+    """Exports the animation of the active object as a new camera shake, either as Python data or as a packed shake file"""
+    bl_idname = "object.action_to_python_data"
+    bl_label = "Export Action as Camera Shake"
+    bl_options = {'REGISTER'}
+
+    output_format: bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ('LITERAL', "Python Data", "An entry for the SHAKE_LIST in dev/shake_data_src.py"),
+            ('BINARY', "Packed Shake File", "A packed shake file in the same format as the addon's shake_data.bin"),
+        ],
+        default='LITERAL',
+    )
+    filepath: bpy.props.StringProperty(
+        name="File Path",
+        description="File to write the shake to. If empty, Python data is written to a new text block instead",
+        subtype='FILE_PATH',
+    )
+    shake_id: bpy.props.StringProperty(
+        name="Shake ID",
+        description="Identifier of the new shake. Defaults to the action's name in upper case",
+    )
+    shake_name: bpy.props.StringProperty(
+        name="Shake Name",
+        description="Display name of the new shake. Defaults to the action's name",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        prefs = addon_preferences()
+        if prefs is None or not prefs.developer_tools:
+            return False
+        obj = context.active_object
+        return obj is not None \
+               and obj.animation_data is not None \
+               and obj.animation_data.action is not None \
+               and obj.animation_data.action_slot is not None
+
+    def execute(self, context):
+        anim_data = context.active_object.animation_data
+        action = anim_data.action
+        shake_id = self.shake_id if self.shake_id != "" else re.sub(r"\W", "_", action.name).upper()
+        shake_name = self.shake_name if self.shake_name != "" else action.name
+        fps = context.scene.render.fps / context.scene.render.fps_base
+
+        if self.output_format == 'BINARY' and self.filepath == "":
+            self.report({'ERROR'}, "A file path is needed to write a packed shake file")
+            return {'CANCELLED'}
+
+        try:
+            frame_start, channels = sample_action_slot(action, anim_data.action_slot)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        frame_count = len(channels[0][1])
+
+        if self.output_format == 'BINARY':
+            path = bpy.path.abspath(self.filepath)
+            write_shake_binary(path, shake_id, shake_name, fps, frame_start, channels)
+        elif self.filepath != "":
+            path = bpy.path.abspath(self.filepath)
+            with open(path, "w") as f:
+                write_shake_literal(f, shake_id, shake_name, fps, frame_start, channels)
+        else:
+            text = bpy.data.texts.new(shake_id + ".py")
+            write_shake_literal(text, shake_id, shake_name, fps, frame_start, channels)
+            path = text.name
+
+        self.report({'INFO'}, "Exported {} frames of {} channels as shake \"{}\" to {}".format(frame_count, len(channels), shake_id, path))
+        return {'FINISHED'}
+
+
+def draw_action_to_python_data_menu(self, context):
+    prefs = addon_preferences()
+    if prefs is not None and prefs.developer_tools:
+        self.layout.operator(ActionToPythonData.bl_idname)
 
 
 class CameraShakeAdd(bpy.types.Operator):
@@ -539,18 +1864,692 @@ class CameraShakeMove(bpy.types.Operator):
         return {'FINISHED'}
 
 
+# The cameras that the batch operators below act on.
+def selected_cameras(context):
+    return [obj for obj in context.selected_objects if obj.type == 'CAMERA' and obj.library == None]
+
+
+# Batch operators.
+#
+# These edit the shakes of all selected cameras, and then rebuild them all in
+# a single pass at the end, rather than once per edit.
+
+# Returns the shakes of `camera` that a batch operator with the given shake
+# index should act on (-1 meaning all of them).
+def batch_shakes(camera, index):
+    if index < 0:
+        return list(camera.camera_shakes)
+    if index < len(camera.camera_shakes):
+        return [camera.camera_shakes[index]]
+    return []
+
+
+class CameraShakesBatchAdd(bpy.types.Operator):
+    """Adds a camera shake to all selected cameras"""
+    bl_idname = "object.camera_shakes_batch_add"
+    bl_label = "Add Shake to Selected Cameras"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    shake_type: bpy.props.EnumProperty(
+        name="Shake",
+        items=shake_type_items,
+    )
+    influence: bpy.props.FloatProperty(
+        name="Influence",
+        default=1.0,
+        min=0.0, max=INFLUENCE_MAX,
+        soft_min=0.0, soft_max=1.0,
+    )
+    normalize: bpy.props.BoolProperty(
+        name="Auto-Normalize",
+        default=False,
+    )
+    scale: bpy.props.FloatProperty(
+        name="Scale",
+        default=1.0,
+        min=0.0, max=SCALE_MAX,
+        soft_min=0.0, soft_max=2.0,
+    )
+    speed: bpy.props.FloatProperty(
+        name="Speed",
+        default=1.0,
+        soft_min=0.0, soft_max=4.0,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and len(selected_cameras(context)) > 0
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        cameras = selected_cameras(context)
+        with batch_edit():
+            for camera in cameras:
+                shake = camera.camera_shakes.add()
+                shake.shake_type = self.shake_type
+                shake.influence = self.influence
+                shake.normalize = self.normalize
+                shake.scale = self.scale
+                shake.speed = self.speed
+                camera.camera_shakes_active_index = len(camera.camera_shakes) - 1
+        rebuild_cameras(cameras, context)
+        self.report({'INFO'}, "Added shake to {} camera(s)".format(len(cameras)))
+        return {'FINISHED'}
+
+
+class CameraShakesBatchRemove(bpy.types.Operator):
+    """Removes camera shakes from all selected cameras"""
+    bl_idname = "object.camera_shakes_batch_remove"
+    bl_label = "Remove Shakes from Selected Cameras"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    remove: bpy.props.EnumProperty(
+        name="Remove",
+        items = [
+            ('ALL', "All Shakes", "Remove all shakes"),
+            ('TYPE', "Shakes of Type", "Remove only the shakes of the given type"),
+        ],
+        default='ALL',
+    )
+    shake_type: bpy.props.EnumProperty(
+        name="Shake",
+        items=shake_type_items,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and len(selected_cameras(context)) > 0
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "remove")
+        row = layout.row()
+        row.active = self.remove == 'TYPE'
+        row.prop(self, "shake_type")
+
+    def execute(self, context):
+        cameras = selected_cameras(context)
+        removed = 0
+        with batch_edit():
+            for camera in cameras:
+                for i in reversed(range(len(camera.camera_shakes))):
+                    if self.remove == 'ALL' or camera.camera_shakes[i].shake_type == self.shake_type:
+                        camera.camera_shakes.remove(i)
+                        removed += 1
+                camera.camera_shakes_active_index = min(camera.camera_shakes_active_index, max(len(camera.camera_shakes) - 1, 0))
+        rebuild_cameras(cameras, context)
+        self.report({'INFO'}, "Removed {} shake(s) from {} camera(s)".format(removed, len(cameras)))
+        return {'FINISHED'}
+
+
+class CameraShakesBatchRetype(bpy.types.Operator):
+    """Changes the shake type of camera shakes on all selected cameras"""
+    bl_idname = "object.camera_shakes_batch_retype"
+    bl_label = "Change Shake Type of Selected Cameras"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    shake_type: bpy.props.EnumProperty(
+        name="Shake",
+        items=shake_type_items,
+    )
+    index: bpy.props.IntProperty(
+        name="Shake Index",
+        description="Which shake of each camera to change, counting from 0 at the top of the list, or -1 for all of them",
+        default=-1,
+        min=-1,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and len(selected_cameras(context)) > 0
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        cameras = selected_cameras(context)
+        changed = 0
+        with batch_edit():
+            for camera in cameras:
+                for shake in batch_shakes(camera, self.index):
+                    if shake.shake_type != self.shake_type:
+                        shake.shake_type = self.shake_type
+                        changed += 1
+        rebuild_cameras(cameras, context)
+        self.report({'INFO'}, "Changed {} shake(s) on {} camera(s)".format(changed, len(cameras)))
+        return {'FINISHED'}
+
+
+class CameraShakesRandomizeOffsets(bpy.types.Operator):
+    """Sets the frame offsets of camera shakes on all selected cameras to random values, so that the same shake doesn't play in sync on different cameras"""
+    bl_idname = "object.camera_shakes_randomize_offsets"
+    bl_label = "Randomize Shake Offsets of Selected Cameras"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    seed: bpy.props.IntProperty(
+        name="Seed",
+        description="Seed for the random offsets. The same seed gives the same offsets for the same cameras",
+        default=0,
+        min=0,
+    )
+    offset_min: bpy.props.FloatProperty(
+        name="Min Offset",
+        default=0.0,
+        precision=1,
+        step=100.0,
+    )
+    offset_max: bpy.props.FloatProperty(
+        name="Max Offset",
+        default=1000.0,
+        precision=1,
+        step=100.0,
+    )
+    whole_frames: bpy.props.BoolProperty(
+        name="Whole Frames",
+        description="Round the offsets to whole frames",
+        default=True,
+    )
+    index: bpy.props.IntProperty(
+        name="Shake Index",
+        description="Which shake of each camera to change, counting from 0 at the top of the list, or -1 for all of them",
+        default=-1,
+        min=-1,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and len(selected_cameras(context)) > 0
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        # Sorted by name, so that the result doesn't depend on selection order.
+        cameras = sorted(selected_cameras(context), key=lambda camera: camera.name)
+        rng = random.Random(self.seed)
+        with batch_edit():
+            for camera in cameras:
+                for shake in batch_shakes(camera, self.index):
+                    offset = rng.uniform(self.offset_min, self.offset_max)
+                    if self.whole_frames:
+                        offset = float(round(offset))
+                    shake.offset = offset
+        rebuild_cameras(cameras, context)
+        return {'FINISHED'}
+
+
 class CameraShakesFixGlobal(bpy.types.Operator):
-    """Ensures that all camera shakes in the scene are set up properly. This generally shouldn't be necessary, but if things are behaving strangely this should fix it"""
+    """Ensures that all camera shakes are set up properly. This generally shouldn't be necessary, but if things are behaving strangely this should fix it"""
     bl_idname = "object.camera_shakes_fix_global"
     bl_label = "Fix All Camera Shakes"
     bl_options = {'UNDO'}
 
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items = [
+            ('REPAIR', "Repair", "Check the camera shakes of all scenes, and only rebuild the ones that aren't set up properly"),
+            ('REBUILD', "Rebuild", "Delete and rebuild all camera shakes of all scenes from scratch"),
+        ],
+        default='REPAIR',
+    )
+
     @classmethod
     def poll(cls, context):
         return context.mode == 'OBJECT'
 
     def execute(self, context):
-        fix_camera_shakes_globally(context)
+        if self.mode == 'REBUILD':
+            fix_camera_shakes_globally(context)
+            return {'FINISHED'}
+
+        repaired = repair_camera_shakes_globally(context)
+        if len(repaired) == 0:
+            self.report({'INFO'}, "All camera shakes are set up properly")
+        else:
+            print_repaired_cameras(repaired)
+            self.report({'INFO'}, "Repaired the shakes of {} camera(s): {} (see the console for details)".format(
+                len(repaired),
+                ", ".join(name for name, _ in repaired),
+            ))
+        return {'FINISHED'}
+
+
+def print_repaired_cameras(repaired):
+    for name, problems in repaired:
+        print("Camera Shakify: repaired shakes of camera \"{}\": {}".format(name, "; ".join(problems)))
+
+
+# Checks and repairs camera shakes in newly loaded files, e.g. ones saved by an
+# older version of the addon.
+@persistent
+def repair_camera_shakes_on_load(*args):
+    clear_transform_caches()
+    _scene_settings.clear()
+    prefs = addon_preferences()
+    if prefs is None or prefs.repair_on_load:
+        print_repaired_cameras(repair_camera_shakes_globally(bpy.context))
+    # The depsgraph handler only sees the active scene, so check all of them
+    # now.  This also applies the driver-free shake offsets, which files are
+    # saved without.
+    for scene in bpy.data.scenes:
+        update_rigs_for_scene_settings(scene)
+
+
+#========================================================
+# Keeping rigs up to date with scene settings.
+#
+# The scene's frame rate is baked into the eval-time driver expressions (and
+# the names of shared shake empties), so when it changes, the affected
+# expressions are rewritten in place, without rebuilding anything.  The unit
+# scale, on the other hand, is read by the location influence drivers
+# directly, so it only needs checking against the range the rigs support.
+#
+# To stay cheap enough to run on every depsgraph update, the handler only
+# compares the active scene's settings against the ones it last saw, and only
+# does any work when they differ.  Those are kept here rather than on the
+# scene, since writing ID properties from a depsgraph handler would tag the
+# scene for yet another update.  Scenes seen for the first time (e.g. all of
+# them after loading a file) get their rigs' timing checked.
+
+# Scene `session_uid` -> (frame rate, unit scale).
+_scene_settings = {}
+
+
+def scene_fps(scene):
+    return scene.render.fps / scene.render.fps_base
+
+
+# Whether the scene's unit scale is so small that large shake influences and
+# scales get clamped.
+def unit_scale_too_small(scene):
+    return scene.unit_settings.scale_length < 1.0 / UNIT_SCALE_MAX
+
+
+# Sets the expression of an existing driver.  Returns False if there's no
+# driver.
+def set_driver_expression(owner, prop, expression):
+    fcurve = find_driver(owner, prop)
+    if fcurve is None:
+        return False
+    if fcurve.driver.expression != expression:
+        fcurve.driver.expression = expression
+    return True
+
+
+# Updates the eval-time drivers of a camera's shake rig for the scene's
+# current frame rate, renaming shared shake empties to match as well.
+#
+# Returns False if the rig isn't set up as expected, in which case it needs a
+# proper repair instead.
+def update_camera_shake_timing(camera, scene):
+    if camera.library is not None:
+        return True
+    available = [i for i, shake in enumerate(camera.camera_shakes) if is_shake_type_available(shake)]
+    if len(available) == 0:
+        return True
+
+    layout = camera_rig_layout(camera, scene)
+    if layout == 'CACHED':
+        # The cached offsets are invalidated by the frame rate change by
+        # themselves.
+        return True
+
+    if layout == 'PER_CAMERA':
+        constraint = camera.constraints.get(STACK_LOC_CONSTRAINT_NAME)
+        stack_object = constraint.target if constraint is not None else None
+        if stack_object is None:
+            return False
+        for shake_item_index in available:
+            shake = camera.camera_shakes[shake_item_index]
+            shake_info = shake_index()[shake.shake_type]
+            shake_range = shake_item_frame_range(shake, shake_info)
+            eval_time = eval_time_expression(shake_range[1] - shake_range[0], shake_info.fps, scene)
+            for name, _, _, _ in shake_stack_parts(camera, shake_item_index, shake_info, scene):
+                constraint = stack_object.constraints.get(name)
+                if constraint is None or not set_driver_expression(constraint, "eval_time", eval_time):
+                    return False
+        return True
+
+    for shake_item_index in available:
+        shake_info = shake_index()[camera.camera_shakes[shake_item_index].shake_type]
+        constraint = camera.constraints.get(loc_constraint_name(shake_item_index))
+        shake_object = constraint.target if constraint is not None else None
+        if shake_object is None or len(shake_object.constraints) != 1:
+            return False
+        share_key, object_name, expression, _ = single_shake_object_spec(camera, shake_item_index, shake_info, scene)
+        if shake_object.name != object_name:
+            # Shared shake empties are named after the frame rate too.  Other
+            # cameras sharing the same empty find it already renamed.
+            if share_key is None or not is_shared_shake_object(shake_object) \
+                or bpy.data.objects.get((object_name, None)) is not None:
+                return False
+            shake_object.name = object_name
+        if not set_driver_expression(shake_object.constraints[0], "eval_time", expression):
+            return False
+    return True
+
+
+def deferred_repair():
+    print_repaired_cameras(repair_camera_shakes_globally(bpy.context))
+    return None # Don't repeat.
+
+
+@persistent
+def update_rigs_for_scene_settings(scene, depsgraph=None):
+    if scene.library is not None:
+        return
+
+    fps = scene_fps(scene)
+    unit_scale = scene.unit_settings.scale_length
+    previous_fps, previous_unit_scale = _scene_settings.get(scene.session_uid, (None, None))
+    settings_changed = (fps, unit_scale) != (previous_fps, previous_unit_scale)
+    if settings_changed:
+        _scene_settings[scene.session_uid] = (fps, unit_scale)
+
+    if fps != previous_fps:
+        ok = True
+        for obj in scene.objects:
+            if obj.type == 'CAMERA' and len(obj.camera_shakes) > 0:
+                ok = update_camera_shake_timing(obj, scene) and ok
+        if not ok:
+            # Changing the rigs' structure isn't safe in the middle of a
+            # depsgraph update, so leave it for a moment later.
+            if not bpy.app.timers.is_registered(deferred_repair):
+                bpy.app.timers.register(deferred_repair)
+
+    if unit_scale != previous_unit_scale and unit_scale_too_small(scene):
+        print("Camera Shakify: the unit scale of scene \"{}\" is below {}, so the location of shakes with a high influence or scale will be limited.".format(scene.name, 1.0 / UNIT_SCALE_MAX))
+
+    # Bring the driver-free shakes of the cameras that were updated (e.g.
+    # their shake parameters) up to date, or of all cameras if the scene
+    # settings changed.  Nothing is written if they're already up to date, so
+    # this doesn't trigger further updates.
+    if settings_changed:
+        cameras = cached_shake_cameras(scene, scene.objects)
+    elif depsgraph is not None:
+        cameras = cached_shake_cameras(scene, [update.id.original for update in depsgraph.updates if isinstance(update.id, bpy.types.Object)])
+    else:
+        cameras = []
+    for camera in cameras:
+        refresh_camera_cache(camera, scene)
+    apply_cached_camera_shakes(scene, cameras)
+
+
+# Returns the cameras among `objects` whose shakes use the driver-free rig
+# layout.
+def cached_shake_cameras(scene, objects):
+    if scene.camera_shakify_rig_layout != 'CACHED':
+        return []
+    return [obj for obj in objects if obj.type == 'CAMERA' and BASE_DELTA_PROP in obj and obj.library is None]
+
+
+# Applies the shake offsets of the given driver-free cameras for the scene's
+# current (sub-)frame.
+def apply_cached_camera_shakes(scene, cameras):
+    frame = scene_frame(scene)
+    for camera in cameras:
+        if camera_rig_layout(camera, scene) != 'CACHED':
+            # The camera got e.g. a constraint since its shakes were set up,
+            # so it needs another layout, which can't be built here.
+            if not bpy.app.timers.is_registered(deferred_repair):
+                bpy.app.timers.register(deferred_repair)
+            continue
+        apply_camera_shake(camera, scene, frame)
+
+
+@persistent
+def apply_cached_shakes(scene, depsgraph=None):
+    apply_cached_camera_shakes(scene, cached_shake_cameras(scene, scene.objects))
+
+
+# Files are saved with the driver-free cameras' own delta transforms rather
+# than the current frame's shake offsets, which are reapplied right after.
+@persistent
+def reset_cached_shakes_for_save(*args):
+    for scene in bpy.data.scenes:
+        for camera in cached_shake_cameras(scene, scene.objects):
+            reset_base_delta(camera)
+
+
+@persistent
+def reapply_cached_shakes_after_save(*args):
+    for scene in bpy.data.scenes:
+        apply_cached_shakes(scene)
+
+
+class CameraShakesBake(bpy.types.Operator):
+    """Bakes the camera shakes of the selected cameras into ordinary location/rotation keyframes, so that they render without any drivers or constraints"""
+    bl_idname = "object.camera_shakes_bake"
+    bl_label = "Bake Camera Shakes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frame_start: bpy.props.IntProperty(
+        name="Start Frame",
+        description="First frame to bake",
+        default=1,
+    )
+    frame_end: bpy.props.IntProperty(
+        name="End Frame",
+        description="Last frame to bake",
+        default=250,
+    )
+    samples_per_frame: bpy.props.IntProperty(
+        name="Samples Per Frame",
+        description="How many keyframes to bake per frame. Use more than one for accurate motion blur",
+        default=1,
+        min=1, max=64,
+        soft_max=8,
+    )
+    target: bpy.props.EnumProperty(
+        name="Bake To",
+        items = [
+            ('CAMERA', "Camera", "Replace the camera's own location/rotation animation within the baked frame range with the baked result, and remove its shakes"),
+            ('COPY', "Baked Copy", "Write the baked result to a copy of the camera (replacing the one from an earlier bake), leaving the original untouched"),
+        ],
+        default='CAMERA',
+    )
+    jobs: bpy.props.IntProperty(
+        name="Processes",
+        description="How many processes to evaluate the shakes in. 0 uses one per CPU. Only large bakes are split across processes",
+        default=0,
+        min=0, soft_max=64,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and len(cls.cameras_to_bake(context)) > 0
+
+    @staticmethod
+    def cameras_to_bake(context):
+        cameras = [obj for obj in context.selected_objects if obj.type == 'CAMERA' and len(obj.camera_shakes) > 0]
+        obj = context.active_object
+        if len(cameras) == 0 and obj is not None and obj.type == 'CAMERA' and len(obj.camera_shakes) > 0:
+            cameras = [obj]
+        return [camera for camera in cameras if camera.library == None]
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "End frame must not be before start frame")
+            return {'CANCELLED'}
+
+        frames = bake_frames(self.frame_start, self.frame_end, self.samples_per_frame)
+        cameras = self.cameras_to_bake(context)
+        constrained = [camera.name for camera in cameras if len(non_shake_constraints(camera)) > 0]
+        bake_cameras(cameras, context, frames, self.target, self.jobs if self.jobs > 0 else None)
+
+        if len(constrained) > 0:
+            self.report({'WARNING'}, "Baked shakes of {} camera(s), but these have other constraints, which now apply on top of the shake instead of before it, so the result may differ: {}".format(len(cameras), ", ".join(constrained)))
+        else:
+            self.report({'INFO'}, "Baked shakes of {} camera(s)".format(len(cameras)))
+        return {'FINISHED'}
+
+
+# Bakes the shakes of the given cameras at the given frames, in the context's
+# scene.  `target` is as for `CameraShakesBake`.  Cameras baked in place lose
+# their shakes, since they'd otherwise apply on top of the baked result.
+#
+# The shakes are evaluated across `jobs` worker processes (None for one per
+# CPU), for bakes that are big enough to be worth it.
+#
+# Returns the objects the shakes were baked into, in the same order as the
+# cameras.
+def bake_cameras(cameras, context, frames, target='CAMERA', jobs=None):
+    if target == 'COPY':
+        pairs = [(camera, bake_target_copy(camera)) for camera in cameras]
+    else:
+        for camera in cameras:
+            restore_base_delta(camera)
+        pairs = [(camera, camera) for camera in cameras]
+    bake_many_camera_shakes(pairs, context.scene, frames, jobs)
+
+    if target == 'CAMERA':
+        for camera in cameras:
+            camera.camera_shakes.clear()
+            camera.camera_shakes_active_index = 0
+            remove_shake_property_fcurves(camera)
+        if len(cameras) > 0:
+            rebuild_cameras(cameras, context)
+    return [target for _, target in pairs]
+
+
+# Creates an un-shaken copy of a camera object to bake its shakes into, linked
+# into the same collections as the camera.
+#
+# A copy left by an earlier bake is replaced, rather than piling up numbered
+# copies, and the new copy takes over its place as scene or marker camera.
+def bake_target_copy(camera):
+    name = camera.name + "_baked"
+    target = camera.copy()
+    for collection in camera.users_collection:
+        collection.objects.link(target)
+
+    previous = bpy.data.objects.get((name, None))
+    if previous is not None and previous.type == 'CAMERA' and len(previous.camera_shakes) == 0:
+        replace_scene_camera(previous, target)
+        action = previous.animation_data.action if previous.animation_data is not None else None
+        bpy.data.objects.remove(previous)
+        if action is not None and action.users == 0:
+            bpy.data.actions.remove(action)
+    target.name = name
+
+    # Give the copy its own action, so that baking doesn't touch the
+    # original's animation.
+    anim_data = target.animation_data
+    if anim_data is not None and anim_data.action is not None:
+        slot_identifier = anim_data.action_slot.identifier if anim_data.action_slot is not None else None
+        anim_data.action = anim_data.action.copy()
+        if slot_identifier is not None and slot_identifier in anim_data.action.slots:
+            anim_data.action_slot = anim_data.action.slots[slot_identifier]
+
+    # The copy's shake constraints and rig object references are the
+    # original's, so strip them without touching the shake empties, which
+    # the original still uses.
+    remove_shake_constraints(target, release=False)
+    if RIG_OBJECTS_PROP in target:
+        del target[RIG_OBJECTS_PROP]
+    restore_base_delta(target)
+    remove_shake_property_fcurves(target)
+    target.camera_shakes.clear()
+    target.camera_shakes_active_index = 0
+    return target
+
+
+# Makes `new` the camera of the scenes and timeline markers that use `old`.
+def replace_scene_camera(old, new):
+    for scene in bpy.data.scenes:
+        if scene.library is not None:
+            continue
+        if scene.camera == old:
+            scene.camera = new
+        for marker in scene.timeline_markers:
+            if marker.camera == old:
+                marker.camera = new
+
+
+class CameraShakesExportTracks(bpy.types.Operator):
+    """Exports the evaluated shake offsets of the selected cameras, without their own animation, to one file per camera"""
+    bl_idname = "object.camera_shakes_export_tracks"
+    bl_label = "Export Shake Tracks"
+    bl_options = {'REGISTER'}
+
+    directory: bpy.props.StringProperty(subtype='DIR_PATH')
+
+    format: bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ('CSV', "CSV", "Comma-separated text, with rotations in degrees"),
+            ('CHAN', "Nuke .chan", "Nuke channel file, with rotations in degrees"),
+            ('FLOAT32', "Raw Float32", "Flat little-endian float32 samples (frame, tx, ty, tz, rx, ry, rz) with rotations in radians, plus a JSON description"),
+        ],
+        default='CSV',
+    )
+    frame_start: bpy.props.IntProperty(
+        name="Start Frame",
+        description="First frame to export",
+        default=1,
+    )
+    frame_end: bpy.props.IntProperty(
+        name="End Frame",
+        description="Last frame to export",
+        default=250,
+    )
+    samples_per_frame: bpy.props.IntProperty(
+        name="Samples Per Frame",
+        description="How many evenly spaced samples to export per frame, e.g. for motion blur",
+        default=1,
+        min=1, soft_max=16,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return len(cls.cameras_to_export(context)) > 0
+
+    @staticmethod
+    def cameras_to_export(context):
+        return [obj for obj in context.selected_objects if obj.type == 'CAMERA' and len(obj.camera_shakes) > 0]
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        if self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "End frame must not be before start frame")
+            return {'CANCELLED'}
+
+        directory = bpy.path.abspath(self.directory)
+        prepared = {}
+        cameras = self.cameras_to_export(context)
+        try:
+            for camera in cameras:
+                path = os.path.join(directory, bpy.path.clean_name(camera.name) + TRACK_EXPORT_FORMATS[self.format])
+                export_shake_track(
+                    camera,
+                    context.scene,
+                    path,
+                    self.format,
+                    self.frame_start,
+                    self.frame_end,
+                    self.samples_per_frame,
+                    prepared,
+                )
+        except OSError as e:
+            self.report({'ERROR'}, "Couldn't export shake tracks: {}".format(e))
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "Exported shake tracks of {} camera(s) to {}".format(len(cameras), directory))
         return {'FINISHED'}
 
 
@@ -566,6 +2565,211 @@ class CameraShakifyPrepFileForFarm(bpy.types.Operator):
 
     def execute(self, context):
         ensure_farm_script(INFLUENCE_MAX, SCALE_MAX)
+        if any(scene.camera_shakify_rig_layout == 'CACHED' for scene in bpy.data.scenes):
+            self.report({'WARNING'}, "Driver-Free camera shakes need the addon to render. Bake them, or use another rig layout, before rendering without it")
+        return {'FINISHED'}
+
+
+class CameraShakifyImportCapture(bpy.types.Operator):
+    """Imports tracked camera motion from a CSV, JSON, or .chan file as a new shake type"""
+    bl_idname = "wm.camera_shakify_import_capture"
+    bl_label = "Import Camera Shake"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(
+        default="*.csv;*.json;*.jsonl;*.ndjson;*.chan",
+        options={'HIDDEN'},
+    )
+
+    shake_name: bpy.props.StringProperty(
+        name="Shake Name",
+        description="Name of the new shake type. Defaults to the file name",
+    )
+    source_fps: bpy.props.FloatProperty(
+        name="Capture Frame Rate",
+        description="Frame rate of the capture's frame numbers. Not used for captures with a time column",
+        default=24.0,
+        min=1.0, soft_max=240.0,
+    )
+    target_fps: bpy.props.FloatProperty(
+        name="Shake Frame Rate",
+        description="Frame rate the capture is resampled to. Defaults to the scene's frame rate",
+        default=24.0,
+        min=1.0, soft_max=240.0,
+    )
+    rotation_unit: bpy.props.EnumProperty(
+        name="Rotation Unit",
+        items=[
+            ('DEGREES', "Degrees", ""),
+            ('RADIANS', "Radians", ""),
+        ],
+        default='DEGREES',
+    )
+    location_scale: bpy.props.FloatProperty(
+        name="Location Scale",
+        description="Factor the capture's locations are multiplied by, e.g. to convert them to meters",
+        default=1.0,
+        min=0.0, soft_max=10.0,
+    )
+    detrend: bpy.props.BoolProperty(
+        name="Remove Drift",
+        description="Remove the capture's overall linear motion, leaving just the shake",
+        default=True,
+    )
+    loop_blend_frames: bpy.props.IntProperty(
+        name="Loop Blend Frames",
+        description="How many frames the end of the capture is blended into the start over, to make it loop seamlessly",
+        default=12,
+        min=0, soft_max=96,
+    )
+
+    def invoke(self, context, event):
+        self.target_fps = context.scene.render.fps / context.scene.render.fps_base
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        name = self.shake_name.strip()
+        if name == "":
+            name = bpy.path.display_name_from_filepath(self.filepath)
+        shake_id = IMPORTED_SHAKE_ID_PREFIX + re.sub(r"\W", "_", name).upper()
+        if shake_id in shake_index():
+            self.report({'ERROR'}, "There is already a shake named \"{}\"".format(name))
+            return {'CANCELLED'}
+
+        try:
+            data, sample_count = import_capture(
+                bpy.path.abspath(self.filepath),
+                source_fps=self.source_fps,
+                target_fps=self.target_fps,
+                rotation_unit=self.rotation_unit,
+                location_scale=self.location_scale,
+                detrend=self.detrend,
+                loop_blend_frames=self.loop_blend_frames,
+            )
+            path = os.path.join(imported_shakes_dir(create=True), shake_id.lower() + ".bin")
+            write_shake_file(path, {shake_id: (name, self.target_fps, data)})
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, "Couldn't import camera shake: {}".format(e))
+            return {'CANCELLED'}
+
+        reload_shakes()
+
+        # A shake with the same id may have been imported (and since removed)
+        # before, so make sure its old animation isn't used.
+        clear_shake_animation(shake_index()[shake_id])
+        repair_camera_shakes_globally(context)
+
+        frame_count = len(next(iter(data.values())))
+        self.report({'INFO'}, "Imported shake \"{}\": {} frames from {} capture samples".format(name, frame_count, sample_count))
+        return {'FINISHED'}
+
+
+class CameraShakifyRemoveImportedShake(bpy.types.Operator):
+    """Removes an imported shake type. Cameras in open files that use it keep their shake until it's changed"""
+    bl_idname = "wm.camera_shakify_remove_imported_shake"
+    bl_label = "Remove Imported Shake"
+    bl_options = {'REGISTER'}
+
+    shake_type: bpy.props.EnumProperty(
+        name="Shake",
+        items=imported_shake_type_items,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return len(IMPORTED_SHAKE_TYPE_ITEMS) > 0
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        shake_info = shake_index().get(self.shake_type)
+        if shake_info is None or is_builtin_shake(shake_info):
+            return {'CANCELLED'}
+        try:
+            os.remove(shake_info.path)
+        except OSError as e:
+            self.report({'ERROR'}, "Couldn't remove shake file: {}".format(e))
+            return {'CANCELLED'}
+        reload_shakes()
+        self.report({'INFO'}, "Removed imported shake \"{}\"".format(shake_info.name))
+        return {'FINISHED'}
+
+
+class CameraShakifyWriteShakeLibrary(bpy.types.Operator):
+    """Writes a shake library .blend with the animation of all built-in shakes, for files to link instead of each storing their own copy"""
+    bl_idname = "wm.camera_shakify_write_shake_library"
+    bl_label = "Write Shake Library"
+    bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(
+        default="*.blend",
+        options={'HIDDEN'},
+    )
+
+    def invoke(self, context, event):
+        path = shake_library_path()
+        self.filepath = path if path is not None else "camera_shakify_library.blend"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".blend")
+        try:
+            write_shake_library(path)
+        except OSError as e:
+            self.report({'ERROR'}, "Couldn't write shake library: {}".format(e))
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Wrote shake library to {}".format(path))
+        return {'FINISHED'}
+
+
+class CameraShakifyDecimationReport(bpy.types.Operator):
+    """Writes how many keys decimating each shake with the scene's tolerances keeps, and the resulting error, to a text block"""
+    bl_idname = "wm.camera_shakify_decimation_report"
+    bl_label = "Camera Shakify Decimation Report"
+
+    def execute(self, context):
+        scene = context.scene
+        report = format_decimation_report(
+            ((info.id, get_shake(info.id)[2]) for info in shake_index().values()),
+            scene.camera_shakify_location_tolerance,
+            scene.camera_shakify_rotation_tolerance,
+        )
+        text = bpy.data.texts.get(DECIMATION_REPORT_TEXT_NAME)
+        if text is None:
+            text = bpy.data.texts.new(DECIMATION_REPORT_TEXT_NAME)
+        text.from_string(report)
+        self.report({'INFO'}, "Wrote decimation report to text block \"{}\"".format(text.name))
+        return {'FINISHED'}
+
+
+class CameraShakifyProfilingReport(bpy.types.Operator):
+    """Writes the rig building statistics collected by Camera Shakify's profiling to a text block"""
+    bl_idname = "wm.camera_shakify_profiling_report"
+    bl_label = "Camera Shakify Profiling Report"
+
+    reset: bpy.props.BoolProperty(
+        name="Reset",
+        description="Clear the collected statistics after writing the report",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return profiling.is_enabled()
+
+    def execute(self, context):
+        text = bpy.data.texts.get(PROFILING_REPORT_TEXT_NAME)
+        if text is None:
+            text = bpy.data.texts.new(PROFILING_REPORT_TEXT_NAME)
+        text.from_string(profiling.format_report())
+        if self.reset:
+            profiling.reset()
+        self.report({'INFO'}, "Wrote profiling report to text block \"{}\"".format(text.name))
         return {'FINISHED'}
 
 
@@ -576,7 +2780,27 @@ class CameraShakifyPrepFileForFarm(bpy.types.Operator):
 class CameraShakeInstance(bpy.types.PropertyGroup):
     shake_type: bpy.props.EnumProperty(
         name = "Shake Type",
-        items = [(id, SHAKE_LIST[id][0], "") for id in SHAKE_LIST.keys()],
+        items = shake_type_items,
+        options = set(), # Not animatable.
+        override = set(), # Not library overridable.
+        update = on_shake_type_update,
+    )
+    source: bpy.props.EnumProperty(
+        name = "Source",
+        items = [
+            ('CAPTURE', "Capture", "Play the captured shake, which loops"),
+            ('PROCEDURAL', "Procedural", "Play a shake synthesized to match the captured one, which doesn't visibly repeat"),
+        ],
+        default = 'CAPTURE',
+        options = set(), # Not animatable.
+        override = set(), # Not library overridable.
+        update = on_shake_type_update,
+    )
+    seed: bpy.props.IntProperty(
+        name = "Seed",
+        description = "Seed of the procedural shake. Each seed gives a different variation of the shake",
+        default = 0,
+        min = 0,
         options = set(), # Not animatable.
         override = set(), # Not library overridable.
         update = on_shake_type_update,
@@ -587,6 +2811,15 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=1.0,
         min=0.0, max=INFLUENCE_MAX,
         soft_min=0.0, soft_max=1.0,
+        update=on_shake_parameter_update,
+    )
+    normalize: bpy.props.BoolProperty(
+        name = "Auto-Normalize",
+        description = "Scale the shake so that it's about as intense as the other auto-normalized shakes, whatever its type. Influence and scale still apply on top",
+        default = False,
+        options = set(), # Not animatable.
+        override = set(), # Not library overridable.
+        update = on_shake_type_update,
     )
     scale: bpy.props.FloatProperty(
         name="Scale",
@@ -594,11 +2827,13 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=1.0,
         min=0.0, max=SCALE_MAX,
         soft_min=0.0, soft_max=2.0,
+        update=on_shake_parameter_update,
     )
     use_manual_timing: bpy.props.BoolProperty(
         name="Manual Timing",
         description="Manually animate the progression of time through the camera shake animation",
         default=False,
+        update = on_shake_timing_update,
     )
     time: bpy.props.FloatProperty(
         name="Time",
@@ -606,6 +2841,7 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=0.0,
         precision=1,
         step=100.0,
+        update=on_shake_parameter_update,
     )
     speed: bpy.props.FloatProperty(
         name="Speed",
@@ -613,6 +2849,7 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=1.0,
         soft_min=0.0, soft_max=4.0,
         options = set(), # Not animatable.
+        update = on_shake_timing_update,
     )
     offset: bpy.props.FloatProperty(
         name="Frame Offset",
@@ -620,27 +2857,140 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=0.0,
         precision=1,
         step=100.0,
+        update = on_shake_timing_update,
+    )
+
+
+class CameraShakifyPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    enable_profiling: bpy.props.BoolProperty(
+        name="Enable Profiling",
+        description="Record how long each part of building camera shake rigs takes. Can also be enabled with the " + profiling.ENV_VAR + " environment variable",
+        default=False,
+        update = lambda self, context: update_profiling(),
+    )
+    profiling_log_path: bpy.props.StringProperty(
+        name="Profiling Log File",
+        description="If set, a record of each camera shake rebuild is appended to this file while profiling is enabled",
+        subtype='FILE_PATH',
+        update = lambda self, context: update_profiling(),
     )
 
+    repair_on_load: bpy.props.BoolProperty(
+        name="Repair Camera Shakes on Load",
+        description="When a file is loaded, check that its camera shakes are set up properly, and repair the ones that aren't",
+        default=True,
+    )
+
+    shake_library_path: bpy.props.StringProperty(
+        name="Shake Library",
+        description="A shake library .blend to link shake animation from, instead of storing a copy of it in every file. It must be reachable wherever the files are opened or rendered. Shakes it doesn't have are stored in the files as usual",
+        subtype='FILE_PATH',
+        update = on_shake_library_update,
+    )
+
+    developer_tools: bpy.props.BoolProperty(
+        name="Developer Tools",
+        description="Show tools for creating new shakes for this addon, such as exporting an object's animation as a shake (in the Object menu)",
+        default=False,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "repair_on_load")
+        row = layout.row(align=True)
+        row.prop(self, "shake_library_path")
+        row.operator("wm.camera_shakify_write_shake_library", text="", icon='FILE_TICK')
+        layout.prop(self, "enable_profiling")
+        row = layout.row()
+        row.active = self.enable_profiling
+        row.prop(self, "profiling_log_path")
+        layout.prop(self, "developer_tools")
+
+
+#========================================================
+# Profiling.
+
+PROFILING_REPORT_TEXT_NAME = "Camera Shakify Profile"
+DECIMATION_REPORT_TEXT_NAME = "Camera Shakify Decimation"
+
+# Functions that are timed when profiling is enabled.  See `profiling.py`.
+PROFILED_PHASES = [
+    "ensure_camera_shakify_collection",
+    "ensure_action",
+    "ensure_shake_in_action",
+    "get_shake",
+    "build_single_shake",
+    "build_shake_stack",
+    "ensure_shake_object",
+    "ensure_camera_constraint",
+    "ensure_driver",
+    "sort_shake_constraints",
+    "verify_camera_shakes",
+    "remove_shake_constraints",
+    "remove_shake_object",
+]
+PROFILED_ROOTS = [
+    "repair_camera_shakes_globally",
+    "rebuild_cameras",
+    "rebuild_camera_shakes",
+    "fix_camera_shakes_globally",
+]
+
+
+def addon_preferences():
+    addon = bpy.context.preferences.addons.get(__package__)
+    if addon is None:
+        return None
+    return addon.preferences
+
+
+# Enables or disables profiling according to the environment and the addon
+# preferences.
+def update_profiling():
+    prefs = addon_preferences()
+    enabled = profiling.env_enabled() or (prefs is not None and prefs.enable_profiling)
+    log_path = profiling.env_log_path()
+    if log_path is None and prefs is not None and prefs.profiling_log_path != "":
+        log_path = bpy.path.abspath(prefs.profiling_log_path)
+
+    if enabled:
+        profiling.enable(log_path)
+    else:
+        profiling.disable()
+
 
 #========================================================
 
 
 def register():
+    # Only the shake metadata is loaded here.  The keyframe data of each shake
+    # is loaded on demand when it's actually used.
+    reload_shakes()
+
     bpy.utils.register_class(CameraShakifyPanel)
     bpy.utils.register_class(OBJECT_UL_camera_shake_items)
     bpy.utils.register_class(CameraShakeInstance)
     bpy.utils.register_class(CameraShakeAdd)
     bpy.utils.register_class(CameraShakeRemove)
     bpy.utils.register_class(CameraShakeMove)
+    bpy.utils.register_class(CameraShakesBatchAdd)
+    bpy.utils.register_class(CameraShakesBatchRemove)
+    bpy.utils.register_class(CameraShakesBatchRetype)
+    bpy.utils.register_class(CameraShakesRandomizeOffsets)
     bpy.utils.register_class(CameraShakesFixGlobal)
+    bpy.utils.register_class(CameraShakesBake)
+    bpy.utils.register_class(CameraShakesExportTracks)
     bpy.utils.register_class(CameraShakifyPrepFileForFarm)
-
-    # # Only needed for creating new shakes to add to this addon. Not for end users.
-    # bpy.utils.register_class(ActionToPythonData)
-    # bpy.types.VIEW3D_MT_object.append(
-    #     lambda self, context : self.layout.operator(ActionToPythonData.bl_idname)
-    # )
+    bpy.utils.register_class(CameraShakifyImportCapture)
+    bpy.utils.register_class(CameraShakifyRemoveImportedShake)
+    bpy.utils.register_class(CameraShakifyWriteShakeLibrary)
+    bpy.utils.register_class(CameraShakifyDecimationReport)
+    bpy.utils.register_class(CameraShakifyProfilingReport)
+    bpy.utils.register_class(CameraShakifyPreferences)
+    bpy.utils.register_class(ActionToPythonData)
+    bpy.types.VIEW3D_MT_object.append(draw_action_to_python_data_menu)
 
     # The list of camera shakes active on an camera, along with each shake's parameters.
     bpy.types.Object.camera_shakes = bpy.props.CollectionProperty(type=CameraShakeInstance)
@@ -648,8 +2998,85 @@ def register():
 
     bpy.types.WindowManager.camera_shake_show_utils = bpy.props.BoolProperty(name="Show Camera Shake Utils UI", default=False)
 
+    bpy.types.Scene.camera_shakify_rig_layout = bpy.props.EnumProperty(
+        name="Rig Layout",
+        description="How the shake rigs of cameras are constructed",
+        items=[
+            ('PER_SHAKE', "Per Shake", "One shake empty, and a location and rotation constraint on the camera, for each shake", 0),
+            ('PER_CAMERA', "Per Camera", "A single shake empty that evaluates all of a camera's shakes, and a single location and rotation constraint on the camera. Scales better for cameras with many shakes", 1),
+            ('CACHED', "Driver-Free", "No shake empties, constraints, or drivers: the addon computes each camera's shake offset, caches it per frame, and writes it to the camera's delta transforms. Fastest for playback and scrubbing, but needs the addon (or a bake) to render", 2),
+        ],
+        default='PER_SHAKE',
+        options = set(), # Not animatable.
+        update = on_rig_settings_update,
+    )
+    bpy.types.Scene.camera_shakify_share_empties = bpy.props.BoolProperty(
+        name="Share Shake Empties",
+        description="Use a single shake empty for identical shakes (same type, speed, and frame offset) on different cameras, instead of one per camera. Only used with the Per Shake rig layout. Shakes with manual or animated timing are never shared",
+        default=False,
+        options = set(), # Not animatable.
+        update = on_rig_settings_update,
+    )
+    bpy.types.Scene.camera_shakify_decimate = bpy.props.BoolProperty(
+        name="Decimate Shake Curves",
+        description="Store shakes with as few keyframes as stay within the tolerances below, instead of a keyframe on every frame. Makes files smaller and shakes faster to evaluate",
+        default=False,
+        options = set(), # Not animatable.
+        update = on_decimation_update,
+    )
+    bpy.types.Scene.camera_shakify_location_tolerance = bpy.props.FloatProperty(
+        name="Location Tolerance",
+        description="How far decimated shakes may deviate from the original shake's location, at full influence and scale",
+        default=DEFAULT_LOCATION_TOLERANCE,
+        min=0.0, soft_max=0.01,
+        precision=5,
+        step=0.01,
+        subtype='DISTANCE',
+        options = set(), # Not animatable.
+        update = on_decimation_update,
+    )
+    bpy.types.Scene.camera_shakify_rotation_tolerance = bpy.props.FloatProperty(
+        name="Rotation Tolerance",
+        description="How far decimated shakes may deviate from the original shake's rotation, at full influence",
+        default=DEFAULT_ROTATION_TOLERANCE,
+        min=0.0, soft_max=math.radians(0.5),
+        precision=4,
+        step=0.01,
+        subtype='ANGLE',
+        options = set(), # Not animatable.
+        update = on_decimation_update,
+    )
+
+    profiling.set_targets(globals(), PROFILED_PHASES, PROFILED_ROOTS)
+    update_profiling()
+
+    bpy.app.handlers.load_post.append(repair_camera_shakes_on_load)
+    bpy.app.handlers.depsgraph_update_post.append(update_rigs_for_scene_settings)
+    bpy.app.handlers.frame_change_pre.append(apply_cached_shakes)
+    bpy.app.handlers.save_pre.append(reset_cached_shakes_for_save)
+    bpy.app.handlers.save_post.append(reapply_cached_shakes_after_save)
+
 
 def unregister():
+    if repair_camera_shakes_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(repair_camera_shakes_on_load)
+    if update_rigs_for_scene_settings in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(update_rigs_for_scene_settings)
+    if apply_cached_shakes in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.remove(apply_cached_shakes)
+    if reset_cached_shakes_for_save in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(reset_cached_shakes_for_save)
+    if reapply_cached_shakes_after_save in bpy.app.handlers.save_post:
+        bpy.app.handlers.save_post.remove(reapply_cached_shakes_after_save)
+    if bpy.app.timers.is_registered(deferred_repair):
+        bpy.app.timers.unregister(deferred_repair)
+    profiling.disable()
+
+    del bpy.types.Scene.camera_shakify_rotation_tolerance
+    del bpy.types.Scene.camera_shakify_location_tolerance
+    del bpy.types.Scene.camera_shakify_decimate
+    del bpy.types.Scene.camera_shakify_share_empties
+    del bpy.types.Scene.camera_shakify_rig_layout
     del bpy.types.Object.camera_shakes
     del bpy.types.Object.camera_shakes_active_index
 
@@ -659,10 +3086,25 @@ def unregister():
     bpy.utils.unregister_class(CameraShakeAdd)
     bpy.utils.unregister_class(CameraShakeRemove)
     bpy.utils.unregister_class(CameraShakeMove)
+    bpy.utils.unregister_class(CameraShakesBatchAdd)
+    bpy.utils.unregister_class(CameraShakesBatchRemove)
+    bpy.utils.unregister_class(CameraShakesBatchRetype)
+    bpy.utils.unregister_class(CameraShakesRandomizeOffsets)
     bpy.utils.unregister_class(CameraShakesFixGlobal)
+    bpy.utils.unregister_class(CameraShakesBake)
+    bpy.utils.unregister_class(CameraShakesExportTracks)
     bpy.utils.unregister_class(CameraShakifyPrepFileForFarm)
-
-    #bpy.utils.unregister_class(ActionToPythonData)
+    bpy.utils.unregister_class(CameraShakifyImportCapture)
+    bpy.utils.unregister_class(CameraShakifyRemoveImportedShake)
+    bpy.utils.unregister_class(CameraShakifyWriteShakeLibrary)
+    bpy.utils.unregister_class(CameraShakifyDecimationReport)
+    bpy.utils.unregister_class(CameraShakifyProfilingReport)
+    bpy.utils.unregister_class(CameraShakifyPreferences)
+    bpy.types.VIEW3D_MT_object.remove(draw_action_to_python_data_menu)
+    bpy.utils.unregister_class(ActionToPythonData)
+
+    clear_shake_cache()
+    clear_transform_caches()
 
 
 if __name__ == "__main__":
@@ -19,43 +19,27 @@
 import math
 
 import bpy
+import numpy as np
 from bpy.types import Action, ActionSlot, Context
 
+from . import shake_data
+from .decimate import decimate_shake
+
+
+# Raw enum values of keyframe properties, as needed by `foreach_set()`.
+INTERPOLATION_BEZIER = 2 # BEZT_IPO_BEZ
+HANDLE_TYPE_AUTO = 1 # HD_AUTO
+HANDLE_TYPE_AUTO_CLAMPED = 4 # HD_AUTO_ANIM
 
-# TODO: update this function to work with slotted actions.  This is only used
-# when exporting actions as new shakes, and is never run for end users, so I've
-# left it as-is for now.  We can update it when we actually need to use it.
-def action_to_python_data_text(act: Action, text_block_name):
-    channels = {}
-    act_range = action_frame_range(act)
-    for curve in act.fcurves:
-        baked_keys = []
-        for frame in range(int(act_range[0]), int(act_range[1]) + 1):
-            baked_keys += [(frame, curve.evaluate(frame))]
-        channels[(curve.data_path, curve.array_index)] = baked_keys
-
-    text = "{\n"
-    for k in channels:
-        text += "  {}: [".format(k)
-        for point in channels[k]:
-            text += "({}, {:.6f}), ".format(point[0], point[1])
-        text += "],\n"
-    text += "}\n"
-    
-    return bpy.data.texts.new(text_block_name).from_string(text)
 
 # Ensure that an Action with the given name exists, and that it has a layer and
 # a keyframe strip.
 def ensure_action(action_name) -> Action:
     # Ensure the action exists.
     #
-    # The song-and-dance here is to make sure we get a *local* action, not a
-    # library-linked action.
-    action = None
-    for act in bpy.data.actions:
-        if act.name == action_name and act.library == None:
-            action = act
-            break
+    # Looking it up with a `None` library makes sure we get a *local* action,
+    # not a library-linked action.
+    action = bpy.data.actions.get((action_name, None))
     if action == None:
         action = bpy.data.actions.new(action_name)
         action.use_fake_user = False
@@ -77,13 +61,22 @@ def ensure_action(action_name) -> Action:
 
 # Ensures that a shake with the given name exists as a slot in the given action.
 #
-# If it doesn't exist, it will be created from the passed `data`.
+# If it doesn't exist, it will be created from the data returned by `get_data`,
+# which is only called in that case.  This lets callers avoid loading the
+# shake's keyframe data when it's already in the action.
 #
 # rot_factor and loc_factor are scaling factors for rotation and location
-# values, respectively.
+# values, respectively.  If `data_path_prefix` is given, only the channels whose
+# data path starts with it are included (e.g. "location" for a location-only
+# slot).
+#
+# If `decimation` is given, it's a (location tolerance, rotation tolerance)
+# pair, and each channel is reduced to as few keys as stay within that
+# tolerance of the shake data (see `decimate.py`).  The tolerances are in the
+# units of the shake data, i.e. before `loc_factor` and `rot_factor`.
 #
 # Returns the slot in the action corresponding to the shake.
-def ensure_shake_in_action(shake_name, action: Action, data, rot_factor=1.0, loc_factor=1.0) -> ActionSlot:
+def ensure_shake_in_action(shake_name, action: Action, get_data, rot_factor=1.0, loc_factor=1.0, data_path_prefix="", decimation=None) -> ActionSlot:
     slot_identifier = "OB" + shake_name
 
     # Ensure a slot for the shake exists.
@@ -99,38 +92,263 @@ def ensure_shake_in_action(shake_name, action: Action, data, rot_factor=1.0, loc
         return slot
 
     # Create channelbag and fill it in with the shake data.
+    #
+    # The keyframes are written with bulk `foreach_set()` calls rather than
+    # one point at a time, which is dramatically faster for shakes with
+    # many keyframes.
+    data = {k: v for k, v in get_data().items() if k[0].startswith(data_path_prefix)}
+    if decimation is not None:
+        data, _ = decimate_shake(data, decimation[0], decimation[1])
     channelbag = action.layers[0].strips[0].channelbags.new(slot)
     for k in data:
+        co = np.array(data[k], dtype=np.float64)
+        if k[0].startswith("rotation"):
+            co[:, 1] *= rot_factor
+        if k[0].startswith("location"):
+            co[:, 1] *= loc_factor
+        co[-1, 1] = co[0, 1] # Ensure looping.
+
         curve = channelbag.fcurves.new(k[0], index=k[1])
-        curve.keyframe_points.add(len(data[k]))
-        for i in range(len(data[k])):
-            co = [data[k][i][0], data[k][i][1]]
-            if k[0].startswith("rotation"):
-                co[1] *= rot_factor
-            if k[0].startswith("location"):
-                co[1] *= loc_factor
-
-            curve.keyframe_points[i].co = co
-            curve.keyframe_points[i].handle_left_type = 'AUTO'
-            curve.keyframe_points[i].handle_right_type = 'AUTO'
-        curve.keyframe_points[-1].co[1] = curve.keyframe_points[0].co[1] # Ensure looping.
+        # Don't depend on the user's preferences for new curves, so that the
+        # handles (and thus the shake) are the same everywhere.
+        curve.auto_smoothing = 'NONE'
+        set_fcurve_keyframes(curve, co, HANDLE_TYPE_AUTO)
         curve.modifiers.new('CYCLES')
         curve.update()
 
     return slot
 
 
-def action_slot_frame_range(action: Action, slot: ActionSlot):
-    channelbag = action.layers[0].strips[0].channelbag(slot)
+# Like `ensure_shake_in_action()`, but for a procedural shake (see
+# `spectral.py`).
+#
+# `get_channels` returns the synthesized channels, as returned by
+# `spectral.synthesize()`.  Each channel becomes an F-curve holding the
+# channel's mean from frame 0 to `period`, with an additive sine generator
+# modifier per sinusoid, so the shake is evaluated directly rather than from
+# keys.
+def ensure_procedural_shake_in_action(shake_name, action: Action, get_channels, period, rot_factor=1.0, loc_factor=1.0, data_path_prefix="") -> ActionSlot:
+    slot_identifier = "OB" + shake_name
+
+    if slot_identifier in action.slots:
+        slot = action.slots[slot_identifier]
+    else:
+        slot = action.slots.new('OBJECT', shake_name)
+    assert(slot.identifier == slot_identifier)
+
+    if action.layers[0].strips[0].channelbag(slot) != None:
+        return slot
+
+    channels = {k: v for k, v in get_channels().items() if k[0].startswith(data_path_prefix)}
+    channelbag = action.layers[0].strips[0].channelbags.new(slot)
+    for k, (mean, components) in channels.items():
+        factor = 1.0
+        if k[0].startswith("rotation"):
+            factor = rot_factor
+        if k[0].startswith("location"):
+            factor = loc_factor
+
+        curve = channelbag.fcurves.new(k[0], index=k[1])
+        curve.auto_smoothing = 'NONE'
+        set_fcurve_keyframes(curve, [(0.0, mean * factor), (float(period), mean * factor)], HANDLE_TYPE_AUTO)
+        for amplitude, frequency, phase in components:
+            mod = curve.modifiers.new('FNGENERATOR')
+            mod.function_type = 'SIN'
+            mod.use_additive = True
+            mod.amplitude = amplitude * factor
+            mod.phase_multiplier = frequency
+            mod.phase_offset = phase
+            mod.value_offset = 0.0
+        curve.update()
+
+    return slot
+
+
+# Replaces all keyframes of an F-curve with Bezier keyframes at the given
+# points, using bulk writes.
+#
+# `co` is an (N, 2) array of (frame, value) pairs, and `handle_type` is one of
+# the raw HANDLE_TYPE_* values above.
+#
+# Note: this doesn't call `fcurve.update()`, so that callers can make further
+# changes first.
+def set_fcurve_keyframes(fcurve, co, handle_type=HANDLE_TYPE_AUTO_CLAMPED):
+    co = np.asarray(co, dtype=np.float64)
+    point_count = len(co)
+
+    fcurve.keyframe_points.clear()
+    fcurve.keyframe_points.add(point_count)
+    fcurve.keyframe_points.foreach_set("co", co.astype(np.float32).ravel())
+    fcurve.keyframe_points.foreach_set("interpolation", np.full(point_count, INTERPOLATION_BEZIER, dtype=np.int32))
+    fcurve.keyframe_points.foreach_set("handle_left_type", np.full(point_count, handle_type, dtype=np.int32))
+    fcurve.keyframe_points.foreach_set("handle_right_type", np.full(point_count, handle_type, dtype=np.int32))
+
+
+# Keyframe properties kept by `replace_fcurve_keyframes()`, as
+# (name, dtype, values per keyframe).
+KEYFRAME_PROPERTIES = [
+    ("co", np.float32, 2),
+    ("handle_left", np.float32, 2),
+    ("handle_right", np.float32, 2),
+    ("interpolation", np.int32, 1),
+    ("handle_left_type", np.int32, 1),
+    ("handle_right_type", np.int32, 1),
+    ("easing", np.int32, 1),
+    ("type", np.int32, 1),
+    ("back", np.float32, 1),
+    ("amplitude", np.float32, 1),
+    ("period", np.float32, 1),
+]
+
+
+def _get_keyframe_properties(points):
+    properties = {}
+    for name, dtype, size in KEYFRAME_PROPERTIES:
+        values = np.empty(len(points) * size, dtype=dtype)
+        points.foreach_get(name, values)
+        properties[name] = values.reshape(len(points), size)
+    return properties
+
+
+# Like `set_fcurve_keyframes()`, but only replaces the keyframes within the
+# frame range of `co` (inclusive), keeping the ones before and after it as
+# they are.  `co` must be sorted by frame.
+#
+# Note: this doesn't call `fcurve.update()` either.
+def replace_fcurve_keyframes(fcurve, co, handle_type=HANDLE_TYPE_AUTO_CLAMPED):
+    co = np.asarray(co, dtype=np.float64)
+    points = fcurve.keyframe_points
+    if len(points) == 0:
+        set_fcurve_keyframes(fcurve, co, handle_type)
+        return
+
+    # Keyframe frames are stored in single precision, so compare in that.
+    old = _get_keyframe_properties(points)
+    frame_start = np.float32(co[0, 0])
+    frame_end = np.float32(co[-1, 0])
+    keep = (old["co"][:, 0] < frame_start) | (old["co"][:, 0] > frame_end)
+    kept = {name: values[keep] for name, values in old.items()}
+
+    # Newly added keyframes get Blender's defaults for everything that isn't
+    # set explicitly below.
+    points.clear()
+    points.add(len(kept["co"]) + len(co))
+    added = {name: values[:len(co)] for name, values in _get_keyframe_properties(points).items()}
+    added["co"][:] = co.astype(np.float32)
+    added["handle_left"][:] = added["co"]
+    added["handle_right"][:] = added["co"]
+    added["interpolation"][:] = INTERPOLATION_BEZIER
+    added["handle_left_type"][:] = handle_type
+    added["handle_right_type"][:] = handle_type
+
+    order = np.argsort(np.concatenate([kept["co"][:, 0], added["co"][:, 0]]), kind='stable')
+    for name, _, _ in KEYFRAME_PROPERTIES:
+        values = np.concatenate([kept[name], added[name]])[order]
+        points.foreach_set(name, values.ravel())
+
+
+# Finds the F-curve animating the given property of an ID in its assigned
+# action slot, if any.
+def find_id_fcurve(id, data_path, index=0):
+    anim_data = id.animation_data
+    if anim_data is None or anim_data.action is None or anim_data.action_slot is None:
+        return None
+    for layer in anim_data.action.layers:
+        for strip in layer.strips:
+            channelbag = strip.channelbag(anim_data.action_slot)
+            if channelbag is None:
+                continue
+            fcurve = channelbag.fcurves.find(data_path, index=index)
+            if fcurve is not None:
+                return fcurve
+    return None
+
+
+# Ensures that an F-curve exists for the given property of an ID, creating an
+# action and slot for the ID if needed.
+def ensure_id_fcurve(id, data_path, index=0):
+    anim_data = id.animation_data
+    if anim_data is None:
+        anim_data = id.animation_data_create()
+    if anim_data.action is None:
+        anim_data.action = bpy.data.actions.new(id.name + "Action")
+    return anim_data.action.fcurve_ensure_for_datablock(id, data_path, index=index)
 
-    r = [9999999999, -9999999999]
-    for curve in channelbag.fcurves:
-        cr = curve.range()
-        r[0] = min(r[0], cr[0])
-        r[1] = max(r[1], cr[1])
 
-    # Ensure integer values.
-    r[0] = math.floor(r[0])
-    r[1] = math.ceil(r[1])
+#========================================================
+# Exporting actions as new shakes.
+#
+# Only needed for creating new shakes to add to this addon.  Not for end users.
+
+
+# Samples every F-curve of an action slot at each integer frame from
+# `frame_range[0]` to `frame_range[1]` inclusive.  If `frame_range` is None,
+# the frame range of the slot's keyframes is used.
+#
+# Returns `(frame_start, channels)`, where `channels` is a list of
+# `((data_path, array_index), values)` with `values` a float64 array of one
+# value per frame.
+#
+# Captured shakes are typically keyed on every frame, so curves that have
+# exactly one keyframe per frame of the range and no modifiers are read with a
+# single bulk `foreach_get()`.  Only other curves are evaluated frame by frame.
+def sample_action_slot(action: Action, slot: ActionSlot, frame_range=None):
+    curves = []
+    for layer in action.layers:
+        for strip in layer.strips:
+            channelbag = strip.channelbag(slot)
+            if channelbag is not None:
+                curves += list(channelbag.fcurves)
+    if len(curves) == 0:
+        raise ValueError("Action slot '{}' has no animation".format(slot.identifier))
+
+    if frame_range is None:
+        frame_range = (
+            math.floor(min(curve.range()[0] for curve in curves)),
+            math.ceil(max(curve.range()[1] for curve in curves)),
+        )
+    frame_start = int(frame_range[0])
+    frames = np.arange(frame_start, int(frame_range[1]) + 1, dtype=np.float64)
+
+    channels = []
+    for curve in sorted(curves, key=lambda c: (c.data_path, c.array_index)):
+        point_count = len(curve.keyframe_points)
+        co = np.empty(point_count * 2, dtype=np.float32)
+        curve.keyframe_points.foreach_get("co", co)
+        co = co.reshape((point_count, 2)).astype(np.float64)
 
-    return r
+        if len(curve.modifiers) == 0 and point_count == len(frames) and np.array_equal(co[:, 0], frames):
+            values = co[:, 1]
+        else:
+            values = np.array([curve.evaluate(frame) for frame in frames], dtype=np.float64)
+        channels += [((curve.data_path, curve.array_index), values)]
+
+    return (frame_start, channels)
+
+
+# Writes a shake as an entry of the `SHAKE_LIST` literal in
+# `dev/shake_data_src.py`, to `f`, which can be a file object or a text block.
+#
+# The output is written one channel at a time, so even shakes with thousands of
+# frames never need to be assembled into one big string.
+def write_shake_literal(f, shake_id, name, fps, frame_start, channels):
+    f.write("    {}: ({}, {}, {{\n".format(repr(shake_id), repr(name), float(fps)))
+    for (data_path, array_index), values in channels:
+        points = ", ".join(
+            "({}, {:.6f})".format(frame_start + i, value) for i, value in enumerate(values)
+        )
+        f.write("        {}: [{}],\n".format(repr((data_path, array_index)), points))
+    f.write("    }),\n")
+
+
+# Writes a shake to a packed shake file, in the same format as the addon's
+# `shake_data.bin` (see `shake_data.py`).
+#
+# Values are rounded to six decimal places, the same as the literal format, so
+# that they can usually be stored as fixed point.
+def write_shake_binary(path, shake_id, name, fps, frame_start, channels):
+    data = {}
+    for channel, values in channels:
+        values = np.round(values, 6)
+        data[channel] = [(frame_start + i, float(value)) for i, value in enumerate(values)]
+    shake_data.write_shake_file(path, {shake_id: (name, float(fps), data)})
@@ -0,0 +1,327 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Baking of camera shakes into plain location/rotation keyframes.
+#
+# Rather than stepping the scene through the shake rig frame by frame, this
+# evaluates the shakes directly with `shake_eval` and combines them with the
+# camera's own (F-curve) animation, then writes the result with bulk F-curve
+# writes.
+#
+# Note: the camera's own transform is taken from its action's F-curves (or its
+# static values where there are none).  Drivers and NLA tracks on the camera's
+# transform aren't taken into account.
+#
+# Also, the baked shake becomes part of the camera's own transform, which is
+# applied before the camera's other constraints, whereas the shake rigs apply
+# the shake after them.  So on cameras with other constraints (e.g. Track To,
+# Damped Track, or Child Of), the baked shake can be changed or cancelled out
+# by those constraints.  The bake operator warns about such cameras.
+
+import numpy as np
+
+from .action_utils import find_id_fcurve, ensure_id_fcurve, replace_fcurve_keyframes
+from .shake_data import shake_index, get_shake
+from . import parallel_eval
+from . import shake_eval
+from . import shake_stats
+from . import spectral
+
+# Properties of `CameraShakeInstance` that can be animated, and thus need to be
+# sampled per frame rather than read once.
+ANIMATABLE_SHAKE_PROPERTIES = ["influence", "scale", "use_manual_timing", "time", "offset"]
+
+EULER_ROTATION_MODES = {'XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX'}
+
+
+# Returns the frames to sample for a bake of the given (inclusive) frame
+# range, with `samples_per_frame` evenly spaced samples per frame.
+def bake_frames(frame_start, frame_end, samples_per_frame=1):
+    count = (frame_end - frame_start) * samples_per_frame + 1
+    return frame_start + np.arange(count, dtype=np.float64) / samples_per_frame
+
+
+# Samples a (possibly animated) property of an ID at the given frames.
+#
+# `value` is the property's current static value, used when it isn't animated.
+def sample_id_property(id, data_path, index, frames, value):
+    fcurve = find_id_fcurve(id, data_path, index)
+    if fcurve is None:
+        return np.full(len(frames), float(value))
+    return np.array([fcurve.evaluate(frame) for frame in frames], dtype=np.float64)
+
+
+# The key identifying what a shake item plays, as used for `prepared` dicts:
+# the shake type for captured shakes, and (shake type, seed) for procedural
+# ones.
+def shake_key(shake):
+    if spectral.is_procedural(shake):
+        return (shake.shake_type, shake.seed)
+    return shake.shake_type
+
+
+# Returns the prepared shake for a key returned by `shake_key()`.
+def prepare_shake_key(key):
+    if isinstance(key, tuple):
+        return spectral.ProceduralShake(spectral.spectra()[key[0]], key[1])
+    return shake_eval.prepare_shake(get_shake(key))
+
+
+# Returns the factor a shake item's influence is scaled by: 1.0, unless the
+# item is auto-normalized, in which case it's the factor that brings its shake
+# type to the reference intensity (see `shake_stats.py`).
+def shake_normalization(shake):
+    if not shake.normalize or shake.shake_type not in shake_index():
+        return 1.0
+    stats = shake_stats.shake_stats(shake.shake_type, lambda: get_shake(shake.shake_type))
+    return shake_stats.normalization(stats)
+
+
+# Samples the parameters of each of a camera's shakes at the given frames.
+#
+# Returns a list of (shake key, parameters) tuples, where the shake key is as
+# returned by `shake_key()`, and `parameters` are the keyword arguments for
+# `shake_eval.evaluate_shake()`.  Shakes whose type isn't available are
+# skipped.
+def camera_shake_parameters(camera, frames):
+    index = shake_index()
+    shakes = []
+    for i, shake in enumerate(camera.camera_shakes):
+        if shake.shake_type not in index:
+            continue
+        params = {"speed": shake.speed}
+        for name in ANIMATABLE_SHAKE_PROPERTIES:
+            data_path = "camera_shakes[{}].{}".format(i, name)
+            params[name] = sample_id_property(camera, data_path, 0, frames, getattr(shake, name))
+        params["use_manual_timing"] = params["use_manual_timing"] > 0.5
+        params["influence"] = params["influence"] * shake_normalization(shake)
+        shakes += [(shake_key(shake), params)]
+    return shakes
+
+
+# Evaluates the combined offsets of all of a camera's shakes at the given
+# frames.
+#
+# `prepared` is an optional dict of shake key (see `shake_key()`) ->
+# prepared shake, used to avoid re-preparing the same shakes for many cameras.
+#
+# Returns (location, rotation) as in `shake_eval.combine_shakes()`.
+def evaluate_camera_shakes(camera, scene, frames, prepared=None):
+    if prepared is None:
+        prepared = {}
+    scene_fps = scene.render.fps / scene.render.fps_base
+    unit_scale = scene.unit_settings.scale_length
+
+    results = []
+    for key, params in camera_shake_parameters(camera, frames):
+        if key not in prepared:
+            prepared[key] = prepare_shake_key(key)
+        results += [shake_eval.evaluate_shake(
+            prepared[key],
+            frames,
+            scene_fps=scene_fps,
+            unit_scale=unit_scale,
+            **params,
+        )]
+    return shake_eval.combine_shakes(results, count=len(frames))
+
+
+# Returns what's needed to prepare the shake with the given key (see
+# `shake_key()`) outside of Blender, in a picklable form.
+def shake_source(key):
+    if isinstance(key, tuple):
+        return ('PROCEDURAL', spectral.spectra()[key[0]].to_dict(), key[1])
+    return ('CAPTURE', get_shake(key))
+
+
+# Samples an object's own (un-shaken) location and rotation at the given frames.
+#
+# Returns (location, rotation), with `rotation` as an (N, 4) array of
+# quaternions, plus the raw sampled rotation channels in the object's rotation
+# mode.
+def object_base_transform(obj, frames):
+    loc = np.stack([
+        sample_id_property(obj, "location", i, frames, obj.location[i]) for i in range(3)
+    ], axis=-1)
+
+    mode = obj.rotation_mode
+    if mode in EULER_ROTATION_MODES:
+        raw = np.stack([
+            sample_id_property(obj, "rotation_euler", i, frames, obj.rotation_euler[i]) for i in range(3)
+        ], axis=-1)
+        quat = shake_eval.euler_to_quat(raw, mode)
+    elif mode == 'QUATERNION':
+        raw = np.stack([
+            sample_id_property(obj, "rotation_quaternion", i, frames, obj.rotation_quaternion[i]) for i in range(4)
+        ], axis=-1)
+        quat = raw / np.linalg.norm(raw, axis=-1, keepdims=True)
+    else:
+        raw = np.stack([
+            sample_id_property(obj, "rotation_axis_angle", i, frames, obj.rotation_axis_angle[i]) for i in range(4)
+        ], axis=-1)
+        quat = _axis_angle_to_quat(raw)
+
+    return loc, quat, raw
+
+
+# Samples an object's delta rotation at the given frames, as an (N, 4) array
+# of quaternions.  Like Blender, this uses the delta rotation of the object's
+# rotation mode, and none for axis-angle rotations.
+def object_delta_rotation(obj, frames):
+    mode = obj.rotation_mode
+    if mode in EULER_ROTATION_MODES:
+        raw = np.stack([
+            sample_id_property(obj, "delta_rotation_euler", i, frames, obj.delta_rotation_euler[i]) for i in range(3)
+        ], axis=-1)
+        return shake_eval.euler_to_quat(raw, mode)
+    if mode == 'QUATERNION':
+        raw = np.stack([
+            sample_id_property(obj, "delta_rotation_quaternion", i, frames, obj.delta_rotation_quaternion[i]) for i in range(4)
+        ], axis=-1)
+        return raw / np.linalg.norm(raw, axis=-1, keepdims=True)
+    quat = np.zeros((len(frames), 4))
+    quat[:, 0] = 1.0
+    return quat
+
+
+# Brings shake location offsets, as returned by `shake_eval.evaluate_shake()`,
+# into the space of an object's `location`.  For objects with a parent they
+# already are, but for objects without one, the shake rigs rotate them by the
+# object's delta rotation and rotation (`quat`, sampled at `frames`).
+def shake_location_in_object_space(obj, frames, shake_loc, quat):
+    if obj.parent is not None:
+        return shake_loc
+    matrix = shake_eval.quat_to_matrix(shake_eval.quat_multiply(object_delta_rotation(obj, frames), quat))
+    return np.einsum('nij,nj->ni', matrix, shake_loc)
+
+
+# Bakes the combined shakes of `source` (a camera object with shakes) together
+# with its own animation into location/rotation keyframes on `target`, at the
+# given frames.  `target` may be `source` itself.
+#
+# Only the keyframes within the range of `frames` are replaced, and those
+# before and after it are kept.  The delta rotation is taken from `target`,
+# whose delta transforms must be the object's own (see
+# `transform_cache.restore_base_delta()`).
+#
+# Note: this only writes keyframes.  Removing the shake rig, if desired, is up
+# to the caller.
+def bake_camera_shakes(source, target, scene, frames, prepared=None):
+    frames = np.asarray(frames, dtype=np.float64)
+    shake_loc, shake_quat = evaluate_camera_shakes(source, scene, frames, prepared)
+    write_shaken_transform(source, target, frames, shake_loc, shake_quat)
+
+
+# Like `bake_camera_shakes()`, but for many cameras at once, with the shakes
+# evaluated across `jobs` worker processes (None for one per CPU).
+#
+# `pairs` is a list of (source, target) camera objects.  The shake parameters
+# of all cameras are sampled up-front, and the results are written back once
+# all of them have been evaluated.
+def bake_many_camera_shakes(pairs, scene, frames, jobs=None):
+    frames = np.asarray(frames, dtype=np.float64)
+    scene_fps = scene.render.fps / scene.render.fps_base
+    unit_scale = scene.unit_settings.scale_length
+
+    cameras = []
+    sources = {}
+    for source, _ in pairs:
+        shakes = camera_shake_parameters(source, frames)
+        for key, _ in shakes:
+            if key not in sources:
+                sources[key] = shake_source(key)
+        cameras += [(shakes, scene_fps, unit_scale)]
+
+    results = parallel_eval.evaluate_cameras(cameras, frames, sources, jobs)
+    for (source, target), (shake_loc, shake_quat) in zip(pairs, results):
+        write_shaken_transform(source, target, frames, shake_loc, shake_quat)
+
+
+# Combines already-evaluated shake offsets with `source`'s own animation, and
+# writes the result as keyframes on `target`.
+def write_shaken_transform(source, target, frames, shake_loc, shake_quat):
+    base_loc, base_quat, raw_rot = object_base_transform(source, frames)
+    loc = base_loc + shake_location_in_object_space(target, frames, shake_loc, base_quat)
+    quat = shake_eval.quat_multiply(base_quat, shake_quat)
+
+    # Compute everything before writing anything, since `target` may be the
+    # same object we sampled from.
+    channels = [("location", i, loc[:, i]) for i in range(3)]
+    mode = source.rotation_mode
+    if mode in EULER_ROTATION_MODES:
+        euler = shake_eval.quat_to_euler(quat, mode, compat=raw_rot)
+        channels += [("rotation_euler", i, euler[:, i]) for i in range(3)]
+    elif mode == 'QUATERNION':
+        # Keep the original quaternion length and hemisphere, to keep the
+        # curves continuous.
+        quat = quat * np.linalg.norm(raw_rot, axis=-1, keepdims=True)
+        flip = np.sum(quat * raw_rot, axis=-1) < 0.0
+        quat[flip] *= -1.0
+        channels += [("rotation_quaternion", i, quat[:, i]) for i in range(4)]
+    else:
+        axis_angle = _quat_to_axis_angle(quat, raw_rot)
+        channels += [("rotation_axis_angle", i, axis_angle[:, i]) for i in range(4)]
+
+    target.rotation_mode = mode
+    for data_path, index, values in channels:
+        fcurve = ensure_id_fcurve(target, data_path, index)
+        replace_fcurve_keyframes(fcurve, np.stack([frames, values], axis=-1))
+        fcurve.update()
+
+
+# Removes all F-curves animating `camera_shakes` properties of an object.
+def remove_shake_property_fcurves(obj):
+    anim_data = obj.animation_data
+    if anim_data is None or anim_data.action is None or anim_data.action_slot is None:
+        return
+    for layer in anim_data.action.layers:
+        for strip in layer.strips:
+            channelbag = strip.channelbag(anim_data.action_slot)
+            if channelbag is None:
+                continue
+            remove_list = [fcurve for fcurve in channelbag.fcurves if fcurve.data_path.startswith("camera_shakes[")]
+            for fcurve in remove_list:
+                channelbag.fcurves.remove(fcurve)
+
+
+def _axis_angle_to_quat(axis_angle):
+    angle = axis_angle[:, 0]
+    axis = axis_angle[:, 1:]
+    norm = np.linalg.norm(axis, axis=-1, keepdims=True)
+    axis = np.where(norm > 0.0, axis / np.where(norm > 0.0, norm, 1.0), np.array([0.0, 1.0, 0.0]))
+    quat = np.empty((len(axis_angle), 4))
+    quat[:, 0] = np.cos(angle * 0.5)
+    quat[:, 1:] = axis * np.sin(angle * 0.5)[:, None]
+    return quat
+
+
+def _quat_to_axis_angle(quat, compat):
+    quat = quat / np.linalg.norm(quat, axis=-1, keepdims=True)
+    angle = 2.0 * np.arccos(np.clip(quat[:, 0], -1.0, 1.0))
+    sin_half = np.sqrt(np.maximum(1.0 - quat[:, 0] ** 2, 0.0))
+    axis = np.where(
+        (sin_half > 1e-12)[:, None],
+        quat[:, 1:] / np.where(sin_half > 1e-12, sin_half, 1.0)[:, None],
+        compat[:, 1:],
+    )
+    # Prefer the representation whose axis points the same way as the
+    # original one.
+    flip = np.sum(axis * compat[:, 1:], axis=-1) < 0.0
+    axis[flip] *= -1.0
+    angle[flip] *= -1.0
+    return np.concatenate([angle[:, None], axis], axis=-1)
@@ -0,0 +1,386 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Importing of tracked camera motion captures as new shakes.
+#
+# Supported formats:
+#
+# - CSV, with a header row naming the columns.
+# - JSON, either as an array of objects or as one object per line (JSON
+#   Lines), with the same names as keys.
+# - Nuke `.chan` files: whitespace separated "frame tx ty tz rx ry rz", with
+#   any further columns (e.g. field of view) ignored.
+#
+# Recognized CSV column and JSON key names (case-insensitive) are "frame" or
+# "time" (in seconds), "tx"/"ty"/"tz" or "location_x" etc. for location, and
+# "rx"/"ry"/"rz" or "rotation_x" etc. for rotation.  Other columns are ignored.
+# Without a frame or time column, rows are taken to be consecutive frames.
+#
+# Captures are read as a stream: rows are resampled to the target frame rate
+# as they're read, and only the resampled values are kept, in compact arrays.
+# The length of a capture is also capped (see `MAX_FRAMES`), so memory use
+# stays bounded however long the capture file is.
+#
+# The resampled motion is then turned into a shake:
+#
+# - Linear drift (e.g. the camera slowly moving across the set) is removed,
+#   leaving just the shake around zero.
+# - The end is cross-faded into the start, so the shake loops seamlessly.
+# - Rotations are converted to radians and locations scaled, giving the
+#   `location` and `rotation_euler` channels used by the built-in shakes.
+#   Rotation order is ignored, which is fine for the small angles of a shake.
+#
+# Note: this module intentionally doesn't depend on bpy.
+
+import csv
+import json
+import math
+import os
+from array import array
+
+import numpy as np
+
+# The longest capture (in frames at the target frame rate) that is imported.
+# Anything beyond it is ignored.
+MAX_FRAMES = 100000
+
+# Size of the chunks JSON arrays are read in.
+JSON_CHUNK_SIZE = 1 << 16
+
+FORMATS = {
+    ".csv": 'CSV',
+    ".json": 'JSON',
+    ".jsonl": 'JSON',
+    ".ndjson": 'JSON',
+    ".chan": 'CHAN',
+}
+
+CHAN_CHANNELS = [
+    ('location', 0), ('location', 1), ('location', 2),
+    ('rotation_euler', 0), ('rotation_euler', 1), ('rotation_euler', 2),
+]
+
+
+def _build_column_names():
+    names = {"frame": "frame", "time": "time", "seconds": "time"}
+    for i, axis in enumerate("xyz"):
+        for name in ["t" + axis, axis, "loc_" + axis, "location_" + axis, "pos_" + axis, "position_" + axis, "location[{}]".format(i)]:
+            names[name] = ('location', i)
+        for name in ["r" + axis, "rot_" + axis, "rotation_" + axis, "rotation_euler_" + axis, "rotation_euler[{}]".format(i)]:
+            names[name] = ('rotation_euler', i)
+    return names
+
+# Lower-case column name -> "frame", "time", or (data_path, array_index).
+COLUMN_NAMES = _build_column_names()
+
+
+# Returns the capture format of a file from its extension.
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError("Unsupported capture file type '{}'".format(extension))
+    return FORMATS[extension]
+
+
+#========================================================
+# Reading.
+#
+# Each reader returns `(channels, rows)`, where `channels` is a list of
+# (data_path, array_index) and `rows` is an iterator of (frame, time, values)
+# tuples, with `frame` and `time` None if not given.
+
+
+# Works out the role of each named column.
+#
+# Returns (frame column, time column, channel columns, channels), where the
+# columns are positions in `names` (or None) and `channels` are the
+# (data_path, array_index) of the channel columns.
+def _column_layout(names):
+    frame_column = None
+    time_column = None
+    channel_columns = []
+    channels = []
+    for i, name in enumerate(names):
+        role = COLUMN_NAMES.get(str(name).strip().lower())
+        if role == "frame":
+            frame_column = i
+        elif role == "time":
+            time_column = i
+        elif role is not None and role not in channels:
+            channel_columns += [i]
+            channels += [role]
+    if len(channels) == 0:
+        raise ValueError("No location or rotation columns found in capture (columns: {})".format(", ".join(str(name) for name in names)))
+    return (frame_column, time_column, channel_columns, channels)
+
+
+def _read_csv(f):
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("Capture file is empty")
+    frame_column, time_column, channel_columns, channels = _column_layout(header)
+
+    def rows():
+        for line_number, row in enumerate(reader, 2):
+            if len(row) == 0 or all(field.strip() == "" for field in row):
+                continue
+            try:
+                frame = float(row[frame_column]) if frame_column is not None else None
+                time = float(row[time_column]) if time_column is not None else None
+                values = [float(row[i]) for i in channel_columns]
+            except (IndexError, ValueError):
+                raise ValueError("Invalid row on line {} of capture".format(line_number))
+            yield (frame, time, values)
+
+    return (channels, rows())
+
+
+def _read_chan(f):
+    def rows():
+        for line_number, line in enumerate(f, 1):
+            fields = line.split()
+            if len(fields) == 0 or fields[0].startswith("#"):
+                continue
+            try:
+                if len(fields) < 7:
+                    raise ValueError()
+                yield (float(fields[0]), None, [float(field) for field in fields[1:7]])
+            except ValueError:
+                raise ValueError("Invalid row on line {} of capture".format(line_number))
+
+    return (list(CHAN_CHANNELS), rows())
+
+
+# Iterates over the objects of a JSON array without reading the whole file at
+# once.
+def _iter_json_array(f, buffer):
+    decoder = json.JSONDecoder()
+    position = buffer.index("[") + 1
+    at_end = False
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            if position == len(buffer):
+                raise json.JSONDecodeError("", buffer, position)
+            item, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if at_end:
+                raise ValueError("Invalid or truncated JSON capture")
+            chunk = f.read(JSON_CHUNK_SIZE)
+            at_end = chunk == ""
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield item
+
+
+def _iter_json_lines(f, buffer):
+    # Re-attach the already read part of the first line.
+    first = True
+    for line in f:
+        if first:
+            line = buffer + line
+            first = False
+        line = line.strip()
+        if line != "":
+            yield json.loads(line)
+    if first and buffer.strip() != "":
+        yield json.loads(buffer)
+
+
+def _read_json(f):
+    # Peek at the first non-whitespace character to tell arrays from JSON
+    # Lines.
+    buffer = ""
+    while buffer.strip() == "":
+        chunk = f.read(1)
+        if chunk == "":
+            raise ValueError("Capture file is empty")
+        buffer += chunk
+    if buffer.strip() == "[":
+        items = _iter_json_array(f, buffer)
+    else:
+        items = _iter_json_lines(f, buffer)
+
+    first = next(items, None)
+    if not isinstance(first, dict):
+        raise ValueError("JSON capture must be a list of objects")
+    keys = list(first.keys())
+    frame_column, time_column, channel_columns, channels = _column_layout(keys)
+    frame_key = keys[frame_column] if frame_column is not None else None
+    time_key = keys[time_column] if time_column is not None else None
+    channel_keys = [keys[i] for i in channel_columns]
+
+    def rows():
+        yield _json_row(first, 1, frame_key, time_key, channel_keys)
+        for item_number, item in enumerate(items, 2):
+            yield _json_row(item, item_number, frame_key, time_key, channel_keys)
+
+    return (channels, rows())
+
+
+def _json_row(item, item_number, frame_key, time_key, channel_keys):
+    try:
+        frame = float(item[frame_key]) if frame_key is not None else None
+        time = float(item[time_key]) if time_key is not None else None
+        return (frame, time, [float(item[key]) for key in channel_keys])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid entry {} in capture".format(item_number))
+
+
+_READERS = {
+    'CSV': _read_csv,
+    'JSON': _read_json,
+    'CHAN': _read_chan,
+}
+
+
+#========================================================
+# Processing.
+
+
+# Linearly resamples a stream of (time, values) samples at a fixed rate,
+# keeping only the resampled values.
+class _Resampler:
+    def __init__(self, fps, channel_count, max_frames):
+        self.step = 1.0 / fps
+        self.max_frames = max_frames
+        self.columns = [array('d') for _ in range(channel_count)]
+        self.start_time = None
+        self.previous = None
+        self.frame_count = 0
+
+    # Adds the next sample.  Returns False once `max_frames` frames have been
+    # produced.
+    def add(self, time, values):
+        if self.previous is None:
+            self.start_time = time
+        elif time <= self.previous[0]:
+            raise ValueError("Capture times must be increasing (at {:.4f}s)".format(time))
+
+        next_time = self.start_time + self.frame_count * self.step
+        while next_time <= time:
+            if self.previous is None:
+                frame_values = values
+            else:
+                previous_time, previous_values = self.previous
+                t = (next_time - previous_time) / (time - previous_time)
+                frame_values = [a + (b - a) * t for a, b in zip(previous_values, values)]
+            for column, value in zip(self.columns, frame_values):
+                column.append(value)
+            self.frame_count += 1
+            if self.frame_count >= self.max_frames:
+                return False
+            next_time = self.start_time + self.frame_count * self.step
+
+        self.previous = (time, values)
+        return True
+
+
+# Subtracts the least-squares line through the values.
+def remove_linear_trend(values):
+    x = np.arange(len(values), dtype=np.float64)
+    slope, intercept = np.polyfit(x, values, 1)
+    return values - (slope * x + intercept)
+
+
+# Cross-fades the end of the values into the start so that they loop
+# seamlessly, shortening them by `blend_frames`.
+#
+# The first `blend_frames` values are dropped, and the last `blend_frames`
+# values are faded into them, so that the last value flows into what
+# originally came right before the new first value.
+def blend_loop_seam(values, blend_frames):
+    if blend_frames <= 0:
+        return values.copy()
+    if len(values) < blend_frames * 2 + 2:
+        raise ValueError("Capture is too short for a loop blend of {} frames".format(blend_frames))
+    result = values[blend_frames:].copy()
+    t = (np.arange(blend_frames, dtype=np.float64) + 1.0) / (blend_frames + 1)
+    weight = t * t * (3.0 - 2.0 * t) # Smoothstep.
+    result[-blend_frames:] = result[-blend_frames:] * (1.0 - weight) + values[:blend_frames] * weight
+    return result
+
+
+# Reads a capture file and turns it into shake data, in the same
+# {(data_path, array_index): [(frame, value), ...]} form as the entries of
+# `SHAKE_LIST`, with frames starting at zero and the last value equal to the
+# first.
+#
+# - `format`: one of the values of `FORMATS`, or None to detect it from the
+#   file extension.
+# - `source_fps`: frame rate of the capture's frame numbers (or rows, if it has
+#   neither frames nor times).
+# - `target_fps`: frame rate of the resulting shake.
+# - `rotation_unit`: 'DEGREES' or 'RADIANS'.
+# - `location_scale`: factor the capture's locations are multiplied by.
+# - `detrend`: whether to remove linear drift.
+# - `loop_blend_frames`: length of the loop seam cross-fade, in target frames.
+# - `max_frames`: the most target frames to import.
+#
+# Returns (data, sample_count), where `sample_count` is the number of capture
+# rows that were read.
+def import_capture(
+    path,
+    format=None,
+    source_fps=24.0,
+    target_fps=24.0,
+    rotation_unit='DEGREES',
+    location_scale=1.0,
+    detrend=True,
+    loop_blend_frames=12,
+    max_frames=MAX_FRAMES,
+):
+    if format is None:
+        format = detect_format(path)
+    if source_fps <= 0.0 or target_fps <= 0.0:
+        raise ValueError("Frame rates must be positive")
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        channels, rows = _READERS[format](f)
+        resampler = _Resampler(target_fps, len(channels), max_frames)
+        sample_count = 0
+        for row_index, (frame, time, values) in enumerate(rows):
+            if time is None:
+                time = (frame if frame is not None else row_index) / source_fps
+            sample_count += 1
+            if not resampler.add(time, values):
+                break
+
+    if resampler.frame_count < 2:
+        raise ValueError("Capture is too short")
+
+    data = {}
+    for (data_path, array_index), column in zip(channels, resampler.columns):
+        values = np.frombuffer(column, dtype=np.float64)
+        if data_path == 'rotation_euler':
+            if rotation_unit == 'DEGREES':
+                values = values * (math.pi / 180.0)
+        else:
+            values = values * location_scale
+        if detrend:
+            values = remove_linear_trend(values)
+        values = blend_loop_seam(values, loop_blend_frames)
+        values = np.round(np.append(values, values[0]), 6)
+        data[(data_path, array_index)] = list(zip(range(len(values)), values.tolist()))
+
+    return (data, sample_count)
@@ -0,0 +1,138 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Error-bounded keyframe decimation of shake curves.
+#
+# The captured shakes have a key on every frame.  Decimation picks a subset of
+# those keys such that the curve Blender builds through them (Bezier with AUTO
+# handles and a CYCLES modifier, exactly as `ensure_shake_in_action()` sets it
+# up) stays within a maximum error of the original value at every frame.
+#
+# Keys are picked by greedy insertion: starting from the first, middle, and
+# last key, the key with the largest error in each segment that's out of
+# tolerance is added, until no frame is.  Since AUTO handles only depend on
+# neighboring keys, adding keys in several segments at once doesn't disturb
+# the rest of the curve much, which keeps the number of passes small.
+#
+# The first and last keys are always kept, so the frame range and the seamless
+# loop (last value equal to the first) are preserved.  The error is only
+# measured at the original frames.
+#
+# Note: this module intentionally doesn't depend on bpy.
+
+import math
+
+import numpy as np
+
+from .shake_eval import BezierCurve
+
+# Default tolerances, in raw shake units (see `decimate_shake()`).
+DEFAULT_LOCATION_TOLERANCE = 0.0005
+DEFAULT_ROTATION_TOLERANCE = math.radians(0.005)
+
+
+# Decimates a single channel.
+#
+# `frames` and `values` are the channel's keys, with the last value already
+# equal to the first.  `tolerance` is the maximum allowed absolute error, in
+# the same units as `values`.
+#
+# Returns (indices, max_error), where `indices` are the (sorted) indices of the
+# keys to keep, and `max_error` the largest error of the resulting curve at any
+# of `frames`.
+def decimate_channel(frames, values, tolerance):
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    n = len(frames)
+    if n <= 3:
+        return (np.arange(n), 0.0)
+
+    # The curves are built from the keys as Blender stores them, rounded to
+    # float32, so that the error includes that rounding.
+    key_frames = frames.astype(np.float32).astype(np.float64)
+    key_values = values.astype(np.float32).astype(np.float64)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, n // 2, n - 1]] = True
+    while True:
+        indices = np.flatnonzero(keep)
+        curve = BezierCurve(key_frames[indices], key_values[indices], cyclic=True)
+        error = np.abs(curve.evaluate(frames) - values)
+        # The kept keys' own rounding error is far below any useful
+        # tolerance, and isn't reduced by adding them again.
+        error[keep] = 0.0
+        max_error = float(error.max())
+        if max_error <= tolerance:
+            error = np.abs(curve.evaluate(frames) - values)
+            return (indices, float(error.max()))
+
+        # Add the worst key of each segment that's out of tolerance.
+        segment = np.searchsorted(indices, np.arange(n), side='right') - 1
+        out_of_tolerance = error > tolerance
+        order = np.lexsort((-error, segment))
+        first_in_segment = np.ones(n, dtype=bool)
+        first_in_segment[1:] = segment[order][1:] != segment[order][:-1]
+        worst = order[first_in_segment]
+        keep[worst[out_of_tolerance[worst]]] = True
+
+
+# Decimates a whole shake in `SHAKE_LIST` form
+# (`{(data_path, array_index): [(frame, value), ...]}`), using
+# `location_tolerance` for location channels and `rotation_tolerance` for
+# rotation channels.  Like `ensure_shake_in_action()`, the last value of each
+# channel is set to the first before decimating.
+#
+# Returns (data, stats), where `data` is the decimated shake in the same form,
+# and `stats` maps each channel to (original key count, key count, max error).
+def decimate_shake(data, location_tolerance, rotation_tolerance):
+    decimated = {}
+    stats = {}
+    for channel, points in data.items():
+        co = np.array(points, dtype=np.float64)
+        co[-1, 1] = co[0, 1]
+        tolerance = rotation_tolerance if channel[0].startswith("rotation") else location_tolerance
+        indices, max_error = decimate_channel(co[:, 0], co[:, 1], tolerance)
+        decimated[channel] = [(float(frame), float(value)) for frame, value in co[indices]]
+        stats[channel] = (len(co), len(indices), max_error)
+    return (decimated, stats)
+
+
+# Returns a human-readable report of the key counts and errors of decimating
+# each of the given shakes, which is an iterable of (shake id, data) pairs.
+def format_decimation_report(shakes, location_tolerance, rotation_tolerance):
+    lines = []
+    lines += ["Shake decimation, location tolerance {:g}, rotation tolerance {:g} rad".format(location_tolerance, rotation_tolerance)]
+    lines += [""]
+    lines += ["{:<24} {:>10} {:>10} {:>8} {:>14} {:>14}".format("shake", "keys", "decimated", "ratio", "loc error", "rot error")]
+    total_before = 0
+    total_after = 0
+    for shake_id, data in shakes:
+        _, stats = decimate_shake(data, location_tolerance, rotation_tolerance)
+        before = sum(s[0] for s in stats.values())
+        after = sum(s[1] for s in stats.values())
+        loc_error = max([s[2] for channel, s in stats.items() if not channel[0].startswith("rotation")], default=0.0)
+        rot_error = max([s[2] for channel, s in stats.items() if channel[0].startswith("rotation")], default=0.0)
+        lines += ["{:<24} {:>10} {:>10} {:>7.1f}% {:>14.3g} {:>14.3g}".format(
+            shake_id, before, after, after / before * 100.0, loc_error, rot_error,
+        )]
+        total_before += before
+        total_after += after
+    if total_before > 0:
+        lines += [""]
+        lines += ["Total: {} keys -> {} keys ({:.1f}%)".format(total_before, total_after, total_after / total_before * 100.0)]
+    return "\n".join(lines)
@@ -0,0 +1,31 @@
+# Imports the addon's bpy-free modules (e.g. `shake_eval` or `decimate`)
+# straight from this source tree, for the development scripts and tests that
+# run outside of Blender.
+#
+# The modules import their siblings relatively, so they're loaded as
+# submodules of a stand-in package, without running the addon's `__init__.py`
+# (which needs bpy).  The stand-in has its own name, so that it doesn't get in
+# the way of loading the real addon later in the same process (e.g. when
+# running all the tests at once).  If the real addon is already loaded, its
+# submodules are used instead.
+#
+# Note: this module intentionally doesn't depend on bpy.
+
+import importlib
+import os
+import sys
+import types
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_MODULE_NAME = "camera_shakify"
+STAND_IN_MODULE_NAME = "_camera_shakify_modules"
+
+
+def import_module(name):
+    if ADDON_MODULE_NAME in sys.modules:
+        return importlib.import_module(ADDON_MODULE_NAME + "." + name)
+    if STAND_IN_MODULE_NAME not in sys.modules:
+        package = types.ModuleType(STAND_IN_MODULE_NAME)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[STAND_IN_MODULE_NAME] = package
+    return importlib.import_module(STAND_IN_MODULE_NAME + "." + name)
@@ -0,0 +1,211 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Command-line tool for prepping, fixing, verifying, and baking the camera
+# shakes of many .blend files at once, e.g. as part of render farm submission.
+#
+# Each file is processed by its own headless Blender instance (running
+# `batch_worker.py`), with several instances running in parallel.  Per-file
+# results and timings are printed, and optionally written as JSON, and the exit
+# status is non-zero if any file failed.
+#
+# Run with any Python 3 (Blender isn't needed to run this script itself):
+#
+#     python3 dev/batch_cli.py [options] FILE_OR_GLOB...
+#
+# For example, to prep and fix all shots and make sure they're good:
+#
+#     python3 dev/batch_cli.py --ops prep,fix,verify --jobs 8 "shots/**/*.blend"
+#
+# Operations are run in the given order:
+#
+# - prep: adds the script that makes shakes work without the addon.
+# - fix: repairs camera shakes that aren't set up properly.
+# - verify: fails the file if any camera shake isn't set up properly.
+# - bake: bakes all shaken cameras' shakes over each scene's frame range.  When
+#   baking into copies, the copies replace their cameras as the scenes'
+#   cameras, and running it again replaces the earlier copies.  Cameras with
+#   other constraints aren't baked, and fail the file.
+#
+# Files are saved in place after modifying operations, unless --no-save is
+# given.
+#
+# Note: this module intentionally doesn't depend on bpy.
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+WORKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch_worker.py")
+
+OPERATIONS = ["prep", "fix", "verify", "bake"]
+
+# How much of a failed Blender instance's output to include in its result.
+OUTPUT_TAIL_LENGTH = 4000
+
+
+def operation_list(text):
+    ops = [op.strip() for op in text.split(",") if op.strip() != ""]
+    for op in ops:
+        if op not in OPERATIONS:
+            raise argparse.ArgumentTypeError("unknown operation '{}' (choose from {})".format(op, ", ".join(OPERATIONS)))
+    if len(ops) == 0:
+        raise argparse.ArgumentTypeError("no operations given")
+    return ops
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="batch_cli.py", description="Prep, fix, verify, and bake Camera Shakify shakes in many .blend files.")
+    parser.add_argument("files", nargs="+", help=".blend files or glob patterns (\"**\" matches subdirectories)")
+    parser.add_argument("--ops", type=operation_list, default=["fix", "verify"], help="comma-separated operations: {} (default: fix,verify)".format(",".join(OPERATIONS)))
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="number of Blender instances to run in parallel (default: CPU count)")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable (default: $BLENDER or 'blender')")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds after which a file counts as failed")
+    parser.add_argument("--bake-target", choices=['CAMERA', 'COPY'], default='COPY', help="bake into the cameras themselves, or into copies of them (default)")
+    parser.add_argument("--bake-samples", type=int, default=1, help="baked samples per frame")
+    parser.add_argument("--bake-jobs", type=int, default=1, help="processes each Blender instance evaluates baked shakes in, 0 for one per CPU (default: 1, since files are already processed in parallel)")
+    parser.add_argument("--no-save", action="store_true", help="don't save files after modifying them")
+    parser.add_argument("--report", default=None, help="file to write the JSON results to")
+    return parser.parse_args(argv)
+
+
+# Expands the given files and glob patterns into a sorted list of unique
+# paths.
+def expand_files(patterns):
+    paths = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.update(glob.glob(pattern, recursive=True))
+        else:
+            paths.add(pattern)
+    return sorted(os.path.abspath(path) for path in paths)
+
+
+# Processes a single file in its own Blender instance, returning its result.
+def process_file(path, args):
+    start = time.perf_counter()
+    result = {"file": path, "ok": False}
+
+    if not os.path.isfile(path):
+        result["error"] = "file not found"
+        result["seconds"] = 0.0
+        return result
+
+    fd, result_path = tempfile.mkstemp(prefix="camera_shakify_batch_", suffix=".json")
+    os.close(fd)
+    command = [
+        args.blender, "-b", path, "--factory-startup", "--python-exit-code", "1",
+        "--python", WORKER_PATH, "--",
+        "--ops", ",".join(args.ops),
+        "--result", result_path,
+        "--bake-target", args.bake_target,
+        "--bake-samples", str(args.bake_samples),
+        "--bake-jobs", str(args.bake_jobs),
+    ]
+    if args.no_save:
+        command += ["--no-save"]
+
+    try:
+        process = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            timeout=args.timeout,
+        )
+        result["returncode"] = process.returncode
+        try:
+            with open(result_path) as f:
+                result.update(json.load(f))
+            result["file"] = path
+        except (OSError, ValueError):
+            result["ok"] = False
+            result["error"] = "Blender exited without a result"
+        if process.returncode != 0:
+            result["ok"] = False
+        if not result["ok"]:
+            result["output"] = process.stdout[-OUTPUT_TAIL_LENGTH:]
+    except subprocess.TimeoutExpired:
+        result["error"] = "timed out after {}s".format(args.timeout)
+    except OSError as e:
+        result["error"] = "couldn't run Blender: {}".format(e)
+    finally:
+        os.remove(result_path)
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def describe(result):
+    text = "{} {} ({:.1f}s)".format("OK  " if result["ok"] else "FAIL", result["file"], result["seconds"])
+    for op in result.get("ops", []):
+        text += "\n    {:<7} {:.2f}s".format(op["op"], op["seconds"])
+        if len(op.get("repaired", {})) > 0:
+            text += ", repaired {}".format(", ".join(sorted(op["repaired"])))
+        if len(op.get("problems", {})) > 0:
+            text += ", problems: " + "; ".join(
+                "{}: {}".format(camera, ", ".join(problems)) for camera, problems in sorted(op["problems"].items())
+            )
+        if len(op.get("baked", [])) > 0:
+            text += ", baked {} camera(s)".format(len(op["baked"]))
+        if len(op.get("constrained", [])) > 0:
+            text += ", not baked because of other constraints: {}".format(", ".join(sorted(op["constrained"])))
+    if "error" in result:
+        text += "\n    " + result["error"].strip().replace("\n", "\n    ")
+    return text
+
+
+def main(argv):
+    args = parse_args(argv)
+    if shutil.which(args.blender) is None and not os.path.isfile(args.blender):
+        print("Blender executable not found: {}".format(args.blender), file=sys.stderr)
+        return 2
+    files = expand_files(args.files)
+    if len(files) == 0:
+        print("No .blend files found.", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for result in pool.map(lambda path: process_file(path, args), files):
+            print(describe(result), file=sys.stderr)
+            results += [result]
+    total_seconds = time.perf_counter() - start
+
+    failed = [result for result in results if not result["ok"]]
+    print("{} files, {} failed, {:.1f}s".format(len(results), len(failed), total_seconds), file=sys.stderr)
+
+    if args.report is not None:
+        with open(args.report, "w") as f:
+            json.dump({"ops": args.ops, "seconds": total_seconds, "results": results}, f, indent=2)
+            f.write("\n")
+
+    return 1 if len(failed) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
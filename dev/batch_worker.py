@@ -0,0 +1,154 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# The part of `batch_cli.py` that runs inside a headless Blender instance,
+# processing the single .blend file it was started with:
+#
+#     blender -b FILE.blend --factory-startup --python dev/batch_worker.py -- --ops prep,fix,verify --result RESULT.json
+#
+# The addon is loaded straight from this source tree (see `blender_util.py`),
+# so it doesn't need to be installed or enabled.  The results of each
+# operation are written as JSON to the result file.
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from blender_util import load_addon
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="batch_worker.py")
+    parser.add_argument("--ops", required=True)
+    parser.add_argument("--result", required=True)
+    parser.add_argument("--bake-target", choices=['CAMERA', 'COPY'], default='COPY')
+    parser.add_argument("--bake-samples", type=int, default=1)
+    parser.add_argument("--bake-jobs", type=int, default=1)
+    parser.add_argument("--no-save", action="store_true")
+    return parser.parse_args(argv)
+
+
+def shaken_cameras(scene):
+    return [
+        obj for obj in scene.objects
+        if obj.type == 'CAMERA' and obj.library is None and len(obj.camera_shakes) > 0
+    ]
+
+
+#========================================================
+# Operations.  Each returns (ok, details).
+
+
+def op_prep(addon, args):
+    addon.ensure_farm_script(addon.INFLUENCE_MAX, addon.SCALE_MAX)
+    return (True, {})
+
+
+def op_fix(addon, args):
+    repaired = addon.repair_camera_shakes_globally(bpy.context)
+    return (True, {"repaired": {name: problems for name, problems in repaired}})
+
+
+def op_verify(addon, args):
+    action = bpy.data.actions.get((addon.ACTION_NAME, None))
+    problems = {}
+    seen = set()
+    for scene in bpy.data.scenes:
+        for camera in shaken_cameras(scene):
+            if camera.name in seen:
+                continue
+            seen.add(camera.name)
+            camera_problems = addon.verify_camera_shakes(camera, scene, action)
+            if len(camera_problems) > 0:
+                problems[camera.name] = camera_problems
+    return (len(problems) == 0, {"problems": problems})
+
+
+# Bakes each shaken camera once, over the frame range of the first scene it's
+# in.  Baked copies take over from their cameras as the scenes' (and timeline
+# markers') camera, so that the saved file renders without the addon.
+def op_bake(addon, args):
+    baked = []
+    # Cameras with other constraints, on which the baked shake would differ
+    # from the live one (see `bake.py`).  These are left alone, and fail the
+    # file.
+    constrained = []
+    seen = set()
+    for scene in bpy.data.scenes:
+        cameras = []
+        for camera in shaken_cameras(scene):
+            if camera.name in seen:
+                continue
+            seen.add(camera.name)
+            if len(addon.non_shake_constraints(camera)) > 0:
+                constrained += [camera.name]
+            else:
+                cameras += [camera]
+        if len(cameras) == 0:
+            continue
+        frames = addon.bake_frames(scene.frame_start, scene.frame_end, args.bake_samples)
+        baked += [camera.name for camera in cameras]
+        with bpy.context.temp_override(scene=scene):
+            targets = addon.bake_cameras(cameras, bpy.context, frames, args.bake_target, jobs=args.bake_jobs if args.bake_jobs > 0 else None)
+        if args.bake_target == 'COPY':
+            for camera, target in zip(cameras, targets):
+                addon.replace_scene_camera(camera, target)
+    return (len(constrained) == 0, {"baked": baked, "constrained": constrained})
+
+
+OPERATIONS = {
+    "prep": op_prep,
+    "fix": op_fix,
+    "verify": op_verify,
+    "bake": op_bake,
+}
+
+# Operations that change the file.
+MODIFYING_OPERATIONS = {"prep", "fix", "bake"}
+
+
+def main():
+    args = parse_args()
+    result = {"file": bpy.data.filepath, "ok": True, "saved": False, "ops": []}
+    try:
+        addon = load_addon()
+        for name in args.ops.split(","):
+            start = time.perf_counter()
+            ok, details = OPERATIONS[name](addon, args)
+            result["ops"] += [{"op": name, "ok": ok, "seconds": time.perf_counter() - start, **details}]
+            result["ok"] = result["ok"] and ok
+        if not args.no_save and any(op["op"] in MODIFYING_OPERATIONS for op in result["ops"]):
+            bpy.ops.wm.save_mainfile()
+            result["saved"] = True
+    except Exception:
+        result["ok"] = False
+        result["error"] = traceback.format_exc()
+
+    with open(args.result, "w") as f:
+        json.dump(result, f)
+
+
+if __name__ == "__main__":
+    main()
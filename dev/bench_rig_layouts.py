@@ -0,0 +1,71 @@
+# Scaling benchmark of the per-shake and per-camera rig layouts, for 1-10
+# shakes per camera.
+#
+# For each layout and shake count, builds a number of shaken cameras and
+# measures how long building the rigs takes and how long the scene takes to
+# evaluate per frame during playback, along with how many objects,
+# constraints, and drivers the rigs consist of.  Prints the results as JSON.
+#
+# Run with:
+#
+#     blender -b --factory-startup --python dev/bench_rig_layouts.py -- [camera count] [frame count]
+
+import json
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from blender_util import load_addon, script_args, clear_scene, add_shaken_cameras, rig_counts
+
+addon = load_addon()
+
+LAYOUTS = ['PER_SHAKE', 'PER_CAMERA']
+SHAKE_COUNTS = range(1, 11)
+
+args = script_args()
+CAMERA_COUNT = int(args[0]) if len(args) > 0 else 20
+FRAME_COUNT = int(args[1]) if len(args) > 1 else 100
+
+
+def run(scene, layout, shake_count):
+    clear_scene()
+    scene.camera_shakify_rig_layout = layout
+
+    cameras = add_shaken_cameras(scene, CAMERA_COUNT, shake_count)
+    start = time.perf_counter()
+    for camera in cameras:
+        addon.rebuild_camera_shakes(camera, bpy.context)
+    build_time = time.perf_counter() - start
+
+    scene.frame_set(0)
+    start = time.perf_counter()
+    for frame in range(1, FRAME_COUNT + 1):
+        scene.frame_set(frame)
+    frame_time = (time.perf_counter() - start) / FRAME_COUNT
+
+    result = {
+        "layout": layout,
+        "shakes_per_camera": shake_count,
+        "cameras": CAMERA_COUNT,
+        "build_seconds": build_time,
+        "seconds_per_frame": frame_time,
+    }
+    result.update(rig_counts())
+    return result
+
+
+def main():
+    scene = bpy.context.scene
+    results = []
+    for shake_count in SHAKE_COUNTS:
+        for layout in LAYOUTS:
+            results += [run(scene, layout, shake_count)]
+            print("{layout:<10} {shakes_per_camera:>2} shakes: build {build_seconds:.3f}s, {seconds_per_frame:.5f}s/frame, "
+                  "{objects} objects, {constraints} constraints, {drivers} drivers".format(**results[-1]), file=sys.stderr)
+    print(json.dumps(results, indent=2))
+
+
+main()
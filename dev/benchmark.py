@@ -0,0 +1,199 @@
+# Headless benchmark suite for Camera Shakify.
+#
+# Measures:
+#
+# - Importing the addon's modules, and `register()`.
+# - `ensure_shake_in_action()` for every shake type: cold (with the shake data
+#   still to be decoded), cold with the shake data already decoded, and warm
+#   (with the shake already in the action).
+# - `rebuild_camera_shakes()` on all cameras, both from scratch and when
+#   nothing has changed, `repair_camera_shakes_globally()` with nothing to
+#   repair, and `fix_camera_shakes_globally()`, for every
+#   combination of camera count, shakes per camera, and rig layout.
+# - Per-frame scene evaluation time during simulated playback of each of those
+#   setups.
+#
+# Results are written as JSON, along with the Blender, addon, and Python
+# versions, so that they can be compared across versions.
+#
+# Run with:
+#
+#     blender -b --factory-startup --python dev/benchmark.py -- [options]
+#
+# Use `--help` after the "--" for the available options.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from blender_util import ADDON_DIR, import_addon, addon_submodule, script_args, clear_scene, add_shaken_cameras, rig_counts
+
+
+def int_list(text):
+    return [int(n) for n in text.split(",")]
+
+
+def str_list(text):
+    return text.split(",")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="benchmark.py")
+    parser.add_argument("--cameras", type=int_list, default=[1, 10, 100, 500], help="comma-separated camera counts")
+    parser.add_argument("--shakes", type=int_list, default=[1, 2, 3, 4, 5], help="comma-separated shakes-per-camera counts")
+    parser.add_argument("--layouts", type=str_list, default=['PER_SHAKE'], help="comma-separated rig layouts")
+    parser.add_argument("--frames", type=int, default=50, help="number of frames of playback to time")
+    parser.add_argument("--output", default=None, help="file to write the JSON results to (default: stdout)")
+    return parser.parse_args(script_args())
+
+
+def addon_version():
+    with open(os.path.join(ADDON_DIR, "blender_manifest.toml")) as f:
+        for line in f:
+            if line.startswith("version"):
+                return line.split("=", 1)[1].strip().strip('"')
+    return None
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def progress(text):
+    print(text, file=sys.stderr)
+
+
+#========================================================
+
+
+def bench_import_register(results):
+    start = time.perf_counter()
+    addon = import_addon()
+    import_time = time.perf_counter() - start
+    register_time = timed(addon.register)
+
+    results += [
+        {"benchmark": "import", "seconds": import_time},
+        {"benchmark": "register", "seconds": register_time},
+    ]
+    progress("import {:.4f}s, register {:.4f}s".format(import_time, register_time))
+    return addon
+
+
+def bench_ensure_shake_in_action(addon, results):
+    action_utils = addon_submodule("action_utils")
+    shake_data = addon_submodule("shake_data")
+
+    loc_factor = addon.INFLUENCE_MAX * addon.SCALE_MAX * addon.UNIT_SCALE_MAX
+    for info in shake_data.shake_index().values():
+        get_data = lambda: shake_data.get_shake(info.id)[2]
+        ensure = lambda action: action_utils.ensure_shake_in_action(
+            info.id.lower(), action, get_data, addon.INFLUENCE_MAX, loc_factor,
+        )
+
+        shake_data.clear_shake_cache()
+        action = action_utils.ensure_action("benchmark_cold_decode")
+        cold_decode = timed(ensure, action)
+
+        action = action_utils.ensure_action("benchmark_cold")
+        cold = timed(ensure, action)
+
+        warm = timed(ensure, action)
+
+        results += [{
+            "benchmark": "ensure_shake_in_action",
+            "shake_type": info.id,
+            "keyframes": info.frame_count * len(info.channels),
+            "cold_decode_seconds": cold_decode,
+            "cold_seconds": cold,
+            "warm_seconds": warm,
+        }]
+        progress("ensure_shake_in_action {}: cold+decode {:.4f}s, cold {:.4f}s, warm {:.6f}s".format(info.id, cold_decode, cold, warm))
+
+    for action in list(bpy.data.actions):
+        if action.name.startswith("benchmark_"):
+            bpy.data.actions.remove(action)
+
+
+def bench_rig(addon, scene, layout, camera_count, shake_count, frame_count, results):
+    clear_scene()
+    scene.camera_shakify_rig_layout = layout
+    cameras = add_shaken_cameras(scene, camera_count, shake_count)
+
+    def rebuild_all():
+        for camera in cameras:
+            addon.rebuild_camera_shakes(camera, bpy.context)
+
+    rebuild_cold = timed(rebuild_all)
+    rebuild_warm = timed(rebuild_all)
+    repair = timed(addon.repair_camera_shakes_globally, bpy.context)
+    fix_global = timed(addon.fix_camera_shakes_globally, bpy.context)
+
+    scene.frame_set(0)
+    frame_times = []
+    for frame in range(1, frame_count + 1):
+        frame_times += [timed(scene.frame_set, frame)]
+
+    result = {
+        "benchmark": "rig",
+        "layout": layout,
+        "cameras": camera_count,
+        "shakes_per_camera": shake_count,
+        "rebuild_cold_seconds": rebuild_cold,
+        "rebuild_warm_seconds": rebuild_warm,
+        "repair_seconds": repair,
+        "fix_global_seconds": fix_global,
+        "frames": frame_count,
+        "frame_mean_seconds": statistics.mean(frame_times),
+        "frame_median_seconds": statistics.median(frame_times),
+        "frame_min_seconds": min(frame_times),
+        "frame_max_seconds": max(frame_times),
+    }
+    result.update(rig_counts())
+    results += [result]
+    progress("rig {} {:>3} cameras x {} shakes: rebuild {:.3f}s (warm {:.3f}s), repair {:.3f}s, fix all {:.3f}s, {:.5f}s/frame".format(
+        layout, camera_count, shake_count, rebuild_cold, rebuild_warm, repair, fix_global, result["frame_mean_seconds"],
+    ))
+
+
+def main():
+    args = parse_args()
+    results = []
+
+    # This has to come first, since it measures the initial import.
+    addon = bench_import_register(results)
+
+    bench_ensure_shake_in_action(addon, results)
+
+    scene = bpy.context.scene
+    for layout in args.layouts:
+        for camera_count in args.cameras:
+            for shake_count in args.shakes:
+                bench_rig(addon, scene, layout, camera_count, shake_count, args.frames, results)
+
+    output = {
+        "blender_version": bpy.app.version_string,
+        "addon_version": addon_version(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+    text = json.dumps(output, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+
+main()
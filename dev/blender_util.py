@@ -0,0 +1,95 @@
+# Helpers shared by the development scripts and tests that run inside
+# Blender.
+
+import importlib.util
+import os
+import sys
+
+import bpy
+
+from addon_modules import ADDON_DIR, ADDON_MODULE_NAME
+
+
+# Imports the addon straight from this source tree, without registering it.
+# Returns the addon's module.
+def import_addon():
+    if ADDON_MODULE_NAME in sys.modules:
+        return sys.modules[ADDON_MODULE_NAME]
+
+    spec = importlib.util.spec_from_file_location(
+        ADDON_MODULE_NAME,
+        os.path.join(ADDON_DIR, "__init__.py"),
+        submodule_search_locations=[ADDON_DIR],
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_MODULE_NAME] = addon
+    spec.loader.exec_module(addon)
+    return addon
+
+
+# Imports and registers the addon straight from this source tree, so that the
+# dev scripts work with `blender -b --factory-startup` without the addon being
+# installed.  Returns the addon's module.
+def load_addon():
+    already_loaded = ADDON_MODULE_NAME in sys.modules
+    addon = import_addon()
+    if not already_loaded:
+        addon.register()
+    return addon
+
+
+def addon_submodule(name):
+    return importlib.import_module(ADDON_MODULE_NAME + "." + name)
+
+
+# Returns the arguments passed to the script after Blender's own arguments,
+# i.e. everything after "--".
+def script_args():
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return []
+
+
+# Removes all objects and actions from the file.
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for action in list(bpy.data.actions):
+        bpy.data.actions.remove(action)
+
+
+# Adds `count` cameras to the scene with `shake_count` shakes each, cycling
+# through the available shake types, and returns them.
+#
+# The shake types are assigned without triggering their update callbacks, so
+# the cameras' shake rigs are *not* built.
+def add_shaken_cameras(scene, count, shake_count, name="bench_camera"):
+    addon = sys.modules[ADDON_MODULE_NAME]
+    shake_type_numbers = [item[3] for item in addon.SHAKE_TYPE_ITEMS]
+    cameras = []
+    for i in range(count):
+        camera_name = "{}_{}".format(name, i)
+        camera = bpy.data.objects.new(camera_name, bpy.data.cameras.new(camera_name))
+        scene.collection.objects.link(camera)
+        for j in range(shake_count):
+            shake = camera.camera_shakes.add()
+            shake["shake_type"] = shake_type_numbers[(i + j) % len(shake_type_numbers)]
+            shake["offset"] = i * 7.0
+        cameras += [camera]
+    return cameras
+
+
+# Counts the objects, constraints, and drivers of the cameras and shake rigs in
+# the file.
+def rig_counts():
+    addon = sys.modules[ADDON_MODULE_NAME]
+    objects = 0
+    constraints = 0
+    drivers = 0
+    for obj in bpy.data.objects:
+        if obj.name.startswith(addon.BASE_NAME) or obj.type == 'CAMERA':
+            objects += 1
+            constraints += len(obj.constraints)
+            if obj.animation_data is not None:
+                drivers += len(obj.animation_data.drivers)
+    return {"objects": objects, "constraints": constraints, "drivers": drivers}
@@ -0,0 +1,37 @@
+# Computes the statistics of the built-in shakes (see `shake_stats.py`) and
+# writes them to `shake_stats.json` next to the addon's `shake_stats.py`, then
+# prints a summary of each shake.
+#
+# This is a development tool, and isn't needed by end users.  It doesn't need
+# Blender, and can be run with any Python 3 that has numpy:
+#
+#     python3 dev/build_shake_stats.py [OUTPUT.json]
+#
+# Re-run it whenever the built-in shakes change.
+
+import os
+import sys
+
+DEV_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(DEV_DIR)
+sys.path.insert(0, ADDON_DIR)
+
+import shake_data
+import shake_stats
+
+
+def main(argv):
+    output_path = argv[1] if len(argv) > 1 else shake_stats.STATS_PATH
+
+    shakes = shake_data.ShakeList()
+    stats = {id: shake_stats.compute_shake_stats(shakes[id]) for id in shakes}
+    shake_stats.write_stats(output_path, stats)
+
+    reference = shake_stats.reference_intensity(stats.values())
+    for id, s in stats.items():
+        print("{:<24} {}, {:.2f}x the reference intensity".format(id, shake_stats.describe(s), s["intensity"] / reference))
+    print("Wrote statistics of {} shakes to {} ({} bytes).".format(len(stats), output_path, os.path.getsize(output_path)))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
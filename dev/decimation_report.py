@@ -0,0 +1,35 @@
+# Prints the decimation report (see `decimate.py`) of the built-in shakes,
+# the same report as the addon's "Decimation Report" utility.
+#
+# This is a development tool, and isn't needed by end users.  It doesn't need
+# Blender, and can be run with any Python 3 that has numpy:
+#
+#     python3 dev/decimation_report.py [LOCATION_TOLERANCE ROTATION_TOLERANCE]
+#
+# The tolerances default to those of new scenes.  The rotation tolerance is in
+# radians.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from addon_modules import import_module
+
+decimate = import_module("decimate")
+shake_data = import_module("shake_data")
+
+
+def main(argv):
+    location_tolerance = float(argv[1]) if len(argv) > 2 else decimate.DEFAULT_LOCATION_TOLERANCE
+    rotation_tolerance = float(argv[2]) if len(argv) > 2 else decimate.DEFAULT_ROTATION_TOLERANCE
+
+    shakes = shake_data.ShakeList()
+    print(decimate.format_decimation_report(
+        ((id, shakes[id][2]) for id in shakes),
+        location_tolerance,
+        rotation_tolerance,
+    ))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
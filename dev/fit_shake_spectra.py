@@ -0,0 +1,61 @@
+# Fits the spectral models used by procedural shakes (see `spectral.py`) from
+# the captured shakes, and writes them to `shake_spectra.json` next to the
+# addon's `spectral.py`.
+#
+# Also checks how well each model matches its capture, by comparing the
+# per-channel RMS of a synthesized signal to that of the capture, and prints
+# the results.
+#
+# This is a development tool, and isn't needed by end users.  It doesn't need
+# Blender, and can be run with any Python 3 that has numpy:
+#
+#     python3 dev/fit_shake_spectra.py [OUTPUT.json]
+#
+# Re-run it whenever the built-in shakes change.
+
+import os
+import sys
+
+import numpy as np
+
+DEV_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(DEV_DIR)
+sys.path.insert(0, ADDON_DIR)
+
+import shake_data
+import spectral
+
+# Number of frames of synthesized signal to check each model against.
+CHECK_FRAMES = 20000
+
+
+def check(spectrum, shake):
+    _, _, data = shake
+    channels = spectral.synthesize(spectrum, seed=0)
+    frames = np.arange(CHECK_FRAMES, dtype=np.float64)
+    worst = 0.0
+    for channel, points in data.items():
+        captured = np.array([value for _, value in points][:-1])
+        synthesized = spectral.evaluate_channel(*channels[channel], frames)
+        captured_rms = captured.std()
+        if captured_rms > 0.0:
+            worst = max(worst, abs(synthesized.std() / captured_rms - 1.0))
+    return worst
+
+
+def main(argv):
+    output_path = argv[1] if len(argv) > 1 else spectral.SPECTRA_PATH
+
+    shakes = shake_data.ShakeList()
+    spectra = {}
+    for id in shakes:
+        spectrum = spectral.fit_spectrum(id, shakes[id])
+        spectra[id] = spectrum
+        print("{:<24} RMS within {:.0%} of the capture".format(id, check(spectrum, shakes[id])))
+
+    spectral.write_spectra(output_path, spectra)
+    print("Wrote {} spectra to {} ({} bytes).".format(len(spectra), output_path, os.path.getsize(output_path)))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
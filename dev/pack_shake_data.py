@@ -0,0 +1,58 @@
+# Converts shake data in the old Python-literal format (a module defining a
+# `SHAKE_LIST` dict, like `shake_data_src.py` in this directory) into the packed
+# binary format loaded by the addon, and verifies that every value round-trips
+# exactly.
+#
+# This is a development tool, and isn't needed by end users.  It doesn't need
+# Blender, and can be run with any Python 3:
+#
+#     python3 dev/pack_shake_data.py [SOURCE.py] [OUTPUT.bin]
+#
+# By default it reads `dev/shake_data_src.py` and writes `shake_data.bin` next
+# to the addon's `shake_data.py`.
+
+import os
+import sys
+
+DEV_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(DEV_DIR)
+sys.path.insert(0, ADDON_DIR)
+
+import shake_data
+
+
+def load_literal_shake_list(path):
+    namespace = {}
+    with open(path, "r", encoding="utf-8") as f:
+        exec(compile(f.read(), path, "exec"), namespace)
+    return namespace["SHAKE_LIST"]
+
+
+def verify_round_trip(source, packed_path):
+    packed = shake_data.ShakeList(packed_path)
+    if list(packed.keys()) != list(source.keys()):
+        raise AssertionError("Shake ids or order differ after packing")
+    for id in source:
+        if packed[id] != source[id]:
+            raise AssertionError("Shake '{}' differs after packing".format(id))
+
+
+def main(argv):
+    source_path = argv[1] if len(argv) > 1 else os.path.join(DEV_DIR, "shake_data_src.py")
+    output_path = argv[2] if len(argv) > 2 else shake_data.SHAKE_DATA_PATH
+
+    source = load_literal_shake_list(source_path)
+    shake_data.write_shake_file(output_path, source)
+    verify_round_trip(source, output_path)
+
+    print("Packed {} shakes from {} ({} bytes) into {} ({} bytes).".format(
+        len(source),
+        source_path,
+        os.path.getsize(source_path),
+        output_path,
+        os.path.getsize(output_path),
+    ))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
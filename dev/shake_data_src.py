@@ -0,0 +1,75 @@
+SHAKE_LIST = {
+    "INVESTIGATION": ("Investigation", 24.0, {
+        ('location', 0): [(0, 0.021819), (1, 0.012368), (2, 0.003192), (3, -0.006550), (4, -0.016339), (5, -0.026018), (6, -0.034887), (7, -0.042019), (8, -0.049939), (9, -0.056172), (10, -0.061366), (11, -0.066012), (12, -0.070278), (13, -0.075834), (14, -0.080062), (15, -0.085495), (16, -0.090940), (17, -0.095961), (18, -0.101095), (19, -0.106177), (20, -0.111180), (21, -0.116064), (22, -0.120905), (23, -0.125763), (24, -0.131110), (25, -0.135837), (26, -0.140447), (27, -0.144403), (28, -0.148510), (29, -0.151668), (30, -0.152941), (31, -0.156221), (32, -0.162279), (33, -0.169061), (34, -0.176461), (35, -0.182510), (36, -0.186673), (37, -0.189361), (38, -0.191242), (39, -0.194900), (40, -0.197357), (41, -0.199245), (42, -0.201040), (43, -0.202700), (44, -0.204774), (45, -0.206178), (46, -0.207589), (47, -0.209708), (48, -0.211459), (49, -0.212665), (50, -0.213541), (51, -0.213835), (52, -0.214496), (53, -0.215382), (54, -0.217090), (55, -0.221154), (56, -0.224319), (57, -0.228769), (58, -0.231445), (59, -0.234377), (60, -0.237737), (61, -0.240104), (62, -0.242053), (63, -0.243004), (64, -0.244117), (65, -0.244425), (66, -0.243168), (67, -0.242141), (68, -0.241821), (69, -0.241773), (70, -0.242412), (71, -0.241920), (72, -0.242203), (73, -0.239480), (74, -0.236067), (75, -0.232184), (76, -0.227986), (77, -0.226187), (78, -0.223316), (79, -0.221301), (80, -0.217417), (81, -0.214397), (82, -0.210026), (83, -0.206673), (84, -0.203780), (85, -0.200372), (86, -0.196763), (87, -0.192126), (88, -0.187427), (89, -0.183385), (90, -0.179442), (91, -0.175286), (92, -0.169655), (93, -0.164775), (94, -0.159902), (95, -0.153548), (96, -0.150353), (97, -0.148575), (98, -0.147311), (99, -0.144095), (100, -0.141059), (101, -0.138495), (102, -0.136538), (103, -0.135235), (104, -0.134107), (105, -0.132890), (106, -0.130241), (107, -0.127601), (108, -0.124418), (109, -0.120474), (110, -0.116139), (111, -0.111402), (112, -0.107792), (113, -0.104194), (114, -0.100679), (115, -0.096566), (116, -0.093592), (117, -0.091974), (118, -0.091595), (119, -0.092374), (120, -0.093917), (121, -0.095131), (122, -0.095733), (123, -0.095824), (124, -0.096493), (125, -0.098141), (126, -0.100411), (127, -0.102545), (128, -0.105664), (129, -0.109149), (130, -0.113019), (131, -0.116814), (132, -0.121083), (133, -0.124707), (134, -0.127718), (135, -0.130643), (136, -0.133213), (137, -0.135697), (138, -0.137416), (139, -0.138920), (140, -0.138718), (141, -0.137933), (142, -0.136365), (143, -0.134356), (144, -0.131411), (145, -0.128308), (146, -0.124466), (147, -0.121465), (148, -0.117868), (149, -0.115640), (150, -0.112450), (151, -0.112923), (152, -0.113673), (153, -0.115733), (154, -0.115463), (155, -0.114305), (156, -0.112894), (157, -0.111642), (158, -0.110926), (159, -0.109431), (160, -0.109151), (161, -0.107809), (162, -0.108091), (163, -0.105725), (164, -0.101777), (165, -0.096781), (166, -0.091344), (167, -0.085706), (168, -0.079978), (169, -0.074584), (170, -0.068466), (171, -0.063174), (172, -0.058409), (173, -0.052818), (174, -0.046163), (175, -0.040124), (176, -0.034181), (177, -0.027608), (178, -0.022729), (179, -0.015939), (180, -0.011040), (181, -0.005775), (182, -0.001767), (183, 0.002795), (184, 0.006824), (185, 0.011953), (186, 0.016769), (187, 0.021467), (188, 0.025224), (189, 0.029206), (190, 0.033157), (191, 0.034732), (192, 0.037727), (193, 0.038889), (194, 0.040164), (195, 0.039905), (196, 0.039475), (197, 0.039377), (198, 0.038610), (199, 0.037526), (200, 0.035025), (201, 0.033177), (202, 0.031235), (203, 0.029469), (204, 0.027606), (205, 0.024406), (206, 0.021168), (207, 0.018235), (208, 0.015396), (209, 0.012284), (210, 0.008344), (211, 0.004378), (212, -0.000789), (213, -0.003943), (214, -0.006213), (215, -0.009609), (216, -0.012470), (217, -0.014667), (218, -0.017930), (219, -0.020415), (220, -0.021939), (221, -0.023782), (222, -0.024823), (223, -0.027069), (224, -0.030103), (225, -0.031093), (226, -0.032917), (227, -0.035371), (228, -0.037845), (229, -0.040165), (230, -0.042721), (231, -0.044713), (232, -0.045933), (233, -0.050767), (234, -0.050549), (235, -0.054889), (236, -0.056804), (237, -0.058702), (238, -0.060120), (239, -0.062345), (240, -0.065202), (241, -0.067013), (242, -0.070071), (243, -0.071447), (244, -0.074546), (245, -0.076468), (246, -0.077345), (247, -0.078502), (248, -0.080165), (249, -0.080317), (250, -0.086436), (251, -0.085962), (252, -0.085341), (253, -0.084204), (254, -0.081790), (255, -0.079656), (256, -0.077789), (257, -0.074561), (258, -0.070708), (259, -0.066158), (260, -0.062436), (261, -0.058702), (262, -0.054996), (263, -0.051689), (264, -0.047849), (265, -0.043810), (266, -0.039606), (267, -0.035009), (268, -0.030804), (269, -0.026571), (270, -0.022500), (271, -0.018267), (272, -0.014322), (273, -0.011338), (274, -0.006208), (275, -0.003142), (276, -0.000502), (277, 0.001287), (278, 0.003183), (279, 0.004538), (280, 0.005444), (281, 0.005567), (282, 0.005034), (283, 0.004540), (284, 0.004666), (285, 0.003491), (286, 0.003236), (287, 0.002391), (288, 0.002178), (289, 0.002222), (290, 0.002159), (291, 0.002454), (292, 0.002860), (293, 0.003124), (294, 0.003109), (295, 0.003438), (296, 0.004080), (297, 0.004269), (298, 0.005184), (299, 0.005959), (300, 0.006053), (301, 0.006896), (302, 0.007623), (303, 0.008652), (304, 0.009656), (305, 0.010911), (306, 0.011937), (307, 0.013900), (308, 0.015222), (309, 0.016509), (310, 0.018416), (311, 0.020780), (312, 0.023245), (313, 0.025865), (314, 0.028403), (315, 0.030632), (316, 0.032807), (317, 0.034764), (318, 0.037335), (319, 0.039534), (320, 0.042262), (321, 0.045650), (322, 0.049205), (323, 0.052355), (324, 0.054701), (325, 0.057475), (326, 0.060015), (327, 0.062916), (328, 0.065300), (329, 0.067722), (330, 0.070228), (331, 0.071757), (332, 0.073171), (333, 0.074482), (334, 0.075646), (335, 0.076205), (336, 0.076582), (337, 0.076681), (338, 0.076909), (339, 0.076835), (340, 0.076681), (341, 0.076818), (342, 0.077076), (343, 0.077268), (344, 0.078078), (345, 0.079215), (346, 0.079996), (347, 0.081517), (348, 0.081337), (349, 0.082381), (350, 0.081848), (351, 0.080697), (352, 0.079344), (353, 0.077664), (354, 0.075831), (355, 0.073276), (356, 0.070420), (357, 0.066948), (358, 0.062833), (359, 0.059599), (360, 0.055332), (361, 0.050333), (362, 0.045575), (363, 0.040193), (364, 0.034548), (365, 0.028773), (366, 0.022693), (367, 0.023183), (368, 0.023425), (369, 0.023147), (370, 0.021201), (371, 0.015919), ],
+        ('location', 1): [(0, 0.004563), (1, 0.000000), (2, -0.004563), (3, -0.008587), (4, -0.012519), (5, -0.017078), (6, -0.021599), (7, -0.026818), (8, -0.031728), (9, -0.036636), (10, -0.041351), (11, -0.045605), (12, -0.049422), (13, -0.052272), (14, -0.054630), (15, -0.055820), (16, -0.056572), (17, -0.057333), (18, -0.057542), (19, -0.057255), (20, -0.056352), (21, -0.055004), (22, -0.053005), (23, -0.050269), (24, -0.046786), (25, -0.043059), (26, -0.038912), (27, -0.034588), (28, -0.030218), (29, -0.026238), (30, -0.021813), (31, -0.017199), (32, -0.011611), (33, -0.005447), (34, 0.000563), (35, 0.006140), (36, 0.011122), (37, 0.015480), (38, 0.020329), (39, 0.025698), (40, 0.030947), (41, 0.036048), (42, 0.041478), (43, 0.046858), (44, 0.052132), (45, 0.056985), (46, 0.061732), (47, 0.066366), (48, 0.068953), (49, 0.072635), (50, 0.075517), (51, 0.077485), (52, 0.078964), (53, 0.079619), (54, 0.079679), (55, 0.079617), (56, 0.078445), (57, 0.074942), (58, 0.071836), (59, 0.068443), (60, 0.063991), (61, 0.059588), (62, 0.054775), (63, 0.051071), (64, 0.047173), (65, 0.043409), (66, 0.040029), (67, 0.037057), (68, 0.034226), (69, 0.031547), (70, 0.028447), (71, 0.026215), (72, 0.024015), (73, 0.022841), (74, 0.022001), (75, 0.021226), (76, 0.020454), (77, 0.019774), (78, 0.018314), (79, 0.016641), (80, 0.014147), (81, 0.010553), (82, 0.006600), (83, 0.002133), (84, -0.003087), (85, -0.008636), (86, -0.014613), (87, -0.020482), (88, -0.026618), (89, -0.033029), (90, -0.039052), (91, -0.044727), (92, -0.050663), (93, -0.054914), (94, -0.058150), (95, -0.060950), (96, -0.064082), (97, -0.065681), (98, -0.065935), (99, -0.065884), (100, -0.064897), (101, -0.064156), (102, -0.063696), (103, -0.063380), (104, -0.063373), (105, -0.063483), (106, -0.063519), (107, -0.064205), (108, -0.065070), (109, -0.067426), (110, -0.069086), (111, -0.071652), (112, -0.075219), (113, -0.079200), (114, -0.083346), (115, -0.087421), (116, -0.092151), (117, -0.097071), (118, -0.102674), (119, -0.108824), (120, -0.115232), (121, -0.121546), (122, -0.129450), (123, -0.135572), (124, -0.141381), (125, -0.147423), (126, -0.153307), (127, -0.158870), (128, -0.164475), (129, -0.169794), (130, -0.174973), (131, -0.179787), (132, -0.184782), (133, -0.189209), (134, -0.193595), (135, -0.198923), (136, -0.203545), (137, -0.207536), (138, -0.211792), (139, -0.214902), (140, -0.217268), (141, -0.219655), (142, -0.221296), (143, -0.222478), (144, -0.222596), (145, -0.223442), (146, -0.223081), (147, -0.222852), (148, -0.222042), (149, -0.221626), (150, -0.221307), (151, -0.220343), (152, -0.219796), (153, -0.218446), (154, -0.216401), (155, -0.213846), (156, -0.211706), (157, -0.209673), (158, -0.207618), (159, -0.205818), (160, -0.203303), (161, -0.200124), (162, -0.197440), (163, -0.193315), (164, -0.189087), (165, -0.185010), (166, -0.181208), (167, -0.177650), (168, -0.174209), (169, -0.170776), (170, -0.167015), (171, -0.163480), (172, -0.163091), (173, -0.159128), (174, -0.155814), (175, -0.152939), (176, -0.150686), (177, -0.148418), (178, -0.147508), (179, -0.144904), (180, -0.142857), (181, -0.140104), (182, -0.136933), (183, -0.133856), (184, -0.130646), (185, -0.127406), (186, -0.124447), (187, -0.121680), (188, -0.118347), (189, -0.114947), (190, -0.111224), (191, -0.108751), (192, -0.105523), (193, -0.102368), (194, -0.099087), (195, -0.095847), (196, -0.092736), (197, -0.089742), (198, -0.087217), (199, -0.085268), (200, -0.083607), (201, -0.082499), (202, -0.081784), (203, -0.081884), (204, -0.082744), (205, -0.084354), (206, -0.086810), (207, -0.089946), (208, -0.092908), (209, -0.096809), (210, -0.100063), (211, -0.103944), (212, -0.108268), (213, -0.113144), (214, -0.118505), (215, -0.124315), (216, -0.131339), (217, -0.137796), (218, -0.144310), (219, -0.150864), (220, -0.157592), (221, -0.164649), (222, -0.172519), (223, -0.178676), (224, -0.184188), (225, -0.189226), (226, -0.194690), (227, -0.198874), (228, -0.202774), (229, -0.206464), (230, -0.209918), (231, -0.213133), (232, -0.216575), (233, -0.218739), (234, -0.221302), (235, -0.224017), (236, -0.227426), (237, -0.230605), (238, -0.233794), (239, -0.236475), (240, -0.238644), (241, -0.240330), (242, -0.241648), (243, -0.243296), (244, -0.243880), (245, -0.243665), (246, -0.243778), (247, -0.242267), (248, -0.239758), (249, -0.236825), (250, -0.231902), (251, -0.228162), (252, -0.222588), (253, -0.216535), (254, -0.209573), (255, -0.202823), (256, -0.195788), (257, -0.188942), (258, -0.181511), (259, -0.175176), (260, -0.168532), (261, -0.161802), (262, -0.155097), (263, -0.148384), (264, -0.141918), (265, -0.135521), (266, -0.129376), (267, -0.123420), (268, -0.117391), (269, -0.111330), (270, -0.105225), (271, -0.099179), (272, -0.093362), (273, -0.087301), (274, -0.082347), (275, -0.076430), (276, -0.070988), (277, -0.066397), (278, -0.061563), (279, -0.057675), (280, -0.053826), (281, -0.050376), (282, -0.047329), (283, -0.045021), (284, -0.043618), (285, -0.041753), (286, -0.041097), (287, -0.039638), (288, -0.038602), (289, -0.037422), (290, -0.036359), (291, -0.035310), (292, -0.034561), (293, -0.033878), (294, -0.033303), (295, -0.032856), (296, -0.032746), (297, -0.032130), (298, -0.032303), (299, -0.031857), (300, -0.032445), (301, -0.032673), (302, -0.033087), (303, -0.033984), (304, -0.035650), (305, -0.036979), (306, -0.037953), (307, -0.039232), (308, -0.040114), (309, -0.040876), (310, -0.041822), (311, -0.043091), (312, -0.044498), (313, -0.046840), (314, -0.048565), (315, -0.050353), (316, -0.052419), (317, -0.054495), (318, -0.056383), (319, -0.058649), (320, -0.060368), (321, -0.061872), (322, -0.063334), (323, -0.063376), (324, -0.063983), (325, -0.064505), (326, -0.064827), (327, -0.065345), (328, -0.065692), (329, -0.066190), (330, -0.066416), (331, -0.066337), (332, -0.066237), (333, -0.066012), (334, -0.065861), (335, -0.065062), (336, -0.064800), (337, -0.064207), (338, -0.063828), (339, -0.062969), (340, -0.062549), (341, -0.061674), (342, -0.060992), (343, -0.060171), (344, -0.059162), (345, -0.058022), (346, -0.056824), (347, -0.055793), (348, -0.054525), (349, -0.053179), (350, -0.051607), (351, -0.049678), (352, -0.047596), (353, -0.045220), (354, -0.042685), (355, -0.039910), (356, -0.037039), (357, -0.034098), (358, -0.030981), (359, -0.028040), (360, -0.024846), (361, -0.021543), (362, -0.017857), (363, -0.014490), (364, -0.010595), (365, -0.007343), (366, -0.003896), (367, -0.003334), (368, -0.002895), (369, -0.002581), (370, -0.002391), (371, -0.002328), ],
+        ('location', 2): [(0, -0.003604), (1, -0.003431), (2, -0.003387), (3, -0.002934), (4, -0.002923), (5, -0.004425), (6, -0.006044), (7, -0.007711), (8, -0.009409), (9, -0.011712), (10, -0.013893), (11, -0.015884), (12, -0.018140), (13, -0.020823), (14, -0.022288), (15, -0.024929), (16, -0.028371), (17, -0.031594), (18, -0.035160), (19, -0.039225), (20, -0.043799), (21, -0.048301), (22, -0.052994), (23, -0.057878), (24, -0.062249), (25, -0.067346), (26, -0.072512), (27, -0.078334), (28, -0.084834), (29, -0.090696), (30, -0.098559), (31, -0.105297), (32, -0.112096), (33, -0.118169), (34, -0.124376), (35, -0.130853), (36, -0.137413), (37, -0.143449), (38, -0.148746), (39, -0.154161), (40, -0.159059), (41, -0.162930), (42, -0.166689), (43, -0.169550), (44, -0.171877), (45, -0.173642), (46, -0.174694), (47, -0.175965), (48, -0.176382), (49, -0.177220), (50, -0.177775), (51, -0.177753), (52, -0.177711), (53, -0.176909), (54, -0.176504), (55, -0.176155), (56, -0.171741), (57, -0.169074), (58, -0.166195), (59, -0.162117), (60, -0.159144), (61, -0.155228), (62, -0.153032), (63, -0.150175), (64, -0.147588), (65, -0.146311), (66, -0.144919), (67, -0.144705), (68, -0.143973), (69, -0.144011), (70, -0.143182), (71, -0.143875), (72, -0.142733), (73, -0.142851), (74, -0.141915), (75, -0.141343), (76, -0.139793), (77, -0.138276), (78, -0.135900), (79, -0.133874), (80, -0.131321), (81, -0.129867), (82, -0.128343), (83, -0.126424), (84, -0.124874), (85, -0.123678), (86, -0.122883), (87, -0.122079), (88, -0.120859), (89, -0.118557), (90, -0.116008), (91, -0.111800), (92, -0.107878), (93, -0.103568), (94, -0.099378), (95, -0.095786), (96, -0.092950), (97, -0.089710), (98, -0.087448), (99, -0.086165), (100, -0.085617), (101, -0.084701), (102, -0.082626), (103, -0.081386), (104, -0.080311), (105, -0.079194), (106, -0.077948), (107, -0.077728), (108, -0.076876), (109, -0.077097), (110, -0.077435), (111, -0.078076), (112, -0.078254), (113, -0.077841), (114, -0.076435), (115, -0.076084), (116, -0.074345), (117, -0.072926), (118, -0.071214), (119, -0.069515), (120, -0.068266), (121, -0.066611), (122, -0.065535), (123, -0.063685), (124, -0.063267), (125, -0.062389), (126, -0.062873), (127, -0.062686), (128, -0.062393), (129, -0.062479), (130, -0.063149), (131, -0.063858), (132, -0.064822), (133, -0.066471), (134, -0.067867), (135, -0.070505), (136, -0.072934), (137, -0.075273), (138, -0.077878), (139, -0.080514), (140, -0.082300), (141, -0.083642), (142, -0.084731), (143, -0.084737), (144, -0.084371), (145, -0.084157), (146, -0.084031), (147, -0.084015), (148, -0.083573), (149, -0.083482), (150, -0.083942), (151, -0.084577), (152, -0.084261), (153, -0.085281), (154, -0.084848), (155, -0.084659), (156, -0.084522), (157, -0.084502), (158, -0.085217), (159, -0.085489), (160, -0.086460), (161, -0.088324), (162, -0.090657), (163, -0.091461), (164, -0.093360), (165, -0.095918), (166, -0.099633), (167, -0.103652), (168, -0.107620), (169, -0.112333), (170, -0.115742), (171, -0.119999), (172, -0.117645), (173, -0.122978), (174, -0.126298), (175, -0.130895), (176, -0.135572), (177, -0.139835), (178, -0.142878), (179, -0.146481), (180, -0.149262), (181, -0.150128), (182, -0.151102), (183, -0.149717), (184, -0.149501), (185, -0.148484), (186, -0.147526), (187, -0.146201), (188, -0.145922), (189, -0.143860), (190, -0.142997), (191, -0.142945), (192, -0.142688), (193, -0.142299), (194, -0.142940), (195, -0.143366), (196, -0.144003), (197, -0.144612), (198, -0.145202), (199, -0.146176), (200, -0.148269), (201, -0.149573), (202, -0.150931), (203, -0.153019), (204, -0.154563), (205, -0.156096), (206, -0.157333), (207, -0.157816), (208, -0.157934), (209, -0.157841), (210, -0.156853), (211, -0.155240), (212, -0.154249), (213, -0.152395), (214, -0.150554), (215, -0.148880), (216, -0.147122), (217, -0.145068), (218, -0.142954), (219, -0.140816), (220, -0.138276), (221, -0.135998), (222, -0.132468), (223, -0.129297), (224, -0.126206), (225, -0.122513), (226, -0.119597), (227, -0.117359), (228, -0.115663), (229, -0.114515), (230, -0.113587), (231, -0.112944), (232, -0.110363), (233, -0.110045), (234, -0.110090), (235, -0.110439), (236, -0.110336), (237, -0.110145), (238, -0.109789), (239, -0.110163), (240, -0.110368), (241, -0.110246), (242, -0.110857), (243, -0.110295), (244, -0.109649), (245, -0.108906), (246, -0.107782), (247, -0.107452), (248, -0.107152), (249, -0.107440), (250, -0.109514), (251, -0.110772), (252, -0.112183), (253, -0.113506), (254, -0.115346), (255, -0.116863), (256, -0.118343), (257, -0.119957), (258, -0.121212), (259, -0.122436), (260, -0.123247), (261, -0.124118), (262, -0.125408), (263, -0.126860), (264, -0.128373), (265, -0.130792), (266, -0.133386), (267, -0.136587), (268, -0.139846), (269, -0.143595), (270, -0.147358), (271, -0.151311), (272, -0.155256), (273, -0.159262), (274, -0.163241), (275, -0.167040), (276, -0.170381), (277, -0.173967), (278, -0.177144), (279, -0.180136), (280, -0.183660), (281, -0.187114), (282, -0.189819), (283, -0.192913), (284, -0.196269), (285, -0.199092), (286, -0.201940), (287, -0.204316), (288, -0.206427), (289, -0.208144), (290, -0.209730), (291, -0.210905), (292, -0.211834), (293, -0.212207), (294, -0.212258), (295, -0.211738), (296, -0.210305), (297, -0.208905), (298, -0.206793), (299, -0.204761), (300, -0.202104), (301, -0.200330), (302, -0.198433), (303, -0.196560), (304, -0.195210), (305, -0.193731), (306, -0.192116), (307, -0.191094), (308, -0.189667), (309, -0.188694), (310, -0.187659), (311, -0.187136), (312, -0.187384), (313, -0.187039), (314, -0.186758), (315, -0.186211), (316, -0.185278), (317, -0.184071), (318, -0.182512), (319, -0.180876), (320, -0.178721), (321, -0.176140), (322, -0.173310), (323, -0.169836), (324, -0.166006), (325, -0.161974), (326, -0.158272), (327, -0.154256), (328, -0.150254), (329, -0.145800), (330, -0.141954), (331, -0.137997), (332, -0.133824), (333, -0.130198), (334, -0.126365), (335, -0.122831), (336, -0.119385), (337, -0.115853), (338, -0.111928), (339, -0.107446), (340, -0.102448), (341, -0.097800), (342, -0.092950), (343, -0.087904), (344, -0.083108), (345, -0.078258), (346, -0.073493), (347, -0.068920), (348, -0.064349), (349, -0.059750), (350, -0.054994), (351, -0.050122), (352, -0.045588), (353, -0.040696), (354, -0.036441), (355, -0.032603), (356, -0.029037), (357, -0.025576), (358, -0.022211), (359, -0.019184), (360, -0.016366), (361, -0.013428), (362, -0.010252), (363, -0.007528), (364, -0.004730), (365, -0.002014), (366, 0.000315), (367, 0.000184), (368, 0.000082), (369, 0.000009), (370, -0.000035), (371, -0.000050), ],
+        ('rotation_euler', 0): [(0, 0.001086), (1, 0.000000), (2, -0.001075), (3, -0.002893), (4, -0.005007), (5, -0.007058), (6, -0.009427), (7, -0.012662), (8, -0.015891), (9, -0.018930), (10, -0.021792), (11, -0.024398), (12, -0.026323), (13, -0.027796), (14, -0.029139), (15, -0.029992), (16, -0.030573), (17, -0.031318), (18, -0.032108), (19, -0.032828), (20, -0.033513), (21, -0.034246), (22, -0.034973), (23, -0.035479), (24, -0.036153), (25, -0.036343), (26, -0.036386), (27, -0.036306), (28, -0.035963), (29, -0.035662), (30, -0.033587), (31, -0.032713), (32, -0.031968), (33, -0.031366), (34, -0.030654), (35, -0.029818), (36, -0.028962), (37, -0.028244), (38, -0.027626), (39, -0.026832), (40, -0.026039), (41, -0.025564), (42, -0.025193), (43, -0.025012), (44, -0.024907), (45, -0.024929), (46, -0.025139), (47, -0.025234), (48, -0.025419), (49, -0.025086), (50, -0.024741), (51, -0.024573), (52, -0.024419), (53, -0.024146), (54, -0.023638), (55, -0.022881), (56, -0.023467), (57, -0.023456), (58, -0.023539), (59, -0.024264), (60, -0.025272), (61, -0.026848), (62, -0.027832), (63, -0.028850), (64, -0.029506), (65, -0.029817), (66, -0.030177), (67, -0.030456), (68, -0.030919), (69, -0.031204), (70, -0.031397), (71, -0.030731), (72, -0.030256), (73, -0.029254), (74, -0.028660), (75, -0.028380), (76, -0.028414), (77, -0.028266), (78, -0.028399), (79, -0.028477), (80, -0.029426), (81, -0.030865), (82, -0.032927), (83, -0.035659), (84, -0.038263), (85, -0.040685), (86, -0.042912), (87, -0.045534), (88, -0.048457), (89, -0.051165), (90, -0.052772), (91, -0.053632), (92, -0.053923), (93, -0.054569), (94, -0.055990), (95, -0.058112), (96, -0.059621), (97, -0.060512), (98, -0.060874), (99, -0.061443), (100, -0.062870), (101, -0.065358), (102, -0.068426), (103, -0.070848), (104, -0.072522), (105, -0.073425), (106, -0.073928), (107, -0.073808), (108, -0.073691), (109, -0.073513), (110, -0.073722), (111, -0.074326), (112, -0.075131), (113, -0.075787), (114, -0.076237), (115, -0.076211), (116, -0.076494), (117, -0.076307), (118, -0.075670), (119, -0.074385), (120, -0.072279), (121, -0.069880), (122, -0.067600), (123, -0.066283), (124, -0.065079), (125, -0.064107), (126, -0.062882), (127, -0.061842), (128, -0.060855), (129, -0.059753), (130, -0.058506), (131, -0.057747), (132, -0.057693), (133, -0.058431), (134, -0.059861), (135, -0.061441), (136, -0.063152), (137, -0.064391), (138, -0.065169), (139, -0.065444), (140, -0.066197), (141, -0.067364), (142, -0.068225), (143, -0.068858), (144, -0.068846), (145, -0.067929), (146, -0.066944), (147, -0.065526), (148, -0.063491), (149, -0.060357), (150, -0.056386), (151, -0.052839), (152, -0.050056), (153, -0.046295), (154, -0.043970), (155, -0.042720), (156, -0.042207), (157, -0.042120), (158, -0.041830), (159, -0.041446), (160, -0.039784), (161, -0.037306), (162, -0.034021), (163, -0.032342), (164, -0.031182), (165, -0.030793), (166, -0.031123), (167, -0.032741), (168, -0.035219), (169, -0.037826), (170, -0.041097), (171, -0.043726), (172, -0.048653), (173, -0.050819), (174, -0.054050), (175, -0.056913), (176, -0.059945), (177, -0.062703), (178, -0.064876), (179, -0.065331), (180, -0.063704), (181, -0.061490), (182, -0.057569), (183, -0.053609), (184, -0.048267), (185, -0.043468), (186, -0.037797), (187, -0.032504), (188, -0.026545), (189, -0.021058), (190, -0.015401), (191, -0.009841), (192, -0.005347), (193, -0.001550), (194, 0.001801), (195, 0.004395), (196, 0.006210), (197, 0.007354), (198, 0.008140), (199, 0.008931), (200, 0.010235), (201, 0.011152), (202, 0.012148), (203, 0.013456), (204, 0.014394), (205, 0.015243), (206, 0.015819), (207, 0.015704), (208, 0.015900), (209, 0.016773), (210, 0.018018), (211, 0.019382), (212, 0.021420), (213, 0.022841), (214, 0.023867), (215, 0.024802), (216, 0.025360), (217, 0.025621), (218, 0.026096), (219, 0.026649), (220, 0.026908), (221, 0.026893), (222, 0.025630), (223, 0.024392), (224, 0.023055), (225, 0.021444), (226, 0.020416), (227, 0.019701), (228, 0.018795), (229, 0.017493), (230, 0.015478), (231, 0.013001), (232, 0.009160), (233, 0.006667), (234, 0.003559), (235, 0.000770), (236, -0.002916), (237, -0.006569), (238, -0.010012), (239, -0.012298), (240, -0.013704), (241, -0.014490), (242, -0.014419), (243, -0.014738), (244, -0.014503), (245, -0.013932), (246, -0.013163), (247, -0.011508), (248, -0.009769), (249, -0.007676), (250, -0.003654), (251, -0.000727), (252, 0.002433), (253, 0.006368), (254, 0.009583), (255, 0.012641), (256, 0.015503), (257, 0.017483), (258, 0.018603), (259, 0.019125), (260, 0.019595), (261, 0.019975), (262, 0.020418), (263, 0.020770), (264, 0.020688), (265, 0.020810), (266, 0.020650), (267, 0.020614), (268, 0.020594), (269, 0.020822), (270, 0.021070), (271, 0.021398), (272, 0.021870), (273, 0.022601), (274, 0.023021), (275, 0.023498), (276, 0.023926), (277, 0.024554), (278, 0.024781), (279, 0.024748), (280, 0.025043), (281, 0.025149), (282, 0.024166), (283, 0.022816), (284, 0.021519), (285, 0.020202), (286, 0.019125), (287, 0.018546), (288, 0.018424), (289, 0.018537), (290, 0.019428), (291, 0.020581), (292, 0.022054), (293, 0.023969), (294, 0.025956), (295, 0.028332), (296, 0.030599), (297, 0.033608), (298, 0.036251), (299, 0.039270), (300, 0.041868), (301, 0.044758), (302, 0.047252), (303, 0.049287), (304, 0.051103), (305, 0.052480), (306, 0.053618), (307, 0.054623), (308, 0.054992), (309, 0.055190), (310, 0.055016), (311, 0.054779), (312, 0.054723), (313, 0.054340), (314, 0.054233), (315, 0.054002), (316, 0.053884), (317, 0.054040), (318, 0.054743), (319, 0.056103), (320, 0.057225), (321, 0.058374), (322, 0.059843), (323, 0.061357), (324, 0.062897), (325, 0.064387), (326, 0.066171), (327, 0.067794), (328, 0.069347), (329, 0.070420), (330, 0.071688), (331, 0.072799), (332, 0.073512), (333, 0.074321), (334, 0.074667), (335, 0.075076), (336, 0.075097), (337, 0.074379), (338, 0.072307), (339, 0.069235), (340, 0.065542), (341, 0.061621), (342, 0.057004), (343, 0.052409), (344, 0.047912), (345, 0.043313), (346, 0.038645), (347, 0.033709), (348, 0.028855), (349, 0.023874), (350, 0.019085), (351, 0.014703), (352, 0.010764), (353, 0.007096), (354, 0.004270), (355, 0.002079), (356, 0.000442), (357, -0.000593), (358, -0.001208), (359, -0.001696), (360, -0.001853), (361, -0.001936), (362, -0.001995), (363, -0.001620), (364, -0.000796), (365, 0.000066), (366, 0.001146), (367, 0.002111), (368, 0.002769), (369, 0.003011), (370, 0.002472), (371, 0.001343), ],
+        ('rotation_euler', 1): [(0, 0.003974), (1, 0.000000), (2, -0.003977), (3, -0.007220), (4, -0.008964), (5, -0.009045), (6, -0.008403), (7, -0.007829), (8, -0.008275), (9, -0.008627), (10, -0.009438), (11, -0.011140), (12, -0.013551), (13, -0.016658), (14, -0.019090), (15, -0.020987), (16, -0.022070), (17, -0.022678), (18, -0.023137), (19, -0.023632), (20, -0.024325), (21, -0.025190), (22, -0.026179), (23, -0.027386), (24, -0.028402), (25, -0.028663), (26, -0.028627), (27, -0.028333), (28, -0.028286), (29, -0.028835), (30, -0.032944), (31, -0.040582), (32, -0.048855), (33, -0.053458), (34, -0.054497), (35, -0.052933), (36, -0.050939), (37, -0.050746), (38, -0.052877), (39, -0.056025), (40, -0.058265), (41, -0.060507), (42, -0.062998), (43, -0.064676), (44, -0.064998), (45, -0.063858), (46, -0.061508), (47, -0.058035), (48, -0.052998), (49, -0.047071), (50, -0.041628), (51, -0.037838), (52, -0.036211), (53, -0.036761), (54, -0.038916), (55, -0.040707), (56, -0.040501), (57, -0.039018), (58, -0.036626), (59, -0.035624), (60, -0.036972), (61, -0.039819), (62, -0.042720), (63, -0.044737), (64, -0.046403), (65, -0.048622), (66, -0.052722), (67, -0.059479), (68, -0.067968), (69, -0.075653), (70, -0.081199), (71, -0.082973), (72, -0.082553), (73, -0.080434), (74, -0.079328), (75, -0.079473), (76, -0.079926), (77, -0.079648), (78, -0.077481), (79, -0.074393), (80, -0.070945), (81, -0.069043), (82, -0.068363), (83, -0.068933), (84, -0.069367), (85, -0.068832), (86, -0.067953), (87, -0.067267), (88, -0.066929), (89, -0.065914), (90, -0.062494), (91, -0.056614), (92, -0.049262), (93, -0.043109), (94, -0.038237), (95, -0.035719), (96, -0.035906), (97, -0.033699), (98, -0.029602), (99, -0.024689), (100, -0.021622), (101, -0.020450), (102, -0.019376), (103, -0.016914), (104, -0.012479), (105, -0.006372), (106, 0.000582), (107, 0.007226), (108, 0.012984), (109, 0.017144), (110, 0.018786), (111, 0.016968), (112, 0.012329), (113, 0.007512), (114, 0.002983), (115, -0.001852), (116, -0.008101), (117, -0.014524), (118, -0.020403), (119, -0.025050), (120, -0.028165), (121, -0.029460), (122, -0.030364), (123, -0.031993), (124, -0.034635), (125, -0.037658), (126, -0.040131), (127, -0.041750), (128, -0.042950), (129, -0.043062), (130, -0.042368), (131, -0.041192), (132, -0.040015), (133, -0.038463), (134, -0.036938), (135, -0.035376), (136, -0.033360), (137, -0.030784), (138, -0.027667), (139, -0.024056), (140, -0.020330), (141, -0.018345), (142, -0.017511), (143, -0.017460), (144, -0.017808), (145, -0.019519), (146, -0.022173), (147, -0.025994), (148, -0.029390), (149, -0.032826), (150, -0.035196), (151, -0.036815), (152, -0.036172), (153, -0.032926), (154, -0.028304), (155, -0.024521), (156, -0.023207), (157, -0.024018), (158, -0.026394), (159, -0.028435), (160, -0.029374), (161, -0.028092), (162, -0.025278), (163, -0.019267), (164, -0.015332), (165, -0.014126), (166, -0.015348), (167, -0.018103), (168, -0.021749), (169, -0.025655), (170, -0.028874), (171, -0.031233), (172, -0.033322), (173, -0.032691), (174, -0.031771), (175, -0.031426), (176, -0.031582), (177, -0.031605), (178, -0.032230), (179, -0.030734), (180, -0.027872), (181, -0.021902), (182, -0.014302), (183, -0.007905), (184, -0.004239), (185, -0.003209), (186, -0.004545), (187, -0.007570), (188, -0.010539), (189, -0.012153), (190, -0.012112), (191, -0.012609), (192, -0.012703), (193, -0.013661), (194, -0.014471), (195, -0.015746), (196, -0.016878), (197, -0.017861), (198, -0.019256), (199, -0.020947), (200, -0.022905), (201, -0.023818), (202, -0.023527), (203, -0.022682), (204, -0.022295), (205, -0.023189), (206, -0.025093), (207, -0.028538), (208, -0.032794), (209, -0.035413), (210, -0.035918), (211, -0.034784), (212, -0.032990), (213, -0.030118), (214, -0.027483), (215, -0.026422), (216, -0.026240), (217, -0.025844), (218, -0.025411), (219, -0.023271), (220, -0.019516), (221, -0.016511), (222, -0.015940), (223, -0.018263), (224, -0.021677), (225, -0.022980), (226, -0.022645), (227, -0.020629), (228, -0.017487), (229, -0.014473), (230, -0.013304), (231, -0.014336), (232, -0.016389), (233, -0.019648), (234, -0.019942), (235, -0.021374), (236, -0.021351), (237, -0.021637), (238, -0.021923), (239, -0.021815), (240, -0.020933), (241, -0.019093), (242, -0.017787), (243, -0.016034), (244, -0.014870), (245, -0.012333), (246, -0.008603), (247, -0.004503), (248, -0.000602), (249, 0.004263), (250, 0.005780), (251, 0.008402), (252, 0.008916), (253, 0.008101), (254, 0.006800), (255, 0.005466), (256, 0.003896), (257, 0.002803), (258, 0.001754), (259, 0.001686), (260, 0.002701), (261, 0.005275), (262, 0.008907), (263, 0.012497), (264, 0.015998), (265, 0.018512), (266, 0.019808), (267, 0.020456), (268, 0.020742), (269, 0.021428), (270, 0.022434), (271, 0.023644), (272, 0.024451), (273, 0.025160), (274, 0.027097), (275, 0.028896), (276, 0.030521), (277, 0.031703), (278, 0.033125), (279, 0.034409), (280, 0.035810), (281, 0.037528), (282, 0.039763), (283, 0.042934), (284, 0.046437), (285, 0.049342), (286, 0.052247), (287, 0.054682), (288, 0.057164), (289, 0.058466), (290, 0.058981), (291, 0.059230), (292, 0.059011), (293, 0.058658), (294, 0.057934), (295, 0.057983), (296, 0.058201), (297, 0.058181), (298, 0.058142), (299, 0.058037), (300, 0.057791), (301, 0.058478), (302, 0.058999), (303, 0.059068), (304, 0.058646), (305, 0.057929), (306, 0.056228), (307, 0.054834), (308, 0.053212), (309, 0.052425), (310, 0.052798), (311, 0.053474), (312, 0.053370), (313, 0.052506), (314, 0.051452), (315, 0.050438), (316, 0.049723), (317, 0.049562), (318, 0.050323), (319, 0.051117), (320, 0.051378), (321, 0.050384), (322, 0.047690), (323, 0.044514), (324, 0.042037), (325, 0.041369), (326, 0.041725), (327, 0.042510), (328, 0.042874), (329, 0.042948), (330, 0.042956), (331, 0.042349), (332, 0.041982), (333, 0.041989), (334, 0.041923), (335, 0.041761), (336, 0.041665), (337, 0.041515), (338, 0.041077), (339, 0.040674), (340, 0.041114), (341, 0.042825), (342, 0.044905), (343, 0.047497), (344, 0.050514), (345, 0.053109), (346, 0.054643), (347, 0.055360), (348, 0.053552), (349, 0.051937), (350, 0.049722), (351, 0.048173), (352, 0.047073), (353, 0.046612), (354, 0.046428), (355, 0.046024), (356, 0.045300), (357, 0.043945), (358, 0.041837), (359, 0.038500), (360, 0.033004), (361, 0.027603), (362, 0.022353), (363, 0.017360), (364, 0.012614), (365, 0.009967), (366, 0.008739), (367, 0.008371), (368, 0.008307), (369, 0.007987), (370, 0.006853), (371, 0.004347), ],
+        ('rotation_euler', 2): [(0, 0.002614), (1, 0.000000), (2, -0.002610), (3, -0.005844), (4, -0.009775), (5, -0.014285), (6, -0.018739), (7, -0.022587), (8, -0.025950), (9, -0.028716), (10, -0.030574), (11, -0.031568), (12, -0.031884), (13, -0.031717), (14, -0.031828), (15, -0.032260), (16, -0.032908), (17, -0.033682), (18, -0.034255), (19, -0.034364), (20, -0.033897), (21, -0.033321), (22, -0.032742), (23, -0.032786), (24, -0.033767), (25, -0.035752), (26, -0.038203), (27, -0.041120), (28, -0.043772), (29, -0.045103), (30, -0.045076), (31, -0.043076), (32, -0.041471), (33, -0.041444), (34, -0.043229), (35, -0.045818), (36, -0.048110), (37, -0.049071), (38, -0.048867), (39, -0.048418), (40, -0.048354), (41, -0.047722), (42, -0.046893), (43, -0.046211), (44, -0.046504), (45, -0.047082), (46, -0.047827), (47, -0.049216), (48, -0.051212), (49, -0.053287), (50, -0.054382), (51, -0.053787), (52, -0.051505), (53, -0.048278), (54, -0.044466), (55, -0.041005), (56, -0.037964), (57, -0.035209), (58, -0.032383), (59, -0.028813), (60, -0.023724), (61, -0.018374), (62, -0.013363), (63, -0.009382), (64, -0.006449), (65, -0.003766), (66, -0.001055), (67, 0.002125), (68, 0.004889), (69, 0.006224), (70, 0.005088), (71, 0.001145), (72, -0.004701), (73, -0.010587), (74, -0.015360), (75, -0.018105), (76, -0.019683), (77, -0.021160), (78, -0.022418), (79, -0.023049), (80, -0.023169), (81, -0.021489), (82, -0.018980), (83, -0.016396), (84, -0.014920), (85, -0.014333), (86, -0.015129), (87, -0.015968), (88, -0.016782), (89, -0.020312), (90, -0.024352), (91, -0.029823), (92, -0.036190), (93, -0.037490), (94, -0.037978), (95, -0.035587), (96, -0.032968), (97, -0.032879), (98, -0.032648), (99, -0.031323), (100, -0.028278), (101, -0.024997), (102, -0.022489), (103, -0.021623), (104, -0.021607), (105, -0.025022), (106, -0.025687), (107, -0.028648), (108, -0.027502), (109, -0.026216), (110, -0.021487), (111, -0.017100), (112, -0.012650), (113, -0.008202), (114, -0.004824), (115, -0.000335), (116, 0.003535), (117, 0.005654), (118, 0.006348), (119, 0.005306), (120, 0.002740), (121, 0.000436), (122, -0.000789), (123, -0.000738), (124, -0.000349), (125, -0.000163), (126, 0.000151), (127, 0.000542), (128, 0.000137), (129, 0.000187), (130, 0.000500), (131, 0.000391), (132, 0.000077), (133, 0.000334), (134, -0.000162), (135, -0.001378), (136, -0.002516), (137, -0.004847), (138, -0.006363), (139, -0.006890), (140, -0.006928), (141, -0.006853), (142, -0.006412), (143, -0.006241), (144, -0.005501), (145, -0.005166), (146, -0.005828), (147, -0.006230), (148, -0.004952), (149, -0.005582), (150, -0.007581), (151, -0.009452), (152, -0.009866), (153, -0.008837), (154, -0.005714), (155, -0.003098), (156, -0.000680), (157, -0.000376), (158, -0.002076), (159, -0.006113), (160, -0.009858), (161, -0.011482), (162, -0.011793), (163, -0.008935), (164, -0.006983), (165, -0.003877), (166, 0.000329), (167, 0.004170), (168, 0.005009), (169, 0.005429), (170, 0.004583), (171, 0.003898), (172, 0.004157), (173, 0.004281), (174, 0.003913), (175, 0.004667), (176, 0.003317), (177, -0.001183), (178, -0.004468), (179, -0.007529), (180, -0.008358), (181, -0.006864), (182, -0.004442), (183, -0.000856), (184, 0.002222), (185, 0.005748), (186, 0.005423), (187, 0.005460), (188, 0.006131), (189, 0.005557), (190, 0.005034), (191, 0.005270), (192, 0.004241), (193, 0.002756), (194, 0.001780), (195, 0.000210), (196, -0.001423), (197, -0.004340), (198, -0.008189), (199, -0.012573), (200, -0.015882), (201, -0.017690), (202, -0.018620), (203, -0.019040), (204, -0.019492), (205, -0.021913), (206, -0.024830), (207, -0.032918), (208, -0.037796), (209, -0.041964), (210, -0.045257), (211, -0.047401), (212, -0.048562), (213, -0.049785), (214, -0.051750), (215, -0.053911), (216, -0.054141), (217, -0.052474), (218, -0.050028), (219, -0.043466), (220, -0.042649), (221, -0.042060), (222, -0.041240), (223, -0.041724), (224, -0.041054), (225, -0.040290), (226, -0.037936), (227, -0.033482), (228, -0.028248), (229, -0.026261), (230, -0.023971), (231, -0.019111), (232, -0.017008), (233, -0.014843), (234, -0.013217), (235, -0.010291), (236, -0.009998), (237, -0.009597), (238, -0.009703), (239, -0.010447), (240, -0.009854), (241, -0.010463), (242, -0.011648), (243, -0.013348), (244, -0.015520), (245, -0.020220), (246, -0.024964), (247, -0.026832), (248, -0.028396), (249, -0.029228), (250, -0.028957), (251, -0.028805), (252, -0.028471), (253, -0.029082), (254, -0.029853), (255, -0.030290), (256, -0.031372), (257, -0.033898), (258, -0.036345), (259, -0.039018), (260, -0.040805), (261, -0.041634), (262, -0.041045), (263, -0.039640), (264, -0.036235), (265, -0.033247), (266, -0.031700), (267, -0.029994), (268, -0.026625), (269, -0.022728), (270, -0.020348), (271, -0.018194), (272, -0.016942), (273, -0.013506), (274, -0.009444), (275, -0.005348), (276, 0.000438), (277, 0.007067), (278, 0.009902), (279, 0.012304), (280, 0.017559), (281, 0.021450), (282, 0.024483), (283, 0.027045), (284, 0.029047), (285, 0.030092), (286, 0.031107), (287, 0.032971), (288, 0.035094), (289, 0.037186), (290, 0.038977), (291, 0.040729), (292, 0.041858), (293, 0.043408), (294, 0.044431), (295, 0.044958), (296, 0.044863), (297, 0.044104), (298, 0.043476), (299, 0.041361), (300, 0.039561), (301, 0.037406), (302, 0.034351), (303, 0.031576), (304, 0.028215), (305, 0.024555), (306, 0.022810), (307, 0.022044), (308, 0.019471), (309, 0.016815), (310, 0.012537), (311, 0.009645), (312, 0.007258), (313, 0.004587), (314, 0.003600), (315, 0.002977), (316, 0.001492), (317, 0.000242), (318, -0.001215), (319, -0.001601), (320, -0.000822), (321, 0.000892), (322, 0.004196), (323, 0.005635), (324, 0.005798), (325, 0.005928), (326, 0.005630), (327, 0.005343), (328, 0.005499), (329, 0.006249), (330, 0.007014), (331, 0.007774), (332, 0.008607), (333, 0.009505), (334, 0.010459), (335, 0.011506), (336, 0.012603), (337, 0.014379), (338, 0.015595), (339, 0.017891), (340, 0.018344), (341, 0.018409), (342, 0.016910), (343, 0.014980), (344, 0.013412), (345, 0.011253), (346, 0.010795), (347, 0.011260), (348, 0.013259), (349, 0.014816), (350, 0.015967), (351, 0.017171), (352, 0.018114), (353, 0.018118), (354, 0.017265), (355, 0.015835), (356, 0.013062), (357, 0.012092), (358, 0.011636), (359, 0.011609), (360, 0.011972), (361, 0.011968), (362, 0.011678), (363, 0.009920), (364, 0.008247), (365, 0.006687), (366, 0.004890), (367, 0.004460), (368, 0.004040), (369, 0.003572), (370, 0.003114), (371, 0.002647), ],
+    }),
+
+    "THE_CLOSEUP": ("The Closeup", 24.0, {
+        ('location', 0): [(-1, -0.000227), (0, -0.000299), (1, -0.000469), (2, -0.000660), (3, -0.000943), (4, -0.001298), (5, -0.001576), (6, -0.001864), (7, -0.002182), (8, -0.002463), (9, -0.002803), (10, -0.003173), (11, -0.003526), (12, -0.003903), (13, -0.004212), (14, -0.004474), (15, -0.004739), (16, -0.004931), (17, -0.005085), (18, -0.005182), (19, -0.005165), (20, -0.005100), (21, -0.004992), (22, -0.004857), (23, -0.004703), (24, -0.004500), (25, -0.004335), (26, -0.004187), (27, -0.004048), (28, -0.004012), (29, -0.003932), (30, -0.003799), (31, -0.003699), (32, -0.003519), (33, -0.003366), (34, -0.003300), (35, -0.003184), (36, -0.003050), (37, -0.002934), (38, -0.002782), (39, -0.002635), (40, -0.002504), (41, -0.002351), (42, -0.002221), (43, -0.002134), (44, -0.002026), (45, -0.002007), (46, -0.002064), (47, -0.002041), (48, -0.002013), (49, -0.001991), (50, -0.001909), (51, -0.001789), (52, -0.001695), (53, -0.001619), (54, -0.001486), (55, -0.001380), (56, -0.001310), (57, -0.001181), (58, -0.001039), (59, -0.000912), (60, -0.000796), (61, -0.000711), (62, -0.000694), (63, -0.000705), (64, -0.000724), (65, -0.000732), (66, -0.000695), (67, -0.000704), (68, -0.000760), (69, -0.000841), (70, -0.001008), (71, -0.001213), (72, -0.001428), (73, -0.001683), (74, -0.001994), (75, -0.002324), (76, -0.002667), (77, -0.003075), (78, -0.003516), (79, -0.003967), (80, -0.004411), (81, -0.004842), (82, -0.005177), (83, -0.005400), (84, -0.005557), (85, -0.005637), (86, -0.005717), (87, -0.005744), (88, -0.005705), (89, -0.005685), (90, -0.005657), (91, -0.005631), (92, -0.005621), (93, -0.005628), (94, -0.005617), (95, -0.005550), (96, -0.005452), (97, -0.005342), (98, -0.005212), (99, -0.005017), (100, -0.004791), (101, -0.004532), (102, -0.004241), (103, -0.003962), (104, -0.003683), (105, -0.003368), (106, -0.003032), (107, -0.002732), (108, -0.002403), (109, -0.002096), (110, -0.001815), (111, -0.001534), (112, -0.001294), (113, -0.001045), (114, -0.000836), (115, -0.000689), (116, -0.000573), (117, -0.000442), (118, -0.000313), (119, -0.000200), (120, -0.000049), (121, 0.000092), (122, 0.000213), (123, 0.000393), (124, 0.000601), (125, 0.000796), (126, 0.001073), (127, 0.001306), (128, 0.001432), (129, 0.001560), (130, 0.001602), (131, 0.001605), (132, 0.001539), (133, 0.001379), (134, 0.001242), (135, 0.001060), (136, 0.000869), (137, 0.000737), (138, 0.000632), (139, 0.000527), (140, 0.000409), (141, 0.000310), (142, 0.000203), (143, 0.000093), (144, -0.000054), (145, -0.000234), (146, -0.000393), (147, -0.000570), (148, -0.000745), (149, -0.000905), (150, -0.001067), (151, -0.001249), (152, -0.001478), (153, -0.001721), (154, -0.001959), (155, -0.002184), (156, -0.002432), (157, -0.002698), (158, -0.002946), (159, -0.003205), (160, -0.003415), (161, -0.003482), (162, -0.003484), (163, -0.003441), (164, -0.003344), (165, -0.003292), (166, -0.003274), (167, -0.003313), (168, -0.003327), (169, -0.003309), (170, -0.003321), (171, -0.003221), (172, -0.003095), (173, -0.002986), (174, -0.002817), (175, -0.002640), (176, -0.002456), (177, -0.002259), (178, -0.002140), (179, -0.002094), (180, -0.002056), (181, -0.002101), (182, -0.002123), (183, -0.002058), (184, -0.001968), (185, -0.001858), (186, -0.001705), (187, -0.001538), (188, -0.001416), (189, -0.001329), (190, -0.001296), (191, -0.001312), (192, -0.001383), (193, -0.001488), (194, -0.001567), (195, -0.001644), (196, -0.001720), (197, -0.001787), (198, -0.001857), (199, -0.001929), (200, -0.002017), (201, -0.002106), (202, -0.002195), (203, -0.002314), (204, -0.002449), (205, -0.002589), (206, -0.002717), (207, -0.002862), (208, -0.003006), (209, -0.003087), (210, -0.003189), (211, -0.003283), (212, -0.003290), (213, -0.003307), (214, -0.003342), (215, -0.003349), (216, -0.003343), (217, -0.003316), (218, -0.003255), (219, -0.003107), (220, -0.002932), (221, -0.002756), (222, -0.002493), (223, -0.002275), (224, -0.002079), (225, -0.001829), (226, -0.001647), (227, -0.001473), (228, -0.001311), (229, -0.001218), (230, -0.001126), (231, -0.001074), (232, -0.001090), (233, -0.001100), (234, -0.001150), (235, -0.001242), (236, -0.001275), (237, -0.001265), (238, -0.001197), (239, -0.001043), (240, -0.000925), (241, -0.000817), (242, -0.000665), (243, -0.000596), (244, -0.000554), (245, -0.000518), (246, -0.000549), (247, -0.000606), (248, -0.000670), (249, -0.000719), (250, -0.000758), (251, -0.000783), (252, -0.000828), (253, -0.000921), (254, -0.000990), (255, -0.001046), (256, -0.001138), (257, -0.001170), (258, -0.001182), (259, -0.001250), (260, -0.001294), (261, -0.001369), (262, -0.001466), (263, -0.001541), (264, -0.001652), (265, -0.001752), (266, -0.001834), (267, -0.001941), (268, -0.001998), (269, -0.001996), (270, -0.002005), (271, -0.002013), (272, -0.002005), (273, -0.002032), (274, -0.002075), (275, -0.002058), (276, -0.002086), (277, -0.002135), (278, -0.002145), (279, -0.002226), (280, -0.002306), (281, -0.002350), (282, -0.002354), (283, -0.002286), (284, -0.002191), (285, -0.002028), (286, -0.001854), (287, -0.001731), (288, -0.001603), (289, -0.001532), (290, -0.001542), (291, -0.001534), (292, -0.001482), (293, -0.001433), (294, -0.001327), (295, -0.001177), (296, -0.001092), (297, -0.001002), (298, -0.000907), (299, -0.000847), (300, -0.000791), (301, -0.000758), (302, -0.000752), (303, -0.000782), (304, -0.000811), (305, -0.000810), (306, -0.000766), (307, -0.000730), (308, -0.000704), (309, -0.000629), (310, -0.000541), (311, -0.000414), (312, -0.000250), (313, -0.000145), (314, -0.000097), (315, -0.000098), (316, -0.000184), (317, -0.000261), (318, -0.000332), (319, -0.000480), (320, -0.000659), (321, -0.000899), (322, -0.001227), (323, -0.001541), (324, -0.001851), (325, -0.002171), (326, -0.002467), (327, -0.002789), (328, -0.003075), (329, -0.003301), (330, -0.003512), (331, -0.003636), (332, -0.003707), (333, -0.003818), (334, -0.003917), (335, -0.003970), (336, -0.004069), (337, -0.004159), (338, -0.004201), (339, -0.004276), (340, -0.004348), (341, -0.004353), (342, -0.004341), (343, -0.004347), (344, -0.004344), (345, -0.004414), (346, -0.004517), (347, -0.004603), (348, -0.004706), (349, -0.004775), (350, -0.004812), (351, -0.004876), (352, -0.004937), (353, -0.004966), (354, -0.005044), (355, -0.005151), (356, -0.005239), (357, -0.005377), (358, -0.005522), (359, -0.005626), (360, -0.005735), (361, -0.005826), (362, -0.005872), (363, -0.005949), (364, -0.006042), (365, -0.006057), (366, -0.006047), (367, -0.006032), (368, -0.006009), (369, -0.006002), (370, -0.006024), (371, -0.006066), (372, -0.006076), (373, -0.006057), (374, -0.006003), (375, -0.005898), (376, -0.005795), (377, -0.005699), (378, -0.005544), (379, -0.005376), (380, -0.005231), (381, -0.004997), (382, -0.004755), (383, -0.004579), (384, -0.004313), (385, -0.003986), (386, -0.003670), (387, -0.003291), (388, -0.002927), (389, -0.002660), (390, -0.002413), (391, -0.002189), (392, -0.001987), (393, -0.001770), (394, -0.001574), (395, -0.001397), (396, -0.001256), (397, -0.001104), (398, -0.000913), (399, -0.000753), (400, -0.000585), (401, -0.000396), (402, -0.000208), (403, -0.000046), (404, 0.000087), (405, 0.000233), (406, 0.000339), (407, 0.000404), (408, 0.000481), (409, 0.000478), (410, 0.000419), (411, 0.000336), (412, 0.000177), (413, 0.000037), (414, -0.000081), (415, -0.000164), (416, -0.000122), (417, -0.000039), (418, 0.000013), (419, 0.000081), (420, 0.000107), (421, 0.000100), (422, 0.000124), (423, 0.000174), (424, 0.000213), (425, 0.000172), (426, 0.000097), (427, -0.000037), (428, -0.000191), (429, -0.000207), (430, -0.000175), (431, -0.000160), (432, -0.000083), (433, -0.000061), (434, -0.000135), (435, -0.000178), (436, -0.000213), (437, -0.000244), ],
+        ('location', 1): [(-1, 0.000344), (0, 0.000318), (1, 0.000238), (2, 0.000141), (3, 0.000073), (4, 0.000041), (5, 0.000081), (6, 0.000217), (7, 0.000393), (8, 0.000544), (9, 0.000654), (10, 0.000707), (11, 0.000708), (12, 0.000660), (13, 0.000555), (14, 0.000414), (15, 0.000242), (16, 0.000052), (17, -0.000145), (18, -0.000354), (19, -0.000530), (20, -0.000662), (21, -0.000797), (22, -0.000932), (23, -0.001097), (24, -0.001282), (25, -0.001429), (26, -0.001561), (27, -0.001614), (28, -0.001552), (29, -0.001472), (30, -0.001334), (31, -0.001138), (32, -0.000921), (33, -0.000699), (34, -0.000514), (35, -0.000377), (36, -0.000340), (37, -0.000352), (38, -0.000356), (39, -0.000345), (40, -0.000317), (41, -0.000263), (42, -0.000162), (43, -0.000053), (44, 0.000074), (45, 0.000279), (46, 0.000525), (47, 0.000750), (48, 0.000940), (49, 0.001056), (50, 0.001087), (51, 0.001033), (52, 0.000936), (53, 0.000815), (54, 0.000668), (55, 0.000555), (56, 0.000496), (57, 0.000495), (58, 0.000519), (59, 0.000601), (60, 0.000731), (61, 0.000795), (62, 0.000855), (63, 0.000929), (64, 0.000928), (65, 0.000888), (66, 0.000846), (67, 0.000812), (68, 0.000772), (69, 0.000726), (70, 0.000703), (71, 0.000693), (72, 0.000659), (73, 0.000610), (74, 0.000579), (75, 0.000553), (76, 0.000556), (77, 0.000606), (78, 0.000699), (79, 0.000818), (80, 0.000942), (81, 0.001077), (82, 0.001208), (83, 0.001319), (84, 0.001436), (85, 0.001521), (86, 0.001531), (87, 0.001494), (88, 0.001429), (89, 0.001384), (90, 0.001359), (91, 0.001344), (92, 0.001346), (93, 0.001351), (94, 0.001339), (95, 0.001289), (96, 0.001270), (97, 0.001268), (98, 0.001211), (99, 0.001199), (100, 0.001199), (101, 0.001105), (102, 0.001032), (103, 0.000966), (104, 0.000812), (105, 0.000667), (106, 0.000564), (107, 0.000425), (108, 0.000293), (109, 0.000198), (110, 0.000111), (111, 0.000081), (112, 0.000116), (113, 0.000171), (114, 0.000247), (115, 0.000352), (116, 0.000444), (117, 0.000509), (118, 0.000553), (119, 0.000553), (120, 0.000513), (121, 0.000446), (122, 0.000350), (123, 0.000267), (124, 0.000176), (125, 0.000073), (126, -0.000004), (127, -0.000105), (128, -0.000199), (129, -0.000248), (130, -0.000232), (131, -0.000134), (132, 0.000019), (133, 0.000241), (134, 0.000480), (135, 0.000684), (136, 0.000882), (137, 0.001038), (138, 0.001114), (139, 0.001128), (140, 0.001078), (141, 0.000932), (142, 0.000756), (143, 0.000630), (144, 0.000523), (145, 0.000453), (146, 0.000465), (147, 0.000475), (148, 0.000469), (149, 0.000510), (150, 0.000539), (151, 0.000591), (152, 0.000729), (153, 0.000886), (154, 0.001050), (155, 0.001252), (156, 0.001435), (157, 0.001603), (158, 0.001792), (159, 0.001943), (160, 0.002056), (161, 0.002146), (162, 0.002207), (163, 0.002274), (164, 0.002377), (165, 0.002531), (166, 0.002723), (167, 0.002969), (168, 0.003181), (169, 0.003300), (170, 0.003389), (171, 0.003397), (172, 0.003372), (173, 0.003355), (174, 0.003339), (175, 0.003316), (176, 0.003243), (177, 0.003175), (178, 0.003114), (179, 0.003021), (180, 0.002969), (181, 0.002930), (182, 0.002852), (183, 0.002823), (184, 0.002792), (185, 0.002729), (186, 0.002711), (187, 0.002686), (188, 0.002677), (189, 0.002751), (190, 0.002818), (191, 0.002880), (192, 0.002989), (193, 0.003059), (194, 0.003100), (195, 0.003129), (196, 0.003093), (197, 0.002986), (198, 0.002783), (199, 0.002514), (200, 0.002244), (201, 0.001967), (202, 0.001681), (203, 0.001415), (204, 0.001173), (205, 0.000967), (206, 0.000838), (207, 0.000835), (208, 0.000932), (209, 0.001068), (210, 0.001196), (211, 0.001259), (212, 0.001274), (213, 0.001240), (214, 0.001157), (215, 0.001063), (216, 0.000961), (217, 0.000877), (218, 0.000795), (219, 0.000751), (220, 0.000778), (221, 0.000804), (222, 0.000831), (223, 0.000871), (224, 0.000886), (225, 0.000877), (226, 0.000885), (227, 0.000926), (228, 0.000986), (229, 0.001058), (230, 0.001100), (231, 0.001133), (232, 0.001173), (233, 0.001190), (234, 0.001247), (235, 0.001330), (236, 0.001396), (237, 0.001490), (238, 0.001586), (239, 0.001647), (240, 0.001690), (241, 0.001686), (242, 0.001615), (243, 0.001512), (244, 0.001413), (245, 0.001325), (246, 0.001256), (247, 0.001229), (248, 0.001219), (249, 0.001224), (250, 0.001210), (251, 0.001170), (252, 0.001127), (253, 0.001066), (254, 0.001006), (255, 0.000971), (256, 0.000975), (257, 0.000982), (258, 0.001017), (259, 0.001090), (260, 0.001145), (261, 0.001191), (262, 0.001214), (263, 0.001222), (264, 0.001222), (265, 0.001265), (266, 0.001346), (267, 0.001448), (268, 0.001551), (269, 0.001590), (270, 0.001621), (271, 0.001646), (272, 0.001650), (273, 0.001671), (274, 0.001684), (275, 0.001660), (276, 0.001603), (277, 0.001515), (278, 0.001423), (279, 0.001325), (280, 0.001216), (281, 0.001117), (282, 0.001013), (283, 0.000948), (284, 0.000927), (285, 0.000894), (286, 0.000880), (287, 0.000876), (288, 0.000788), (289, 0.000698), (290, 0.000661), (291, 0.000563), (292, 0.000433), (293, 0.000309), (294, 0.000170), (295, 0.000013), (296, -0.000151), (297, -0.000290), (298, -0.000400), (299, -0.000490), (300, -0.000557), (301, -0.000592), (302, -0.000582), (303, -0.000571), (304, -0.000585), (305, -0.000603), (306, -0.000639), (307, -0.000692), (308, -0.000732), (309, -0.000758), (310, -0.000811), (311, -0.000880), (312, -0.000971), (313, -0.001109), (314, -0.001265), (315, -0.001444), (316, -0.001654), (317, -0.001876), (318, -0.002057), (319, -0.002173), (320, -0.002215), (321, -0.002171), (322, -0.002075), (323, -0.001944), (324, -0.001769), (325, -0.001557), (326, -0.001333), (327, -0.001104), (328, -0.000892), (329, -0.000707), (330, -0.000494), (331, -0.000275), (332, -0.000070), (333, 0.000150), (334, 0.000335), (335, 0.000473), (336, 0.000605), (337, 0.000728), (338, 0.000823), (339, 0.000909), (340, 0.000991), (341, 0.001072), (342, 0.001141), (343, 0.001202), (344, 0.001307), (345, 0.001394), (346, 0.001439), (347, 0.001486), (348, 0.001495), (349, 0.001506), (350, 0.001542), (351, 0.001563), (352, 0.001574), (353, 0.001555), (354, 0.001471), (355, 0.001355), (356, 0.001249), (357, 0.001185), (358, 0.001178), (359, 0.001205), (360, 0.001240), (361, 0.001234), (362, 0.001196), (363, 0.001127), (364, 0.000990), (365, 0.000838), (366, 0.000667), (367, 0.000480), (368, 0.000298), (369, 0.000097), (370, -0.000063), (371, -0.000193), (372, -0.000321), (373, -0.000408), (374, -0.000454), (375, -0.000460), (376, -0.000469), (377, -0.000486), (378, -0.000481), (379, -0.000463), (380, -0.000435), (381, -0.000384), (382, -0.000288), (383, -0.000186), (384, -0.000105), (385, -0.000062), (386, -0.000049), (387, -0.000044), (388, -0.000066), (389, -0.000121), (390, -0.000168), (391, -0.000189), (392, -0.000204), (393, -0.000174), (394, -0.000089), (395, 0.000031), (396, 0.000171), (397, 0.000281), (398, 0.000356), (399, 0.000404), (400, 0.000375), (401, 0.000280), (402, 0.000168), (403, 0.000032), (404, -0.000106), (405, -0.000232), (406, -0.000316), (407, -0.000373), (408, -0.000384), (409, -0.000300), (410, -0.000193), (411, -0.000085), (412, 0.000027), (413, 0.000116), (414, 0.000125), (415, 0.000093), (416, 0.000094), (417, 0.000147), (418, 0.000286), (419, 0.000448), (420, 0.000553), (421, 0.000622), (422, 0.000623), (423, 0.000524), (424, 0.000465), (425, 0.000550), (426, 0.000738), (427, 0.000845), (428, 0.000856), (429, 0.000775), (430, 0.000471), (431, 0.000125), (432, -0.000089), (433, -0.000127), (434, -0.000035), (435, 0.000091), (436, 0.000221), (437, 0.000311), ],
+        ('location', 2): [(-1, -0.001505), (0, -0.001483), (1, -0.001463), (2, -0.001461), (3, -0.001449), (4, -0.001455), (5, -0.001441), (6, -0.001392), (7, -0.001367), (8, -0.001359), (9, -0.001422), (10, -0.001563), (11, -0.001768), (12, -0.002026), (13, -0.002319), (14, -0.002642), (15, -0.002963), (16, -0.003252), (17, -0.003531), (18, -0.003860), (19, -0.004233), (20, -0.004680), (21, -0.005211), (22, -0.005755), (23, -0.006235), (24, -0.006659), (25, -0.007150), (26, -0.007656), (27, -0.008092), (28, -0.008461), (29, -0.008631), (30, -0.008571), (31, -0.008462), (32, -0.008431), (33, -0.008470), (34, -0.008656), (35, -0.008873), (36, -0.008926), (37, -0.008909), (38, -0.008842), (39, -0.008702), (40, -0.008511), (41, -0.008283), (42, -0.007899), (43, -0.007353), (44, -0.006827), (45, -0.006279), (46, -0.005734), (47, -0.005301), (48, -0.004870), (49, -0.004373), (50, -0.003801), (51, -0.003212), (52, -0.002701), (53, -0.002210), (54, -0.001823), (55, -0.001557), (56, -0.001298), (57, -0.001080), (58, -0.000866), (59, -0.000621), (60, -0.000400), (61, -0.000205), (62, -0.000015), (63, 0.000135), (64, 0.000213), (65, 0.000240), (66, 0.000224), (67, 0.000175), (68, 0.000124), (69, 0.000039), (70, -0.000057), (71, -0.000148), (72, -0.000271), (73, -0.000415), (74, -0.000563), (75, -0.000714), (76, -0.000884), (77, -0.001056), (78, -0.001192), (79, -0.001292), (80, -0.001377), (81, -0.001456), (82, -0.001557), (83, -0.001720), (84, -0.001915), (85, -0.002132), (86, -0.002360), (87, -0.002580), (88, -0.002773), (89, -0.002951), (90, -0.003187), (91, -0.003434), (92, -0.003711), (93, -0.004064), (94, -0.004433), (95, -0.004802), (96, -0.005160), (97, -0.005554), (98, -0.005980), (99, -0.006389), (100, -0.006816), (101, -0.007205), (102, -0.007516), (103, -0.007767), (104, -0.007964), (105, -0.008137), (106, -0.008279), (107, -0.008411), (108, -0.008530), (109, -0.008619), (110, -0.008712), (111, -0.008806), (112, -0.008870), (113, -0.008915), (114, -0.008936), (115, -0.008919), (116, -0.008975), (117, -0.009094), (118, -0.009194), (119, -0.009338), (120, -0.009446), (121, -0.009470), (122, -0.009469), (123, -0.009457), (124, -0.009445), (125, -0.009418), (126, -0.009319), (127, -0.009170), (128, -0.009010), (129, -0.008810), (130, -0.008601), (131, -0.008412), (132, -0.008204), (133, -0.007930), (134, -0.007626), (135, -0.007311), (136, -0.006986), (137, -0.006711), (138, -0.006479), (139, -0.006322), (140, -0.006217), (141, -0.006089), (142, -0.005991), (143, -0.005868), (144, -0.005703), (145, -0.005554), (146, -0.005402), (147, -0.005257), (148, -0.005120), (149, -0.004999), (150, -0.004893), (151, -0.004781), (152, -0.004680), (153, -0.004580), (154, -0.004468), (155, -0.004361), (156, -0.004260), (157, -0.004159), (158, -0.004070), (159, -0.003972), (160, -0.003854), (161, -0.003756), (162, -0.003619), (163, -0.003428), (164, -0.003208), (165, -0.002957), (166, -0.002704), (167, -0.002506), (168, -0.002467), (169, -0.002508), (170, -0.002569), (171, -0.002658), (172, -0.002665), (173, -0.002616), (174, -0.002544), (175, -0.002388), (176, -0.002203), (177, -0.002126), (178, -0.002154), (179, -0.002339), (180, -0.002678), (181, -0.003025), (182, -0.003324), (183, -0.003507), (184, -0.003596), (185, -0.003660), (186, -0.003727), (187, -0.003722), (188, -0.003655), (189, -0.003613), (190, -0.003525), (191, -0.003441), (192, -0.003405), (193, -0.003367), (194, -0.003334), (195, -0.003290), (196, -0.003247), (197, -0.003211), (198, -0.003175), (199, -0.003159), (200, -0.003165), (201, -0.003181), (202, -0.003203), (203, -0.003203), (204, -0.003165), (205, -0.003111), (206, -0.003042), (207, -0.002987), (208, -0.002968), (209, -0.002981), (210, -0.003017), (211, -0.003051), (212, -0.003106), (213, -0.003187), (214, -0.003271), (215, -0.003377), (216, -0.003483), (217, -0.003567), (218, -0.003640), (219, -0.003702), (220, -0.003750), (221, -0.003770), (222, -0.003782), (223, -0.003781), (224, -0.003759), (225, -0.003725), (226, -0.003685), (227, -0.003621), (228, -0.003509), (229, -0.003372), (230, -0.003196), (231, -0.002980), (232, -0.002736), (233, -0.002453), (234, -0.002147), (235, -0.001824), (236, -0.001492), (237, -0.001151), (238, -0.000816), (239, -0.000502), (240, -0.000198), (241, 0.000087), (242, 0.000346), (243, 0.000575), (244, 0.000763), (245, 0.000992), (246, 0.001212), (247, 0.001358), (248, 0.001494), (249, 0.001547), (250, 0.001485), (251, 0.001358), (252, 0.001190), (253, 0.001006), (254, 0.000797), (255, 0.000577), (256, 0.000368), (257, 0.000160), (258, -0.000070), (259, -0.000325), (260, -0.000589), (261, -0.000868), (262, -0.001143), (263, -0.001399), (264, -0.001645), (265, -0.001896), (266, -0.002161), (267, -0.002409), (268, -0.002630), (269, -0.002831), (270, -0.002987), (271, -0.003161), (272, -0.003364), (273, -0.003518), (274, -0.003675), (275, -0.003809), (276, -0.003890), (277, -0.003980), (278, -0.004083), (279, -0.004189), (280, -0.004283), (281, -0.004378), (282, -0.004455), (283, -0.004517), (284, -0.004592), (285, -0.004650), (286, -0.004721), (287, -0.004826), (288, -0.004930), (289, -0.005045), (290, -0.005171), (291, -0.005284), (292, -0.005327), (293, -0.005328), (294, -0.005382), (295, -0.005430), (296, -0.005466), (297, -0.005496), (298, -0.005487), (299, -0.005434), (300, -0.005322), (301, -0.005300), (302, -0.005359), (303, -0.005383), (304, -0.005381), (305, -0.005312), (306, -0.005184), (307, -0.005006), (308, -0.004839), (309, -0.004741), (310, -0.004713), (311, -0.004715), (312, -0.004794), (313, -0.004971), (314, -0.005081), (315, -0.005162), (316, -0.005196), (317, -0.005186), (318, -0.005217), (319, -0.005242), (320, -0.005286), (321, -0.005310), (322, -0.005251), (323, -0.005145), (324, -0.005034), (325, -0.004942), (326, -0.004881), (327, -0.004833), (328, -0.004791), (329, -0.004753), (330, -0.004720), (331, -0.004700), (332, -0.004611), (333, -0.004499), (334, -0.004368), (335, -0.004169), (336, -0.003981), (337, -0.003730), (338, -0.003492), (339, -0.003339), (340, -0.003145), (341, -0.002982), (342, -0.003018), (343, -0.003213), (344, -0.003417), (345, -0.003642), (346, -0.003866), (347, -0.004015), (348, -0.004055), (349, -0.004072), (350, -0.004173), (351, -0.004243), (352, -0.004263), (353, -0.004242), (354, -0.004185), (355, -0.004145), (356, -0.003980), (357, -0.003718), (358, -0.003465), (359, -0.003222), (360, -0.003047), (361, -0.002991), (362, -0.003059), (363, -0.003109), (364, -0.003112), (365, -0.003102), (366, -0.003036), (367, -0.003042), (368, -0.003186), (369, -0.003344), (370, -0.003521), (371, -0.003658), (372, -0.003648), (373, -0.003607), (374, -0.003526), (375, -0.003424), (376, -0.003403), (377, -0.003376), (378, -0.003333), (379, -0.003264), (380, -0.003183), (381, -0.003136), (382, -0.003056), (383, -0.002987), (384, -0.002970), (385, -0.002965), (386, -0.002975), (387, -0.003039), (388, -0.003132), (389, -0.003222), (390, -0.003331), (391, -0.003426), (392, -0.003514), (393, -0.003608), (394, -0.003692), (395, -0.003761), (396, -0.003805), (397, -0.003888), (398, -0.004001), (399, -0.004112), (400, -0.004287), (401, -0.004484), (402, -0.004657), (403, -0.004890), (404, -0.005136), (405, -0.005316), (406, -0.005484), (407, -0.005578), (408, -0.005588), (409, -0.005578), (410, -0.005533), (411, -0.005380), (412, -0.005125), (413, -0.004917), (414, -0.004747), (415, -0.004607), (416, -0.004576), (417, -0.004588), (418, -0.004548), (419, -0.004485), (420, -0.004422), (421, -0.004324), (422, -0.004179), (423, -0.004007), (424, -0.003818), (425, -0.003653), (426, -0.003552), (427, -0.003466), (428, -0.003283), (429, -0.002887), (430, -0.002357), (431, -0.001897), (432, -0.001588), (433, -0.001431), (434, -0.001459), (435, -0.001586), (436, -0.001599), (437, -0.001535), ],
+        ('rotation_euler', 0): [(-1, -0.008522), (0, -0.008502), (1, -0.008508), (2, -0.008622), (3, -0.008820), (4, -0.009033), (5, -0.009214), (6, -0.009365), (7, -0.009449), (8, -0.009435), (9, -0.009407), (10, -0.009386), (11, -0.009299), (12, -0.009143), (13, -0.009032), (14, -0.008958), (15, -0.008840), (16, -0.008731), (17, -0.008615), (18, -0.008453), (19, -0.008391), (20, -0.008379), (21, -0.008302), (22, -0.008168), (23, -0.007968), (24, -0.007806), (25, -0.007705), (26, -0.007637), (27, -0.007536), (28, -0.007277), (29, -0.006700), (30, -0.005899), (31, -0.005024), (32, -0.004002), (33, -0.002908), (34, -0.001914), (35, -0.001028), (36, -0.000353), (37, -0.000005), (38, 0.000166), (39, 0.000253), (40, 0.000353), (41, 0.000476), (42, 0.000573), (43, 0.000674), (44, 0.000689), (45, 0.000646), (46, 0.000713), (47, 0.000792), (48, 0.000758), (49, 0.000712), (50, 0.000623), (51, 0.000452), (52, 0.000246), (53, 0.000016), (54, -0.000263), (55, -0.000626), (56, -0.001039), (57, -0.001415), (58, -0.001770), (59, -0.002236), (60, -0.002641), (61, -0.002939), (62, -0.003370), (63, -0.003703), (64, -0.003869), (65, -0.004164), (66, -0.004554), (67, -0.004905), (68, -0.005205), (69, -0.005499), (70, -0.005763), (71, -0.005952), (72, -0.006118), (73, -0.006341), (74, -0.006572), (75, -0.006777), (76, -0.007024), (77, -0.007209), (78, -0.007323), (79, -0.007349), (80, -0.007207), (81, -0.007011), (82, -0.006813), (83, -0.006618), (84, -0.006543), (85, -0.006497), (86, -0.006367), (87, -0.006292), (88, -0.006289), (89, -0.006284), (90, -0.006248), (91, -0.006181), (92, -0.006071), (93, -0.005927), (94, -0.005747), (95, -0.005547), (96, -0.005421), (97, -0.005214), (98, -0.004868), (99, -0.004671), (100, -0.004531), (101, -0.004357), (102, -0.004330), (103, -0.004214), (104, -0.003979), (105, -0.003897), (106, -0.003851), (107, -0.003731), (108, -0.003678), (109, -0.003600), (110, -0.003419), (111, -0.003268), (112, -0.003157), (113, -0.003066), (114, -0.002990), (115, -0.002869), (116, -0.002702), (117, -0.002564), (118, -0.002407), (119, -0.002275), (120, -0.002197), (121, -0.002088), (122, -0.001995), (123, -0.001983), (124, -0.001977), (125, -0.001995), (126, -0.002071), (127, -0.002095), (128, -0.002106), (129, -0.002102), (130, -0.002101), (131, -0.002095), (132, -0.001972), (133, -0.001772), (134, -0.001456), (135, -0.001112), (136, -0.000803), (137, -0.000465), (138, -0.000252), (139, -0.000162), (140, -0.000054), (141, -0.000004), (142, -0.000112), (143, -0.000269), (144, -0.000328), (145, -0.000318), (146, -0.000327), (147, -0.000253), (148, -0.000124), (149, -0.000088), (150, -0.000034), (151, 0.000055), (152, 0.000202), (153, 0.000510), (154, 0.000797), (155, 0.001070), (156, 0.001391), (157, 0.001656), (158, 0.002115), (159, 0.002849), (160, 0.003673), (161, 0.004550), (162, 0.005283), (163, 0.005749), (164, 0.006063), (165, 0.006368), (166, 0.006801), (167, 0.007463), (168, 0.008487), (169, 0.009652), (170, 0.010713), (171, 0.011710), (172, 0.012445), (173, 0.012818), (174, 0.013019), (175, 0.013154), (176, 0.013137), (177, 0.013004), (178, 0.012915), (179, 0.012798), (180, 0.012586), (181, 0.012454), (182, 0.012333), (183, 0.012083), (184, 0.011909), (185, 0.011762), (186, 0.011446), (187, 0.011023), (188, 0.010519), (189, 0.009982), (190, 0.009569), (191, 0.009317), (192, 0.009201), (193, 0.009214), (194, 0.009197), (195, 0.009071), (196, 0.008911), (197, 0.008690), (198, 0.008382), (199, 0.007902), (200, 0.007240), (201, 0.006541), (202, 0.005815), (203, 0.005047), (204, 0.004289), (205, 0.003564), (206, 0.002901), (207, 0.002311), (208, 0.001902), (209, 0.001760), (210, 0.001757), (211, 0.001816), (212, 0.001829), (213, 0.001797), (214, 0.001753), (215, 0.001682), (216, 0.001637), (217, 0.001613), (218, 0.001656), (219, 0.001730), (220, 0.001798), (221, 0.001931), (222, 0.002101), (223, 0.002279), (224, 0.002481), (225, 0.002680), (226, 0.002805), (227, 0.002855), (228, 0.002894), (229, 0.002924), (230, 0.002948), (231, 0.002947), (232, 0.002943), (233, 0.002936), (234, 0.002884), (235, 0.002833), (236, 0.002750), (237, 0.002640), (238, 0.002529), (239, 0.002387), (240, 0.002264), (241, 0.002162), (242, 0.002000), (243, 0.001765), (244, 0.001481), (245, 0.001191), (246, 0.000906), (247, 0.000654), (248, 0.000500), (249, 0.000373), (250, 0.000276), (251, 0.000184), (252, 0.000056), (253, -0.000044), (254, -0.000176), (255, -0.000339), (256, -0.000432), (257, -0.000426), (258, -0.000422), (259, -0.000361), (260, -0.000228), (261, -0.000156), (262, -0.000090), (263, 0.000010), (264, 0.000168), (265, 0.000363), (266, 0.000709), (267, 0.001112), (268, 0.001484), (269, 0.001886), (270, 0.002086), (271, 0.002208), (272, 0.002288), (273, 0.002262), (274, 0.002236), (275, 0.002142), (276, 0.001995), (277, 0.001827), (278, 0.001584), (279, 0.001372), (280, 0.001224), (281, 0.001038), (282, 0.000878), (283, 0.000710), (284, 0.000541), (285, 0.000467), (286, 0.000350), (287, 0.000197), (288, 0.000149), (289, 0.000059), (290, -0.000043), (291, 0.000005), (292, 0.000003), (293, -0.000095), (294, -0.000204), (295, -0.000355), (296, -0.000486), (297, -0.000631), (298, -0.000853), (299, -0.001090), (300, -0.001282), (301, -0.001437), (302, -0.001543), (303, -0.001516), (304, -0.001503), (305, -0.001608), (306, -0.001726), (307, -0.001845), (308, -0.001970), (309, -0.002054), (310, -0.002095), (311, -0.002208), (312, -0.002392), (313, -0.002603), (314, -0.002803), (315, -0.002951), (316, -0.003139), (317, -0.003348), (318, -0.003606), (319, -0.003942), (320, -0.004226), (321, -0.004385), (322, -0.004406), (323, -0.004303), (324, -0.004165), (325, -0.004043), (326, -0.003856), (327, -0.003614), (328, -0.003344), (329, -0.003044), (330, -0.002752), (331, -0.002441), (332, -0.002151), (333, -0.001903), (334, -0.001586), (335, -0.001272), (336, -0.001070), (337, -0.000872), (338, -0.000667), (339, -0.000531), (340, -0.000398), (341, -0.000261), (342, -0.000143), (343, -0.000086), (344, -0.000120), (345, -0.000031), (346, 0.000105), (347, 0.000150), (348, 0.000276), (349, 0.000362), (350, 0.000375), (351, 0.000419), (352, 0.000414), (353, 0.000379), (354, 0.000314), (355, 0.000132), (356, -0.000098), (357, -0.000253), (358, -0.000352), (359, -0.000408), (360, -0.000445), (361, -0.000517), (362, -0.000686), (363, -0.000860), (364, -0.000937), (365, -0.001124), (366, -0.001394), (367, -0.001713), (368, -0.002155), (369, -0.002559), (370, -0.002900), (371, -0.003172), (372, -0.003357), (373, -0.003550), (374, -0.003751), (375, -0.003920), (376, -0.004014), (377, -0.004069), (378, -0.004146), (379, -0.004217), (380, -0.004299), (381, -0.004416), (382, -0.004489), (383, -0.004452), (384, -0.004375), (385, -0.004292), (386, -0.004224), (387, -0.004209), (388, -0.004182), (389, -0.004071), (390, -0.003939), (391, -0.003836), (392, -0.003719), (393, -0.003692), (394, -0.003736), (395, -0.003695), (396, -0.003578), (397, -0.003400), (398, -0.003184), (399, -0.002984), (400, -0.002811), (401, -0.002711), (402, -0.002681), (403, -0.002644), (404, -0.002618), (405, -0.002630), (406, -0.002709), (407, -0.002803), (408, -0.002916), (409, -0.003043), (410, -0.003113), (411, -0.003200), (412, -0.003358), (413, -0.003516), (414, -0.003543), (415, -0.003640), (416, -0.003926), (417, -0.004295), (418, -0.004684), (419, -0.005038), (420, -0.005377), (421, -0.005711), (422, -0.005989), (423, -0.006154), (424, -0.006335), (425, -0.006239), (426, -0.005218), (427, -0.003595), (428, -0.002344), (429, -0.001484), (430, -0.001578), (431, -0.003107), (432, -0.005042), (433, -0.006823), (434, -0.008042), (435, -0.008506), (436, -0.008549), (437, -0.008504), ],
+        ('rotation_euler', 1): [(-1, -0.000002), (0, 0.000068), (1, 0.000276), (2, 0.000546), (3, 0.000952), (4, 0.001459), (5, 0.001895), (6, 0.002383), (7, 0.002838), (8, 0.003214), (9, 0.003611), (10, 0.003976), (11, 0.004310), (12, 0.004608), (13, 0.004892), (14, 0.005159), (15, 0.005417), (16, 0.005658), (17, 0.005849), (18, 0.006031), (19, 0.006205), (20, 0.006330), (21, 0.006422), (22, 0.006552), (23, 0.006637), (24, 0.006699), (25, 0.006756), (26, 0.006761), (27, 0.006756), (28, 0.006720), (29, 0.006741), (30, 0.006829), (31, 0.006941), (32, 0.007179), (33, 0.007374), (34, 0.007451), (35, 0.007561), (36, 0.007554), (37, 0.007525), (38, 0.007527), (39, 0.007492), (40, 0.007578), (41, 0.007709), (42, 0.007765), (43, 0.007816), (44, 0.007839), (45, 0.007670), (46, 0.007440), (47, 0.007257), (48, 0.007013), (49, 0.006785), (50, 0.006580), (51, 0.006335), (52, 0.006074), (53, 0.005847), (54, 0.005698), (55, 0.005547), (56, 0.005419), (57, 0.005403), (58, 0.005367), (59, 0.005305), (60, 0.005333), (61, 0.005410), (62, 0.005480), (63, 0.005566), (64, 0.005704), (65, 0.005874), (66, 0.006073), (67, 0.006268), (68, 0.006448), (69, 0.006607), (70, 0.006686), (71, 0.006768), (72, 0.006824), (73, 0.006856), (74, 0.006974), (75, 0.007047), (76, 0.007084), (77, 0.007208), (78, 0.007305), (79, 0.007329), (80, 0.007385), (81, 0.007425), (82, 0.007398), (83, 0.007399), (84, 0.007398), (85, 0.007367), (86, 0.007317), (87, 0.007220), (88, 0.007138), (89, 0.007008), (90, 0.006832), (91, 0.006713), (92, 0.006649), (93, 0.006589), (94, 0.006541), (95, 0.006539), (96, 0.006482), (97, 0.006371), (98, 0.006267), (99, 0.006127), (100, 0.005965), (101, 0.005844), (102, 0.005731), (103, 0.005611), (104, 0.005482), (105, 0.005323), (106, 0.005130), (107, 0.004890), (108, 0.004692), (109, 0.004563), (110, 0.004446), (111, 0.004282), (112, 0.004143), (113, 0.004091), (114, 0.004005), (115, 0.003994), (116, 0.004111), (117, 0.004161), (118, 0.004238), (119, 0.004382), (120, 0.004459), (121, 0.004530), (122, 0.004619), (123, 0.004690), (124, 0.004761), (125, 0.004921), (126, 0.005148), (127, 0.005388), (128, 0.005722), (129, 0.006060), (130, 0.006367), (131, 0.006731), (132, 0.007008), (133, 0.007195), (134, 0.007412), (135, 0.007571), (136, 0.007785), (137, 0.008110), (138, 0.008408), (139, 0.008714), (140, 0.008994), (141, 0.009126), (142, 0.009197), (143, 0.009268), (144, 0.009315), (145, 0.009380), (146, 0.009503), (147, 0.009702), (148, 0.009899), (149, 0.010088), (150, 0.010274), (151, 0.010383), (152, 0.010434), (153, 0.010465), (154, 0.010480), (155, 0.010529), (156, 0.010607), (157, 0.010693), (158, 0.010764), (159, 0.010810), (160, 0.010862), (161, 0.010833), (162, 0.010790), (163, 0.010735), (164, 0.010624), (165, 0.010586), (166, 0.010542), (167, 0.010467), (168, 0.010467), (169, 0.010445), (170, 0.010408), (171, 0.010428), (172, 0.010414), (173, 0.010421), (174, 0.010426), (175, 0.010433), (176, 0.010466), (177, 0.010547), (178, 0.010635), (179, 0.010634), (180, 0.010619), (181, 0.010514), (182, 0.010364), (183, 0.010238), (184, 0.010108), (185, 0.009956), (186, 0.009817), (187, 0.009700), (188, 0.009485), (189, 0.009274), (190, 0.009093), (191, 0.008857), (192, 0.008607), (193, 0.008356), (194, 0.008165), (195, 0.008030), (196, 0.007866), (197, 0.007708), (198, 0.007562), (199, 0.007371), (200, 0.007121), (201, 0.006890), (202, 0.006691), (203, 0.006427), (204, 0.006123), (205, 0.005897), (206, 0.005754), (207, 0.005581), (208, 0.005427), (209, 0.005300), (210, 0.005062), (211, 0.004755), (212, 0.004442), (213, 0.004158), (214, 0.003901), (215, 0.003654), (216, 0.003473), (217, 0.003339), (218, 0.003167), (219, 0.003004), (220, 0.002899), (221, 0.002740), (222, 0.002552), (223, 0.002397), (224, 0.002257), (225, 0.002109), (226, 0.001950), (227, 0.001840), (228, 0.001697), (229, 0.001533), (230, 0.001410), (231, 0.001284), (232, 0.001205), (233, 0.001141), (234, 0.001033), (235, 0.000913), (236, 0.000754), (237, 0.000550), (238, 0.000376), (239, 0.000222), (240, 0.000041), (241, -0.000071), (242, -0.000145), (243, -0.000276), (244, -0.000419), (245, -0.000579), (246, -0.000759), (247, -0.000941), (248, -0.001099), (249, -0.001184), (250, -0.001213), (251, -0.001197), (252, -0.001193), (253, -0.001232), (254, -0.001284), (255, -0.001398), (256, -0.001573), (257, -0.001728), (258, -0.001856), (259, -0.002008), (260, -0.002120), (261, -0.002176), (262, -0.002233), (263, -0.002287), (264, -0.002291), (265, -0.002279), (266, -0.002342), (267, -0.002440), (268, -0.002537), (269, -0.002719), (270, -0.002975), (271, -0.003238), (272, -0.003506), (273, -0.003740), (274, -0.003892), (275, -0.004003), (276, -0.004104), (277, -0.004216), (278, -0.004372), (279, -0.004539), (280, -0.004746), (281, -0.004968), (282, -0.005135), (283, -0.005320), (284, -0.005562), (285, -0.005744), (286, -0.005868), (287, -0.006047), (288, -0.006174), (289, -0.006265), (290, -0.006447), (291, -0.006575), (292, -0.006682), (293, -0.006780), (294, -0.006743), (295, -0.006675), (296, -0.006552), (297, -0.006370), (298, -0.006209), (299, -0.006072), (300, -0.006008), (301, -0.006008), (302, -0.006069), (303, -0.006163), (304, -0.006259), (305, -0.006363), (306, -0.006372), (307, -0.006377), (308, -0.006447), (309, -0.006494), (310, -0.006558), (311, -0.006605), (312, -0.006588), (313, -0.006527), (314, -0.006481), (315, -0.006464), (316, -0.006459), (317, -0.006460), (318, -0.006444), (319, -0.006446), (320, -0.006527), (321, -0.006694), (322, -0.006862), (323, -0.006964), (324, -0.006943), (325, -0.006826), (326, -0.006744), (327, -0.006716), (328, -0.006688), (329, -0.006651), (330, -0.006555), (331, -0.006352), (332, -0.006178), (333, -0.006056), (334, -0.005959), (335, -0.005939), (336, -0.005926), (337, -0.005902), (338, -0.005915), (339, -0.006013), (340, -0.006145), (341, -0.006220), (342, -0.006280), (343, -0.006299), (344, -0.006297), (345, -0.006356), (346, -0.006450), (347, -0.006603), (348, -0.006796), (349, -0.006926), (350, -0.006990), (351, -0.006994), (352, -0.006923), (353, -0.006814), (354, -0.006737), (355, -0.006792), (356, -0.006918), (357, -0.007028), (358, -0.007156), (359, -0.007314), (360, -0.007439), (361, -0.007497), (362, -0.007592), (363, -0.007706), (364, -0.007782), (365, -0.007819), (366, -0.007864), (367, -0.007966), (368, -0.007997), (369, -0.007950), (370, -0.007900), (371, -0.007793), (372, -0.007644), (373, -0.007565), (374, -0.007539), (375, -0.007486), (376, -0.007489), (377, -0.007468), (378, -0.007339), (379, -0.007210), (380, -0.007047), (381, -0.006854), (382, -0.006672), (383, -0.006546), (384, -0.006474), (385, -0.006389), (386, -0.006368), (387, -0.006335), (388, -0.006245), (389, -0.006139), (390, -0.005966), (391, -0.005748), (392, -0.005522), (393, -0.005355), (394, -0.005265), (395, -0.005214), (396, -0.005219), (397, -0.005271), (398, -0.005263), (399, -0.005240), (400, -0.005229), (401, -0.005128), (402, -0.005055), (403, -0.004983), (404, -0.004831), (405, -0.004740), (406, -0.004664), (407, -0.004542), (408, -0.004498), (409, -0.004511), (410, -0.004428), (411, -0.004274), (412, -0.004043), (413, -0.003729), (414, -0.003359), (415, -0.002944), (416, -0.002642), (417, -0.002321), (418, -0.002008), (419, -0.001792), (420, -0.001500), (421, -0.001138), (422, -0.000723), (423, -0.000332), (424, -0.000013), (425, 0.000316), (426, 0.000581), (427, 0.000734), (428, 0.000877), (429, 0.000921), (430, 0.000666), (431, 0.000330), (432, 0.000070), (433, -0.000166), (434, -0.000221), (435, -0.000127), (436, -0.000024), (437, 0.000038), ],
+        ('rotation_euler', 2): [(-1, 0.000000), (0, 0.000009), (1, 0.000008), (2, 0.000055), (3, 0.000099), (4, 0.000014), (5, -0.000025), (6, -0.000115), (7, -0.000336), (8, -0.000436), (9, -0.000523), (10, -0.000597), (11, -0.000567), (12, -0.000533), (13, -0.000373), (14, -0.000177), (15, -0.000005), (16, 0.000313), (17, 0.000615), (18, 0.000897), (19, 0.001254), (20, 0.001488), (21, 0.001570), (22, 0.001528), (23, 0.001450), (24, 0.001411), (25, 0.001267), (26, 0.001155), (27, 0.001129), (28, 0.000992), (29, 0.001038), (30, 0.001325), (31, 0.001581), (32, 0.001895), (33, 0.002097), (34, 0.002079), (35, 0.002124), (36, 0.002200), (37, 0.002259), (38, 0.002408), (39, 0.002536), (40, 0.002640), (41, 0.002842), (42, 0.003119), (43, 0.003438), (44, 0.003870), (45, 0.004197), (46, 0.004401), (47, 0.004698), (48, 0.004925), (49, 0.005082), (50, 0.005302), (51, 0.005541), (52, 0.005703), (53, 0.005823), (54, 0.005995), (55, 0.006066), (56, 0.006000), (57, 0.005978), (58, 0.005895), (59, 0.005651), (60, 0.005379), (61, 0.005117), (62, 0.004740), (63, 0.004401), (64, 0.004162), (65, 0.003934), (66, 0.003743), (67, 0.003462), (68, 0.003150), (69, 0.002857), (70, 0.002494), (71, 0.002198), (72, 0.001977), (73, 0.001702), (74, 0.001442), (75, 0.001279), (76, 0.001170), (77, 0.001095), (78, 0.001070), (79, 0.001028), (80, 0.000974), (81, 0.000856), (82, 0.000754), (83, 0.000685), (84, 0.000558), (85, 0.000427), (86, 0.000219), (87, 0.000069), (88, 0.000008), (89, -0.000076), (90, -0.000134), (91, -0.000196), (92, -0.000254), (93, -0.000349), (94, -0.000450), (95, -0.000508), (96, -0.000584), (97, -0.000714), (98, -0.000904), (99, -0.001019), (100, -0.001123), (101, -0.001254), (102, -0.001396), (103, -0.001623), (104, -0.001901), (105, -0.002148), (106, -0.002361), (107, -0.002633), (108, -0.002806), (109, -0.002960), (110, -0.003133), (111, -0.003237), (112, -0.003333), (113, -0.003355), (114, -0.003416), (115, -0.003513), (116, -0.003595), (117, -0.003669), (118, -0.003705), (119, -0.003754), (120, -0.003798), (121, -0.003849), (122, -0.003966), (123, -0.004060), (124, -0.004157), (125, -0.004364), (126, -0.004471), (127, -0.004642), (128, -0.004924), (129, -0.005035), (130, -0.005147), (131, -0.005208), (132, -0.005271), (133, -0.005425), (134, -0.005505), (135, -0.005657), (136, -0.005812), (137, -0.005898), (138, -0.006014), (139, -0.006155), (140, -0.006301), (141, -0.006393), (142, -0.006455), (143, -0.006450), (144, -0.006486), (145, -0.006608), (146, -0.006678), (147, -0.006766), (148, -0.006838), (149, -0.006826), (150, -0.006759), (151, -0.006701), (152, -0.006703), (153, -0.006705), (154, -0.006697), (155, -0.006639), (156, -0.006606), (157, -0.006601), (158, -0.006516), (159, -0.006509), (160, -0.006485), (161, -0.006281), (162, -0.006094), (163, -0.005904), (164, -0.005679), (165, -0.005563), (166, -0.005518), (167, -0.005619), (168, -0.005730), (169, -0.005827), (170, -0.006025), (171, -0.006053), (172, -0.006041), (173, -0.006097), (174, -0.006071), (175, -0.006019), (176, -0.005964), (177, -0.005821), (178, -0.005725), (179, -0.005695), (180, -0.005624), (181, -0.005697), (182, -0.005781), (183, -0.005770), (184, -0.005801), (185, -0.005875), (186, -0.005907), (187, -0.005892), (188, -0.005892), (189, -0.005871), (190, -0.005809), (191, -0.005734), (192, -0.005727), (193, -0.005759), (194, -0.005764), (195, -0.005778), (196, -0.005770), (197, -0.005704), (198, -0.005579), (199, -0.005378), (200, -0.005173), (201, -0.004960), (202, -0.004711), (203, -0.004468), (204, -0.004199), (205, -0.003868), (206, -0.003478), (207, -0.003181), (208, -0.002969), (209, -0.002756), (210, -0.002744), (211, -0.002799), (212, -0.002772), (213, -0.002846), (214, -0.002965), (215, -0.003062), (216, -0.003158), (217, -0.003256), (218, -0.003431), (219, -0.003571), (220, -0.003775), (221, -0.004163), (222, -0.004498), (223, -0.004903), (224, -0.005352), (225, -0.005684), (226, -0.006038), (227, -0.006286), (228, -0.006457), (229, -0.006635), (230, -0.006680), (231, -0.006665), (232, -0.006671), (233, -0.006593), (234, -0.006531), (235, -0.006519), (236, -0.006437), (237, -0.006378), (238, -0.006326), (239, -0.006250), (240, -0.006352), (241, -0.006491), (242, -0.006496), (243, -0.006578), (244, -0.006590), (245, -0.006474), (246, -0.006414), (247, -0.006377), (248, -0.006330), (249, -0.006279), (250, -0.006227), (251, -0.006150), (252, -0.006110), (253, -0.006140), (254, -0.006111), (255, -0.006068), (256, -0.006079), (257, -0.005955), (258, -0.005827), (259, -0.005835), (260, -0.005789), (261, -0.005800), (262, -0.005864), (263, -0.005854), (264, -0.005853), (265, -0.005831), (266, -0.005803), (267, -0.005806), (268, -0.005733), (269, -0.005614), (270, -0.005533), (271, -0.005448), (272, -0.005351), (273, -0.005282), (274, -0.005164), (275, -0.004875), (276, -0.004602), (277, -0.004328), (278, -0.003968), (279, -0.003758), (280, -0.003609), (281, -0.003486), (282, -0.003407), (283, -0.003335), (284, -0.003394), (285, -0.003437), (286, -0.003501), (287, -0.003702), (288, -0.003836), (289, -0.003982), (290, -0.004243), (291, -0.004440), (292, -0.004584), (293, -0.004801), (294, -0.004953), (295, -0.005065), (296, -0.005304), (297, -0.005451), (298, -0.005526), (299, -0.005623), (300, -0.005636), (301, -0.005644), (302, -0.005684), (303, -0.005727), (304, -0.005746), (305, -0.005698), (306, -0.005569), (307, -0.005485), (308, -0.005496), (309, -0.005526), (310, -0.005624), (311, -0.005734), (312, -0.005762), (313, -0.005841), (314, -0.005951), (315, -0.006058), (316, -0.006261), (317, -0.006405), (318, -0.006461), (319, -0.006524), (320, -0.006513), (321, -0.006492), (322, -0.006550), (323, -0.006546), (324, -0.006520), (325, -0.006520), (326, -0.006489), (327, -0.006507), (328, -0.006466), (329, -0.006405), (330, -0.006412), (331, -0.006310), (332, -0.006213), (333, -0.006233), (334, -0.006197), (335, -0.006078), (336, -0.006042), (337, -0.005967), (338, -0.005824), (339, -0.005795), (340, -0.005792), (341, -0.005730), (342, -0.005707), (343, -0.005727), (344, -0.005721), (345, -0.005787), (346, -0.005810), (347, -0.005743), (348, -0.005697), (349, -0.005591), (350, -0.005461), (351, -0.005440), (352, -0.005410), (353, -0.005224), (354, -0.005036), (355, -0.004803), (356, -0.004419), (357, -0.004106), (358, -0.003853), (359, -0.003593), (360, -0.003448), (361, -0.003315), (362, -0.003110), (363, -0.002975), (364, -0.002852), (365, -0.002620), (366, -0.002426), (367, -0.002274), (368, -0.002174), (369, -0.002153), (370, -0.002157), (371, -0.002187), (372, -0.002165), (373, -0.002137), (374, -0.002119), (375, -0.002068), (376, -0.002099), (377, -0.002178), (378, -0.002119), (379, -0.002063), (380, -0.002123), (381, -0.002097), (382, -0.002173), (383, -0.002521), (384, -0.002768), (385, -0.002948), (386, -0.003200), (387, -0.003287), (388, -0.003381), (389, -0.003695), (390, -0.004016), (391, -0.004323), (392, -0.004628), (393, -0.004798), (394, -0.004869), (395, -0.004907), (396, -0.005015), (397, -0.005144), (398, -0.005281), (399, -0.005533), (400, -0.005803), (401, -0.006047), (402, -0.006224), (403, -0.006384), (404, -0.006547), (405, -0.006574), (406, -0.006571), (407, -0.006576), (408, -0.006439), (409, -0.006279), (410, -0.006091), (411, -0.005796), (412, -0.005413), (413, -0.004773), (414, -0.003864), (415, -0.002849), (416, -0.001861), (417, -0.001026), (418, -0.000451), (419, -0.000070), (420, 0.000269), (421, 0.000877), (422, 0.001799), (423, 0.002695), (424, 0.003390), (425, 0.003694), (426, 0.003315), (427, 0.002487), (428, 0.001685), (429, 0.001096), (430, 0.000824), (431, 0.000709), (432, 0.000714), (433, 0.000610), (434, 0.000323), (435, 0.000147), (436, 0.000017), (437, -0.000070), ],
+    }),
+
+    "THE_WEDDING": ("The Wedding", 24.0, {
+        ('location', 0): [(-10, 0.002507), (-9, 0.002109), (-8, 0.001721), (-7, 0.001349), (-6, 0.000998), (-5, 0.000672), (-4, 0.000376), (-3, 0.000111), (-2, -0.000124), (-1, -0.000333), (0, -0.000525), (1, -0.000705), (2, -0.000879), (3, -0.001047), (4, -0.001208), (5, -0.001363), (6, -0.001508), (7, -0.001644), (8, -0.001773), (9, -0.001898), (10, -0.002023), (11, -0.002151), (12, -0.002284), (13, -0.002420), (14, -0.002554), (15, -0.002681), (16, -0.002799), (17, -0.002903), (18, -0.002996), (19, -0.003085), (20, -0.003176), (21, -0.003270), (22, -0.003372), (23, -0.003481), (24, -0.003592), (25, -0.003707), (26, -0.003826), (27, -0.003944), (28, -0.004060), (29, -0.004172), (30, -0.004270), (31, -0.004349), (32, -0.004407), (33, -0.004441), (34, -0.004452), (35, -0.004441), (36, -0.004410), (37, -0.004361), (38, -0.004297), (39, -0.004220), (40, -0.004130), (41, -0.004031), (42, -0.003924), (43, -0.003807), (44, -0.003682), (45, -0.003549), (46, -0.003404), (47, -0.003246), (48, -0.003073), (49, -0.002881), (50, -0.002668), (51, -0.002435), (52, -0.002182), (53, -0.001910), (54, -0.001621), (55, -0.001322), (56, -0.001019), (57, -0.000712), (58, -0.000400), (59, -0.000088), (60, 0.000220), (61, 0.000516), (62, 0.000790), (63, 0.001032), (64, 0.001237), (65, 0.001402), (66, 0.001531), (67, 0.001636), (68, 0.001729), (69, 0.001821), (70, 0.001923), (71, 0.002039), (72, 0.002170), (73, 0.002317), (74, 0.002477), (75, 0.002647), (76, 0.002824), (77, 0.003002), (78, 0.003174), (79, 0.003336), (80, 0.003485), (81, 0.003614), (82, 0.003726), (83, 0.003821), (84, 0.003890), (85, 0.003936), (86, 0.003957), (87, 0.003949), (88, 0.003918), (89, 0.003874), (90, 0.003817), (91, 0.003758), (92, 0.003706), (93, 0.003662), (94, 0.003625), (95, 0.003596), (96, 0.003573), (97, 0.003552), (98, 0.003536), (99, 0.003522), (100, 0.003505), (101, 0.003480), (102, 0.003442), (103, 0.003383), (104, 0.003303), (105, 0.003204), (106, 0.003094), (107, 0.002981), (108, 0.002876), (109, 0.002787), (110, 0.002719), (111, 0.002677), (112, 0.002664), (113, 0.002682), (114, 0.002733), (115, 0.002815), (116, 0.002924), (117, 0.003047), (118, 0.003164), (119, 0.003292), (120, 0.003422), (121, 0.003541), (122, 0.003633), (123, 0.003690), (124, 0.003738), (125, 0.003789), (126, 0.003845), (127, 0.003901), (128, 0.003950), (129, 0.003984), (130, 0.003999), (131, 0.003995), (132, 0.003973), (133, 0.003936), (134, 0.003885), (135, 0.003820), (136, 0.003759), (137, 0.003700), (138, 0.003626), (139, 0.003544), (140, 0.003458), (141, 0.003378), (142, 0.003309), (143, 0.003252), (144, 0.003203), (145, 0.003160), (146, 0.003114), (147, 0.003058), (148, 0.002988), (149, 0.002899), (150, 0.002778), (151, 0.002551), ],
+        ('location', 1): [(-10, -0.000571), (-9, -0.000643), (-8, -0.000720), (-7, -0.000804), (-6, -0.000886), (-5, -0.000959), (-4, -0.001018), (-3, -0.001053), (-2, -0.001066), (-1, -0.001059), (0, -0.001035), (1, -0.001001), (2, -0.000966), (3, -0.000933), (4, -0.000911), (5, -0.000904), (6, -0.000911), (7, -0.000936), (8, -0.000972), (9, -0.001018), (10, -0.001070), (11, -0.001127), (12, -0.001189), (13, -0.001254), (14, -0.001323), (15, -0.001395), (16, -0.001466), (17, -0.001534), (18, -0.001598), (19, -0.001649), (20, -0.001678), (21, -0.001684), (22, -0.001657), (23, -0.001594), (24, -0.001500), (25, -0.001376), (26, -0.001229), (27, -0.001073), (28, -0.000914), (29, -0.000760), (30, -0.000620), (31, -0.000498), (32, -0.000394), (33, -0.000313), (34, -0.000254), (35, -0.000217), (36, -0.000201), (37, -0.000203), (38, -0.000217), (39, -0.000239), (40, -0.000265), (41, -0.000289), (42, -0.000310), (43, -0.000326), (44, -0.000335), (45, -0.000334), (46, -0.000326), (47, -0.000311), (48, -0.000287), (49, -0.000257), (50, -0.000225), (51, -0.000189), (52, -0.000153), (53, -0.000118), (54, -0.000085), (55, -0.000054), (56, -0.000024), (57, 0.000006), (58, 0.000035), (59, 0.000064), (60, 0.000092), (61, 0.000117), (62, 0.000141), (63, 0.000167), (64, 0.000197), (65, 0.000231), (66, 0.000273), (67, 0.000322), (68, 0.000377), (69, 0.000437), (70, 0.000499), (71, 0.000559), (72, 0.000615), (73, 0.000658), (74, 0.000685), (75, 0.000697), (76, 0.000691), (77, 0.000668), (78, 0.000630), (79, 0.000577), (80, 0.000511), (81, 0.000437), (82, 0.000363), (83, 0.000300), (84, 0.000257), (85, 0.000236), (86, 0.000236), (87, 0.000251), (88, 0.000269), (89, 0.000284), (90, 0.000295), (91, 0.000297), (92, 0.000289), (93, 0.000272), (94, 0.000240), (95, 0.000191), (96, 0.000127), (97, 0.000053), (98, -0.000027), (99, -0.000102), (100, -0.000165), (101, -0.000215), (102, -0.000251), (103, -0.000274), (104, -0.000287), (105, -0.000292), (106, -0.000289), (107, -0.000280), (108, -0.000269), (109, -0.000257), (110, -0.000247), (111, -0.000239), (112, -0.000233), (113, -0.000238), (114, -0.000263), (115, -0.000319), (116, -0.000415), (117, -0.000532), (118, -0.000633), (119, -0.000688), (120, -0.000661), (121, -0.000545), (122, -0.000372), (123, -0.000174), (124, 0.000009), (125, 0.000145), (126, 0.000232), (127, 0.000279), (128, 0.000293), (129, 0.000289), (130, 0.000274), (131, 0.000250), (132, 0.000222), (133, 0.000193), (134, 0.000165), (135, 0.000139), (136, 0.000111), (137, 0.000081), (138, 0.000047), (139, 0.000008), (140, -0.000033), (141, -0.000074), (142, -0.000116), (143, -0.000159), (144, -0.000203), (145, -0.000250), (146, -0.000300), (147, -0.000353), (148, -0.000408), (149, -0.000462), (150, -0.000516), (151, -0.000567), ],
+        ('location', 2): [(-10, 0.000317), (-9, 0.000469), (-8, 0.000623), (-7, 0.000775), (-6, 0.000922), (-5, 0.001068), (-4, 0.001217), (-3, 0.001370), (-2, 0.001530), (-1, 0.001699), (0, 0.001865), (1, 0.002025), (2, 0.002174), (3, 0.002304), (4, 0.002419), (5, 0.002519), (6, 0.002606), (7, 0.002688), (8, 0.002767), (9, 0.002843), (10, 0.002923), (11, 0.003003), (12, 0.003082), (13, 0.003155), (14, 0.003223), (15, 0.003284), (16, 0.003336), (17, 0.003381), (18, 0.003416), (19, 0.003433), (20, 0.003428), (21, 0.003401), (22, 0.003351), (23, 0.003285), (24, 0.003210), (25, 0.003130), (26, 0.003045), (27, 0.002956), (28, 0.002861), (29, 0.002763), (30, 0.002666), (31, 0.002574), (32, 0.002488), (33, 0.002408), (34, 0.002335), (35, 0.002266), (36, 0.002202), (37, 0.002147), (38, 0.002097), (39, 0.002052), (40, 0.002008), (41, 0.001962), (42, 0.001909), (43, 0.001850), (44, 0.001782), (45, 0.001704), (46, 0.001618), (47, 0.001523), (48, 0.001416), (49, 0.001295), (50, 0.001159), (51, 0.001002), (52, 0.000829), (53, 0.000640), (54, 0.000439), (55, 0.000234), (56, 0.000024), (57, -0.000185), (58, -0.000391), (59, -0.000593), (60, -0.000789), (61, -0.000979), (62, -0.001164), (63, -0.001350), (64, -0.001537), (65, -0.001724), (66, -0.001915), (67, -0.002103), (68, -0.002283), (69, -0.002450), (70, -0.002595), (71, -0.002719), (72, -0.002823), (73, -0.002910), (74, -0.002986), (75, -0.003054), (76, -0.003116), (77, -0.003169), (78, -0.003210), (79, -0.003228), (80, -0.003220), (81, -0.003184), (82, -0.003114), (83, -0.003014), (84, -0.002889), (85, -0.002738), (86, -0.002562), (87, -0.002371), (88, -0.002170), (89, -0.001963), (90, -0.001767), (91, -0.001586), (92, -0.001422), (93, -0.001281), (94, -0.001155), (95, -0.001038), (96, -0.000928), (97, -0.000817), (98, -0.000702), (99, -0.000585), (100, -0.000472), (101, -0.000370), (102, -0.000290), (103, -0.000233), (104, -0.000199), (105, -0.000184), (106, -0.000178), (107, -0.000175), (108, -0.000169), (109, -0.000160), (110, -0.000147), (111, -0.000128), (112, -0.000098), (113, -0.000032), (114, 0.000093), (115, 0.000288), (116, 0.000562), (117, 0.000871), (118, 0.001145), (119, 0.001333), (120, 0.001376), (121, 0.001266), (122, 0.001059), (123, 0.000813), (124, 0.000589), (125, 0.000392), (126, 0.000220), (127, 0.000138), (128, 0.000098), (129, 0.000069), (130, 0.000039), (131, 0.000005), (132, -0.000030), (133, -0.000060), (134, -0.000084), (135, -0.000100), (136, -0.000112), (137, -0.000122), (138, -0.000132), (139, -0.000138), (140, -0.000139), (141, -0.000131), (142, -0.000109), (143, -0.000075), (144, -0.000032), (145, 0.000014), (146, 0.000056), (147, 0.000095), (148, 0.000131), (149, 0.000165), (150, 0.000210), (151, 0.000296), ],
+        ('rotation_euler', 0): [(-10, 0.004106), (-9, 0.004090), (-8, 0.004163), (-7, 0.004237), (-6, 0.004372), (-5, 0.004566), (-4, 0.004810), (-3, 0.005139), (-2, 0.005630), (-1, 0.006211), (0, 0.006804), (1, 0.007389), (2, 0.008002), (3, 0.008586), (4, 0.009161), (5, 0.009572), (6, 0.009981), (7, 0.010248), (8, 0.010401), (9, 0.010439), (10, 0.010349), (11, 0.010117), (12, 0.009838), (13, 0.009464), (14, 0.009022), (15, 0.008433), (16, 0.007906), (17, 0.007364), (18, 0.006659), (19, 0.005783), (20, 0.004972), (21, 0.004390), (22, 0.003980), (23, 0.003808), (24, 0.003523), (25, 0.003392), (26, 0.003282), (27, 0.003195), (28, 0.003156), (29, 0.003121), (30, 0.003071), (31, 0.003022), (32, 0.002869), (33, 0.002713), (34, 0.002524), (35, 0.002260), (36, 0.001948), (37, 0.001578), (38, 0.001126), (39, 0.000663), (40, 0.000115), (41, -0.000399), (42, -0.000843), (43, -0.001256), (44, -0.001622), (45, -0.001858), (46, -0.002099), (47, -0.002286), (48, -0.002418), (49, -0.002522), (50, -0.002613), (51, -0.002714), (52, -0.002782), (53, -0.002776), (54, -0.002801), (55, -0.002854), (56, -0.002954), (57, -0.003074), (58, -0.003150), (59, -0.003162), (60, -0.003162), (61, -0.003183), (62, -0.003212), (63, -0.003245), (64, -0.003335), (65, -0.003404), (66, -0.003538), (67, -0.003691), (68, -0.003763), (69, -0.003836), (70, -0.003861), (71, -0.003842), (72, -0.003836), (73, -0.003839), (74, -0.003851), (75, -0.003807), (76, -0.003793), (77, -0.003743), (78, -0.003690), (79, -0.003647), (80, -0.003632), (81, -0.003649), (82, -0.003647), (83, -0.003569), (84, -0.003453), (85, -0.003285), (86, -0.002811), (87, -0.002344), (88, -0.001739), (89, -0.000945), (90, -0.000053), (91, 0.000631), (92, 0.001102), (93, 0.001464), (94, 0.001687), (95, 0.001845), (96, 0.001822), (97, 0.001758), (98, 0.001569), (99, 0.001425), (100, 0.001325), (101, 0.001267), (102, 0.001159), (103, 0.001113), (104, 0.001104), (105, 0.001163), (106, 0.001181), (107, 0.001155), (108, 0.001141), (109, 0.001060), (110, 0.001053), (111, 0.001056), (112, 0.001130), (113, 0.001148), (114, 0.001189), (115, 0.001165), (116, 0.001206), (117, 0.001302), (118, 0.001524), (119, 0.001735), (120, 0.001951), (121, 0.002127), (122, 0.002215), (123, 0.002333), (124, 0.002425), (125, 0.002381), (126, 0.002366), (127, 0.002364), (128, 0.002391), (129, 0.002435), (130, 0.002495), (131, 0.002520), (132, 0.002638), (133, 0.002744), (134, 0.002882), (135, 0.002977), (136, 0.003050), (137, 0.003121), (138, 0.003211), (139, 0.003313), (140, 0.003356), (141, 0.003412), (142, 0.003476), (143, 0.003503), (144, 0.003537), (145, 0.003603), (146, 0.003669), (147, 0.003785), (148, 0.003836), (149, 0.003885), (150, 0.003963), (151, 0.004044), ],
+        ('rotation_euler', 1): [(-10, 0.018170), (-9, 0.018143), (-8, 0.018200), (-7, 0.018190), (-6, 0.018157), (-5, 0.018165), (-4, 0.018230), (-3, 0.018291), (-2, 0.018469), (-1, 0.018449), (0, 0.018599), (1, 0.018701), (2, 0.018859), (3, 0.018918), (4, 0.019079), (5, 0.019223), (6, 0.019269), (7, 0.019374), (8, 0.019452), (9, 0.019479), (10, 0.019539), (11, 0.019487), (12, 0.019284), (13, 0.018933), (14, 0.018507), (15, 0.018041), (16, 0.017587), (17, 0.017211), (18, 0.016620), (19, 0.015999), (20, 0.015407), (21, 0.015053), (22, 0.014645), (23, 0.014265), (24, 0.013839), (25, 0.013517), (26, 0.013247), (27, 0.012912), (28, 0.012536), (29, 0.012310), (30, 0.012103), (31, 0.012059), (32, 0.012032), (33, 0.012023), (34, 0.012056), (35, 0.012216), (36, 0.012434), (37, 0.012693), (38, 0.012955), (39, 0.013178), (40, 0.013492), (41, 0.013604), (42, 0.013777), (43, 0.013807), (44, 0.013711), (45, 0.013673), (46, 0.013610), (47, 0.013650), (48, 0.013776), (49, 0.014006), (50, 0.014156), (51, 0.014281), (52, 0.014376), (53, 0.014385), (54, 0.014374), (55, 0.014273), (56, 0.014332), (57, 0.014373), (58, 0.014440), (59, 0.014598), (60, 0.014787), (61, 0.014918), (62, 0.015012), (63, 0.015071), (64, 0.015058), (65, 0.014947), (66, 0.014801), (67, 0.014563), (68, 0.014348), (69, 0.014082), (70, 0.013871), (71, 0.013611), (72, 0.013372), (73, 0.013130), (74, 0.012916), (75, 0.012537), (76, 0.012143), (77, 0.011870), (78, 0.011528), (79, 0.011284), (80, 0.011054), (81, 0.011063), (82, 0.011311), (83, 0.011330), (84, 0.011526), (85, 0.011798), (86, 0.011956), (87, 0.012517), (88, 0.013000), (89, 0.013516), (90, 0.013926), (91, 0.014253), (92, 0.014451), (93, 0.014829), (94, 0.015207), (95, 0.015625), (96, 0.015954), (97, 0.016375), (98, 0.016833), (99, 0.017178), (100, 0.017549), (101, 0.017679), (102, 0.017817), (103, 0.017722), (104, 0.017659), (105, 0.017580), (106, 0.017510), (107, 0.017336), (108, 0.017230), (109, 0.017045), (110, 0.016846), (111, 0.016698), (112, 0.016492), (113, 0.016413), (114, 0.016276), (115, 0.016170), (116, 0.016042), (117, 0.015899), (118, 0.015890), (119, 0.015875), (120, 0.016045), (121, 0.016097), (122, 0.016235), (123, 0.016422), (124, 0.016718), (125, 0.017102), (126, 0.017413), (127, 0.017723), (128, 0.017987), (129, 0.018133), (130, 0.018185), (131, 0.018099), (132, 0.017963), (133, 0.017718), (134, 0.017599), (135, 0.017348), (136, 0.017128), (137, 0.017007), (138, 0.016642), (139, 0.016379), (140, 0.016413), (141, 0.016515), (142, 0.016736), (143, 0.016846), (144, 0.017057), (145, 0.017243), (146, 0.017339), (147, 0.017601), (148, 0.017719), (149, 0.017846), (150, 0.018048), (151, 0.018103), ],
+        ('rotation_euler', 2): [(-10, 0.009756), (-9, 0.009728), (-8, 0.009699), (-7, 0.009829), (-6, 0.009911), (-5, 0.009995), (-4, 0.009963), (-3, 0.009914), (-2, 0.009819), (-1, 0.009645), (0, 0.009307), (1, 0.008845), (2, 0.008403), (3, 0.007982), (4, 0.007402), (5, 0.006859), (6, 0.006103), (7, 0.005302), (8, 0.004454), (9, 0.003457), (10, 0.002609), (11, 0.001632), (12, 0.000820), (13, -0.000006), (14, -0.000750), (15, -0.001607), (16, -0.002341), (17, -0.003086), (18, -0.004030), (19, -0.004990), (20, -0.005869), (21, -0.006467), (22, -0.006821), (23, -0.006914), (24, -0.007222), (25, -0.007388), (26, -0.007499), (27, -0.007632), (28, -0.007488), (29, -0.007401), (30, -0.006982), (31, -0.006500), (32, -0.006003), (33, -0.005487), (34, -0.005001), (35, -0.004527), (36, -0.004162), (37, -0.003724), (38, -0.003400), (39, -0.003156), (40, -0.002813), (41, -0.002533), (42, -0.002034), (43, -0.001673), (44, -0.001377), (45, -0.001079), (46, -0.000899), (47, -0.000635), (48, -0.000375), (49, -0.000223), (50, -0.000159), (51, -0.000063), (52, -0.000012), (53, 0.000103), (54, 0.000182), (55, 0.000192), (56, 0.000119), (57, -0.000032), (58, -0.000266), (59, -0.000514), (60, -0.000677), (61, -0.000895), (62, -0.001217), (63, -0.001413), (64, -0.001567), (65, -0.001666), (66, -0.001695), (67, -0.001531), (68, -0.001393), (69, -0.001212), (70, -0.001105), (71, -0.000936), (72, -0.000730), (73, -0.000628), (74, -0.000475), (75, -0.000423), (76, -0.000485), (77, -0.000412), (78, -0.000473), (79, -0.000598), (80, -0.000838), (81, -0.001035), (82, -0.001206), (83, -0.001347), (84, -0.001334), (85, -0.001383), (86, -0.001425), (87, -0.001169), (88, -0.000826), (89, -0.000315), (90, 0.000528), (91, 0.001163), (92, 0.001553), (93, 0.001853), (94, 0.002061), (95, 0.002334), (96, 0.002358), (97, 0.002467), (98, 0.002333), (99, 0.002338), (100, 0.002353), (101, 0.002376), (102, 0.002430), (103, 0.002510), (104, 0.002691), (105, 0.002975), (106, 0.003233), (107, 0.003505), (108, 0.003632), (109, 0.003869), (110, 0.004081), (111, 0.004287), (112, 0.004491), (113, 0.004593), (114, 0.004796), (115, 0.004827), (116, 0.004966), (117, 0.005007), (118, 0.005292), (119, 0.005656), (120, 0.005777), (121, 0.005961), (122, 0.005893), (123, 0.006019), (124, 0.006129), (125, 0.006224), (126, 0.006283), (127, 0.006394), (128, 0.006459), (129, 0.006569), (130, 0.006774), (131, 0.006977), (132, 0.007284), (133, 0.007611), (134, 0.007875), (135, 0.008177), (136, 0.008445), (137, 0.008761), (138, 0.009028), (139, 0.009312), (140, 0.009450), (141, 0.009547), (142, 0.009573), (143, 0.009640), (144, 0.009619), (145, 0.009651), (146, 0.009676), (147, 0.009722), (148, 0.009666), (149, 0.009710), (150, 0.009726), (151, 0.009716), ],
+    }),
+
+    "WALK_TO_THE_STORE": ("Walk to the Store", 24.0, {
+        ('location', 0): [(1, -0.030772), (2, -0.032342), (3, -0.034982), (4, -0.035541), (5, -0.035923), (6, -0.036059), (7, -0.036016), (8, -0.035786), (9, -0.035490), (10, -0.035015), (11, -0.034291), (12, -0.033353), (13, -0.032219), (14, -0.030937), (15, -0.029623), (16, -0.028411), (17, -0.027348), (18, -0.026413), (19, -0.025548), (20, -0.024611), (21, -0.023492), (22, -0.022142), (23, -0.020457), (24, -0.018388), (25, -0.016026), (26, -0.013393), (27, -0.010530), (28, -0.007661), (29, -0.004892), (30, -0.002122), (31, 0.000698), (32, 0.003642), (33, 0.006805), (34, 0.010197), (35, 0.013731), (36, 0.017234), (37, 0.020593), (38, 0.023723), (39, 0.026586), (40, 0.029293), (41, 0.031938), (42, 0.034586), (43, 0.037206), (44, 0.039483), (45, 0.041213), (46, 0.042252), (47, 0.042428), (48, 0.042027), (49, 0.041306), (50, 0.040382), (51, 0.039487), (52, 0.038810), (53, 0.038507), (54, 0.038545), (55, 0.039059), (56, 0.040169), (57, 0.041588), (58, 0.043339), (59, 0.045508), (60, 0.047889), (61, 0.050466), (62, 0.053188), (63, 0.055851), (64, 0.058273), (65, 0.060231), (66, 0.061543), (67, 0.062130), (68, 0.062015), (69, 0.061417), (70, 0.060614), (71, 0.059772), (72, 0.058954), (73, 0.058099), (74, 0.057050), (75, 0.055814), (76, 0.054497), (77, 0.053123), (78, 0.051869), (79, 0.050790), (80, 0.049578), (81, 0.048130), (82, 0.046468), (83, 0.044374), (84, 0.041858), (85, 0.039166), (86, 0.036314), (87, 0.033331), (88, 0.030365), (89, 0.027412), (90, 0.024428), (91, 0.021350), (92, 0.018126), (93, 0.014832), (94, 0.011484), (95, 0.008146), (96, 0.004977), (97, 0.002010), (98, -0.000785), (99, -0.003397), (100, -0.005864), (101, -0.008260), (102, -0.010577), (103, -0.012786), (104, -0.014886), (105, -0.016818), (106, -0.018559), (107, -0.020109), (108, -0.021457), (109, -0.022637), (110, -0.023668), (111, -0.024588), (112, -0.025438), (113, -0.026019), (114, -0.026373), (115, -0.026625), (116, -0.026901), (117, -0.027326), (118, -0.028025), (119, -0.029002), (120, -0.029829), (121, -0.030162), (122, -0.030138), (123, -0.030757), ],
+        ('location', 1): [(1, 0.008810), (2, 0.006461), (3, 0.004390), (4, 0.002925), (5, 0.001507), (6, 0.000524), (7, 0.000425), (8, 0.001263), (9, 0.002628), (10, 0.004369), (11, 0.006086), (12, 0.007223), (13, 0.007648), (14, 0.007295), (15, 0.006047), (16, 0.004026), (17, 0.001428), (18, -0.001639), (19, -0.004981), (20, -0.008313), (21, -0.011301), (22, -0.013559), (23, -0.014814), (24, -0.014825), (25, -0.013568), (26, -0.011304), (27, -0.008231), (28, -0.004580), (29, -0.000614), (30, 0.003364), (31, 0.006983), (32, 0.009933), (33, 0.011907), (34, 0.012683), (35, 0.012263), (36, 0.010786), (37, 0.008415), (38, 0.005438), (39, 0.002259), (40, -0.000812), (41, -0.003488), (42, -0.005531), (43, -0.006853), (44, -0.007373), (45, -0.006996), (46, -0.005682), (47, -0.003520), (48, -0.000780), (49, 0.002153), (50, 0.004759), (51, 0.006557), (52, 0.007199), (53, 0.006461), (54, 0.004420), (55, 0.001294), (56, -0.002603), (57, -0.006691), (58, -0.010478), (59, -0.013614), (60, -0.015746), (61, -0.016740), (62, -0.016585), (63, -0.015367), (64, -0.013372), (65, -0.010871), (66, -0.008173), (67, -0.005691), (68, -0.003697), (69, -0.002386), (70, -0.002010), (71, -0.002638), (72, -0.004187), (73, -0.006562), (74, -0.009383), (75, -0.012137), (76, -0.014497), (77, -0.016012), (78, -0.016345), (79, -0.015522), (80, -0.013563), (81, -0.010611), (82, -0.007014), (83, -0.003103), (84, 0.000785), (85, 0.004288), (86, 0.007095), (87, 0.009014), (88, 0.009930), (89, 0.009793), (90, 0.008668), (91, 0.006724), (92, 0.004172), (93, 0.001323), (94, -0.001428), (95, -0.003722), (96, -0.005209), (97, -0.005672), (98, -0.005105), (99, -0.003578), (100, -0.001275), (101, 0.001572), (102, 0.004782), (103, 0.008193), (104, 0.011626), (105, 0.014824), (106, 0.017495), (107, 0.019366), (108, 0.020182), (109, 0.019849), (110, 0.018443), (111, 0.016236), (112, 0.013847), (113, 0.011804), (114, 0.010392), (115, 0.009953), (116, 0.010321), (117, 0.010937), (118, 0.011546), (119, 0.011847), (120, 0.011549), (121, 0.010898), (122, 0.010213), (123, 0.009037), ],
+        ('location', 2): [(1, -0.027751), (2, -0.024322), (3, -0.018351), (4, -0.012577), (5, -0.007166), (6, -0.005179), (7, -0.003418), (8, -0.001511), (9, 0.000155), (10, 0.000969), (11, 0.001525), (12, 0.001898), (13, 0.002033), (14, 0.002278), (15, 0.002632), (16, 0.003062), (17, 0.003789), (18, 0.004496), (19, 0.004767), (20, 0.004399), (21, 0.002879), (22, 0.000520), (23, -0.000831), (24, -0.001572), (25, -0.002908), (26, -0.003166), (27, -0.002848), (28, -0.003118), (29, -0.003108), (30, -0.002442), (31, -0.001734), (32, -0.001583), (33, -0.001781), (34, -0.001996), (35, -0.002128), (36, -0.002155), (37, -0.001812), (38, -0.001020), (39, 0.000097), (40, 0.001393), (41, 0.002645), (42, 0.003265), (43, 0.003320), (44, 0.003052), (45, 0.003245), (46, 0.004681), (47, 0.006837), (48, 0.010002), (49, 0.013688), (50, 0.017092), (51, 0.020315), (52, 0.023341), (53, 0.026371), (54, 0.028192), (55, 0.029008), (56, 0.030014), (57, 0.030121), (58, 0.029953), (59, 0.030102), (60, 0.029838), (61, 0.029255), (62, 0.028486), (63, 0.027845), (64, 0.027430), (65, 0.027346), (66, 0.027996), (67, 0.029303), (68, 0.030985), (69, 0.032883), (70, 0.034726), (71, 0.036190), (72, 0.037263), (73, 0.038233), (74, 0.039144), (75, 0.040341), (76, 0.041670), (77, 0.042666), (78, 0.043520), (79, 0.043890), (80, 0.043240), (81, 0.042199), (82, 0.041451), (83, 0.040543), (84, 0.039639), (85, 0.039230), (86, 0.038988), (87, 0.038692), (88, 0.038421), (89, 0.038012), (90, 0.037468), (91, 0.036672), (92, 0.035658), (93, 0.034546), (94, 0.033029), (95, 0.031228), (96, 0.029240), (97, 0.027198), (98, 0.025255), (99, 0.023488), (100, 0.022137), (101, 0.020907), (102, 0.019370), (103, 0.017346), (104, 0.014308), (105, 0.009930), (106, 0.004245), (107, -0.002405), (108, -0.009523), (109, -0.016716), (110, -0.023473), (111, -0.029485), (112, -0.034344), (113, -0.037919), (114, -0.040446), (115, -0.041778), (116, -0.041827), (117, -0.041088), (118, -0.039581), (119, -0.037090), (120, -0.034402), (121, -0.031946), (122, -0.029901), (123, -0.027730), ],
+        ('rotation_euler', 0): [(1, 0.021889), (2, 0.018053), (3, 0.015500), (4, 0.014222), (5, 0.013912), (6, 0.013955), (7, 0.014104), (8, 0.014018), (9, 0.013270), (10, 0.012114), (11, 0.010706), (12, 0.009083), (13, 0.007510), (14, 0.006032), (15, 0.004687), (16, 0.003698), (17, 0.003328), (18, 0.003762), (19, 0.005237), (20, 0.007809), (21, 0.011215), (22, 0.015137), (23, 0.019128), (24, 0.023001), (25, 0.026680), (26, 0.029913), (27, 0.032466), (28, 0.034165), (29, 0.035013), (30, 0.034947), (31, 0.034232), (32, 0.033383), (33, 0.032484), (34, 0.031585), (35, 0.030860), (36, 0.030360), (37, 0.029949), (38, 0.029706), (39, 0.029738), (40, 0.029950), (41, 0.030286), (42, 0.030703), (43, 0.031090), (44, 0.031215), (45, 0.030630), (46, 0.029125), (47, 0.026505), (48, 0.022590), (49, 0.017766), (50, 0.012485), (51, 0.007198), (52, 0.002414), (53, -0.001577), (54, -0.004303), (55, -0.005399), (56, -0.004890), (57, -0.002836), (58, 0.000752), (59, 0.005371), (60, 0.010065), (61, 0.014371), (62, 0.017905), (63, 0.020035), (64, 0.020738), (65, 0.020402), (66, 0.019268), (67, 0.017721), (68, 0.016228), (69, 0.015179), (70, 0.014777), (71, 0.015041), (72, 0.015975), (73, 0.017489), (74, 0.019609), (75, 0.022618), (76, 0.026082), (77, 0.029389), (78, 0.032235), (79, 0.033797), (80, 0.033870), (81, 0.032553), (82, 0.030043), (83, 0.026735), (84, 0.022739), (85, 0.018380), (86, 0.014047), (87, 0.010097), (88, 0.006840), (89, 0.004447), (90, 0.003010), (91, 0.002583), (92, 0.003093), (93, 0.004456), (94, 0.006530), (95, 0.008832), (96, 0.011014), (97, 0.012840), (98, 0.014036), (99, 0.014695), (100, 0.014802), (101, 0.014338), (102, 0.013401), (103, 0.011914), (104, 0.010023), (105, 0.008041), (106, 0.006314), (107, 0.005200), (108, 0.004876), (109, 0.005435), (110, 0.006935), (111, 0.009346), (112, 0.012506), (113, 0.016128), (114, 0.019934), (115, 0.023479), (116, 0.026200), (117, 0.027867), (118, 0.030233), (119, 0.031906), (120, 0.031437), (121, 0.028787), (122, 0.025507), (123, 0.021906), ],
+        ('rotation_euler', 1): [(1, 0.003163), (2, 0.003110), (3, 0.003150), (4, 0.003400), (5, 0.003814), (6, 0.003861), (7, 0.003797), (8, 0.003336), (9, 0.002261), (10, 0.000818), (11, -0.000853), (12, -0.002611), (13, -0.004196), (14, -0.005614), (15, -0.006982), (16, -0.008271), (17, -0.009482), (18, -0.010545), (19, -0.011250), (20, -0.011519), (21, -0.011442), (22, -0.011022), (23, -0.010500), (24, -0.010152), (25, -0.009814), (26, -0.009365), (27, -0.008923), (28, -0.008488), (29, -0.008004), (30, -0.007647), (31, -0.007467), (32, -0.007309), (33, -0.007122), (34, -0.006945), (35, -0.006765), (36, -0.006512), (37, -0.006202), (38, -0.005819), (39, -0.005341), (40, -0.004867), (41, -0.004411), (42, -0.003910), (43, -0.003446), (44, -0.002991), (45, -0.002549), (46, -0.002222), (47, -0.002108), (48, -0.002402), (49, -0.003013), (50, -0.003869), (51, -0.004908), (52, -0.005838), (53, -0.006450), (54, -0.006735), (55, -0.006771), (56, -0.006603), (57, -0.006411), (58, -0.006278), (59, -0.005995), (60, -0.005604), (61, -0.004708), (62, -0.003040), (63, -0.001115), (64, 0.000791), (65, 0.002300), (66, 0.003207), (67, 0.003405), (68, 0.003120), (69, 0.002886), (70, 0.002772), (71, 0.002789), (72, 0.002909), (73, 0.003084), (74, 0.003362), (75, 0.003786), (76, 0.004186), (77, 0.004607), (78, 0.005106), (79, 0.005366), (80, 0.005477), (81, 0.005513), (82, 0.005421), (83, 0.005224), (84, 0.004739), (85, 0.004089), (86, 0.003479), (87, 0.002870), (88, 0.002498), (89, 0.002427), (90, 0.002488), (91, 0.002665), (92, 0.002886), (93, 0.003138), (94, 0.003436), (95, 0.003718), (96, 0.004027), (97, 0.004335), (98, 0.004598), (99, 0.004896), (100, 0.005157), (101, 0.005388), (102, 0.005532), (103, 0.005534), (104, 0.005492), (105, 0.005307), (106, 0.005000), (107, 0.004780), (108, 0.004601), (109, 0.004459), (110, 0.004430), (111, 0.004501), (112, 0.004754), (113, 0.005003), (114, 0.005059), (115, 0.005076), (116, 0.004866), (117, 0.004430), (118, 0.004102), (119, 0.003828), (120, 0.003621), (121, 0.003496), (122, 0.003366), (123, 0.003167), ],
+        ('rotation_euler', 2): [(1, -0.021794), (2, -0.020714), (3, -0.020080), (4, -0.019484), (5, -0.017329), (6, -0.013735), (7, -0.009082), (8, -0.003491), (9, 0.001821), (10, 0.005862), (11, 0.009056), (12, 0.011700), (13, 0.013756), (14, 0.015384), (15, 0.016832), (16, 0.018026), (17, 0.018922), (18, 0.019607), (19, 0.019909), (20, 0.019780), (21, 0.019198), (22, 0.018342), (23, 0.017420), (24, 0.016505), (25, 0.015809), (26, 0.015805), (27, 0.017245), (28, 0.019821), (29, 0.022721), (30, 0.025567), (31, 0.027395), (32, 0.027612), (33, 0.026720), (34, 0.025267), (35, 0.023578), (36, 0.021982), (37, 0.020771), (38, 0.019991), (39, 0.019560), (40, 0.019165), (41, 0.018073), (42, 0.016000), (43, 0.013668), (44, 0.011918), (45, 0.011664), (46, 0.013483), (47, 0.016689), (48, 0.020184), (49, 0.023229), (50, 0.025525), (51, 0.026993), (52, 0.027915), (53, 0.028423), (54, 0.028163), (55, 0.026935), (56, 0.024534), (57, 0.020948), (58, 0.016566), (59, 0.012074), (60, 0.007980), (61, 0.004331), (62, 0.001499), (63, -0.000533), (64, -0.002183), (65, -0.002799), (66, -0.001889), (67, 0.000036), (68, 0.002377), (69, 0.004449), (70, 0.005663), (71, 0.005946), (72, 0.005815), (73, 0.005823), (74, 0.006223), (75, 0.007599), (76, 0.009782), (77, 0.011791), (78, 0.013300), (79, 0.013938), (80, 0.013417), (81, 0.012229), (82, 0.010936), (83, 0.009770), (84, 0.008919), (85, 0.008355), (86, 0.007841), (87, 0.007333), (88, 0.006780), (89, 0.006159), (90, 0.005606), (91, 0.005173), (92, 0.004876), (93, 0.004717), (94, 0.004604), (95, 0.004531), (96, 0.004514), (97, 0.004597), (98, 0.004837), (99, 0.005377), (100, 0.006689), (101, 0.008850), (102, 0.011480), (103, 0.014115), (104, 0.015973), (105, 0.016300), (106, 0.015051), (107, 0.012770), (108, 0.009968), (109, 0.006931), (110, 0.003729), (111, 0.000343), (112, -0.003263), (113, -0.007145), (114, -0.011796), (115, -0.016786), (116, -0.020991), (117, -0.024555), (118, -0.026874), (119, -0.027018), (120, -0.026040), (121, -0.024719), (122, -0.023281), (123, -0.021928), ],
+    }),
+
+    "HANDYCAM_RUN": ("HandyCam Run", 24.0, {
+        ('location', 0): [(0, -0.017760), (1, -0.020441), (2, -0.023960), (3, -0.029392), (4, -0.035781), (5, -0.042153), (6, -0.047954), (7, -0.052314), (8, -0.056004), (9, -0.059061), (10, -0.060912), (11, -0.062539), (12, -0.063192), (13, -0.061350), (14, -0.057721), (15, -0.053152), (16, -0.047561), (17, -0.041731), (18, -0.037374), (19, -0.034749), (20, -0.032649), (21, -0.030528), (22, -0.028348), (23, -0.025828), (24, -0.022658), (25, -0.018748), (26, -0.014897), (27, -0.011778), (28, -0.008471), (29, -0.004570), (30, -0.001448), (31, 0.000633), (32, 0.002837), (33, 0.005068), (34, 0.007113), (35, 0.009364), (36, 0.012143), (37, 0.015852), (38, 0.018178), (39, 0.017865), (40, 0.018472), (41, 0.019394), (42, 0.017804), (43, 0.016205), (44, 0.014672), (45, 0.010634), (46, 0.005037), (47, -0.000305), (48, -0.004398), (49, -0.007329), (50, -0.009853), (51, -0.011361), (52, -0.011303), (53, -0.010754), (54, -0.010280), (55, -0.009473), (56, -0.008518), (57, -0.008666), (58, -0.010830), (59, -0.013243), (60, -0.014402), (61, -0.016053), (62, -0.017488), (63, -0.017671), (64, -0.020441), ],
+        ('location', 1): [(0, 0.000500), (1, 0.007948), (2, 0.009587), (3, 0.005775), (4, -0.001160), (5, -0.009195), (6, -0.018055), (7, -0.022637), (8, -0.021233), (9, -0.018738), (10, -0.012144), (11, -0.003710), (12, -0.002647), (13, -0.004932), (14, -0.007374), (15, -0.015810), (16, -0.023316), (17, -0.024828), (18, -0.024130), (19, -0.019167), (20, -0.008979), (21, 0.000967), (22, 0.008697), (23, 0.011537), (24, 0.009443), (25, 0.002179), (26, -0.010399), (27, -0.016652), (28, -0.018680), (29, -0.016839), (30, -0.006438), (31, 0.003816), (32, 0.015017), (33, 0.018749), (34, 0.011238), (35, 0.003200), (36, -0.012741), (37, -0.029053), (38, -0.035686), (39, -0.036209), (40, -0.025814), (41, -0.014299), (42, -0.006979), (43, -0.004961), (44, -0.010790), (45, -0.018951), (46, -0.029019), (47, -0.030864), (48, -0.026783), (49, -0.022926), (50, -0.013857), (51, -0.002970), (52, 0.001304), (53, -0.000065), (54, -0.001189), (55, -0.008342), (56, -0.019144), (57, -0.022374), (58, -0.022678), (59, -0.020136), (60, -0.011577), (61, -0.005809), (62, -0.001259), (63, 0.000661), (64, 0.007948), ],
+        ('location', 2): [(0, -0.005391), (1, -0.005391), (2, -0.005391), (3, -0.005391), (4, -0.005391), (5, -0.005391), (6, -0.005391), (7, -0.005391), (8, -0.005391), (9, -0.005391), (10, -0.005391), (11, -0.005391), (12, -0.005391), (13, -0.005391), (14, -0.005391), (15, -0.005391), (16, -0.005391), (17, -0.005391), (18, -0.005391), (19, -0.005391), (20, -0.005391), (21, -0.005391), (22, -0.005391), (23, -0.005391), (24, -0.005391), (25, -0.005391), (26, -0.005391), (27, -0.005391), (28, -0.005391), (29, -0.005391), (30, -0.005391), (31, -0.005391), (32, -0.005391), (33, -0.005391), (34, -0.005391), (35, -0.005391), (36, -0.005391), (37, -0.005391), (38, -0.005391), (39, -0.005391), (40, -0.005391), (41, -0.005391), (42, -0.005391), (43, -0.005391), (44, -0.005391), (45, -0.005391), (46, -0.005391), (47, -0.005391), (48, -0.005391), (49, -0.005391), (50, -0.005391), (51, -0.005391), (52, -0.005391), (53, -0.005391), (54, -0.005391), (55, -0.005391), (56, -0.005391), (57, -0.005391), (58, -0.005391), (59, -0.005391), (60, -0.005391), (61, -0.005391), (62, -0.005391), (63, -0.005391), (64, -0.005391), ],
+        ('rotation_euler', 0): [(0, -0.025596), (1, -0.036735), (2, -0.030108), (3, -0.014478), (4, 0.005734), (5, 0.016080), (6, 0.017318), (7, 0.016132), (8, 0.008823), (9, -0.009410), (10, -0.015704), (11, -0.017043), (12, -0.009645), (13, 0.011415), (14, 0.027458), (15, 0.033424), (16, 0.041844), (17, 0.049417), (18, 0.041270), (19, 0.023567), (20, -0.001007), (21, -0.015594), (22, -0.011693), (23, -0.000614), (24, 0.009784), (25, 0.022827), (26, 0.034312), (27, 0.029120), (28, 0.003863), (29, -0.018912), (30, -0.031209), (31, -0.035049), (32, -0.027213), (33, -0.012141), (34, 0.015340), (35, 0.052905), (36, 0.050837), (37, 0.043495), (38, 0.021338), (39, -0.011508), (40, -0.042248), (41, -0.062604), (42, -0.054650), (43, -0.034711), (44, -0.010179), (45, -0.001107), (46, 0.002627), (47, -0.000882), (48, -0.016582), (49, -0.025937), (50, -0.023532), (51, -0.024543), (52, -0.019414), (53, 0.012108), (54, 0.043873), (55, 0.037867), (56, 0.036217), (57, 0.029138), (58, 0.002712), (59, -0.023940), (60, -0.045936), (61, -0.054723), (62, -0.043676), (63, -0.026435), (64, -0.026420), ],
+        ('rotation_euler', 1): [(0, -0.023238), (1, -0.026430), (2, -0.023854), (3, -0.025981), (4, -0.033882), (5, -0.047930), (6, -0.049037), (7, -0.050552), (8, -0.063574), (9, -0.071810), (10, -0.069699), (11, -0.070574), (12, -0.070151), (13, -0.074938), (14, -0.082066), (15, -0.067617), (16, -0.044029), (17, -0.036039), (18, -0.029113), (19, -0.019001), (20, -0.015441), (21, -0.021264), (22, -0.026234), (23, -0.030818), (24, -0.036552), (25, -0.034998), (26, -0.028784), (27, -0.037575), (28, -0.055770), (29, -0.062489), (30, -0.055890), (31, -0.046733), (32, -0.042975), (33, -0.056436), (34, -0.072205), (35, -0.073701), (36, -0.072360), (37, -0.061041), (38, -0.050528), (39, -0.024102), (40, 0.001949), (41, 0.015498), (42, 0.018278), (43, 0.011390), (44, 0.003440), (45, -0.003694), (46, -0.005067), (47, -0.020583), (48, -0.047411), (49, -0.059380), (50, -0.050158), (51, -0.036971), (52, -0.034585), (53, -0.034205), (54, -0.029629), (55, -0.023398), (56, -0.016586), (57, -0.030123), (58, -0.032961), (59, -0.018701), (60, -0.011907), (61, -0.015034), (62, -0.020980), (63, -0.022573), (64, -0.026430), ],
+        ('rotation_euler', 2): [(0, -0.071871), (1, -0.071298), (2, -0.069715), (3, -0.068078), (4, -0.062048), (5, -0.040747), (6, -0.021076), (7, -0.004354), (8, -0.003135), (9, -0.004422), (10, -0.005421), (11, -0.005861), (12, -0.005444), (13, -0.011951), (14, -0.020798), (15, -0.021689), (16, -0.019187), (17, -0.026708), (18, -0.051748), (19, -0.062587), (20, -0.052661), (21, -0.032018), (22, -0.023176), (23, -0.013146), (24, 0.004961), (25, 0.026719), (26, 0.032956), (27, 0.037948), (28, 0.044049), (29, 0.039563), (30, 0.027857), (31, 0.019822), (32, 0.014830), (33, -0.000856), (34, -0.015537), (35, -0.005762), (36, 0.010076), (37, 0.006172), (38, -0.023949), (39, -0.038060), (40, -0.028144), (41, -0.024676), (42, -0.019484), (43, -0.000309), (44, 0.003923), (45, 0.004699), (46, 0.005128), (47, 0.018862), (48, 0.021167), (49, 0.004675), (50, -0.009374), (51, -0.008165), (52, -0.016224), (53, -0.038857), (54, -0.047585), (55, -0.044906), (56, -0.048685), (57, -0.086840), (58, -0.120676), (59, -0.118020), (60, -0.095882), (61, -0.096469), (62, -0.089472), (63, -0.072262), (64, -0.071298), ],
+    }),
+
+    "OUT_CAR_WINDOW": ("Out Car Window", 24.0, {
+        ('location', 0): [(-1, 0.009985), (0, 0.012103), (1, 0.011936), (2, 0.010596), (3, 0.010207), (4, 0.010109), (5, 0.010387), (6, 0.011021), (7, 0.010938), (8, 0.010907), (9, 0.010834), (10, 0.010901), (11, 0.011124), (12, 0.011564), (13, 0.011831), (14, 0.012136), (15, 0.011848), (16, 0.011444), (17, 0.011913), (18, 0.011699), (19, 0.011742), (20, 0.011813), (21, 0.011554), (22, 0.010921), (23, 0.010116), (24, 0.008551), (25, 0.007345), (26, 0.006583), (27, 0.005448), (28, 0.004383), (29, 0.003340), (30, 0.003317), (31, 0.003449), (32, 0.004713), (33, 0.005789), (34, 0.007833), (35, 0.010186), (36, 0.012167), (37, 0.013962), (38, 0.014537), (39, 0.015095), (40, 0.014996), (41, 0.013845), (42, 0.011558), (43, 0.008941), (44, 0.006591), (45, 0.005244), (46, 0.004128), (47, 0.004177), (48, 0.004278), (49, 0.004621), (50, 0.006247), (51, 0.008369), (52, 0.011494), (53, 0.012971), (54, 0.016548), (55, 0.019106), (56, 0.021730), (57, 0.023827), (58, 0.024763), (59, 0.024617), (60, 0.023274), (61, 0.020692), (62, 0.017841), (63, 0.015116), (64, 0.013084), (65, 0.011293), (66, 0.009612), (67, 0.008506), (68, 0.007531), (69, 0.007786), (70, 0.008322), (71, 0.009841), (72, 0.011769), (73, 0.013243), (74, 0.014214), (75, 0.015815), (76, 0.017384), (77, 0.018233), (78, 0.018593), (79, 0.018591), (80, 0.017833), (81, 0.016886), (82, 0.015071), (83, 0.013927), (84, 0.012319), (85, 0.010793), (86, 0.009688), (87, 0.008767), (88, 0.008402), (89, 0.008101), (90, 0.008507), (91, 0.008503), (92, 0.008346), (93, 0.008106), (94, 0.008636), (95, 0.009510), (96, 0.010287), (97, 0.010587), (98, 0.011214), (99, 0.012083), (100, 0.013114), (101, 0.013787), (102, 0.013975), (103, 0.014580), (104, 0.014881), (105, 0.014531), (106, 0.013785), (107, 0.012366), (108, 0.011185), (109, 0.009680), (110, 0.007415), (111, 0.004267), (112, 0.001739), (113, -0.000875), (114, -0.002272), (115, -0.002962), (116, -0.003587), (117, -0.002485), (118, -0.001256), (119, 0.000775), (120, 0.002304), (121, 0.003353), (122, 0.003526), (123, 0.004071), (124, 0.003896), (125, 0.002613), (126, 0.001718), (127, -0.000482), (128, -0.002422), (129, -0.005701), (130, -0.008357), (131, -0.011930), (132, -0.014880), (133, -0.017145), (134, -0.019821), (135, -0.020599), (136, -0.020646), (137, -0.019693), (138, -0.018760), (139, -0.017593), (140, -0.015044), (141, -0.012013), (142, -0.009387), (143, -0.007321), (144, -0.005627), (145, -0.004250), (146, -0.003187), (147, -0.003285), (148, -0.003565), (149, -0.004420), (150, -0.005105), (151, -0.003663), (152, -0.002952), (153, -0.002558), (154, -0.001537), (155, 0.000946), (156, 0.002393), (157, 0.004293), (158, 0.006374), (159, 0.010092), ],
+        ('location', 1): [(-1, -0.008317), (0, -0.008898), (1, -0.008531), (2, -0.008319), (3, -0.007873), (4, -0.007348), (5, -0.007690), (6, -0.007880), (7, -0.007245), (8, -0.005463), (9, -0.004093), (10, -0.003866), (11, -0.003994), (12, -0.004281), (13, -0.004103), (14, -0.002765), (15, -0.000893), (16, 0.000923), (17, 0.001776), (18, 0.002532), (19, 0.002835), (20, 0.001692), (21, -0.000027), (22, -0.002085), (23, -0.003551), (24, -0.004532), (25, -0.003800), (26, -0.002383), (27, -0.000018), (28, 0.003729), (29, 0.007911), (30, 0.011980), (31, 0.014860), (32, 0.015895), (33, 0.015254), (34, 0.013668), (35, 0.010749), (36, 0.006701), (37, 0.002035), (38, -0.003249), (39, -0.008258), (40, -0.011180), (41, -0.012694), (42, -0.009995), (43, -0.004983), (44, 0.001766), (45, 0.006724), (46, 0.010962), (47, 0.013295), (48, 0.014559), (49, 0.015521), (50, 0.014994), (51, 0.014382), (52, 0.012061), (53, 0.010776), (54, 0.007910), (55, 0.005144), (56, 0.001426), (57, -0.002384), (58, -0.004588), (59, -0.005326), (60, -0.002773), (61, 0.001072), (62, 0.006732), (63, 0.012390), (64, 0.018204), (65, 0.022698), (66, 0.025810), (67, 0.027134), (68, 0.026756), (69, 0.023891), (70, 0.019766), (71, 0.015021), (72, 0.010488), (73, 0.007521), (74, 0.006187), (75, 0.005523), (76, 0.005156), (77, 0.005793), (78, 0.006204), (79, 0.005819), (80, 0.006792), (81, 0.008377), (82, 0.010883), (83, 0.012610), (84, 0.013904), (85, 0.014676), (86, 0.013805), (87, 0.012945), (88, 0.010810), (89, 0.007989), (90, 0.005502), (91, 0.003430), (92, 0.001437), (93, 0.000184), (94, -0.000189), (95, 0.000893), (96, 0.001667), (97, 0.002573), (98, 0.003046), (99, 0.003345), (100, 0.003317), (101, 0.002366), (102, 0.000613), (103, -0.002042), (104, -0.004928), (105, -0.007934), (106, -0.010101), (107, -0.011437), (108, -0.012730), (109, -0.012760), (110, -0.011627), (111, -0.009464), (112, -0.007140), (113, -0.006153), (114, -0.005917), (115, -0.006020), (116, -0.006542), (117, -0.008734), (118, -0.011175), (119, -0.013073), (120, -0.015985), (121, -0.017659), (122, -0.019983), (123, -0.022311), (124, -0.023691), (125, -0.024199), (126, -0.023782), (127, -0.023294), (128, -0.022948), (129, -0.021700), (130, -0.020299), (131, -0.018189), (132, -0.016413), (133, -0.014272), (134, -0.013313), (135, -0.011870), (136, -0.011687), (137, -0.011769), (138, -0.012452), (139, -0.014302), (140, -0.015666), (141, -0.018227), (142, -0.020437), (143, -0.021995), (144, -0.023532), (145, -0.025311), (146, -0.026539), (147, -0.025013), (148, -0.023382), (149, -0.020595), (150, -0.017884), (151, -0.014254), (152, -0.010704), (153, -0.007490), (154, -0.004744), (155, -0.003315), (156, -0.004389), (157, -0.005531), (158, -0.006413), (159, -0.008312), ],
+        ('location', 2): [(-1, -0.022019), (0, -0.022234), (1, -0.021511), (2, -0.018667), (3, -0.016380), (4, -0.015092), (5, -0.014506), (6, -0.013627), (7, -0.011573), (8, -0.010045), (9, -0.009347), (10, -0.009141), (11, -0.008742), (12, -0.008536), (13, -0.008147), (14, -0.008447), (15, -0.008401), (16, -0.007965), (17, -0.006912), (18, -0.006897), (19, -0.006456), (20, -0.004841), (21, -0.002589), (22, -0.000358), (23, 0.001455), (24, 0.002940), (25, 0.003689), (26, 0.003157), (27, 0.002189), (28, 0.000784), (29, -0.000483), (30, -0.001636), (31, -0.002431), (32, -0.001374), (33, -0.000348), (34, 0.001217), (35, 0.003356), (36, 0.005813), (37, 0.008431), (38, 0.010093), (39, 0.011179), (40, 0.011609), (41, 0.011477), (42, 0.011577), (43, 0.011063), (44, 0.009396), (45, 0.006895), (46, 0.004958), (47, 0.003802), (48, 0.003265), (49, 0.002847), (50, 0.003120), (51, 0.002950), (52, 0.004182), (53, 0.006522), (54, 0.009873), (55, 0.012725), (56, 0.014945), (57, 0.016286), (58, 0.016935), (59, 0.017825), (60, 0.017857), (61, 0.016797), (62, 0.014304), (63, 0.011444), (64, 0.008055), (65, 0.004994), (66, 0.003287), (67, 0.002446), (68, 0.003296), (69, 0.004309), (70, 0.005996), (71, 0.008550), (72, 0.011302), (73, 0.014210), (74, 0.015919), (75, 0.016436), (76, 0.016333), (77, 0.017035), (78, 0.016647), (79, 0.015697), (80, 0.014428), (81, 0.014286), (82, 0.013882), (83, 0.013673), (84, 0.014090), (85, 0.014864), (86, 0.015832), (87, 0.017812), (88, 0.019629), (89, 0.021537), (90, 0.023145), (91, 0.024517), (92, 0.026051), (93, 0.027035), (94, 0.026881), (95, 0.026678), (96, 0.026331), (97, 0.026839), (98, 0.027666), (99, 0.028223), (100, 0.028600), (101, 0.029908), (102, 0.031536), (103, 0.032758), (104, 0.034147), (105, 0.035707), (106, 0.037265), (107, 0.038119), (108, 0.038416), (109, 0.037783), (110, 0.035872), (111, 0.032607), (112, 0.028745), (113, 0.024858), (114, 0.020654), (115, 0.016018), (116, 0.011828), (117, 0.008864), (118, 0.006319), (119, 0.004242), (120, 0.001535), (121, 0.000047), (122, -0.001158), (123, -0.002746), (124, -0.003846), (125, -0.005443), (126, -0.007439), (127, -0.009611), (128, -0.012209), (129, -0.014256), (130, -0.015752), (131, -0.017670), (132, -0.019891), (133, -0.021168), (134, -0.021530), (135, -0.022594), (136, -0.024025), (137, -0.024488), (138, -0.024693), (139, -0.024135), (140, -0.023365), (141, -0.021433), (142, -0.019315), (143, -0.016998), (144, -0.014647), (145, -0.013247), (146, -0.012632), (147, -0.012461), (148, -0.013861), (149, -0.014691), (150, -0.017120), (151, -0.016432), (152, -0.018600), (153, -0.020775), (154, -0.023754), (155, -0.024667), (156, -0.024360), (157, -0.023830), (158, -0.022855), (159, -0.022006), ],
+        ('rotation_euler', 0): [(-1, -0.015219), (0, -0.015160), (1, -0.015067), (2, -0.014754), (3, -0.015326), (4, -0.013451), (5, -0.012049), (6, -0.011697), (7, -0.011753), (8, -0.011141), (9, -0.008984), (10, -0.007039), (11, -0.006440), (12, -0.006467), (13, -0.006741), (14, -0.006858), (15, -0.006098), (16, -0.004363), (17, -0.002452), (18, -0.000777), (19, -0.000634), (20, -0.000663), (21, -0.001045), (22, -0.001850), (23, -0.003404), (24, -0.005294), (25, -0.006206), (26, -0.005624), (27, -0.004348), (28, -0.000822), (29, 0.004487), (30, 0.010348), (31, 0.015382), (32, 0.017623), (33, 0.018664), (34, 0.017924), (35, 0.015609), (36, 0.011600), (37, 0.006775), (38, 0.000204), (39, -0.006013), (40, -0.012293), (41, -0.015628), (42, -0.017048), (43, -0.015532), (44, -0.009726), (45, -0.001017), (46, 0.005321), (47, 0.009321), (48, 0.011269), (49, 0.012521), (50, 0.013759), (51, 0.013781), (52, 0.013077), (53, 0.010780), (54, 0.008036), (55, 0.002929), (56, -0.002382), (57, -0.006661), (58, -0.011817), (59, -0.013968), (60, -0.014578), (61, -0.012577), (62, -0.007219), (63, 0.001844), (64, 0.010089), (65, 0.018245), (66, 0.023153), (67, 0.025738), (68, 0.026407), (69, 0.026337), (70, 0.022059), (71, 0.016131), (72, 0.010637), (73, 0.005847), (74, 0.002147), (75, 0.001274), (76, 0.000433), (77, -0.000595), (78, -0.000782), (79, -0.000342), (80, -0.000792), (81, -0.000540), (82, 0.000715), (83, 0.003422), (84, 0.005379), (85, 0.005817), (86, 0.006950), (87, 0.007425), (88, 0.007834), (89, 0.006851), (90, 0.004309), (91, 0.001465), (92, 0.000170), (93, -0.001769), (94, -0.003342), (95, -0.004075), (96, -0.003859), (97, -0.003338), (98, -0.002952), (99, -0.002873), (100, -0.002936), (101, -0.003061), (102, -0.003472), (103, -0.004249), (104, -0.005604), (105, -0.008614), (106, -0.012312), (107, -0.014215), (108, -0.015783), (109, -0.017528), (110, -0.018372), (111, -0.018150), (112, -0.014908), (113, -0.011762), (114, -0.011861), (115, -0.011836), (116, -0.011627), (117, -0.011922), (118, -0.013380), (119, -0.016142), (120, -0.018214), (121, -0.021730), (122, -0.024561), (123, -0.029378), (124, -0.036340), (125, -0.038539), (126, -0.038737), (127, -0.038066), (128, -0.036698), (129, -0.034637), (130, -0.033194), (131, -0.033054), (132, -0.032024), (133, -0.031581), (134, -0.031047), (135, -0.030512), (136, -0.029293), (137, -0.028976), (138, -0.028864), (139, -0.029155), (140, -0.031295), (141, -0.033781), (142, -0.038678), (143, -0.043678), (144, -0.046933), (145, -0.048219), (146, -0.049996), (147, -0.051857), (148, -0.050972), (149, -0.046133), (150, -0.040489), (151, -0.034779), (152, -0.028983), (153, -0.023031), (154, -0.019580), (155, -0.016593), (156, -0.013864), (157, -0.013702), (158, -0.014602), (159, -0.015371), ],
+        ('rotation_euler', 1): [(-1, -0.000029), (0, 0.000000), (1, -0.000016), (2, -0.000696), (3, -0.001462), (4, -0.002012), (5, -0.002140), (6, -0.002656), (7, -0.003342), (8, -0.003989), (9, -0.004572), (10, -0.004935), (11, -0.004892), (12, -0.005075), (13, -0.005384), (14, -0.005906), (15, -0.006134), (16, -0.006771), (17, -0.006420), (18, -0.006352), (19, -0.006518), (20, -0.006672), (21, -0.006829), (22, -0.006684), (23, -0.006812), (24, -0.007133), (25, -0.007468), (26, -0.008098), (27, -0.009119), (28, -0.010153), (29, -0.011160), (30, -0.010519), (31, -0.009050), (32, -0.007688), (33, -0.007964), (34, -0.008287), (35, -0.008417), (36, -0.008209), (37, -0.007717), (38, -0.005110), (39, -0.001622), (40, 0.001066), (41, 0.002345), (42, 0.001056), (43, -0.000024), (44, -0.001506), (45, -0.001554), (46, -0.001999), (47, -0.002740), (48, -0.003149), (49, -0.002840), (50, -0.002222), (51, -0.002697), (52, -0.002880), (53, -0.003402), (54, -0.003458), (55, -0.003355), (56, -0.001714), (57, 0.000496), (58, 0.002835), (59, 0.005663), (60, 0.003964), (61, 0.002341), (62, 0.000683), (63, -0.001855), (64, -0.004063), (65, -0.005748), (66, -0.006612), (67, -0.007653), (68, -0.009188), (69, -0.009799), (70, -0.010205), (71, -0.009417), (72, -0.009903), (73, -0.010722), (74, -0.009065), (75, -0.007781), (76, -0.007501), (77, -0.006805), (78, -0.005943), (79, -0.004954), (80, -0.004693), (81, -0.004155), (82, -0.004662), (83, -0.004135), (84, -0.004170), (85, -0.004301), (86, -0.003908), (87, -0.003996), (88, -0.003804), (89, -0.002981), (90, -0.002905), (91, -0.003113), (92, -0.003363), (93, -0.003393), (94, -0.003253), (95, -0.003425), (96, -0.003297), (97, -0.003799), (98, -0.003962), (99, -0.004335), (100, -0.004073), (101, -0.003834), (102, -0.003127), (103, -0.002334), (104, -0.001352), (105, -0.001276), (106, -0.000845), (107, -0.000471), (108, -0.000330), (109, -0.000385), (110, -0.000674), (111, -0.001126), (112, -0.001789), (113, -0.002407), (114, -0.002950), (115, -0.002728), (116, -0.002027), (117, -0.001253), (118, 0.000070), (119, 0.000332), (120, 0.001248), (121, 0.001325), (122, 0.002144), (123, 0.001718), (124, 0.001576), (125, 0.002084), (126, 0.003156), (127, 0.003557), (128, 0.004037), (129, 0.004358), (130, 0.004207), (131, 0.004246), (132, 0.004395), (133, 0.003792), (134, 0.003259), (135, 0.002432), (136, 0.002286), (137, 0.001947), (138, 0.001175), (139, 0.000376), (140, -0.000140), (141, -0.000211), (142, -0.000170), (143, -0.000424), (144, 0.000085), (145, 0.000025), (146, 0.000000), (147, -0.000306), (148, -0.000709), (149, -0.000346), (150, -0.001067), (151, -0.001324), (152, -0.001657), (153, -0.001947), (154, -0.002137), (155, -0.002073), (156, -0.002005), (157, -0.001974), (158, -0.001039), (159, -0.000049), ],
+        ('rotation_euler', 2): [(-1, 0.000007), (0, 0.000000), (1, 0.000061), (2, -0.000588), (3, -0.001006), (4, -0.002324), (5, -0.002587), (6, -0.001503), (7, -0.001568), (8, -0.001993), (9, -0.002454), (10, -0.002165), (11, -0.001512), (12, -0.000933), (13, -0.000591), (14, 0.000112), (15, 0.000461), (16, 0.000095), (17, -0.000253), (18, -0.000927), (19, -0.000615), (20, -0.000308), (21, -0.000009), (22, 0.000165), (23, 0.000625), (24, 0.000550), (25, 0.000778), (26, 0.001077), (27, 0.001280), (28, 0.001204), (29, 0.000437), (30, 0.000731), (31, 0.000805), (32, 0.001194), (33, 0.000496), (34, -0.000154), (35, -0.001450), (36, -0.002511), (37, -0.002468), (38, -0.002663), (39, -0.001803), (40, -0.000197), (41, 0.001374), (42, 0.001241), (43, 0.000586), (44, 0.000274), (45, 0.000926), (46, 0.000979), (47, 0.001146), (48, 0.000885), (49, 0.000213), (50, 0.000286), (51, 0.000160), (52, 0.000496), (53, -0.000805), (54, -0.000980), (55, -0.002502), (56, -0.002518), (57, -0.001820), (58, -0.001613), (59, -0.001804), (60, -0.001704), (61, -0.000662), (62, 0.000580), (63, 0.000977), (64, 0.000812), (65, 0.001649), (66, 0.002206), (67, 0.002111), (68, 0.001347), (69, 0.001311), (70, 0.001708), (71, 0.003385), (72, 0.003886), (73, 0.003097), (74, 0.001558), (75, 0.002207), (76, 0.003474), (77, 0.003983), (78, 0.004330), (79, 0.005043), (80, 0.005398), (81, 0.005715), (82, 0.005448), (83, 0.005498), (84, 0.004797), (85, 0.004624), (86, 0.004870), (87, 0.005143), (88, 0.004995), (89, 0.004235), (90, 0.004574), (91, 0.005047), (92, 0.004861), (93, 0.004089), (94, 0.004400), (95, 0.005806), (96, 0.006597), (97, 0.006064), (98, 0.005325), (99, 0.005530), (100, 0.005953), (101, 0.005651), (102, 0.004672), (103, 0.004620), (104, 0.004850), (105, 0.004554), (106, 0.003209), (107, 0.002342), (108, 0.002285), (109, 0.002719), (110, 0.002674), (111, 0.002722), (112, 0.004696), (113, 0.005828), (114, 0.006340), (115, 0.007134), (116, 0.008567), (117, 0.010420), (118, 0.010567), (119, 0.011531), (120, 0.011350), (121, 0.009416), (122, 0.006335), (123, 0.007080), (124, 0.007421), (125, 0.006994), (126, 0.007953), (127, 0.008566), (128, 0.009644), (129, 0.009602), (130, 0.009985), (131, 0.010203), (132, 0.011138), (133, 0.011484), (134, 0.010044), (135, 0.009447), (136, 0.009449), (137, 0.009935), (138, 0.009900), (139, 0.009038), (140, 0.008117), (141, 0.006803), (142, 0.004062), (143, 0.001302), (144, -0.000569), (145, -0.000729), (146, -0.001038), (147, -0.001551), (148, -0.001312), (149, -0.000269), (150, 0.000558), (151, 0.002068), (152, 0.001911), (153, 0.001469), (154, 0.001006), (155, 0.001945), (156, 0.001092), (157, -0.000076), (158, -0.001300), (159, 0.000044), ],
+    }),
+
+    #--------------------------------
+
+    "BIKE_ON_GRAVEL_2D": ("Bike On Gravel (2D)", 24.0, {
+        ('rotation_euler', 0): [(-1, -0.000078), (0, 0.000000), (1, 0.000085), (2, 0.000810), (3, -0.066465), (4, -0.057542), (5, -0.033001), (6, -0.012458), (7, -0.074098), (8, -0.039907), (9, 0.015724), (10, -0.068089), (11, -0.139640), (12, -0.028404), (13, -0.041543), (14, -0.048633), (15, -0.096246), (16, -0.212581), (17, -0.157675), (18, -0.131935), (19, -0.147113), (20, -0.199160), (21, -0.269824), (22, -0.199037), (23, -0.125103), (24, -0.170847), (25, -0.192168), (26, -0.076199), (27, -0.131190), (28, -0.211039), (29, -0.149041), (30, -0.042445), (31, -0.130906), (32, -0.112130), (33, -0.026560), (34, -0.021638), (35, -0.005938), (36, -0.007441), (37, -0.068062), (38, -0.105772), (39, -0.124324), (40, 0.026162), (41, 0.000382), (42, 0.045858), (43, 0.047309), (44, -0.042892), (45, -0.036843), (46, -0.025342), (47, -0.003964), (48, -0.040739), (49, -0.082334), (50, 0.092071), (51, 0.036501), (52, -0.131504), (53, 0.025213), (54, 0.108789), (55, -0.059837), (56, 0.086976), (57, 0.129223), (58, 0.097298), (59, 0.098135), (60, -0.040527), (61, -0.091630), (62, 0.104583), (63, -0.053018), (64, -0.072825), (65, 0.048346), (66, -0.036054), (67, 0.001736), (68, 0.066190), (69, -0.061916), (70, -0.020880), (71, -0.000243), (72, -0.041029), (73, -0.055794), (74, -0.103323), (75, 0.000698), (76, 0.036851), (77, -0.119682), (78, 0.016292), (79, -0.073771), (80, 0.037467), (81, 0.001940), (82, 0.024659), (83, 0.138218), (84, 0.051696), (85, 0.139265), (86, 0.189935), (87, 0.105093), (88, 0.155971), (89, 0.163328), (90, 0.013233), (91, 0.034089), (92, 0.004731), (93, -0.133469), (94, -0.040586), (95, -0.093119), (96, -0.175385), (97, -0.003623), (98, -0.123718), (99, 0.006529), (100, 0.027292), (101, -0.097547), (102, -0.140673), (103, 0.066518), (104, 0.085386), (105, -0.057530), (106, -0.039356), (107, 0.172075), (108, 0.088864), (109, -0.046416), (110, 0.051081), (111, 0.118495), (112, -0.028568), (113, 0.001808), (114, 0.060020), (115, -0.026690), (116, -0.069613), (117, 0.013295), (118, 0.088957), (119, -0.003677), (120, -0.008877), (121, 0.062937), (122, 0.076262), (123, -0.014165), (124, -0.022118), (125, -0.021977), ],
+        ('rotation_euler', 1): [(-1, -0.000051), (0, 0.000000), (1, 0.000051), (2, 0.005789), (3, 0.022931), (4, 0.014551), (5, 0.018471), (6, 0.019660), (7, 0.010913), (8, 0.014265), (9, -0.015017), (10, -0.023578), (11, -0.008681), (12, -0.022787), (13, -0.019015), (14, 0.020081), (15, 0.000920), (16, -0.040722), (17, -0.063286), (18, -0.016453), (19, -0.005134), (20, 0.022189), (21, 0.009332), (22, 0.023363), (23, 0.021832), (24, 0.053875), (25, 0.067943), (26, 0.081220), (27, 0.068997), (28, 0.080551), (29, 0.092582), (30, 0.025739), (31, 0.030359), (32, 0.069189), (33, 0.043819), (34, 0.052897), (35, 0.033502), (36, -0.006116), (37, -0.027786), (38, -0.082804), (39, -0.136983), (40, -0.139252), (41, -0.132822), (42, -0.113020), (43, -0.065593), (44, -0.029751), (45, -0.036599), (46, -0.023817), (47, -0.030960), (48, -0.039133), (49, 0.000629), (50, -0.022570), (51, 0.013025), (52, 0.011688), (53, -0.031950), (54, -0.035589), (55, -0.035869), (56, -0.038899), (57, -0.016037), (58, 0.003176), (59, -0.013861), (60, -0.028898), (61, -0.032104), (62, -0.026038), (63, -0.017471), (64, -0.023815), (65, -0.019076), (66, 0.014886), (67, 0.035025), (68, 0.004080), (69, 0.045702), (70, 0.073253), (71, 0.057753), (72, 0.016473), (73, 0.018774), (74, 0.069347), (75, 0.045695), (76, 0.033439), (77, 0.060715), (78, 0.002863), (79, 0.012014), (80, -0.005685), (81, -0.025260), (82, -0.023370), (83, -0.046605), (84, -0.061309), (85, -0.049280), (86, -0.059683), (87, -0.054441), (88, -0.030998), (89, -0.014556), (90, 0.010670), (91, 0.025175), (92, 0.035505), (93, 0.047781), (94, 0.046803), (95, 0.046871), (96, 0.069884), (97, 0.063584), (98, 0.081913), (99, 0.037987), (100, 0.018464), (101, 0.047135), (102, 0.052887), (103, 0.020454), (104, 0.006535), (105, 0.011469), (106, 0.017922), (107, -0.020735), (108, -0.014746), (109, -0.013590), (110, -0.045896), (111, -0.053825), (112, -0.030251), (113, -0.036521), (114, -0.048836), (115, -0.029618), (116, -0.008341), (117, -0.017298), (118, -0.025781), (119, -0.011496), (120, 0.013072), (121, -0.007556), (122, -0.011296), (123, -0.003484), (124, -0.000423), (125, -0.000222), ],
+        ('rotation_euler', 2): [(-1, 0.000115), (0, 0.000000), (1, -0.000115), (2, 0.012355), (3, 0.007266), (4, 0.000596), (5, 0.001994), (6, -0.000029), (7, 0.000079), (8, 0.004377), (9, -0.002482), (10, 0.008551), (11, 0.008848), (12, -0.003365), (13, 0.012423), (14, 0.035599), (15, 0.010341), (16, -0.002410), (17, 0.001513), (18, 0.019245), (19, 0.022397), (20, 0.020560), (21, 0.017108), (22, 0.013478), (23, 0.012115), (24, 0.014514), (25, 0.020617), (26, 0.011193), (27, 0.012200), (28, 0.015489), (29, -0.001103), (30, -0.007525), (31, 0.000752), (32, 0.008059), (33, -0.000116), (34, 0.005341), (35, -0.007375), (36, -0.009850), (37, -0.024105), (38, -0.034448), (39, -0.043014), (40, -0.037553), (41, -0.025343), (42, -0.006140), (43, 0.018928), (44, 0.009054), (45, 0.005502), (46, 0.009183), (47, 0.006137), (48, 0.006818), (49, 0.015242), (50, 0.000257), (51, 0.018763), (52, 0.009625), (53, -0.008605), (54, -0.004001), (55, 0.012561), (56, 0.000322), (57, 0.025154), (58, 0.016492), (59, 0.005673), (60, -0.000821), (61, 0.004525), (62, -0.002299), (63, 0.009672), (64, 0.007892), (65, 0.002255), (66, 0.027348), (67, 0.019554), (68, 0.017771), (69, 0.032883), (70, 0.031821), (71, 0.026788), (72, 0.020689), (73, 0.033744), (74, 0.044025), (75, 0.021184), (76, 0.030286), (77, 0.034664), (78, 0.020513), (79, 0.022206), (80, 0.001767), (81, 0.006144), (82, 0.002578), (83, -0.014181), (84, -0.017631), (85, -0.022513), (86, -0.028638), (87, -0.017192), (88, -0.009900), (89, 0.000394), (90, 0.017831), (91, 0.022404), (92, 0.024280), (93, 0.038699), (94, 0.025923), (95, 0.040003), (96, 0.046128), (97, 0.029480), (98, 0.033547), (99, 0.000345), (100, 0.005853), (101, 0.021029), (102, 0.028148), (103, -0.017657), (104, -0.012742), (105, -0.002840), (106, 0.015936), (107, -0.057214), (108, -0.027564), (109, -0.005980), (110, -0.049766), (111, -0.054199), (112, -0.015571), (113, -0.026799), (114, -0.036355), (115, -0.025322), (116, -0.010661), (117, -0.028551), (118, -0.037166), (119, -0.015049), (120, 0.000089), (121, -0.029958), (122, -0.025000), (123, -0.007644), (124, -0.000039), (125, -0.000160), ],
+    }),
+
+    "SPACESHIP_SHAKE_2D": ("Spaceship Shake (2D)", 24.0, {
+        ('rotation_euler', 0): [(1, -0.003631), (2, 0.000000), (3, 0.003630), (4, 0.005901), (5, 0.004899), (6, 0.001740), (7, -0.001893), (8, -0.006758), (9, -0.012088), (10, -0.014730), (11, -0.013647), (12, -0.009205), (13, -0.004117), (14, -0.001060), (15, -0.001243), (16, -0.003038), (17, -0.002273), (18, 0.001257), (19, 0.003089), (20, 0.001158), (21, -0.001834), (22, -0.002549), (23, -0.001662), (24, -0.000478), (25, 0.001098), (26, 0.003839), (27, 0.008085), (28, 0.011954), (29, 0.012609), (30, 0.010043), (31, 0.005102), (32, -0.000892), (33, -0.004079), (34, -0.002769), (35, 0.000036), (36, 0.000617), (37, -0.000448), (38, -0.003229), (39, -0.008389), (40, -0.011858), (41, -0.010768), (42, -0.006234), (43, -0.002742), (44, -0.001623), (45, -0.001303), (46, -0.000824), (47, -0.001118), (48, -0.001941), (49, -0.001953), (50, -0.000368), (51, 0.001583), (52, 0.001814), (53, 0.000569), (54, -0.002643), (55, -0.006712), (56, -0.007554), (57, -0.003706), (58, 0.001612), (59, 0.003226), (60, 0.001660), (61, -0.001151), (62, -0.005970), (63, -0.009069), (64, -0.006641), (65, -0.002389), (66, -0.000769), (67, -0.001858), (68, -0.007052), (69, -0.014319), (70, -0.016641), (71, -0.012120), (72, -0.004892), (73, 0.000739), (74, 0.002262), (75, 0.001358), (76, 0.000403), (77, 0.001168), (78, 0.003718), (79, 0.005334), (80, 0.004848), (81, 0.005137), (82, 0.006897), (83, 0.007285), (84, 0.006004), (85, 0.004565), (86, 0.003094), (87, 0.002246), (88, 0.001942), (89, 0.001859), (90, 0.001308), (91, -0.001419), (92, -0.004179), (93, -0.002092), (94, 0.002248), (95, 0.004355), (96, 0.003684), (97, 0.000305), (98, -0.003592), (99, -0.005021), (100, -0.002559), (101, 0.002739), (102, 0.006845), (103, 0.005618), (104, 0.000170), (105, -0.005742), (106, -0.007775), (107, -0.005307), (108, -0.002782), (109, -0.003979), (110, -0.006334), (111, -0.004686), (112, -0.001448), (113, -0.001378), (114, -0.003596), (115, -0.005809), (116, -0.005574), (117, -0.000943), (118, 0.005563), (119, 0.007807), (120, 0.005776), (121, 0.005226), (122, 0.006875), (123, 0.005829), (124, 0.000299), (125, -0.003887), (126, -0.004391), (127, -0.003327), (128, -0.002114), (129, -0.002206), (130, -0.005890), (131, -0.010795), (132, -0.011033), (133, -0.007454), (134, -0.004450), (135, -0.002610), (136, -0.002549), (137, -0.004611), (138, -0.006274), (139, -0.005172), (140, -0.002586), (141, -0.000846), (142, -0.001358), (143, -0.003354), (144, -0.003569), ],
+        ('rotation_euler', 1): [(1, 0.000344), (2, 0.000000), (3, -0.000355), (4, -0.004007), (5, -0.008947), (6, -0.012751), (7, -0.014634), (8, -0.014101), (9, -0.010429), (10, -0.004074), (11, 0.001754), (12, 0.003431), (13, 0.002210), (14, -0.000340), (15, -0.005010), (16, -0.011250), (17, -0.018633), (18, -0.024276), (19, -0.026024), (20, -0.024716), (21, -0.021369), (22, -0.017551), (23, -0.012196), (24, -0.005527), (25, 0.002148), (26, 0.008452), (27, 0.010870), (28, 0.010188), (29, 0.007542), (30, 0.002376), (31, -0.004389), (32, -0.010846), (33, -0.015339), (34, -0.016773), (35, -0.016102), (36, -0.013242), (37, -0.009126), (38, -0.006926), (39, -0.007523), (40, -0.008613), (41, -0.007771), (42, -0.004514), (43, -0.000413), (44, 0.002315), (45, 0.001541), (46, -0.002338), (47, -0.009755), (48, -0.018101), (49, -0.024504), (50, -0.028484), (51, -0.028156), (52, -0.023105), (53, -0.017900), (54, -0.017282), (55, -0.020013), (56, -0.023964), (57, -0.027865), (58, -0.030274), (59, -0.028398), (60, -0.023137), (61, -0.018565), (62, -0.016186), (63, -0.013079), (64, -0.009046), (65, -0.005069), (66, 0.000060), (67, 0.005245), (68, 0.007771), (69, 0.006907), (70, 0.003327), (71, -0.000642), (72, -0.003490), (73, -0.006051), (74, -0.010785), (75, -0.017289), (76, -0.022254), (77, -0.023226), (78, -0.020409), (79, -0.016038), (80, -0.010852), (81, -0.005655), (82, -0.002369), (83, 0.000113), (84, 0.002529), (85, 0.002759), (86, 0.000740), (87, -0.002415), (88, -0.004278), (89, -0.003723), (90, -0.000672), (91, 0.003888), (92, 0.007970), (93, 0.009256), (94, 0.006226), (95, 0.001193), (96, -0.003605), (97, -0.006414), (98, -0.007850), (99, -0.006982), (100, -0.003013), (101, 0.002482), (102, 0.006400), (103, 0.005969), (104, 0.001375), (105, -0.003439), (106, -0.007599), (107, -0.010674), (108, -0.009495), (109, -0.004550), (110, 0.000616), (111, 0.004907), (112, 0.007616), (113, 0.009257), (114, 0.010875), (115, 0.011833), (116, 0.014674), (117, 0.019964), (118, 0.024069), (119, 0.024337), (120, 0.022196), (121, 0.018387), (122, 0.014791), (123, 0.012672), (124, 0.011782), (125, 0.011792), (126, 0.011668), (127, 0.012356), (128, 0.014152), (129, 0.014890), (130, 0.013106), (131, 0.010917), (132, 0.008833), (133, 0.007221), (134, 0.007903), (135, 0.010210), (136, 0.011436), (137, 0.010453), (138, 0.006982), (139, 0.002150), (140, -0.001217), (141, -0.002648), (142, -0.002664), (143, -0.001537), (144, 0.000222), ],
+        ('rotation_euler', 2): [(1, -0.002932), (2, 0.000000), (3, 0.002931), (4, 0.002776), (5, -0.000217), (6, -0.004530), (7, -0.008458), (8, -0.010412), (9, -0.010400), (10, -0.008864), (11, -0.006141), (12, -0.003665), (13, -0.001947), (14, -0.000661), (15, -0.001036), (16, -0.003134), (17, -0.005130), (18, -0.006843), (19, -0.007829), (20, -0.007286), (21, -0.006093), (22, -0.004631), (23, -0.001721), (24, 0.003770), (25, 0.009708), (26, 0.014255), (27, 0.015541), (28, 0.014101), (29, 0.011614), (30, 0.008212), (31, 0.004453), (32, 0.001959), (33, 0.000287), (34, -0.000110), (35, -0.000004), (36, 0.000273), (37, 0.003272), (38, 0.005829), (39, 0.005368), (40, 0.003048), (41, 0.002849), (42, 0.004854), (43, 0.008314), (44, 0.012435), (45, 0.014423), (46, 0.013488), (47, 0.010202), (48, 0.005140), (49, 0.002285), (50, 0.000266), (51, -0.002690), (52, -0.005167), (53, -0.006633), (54, -0.007317), (55, -0.006934), (56, -0.006086), (57, -0.005236), (58, -0.007513), (59, -0.008395), (60, -0.004792), (61, -0.000082), (62, 0.001287), (63, 0.001420), (64, 0.002492), (65, 0.004303), (66, 0.006114), (67, 0.008395), (68, 0.007105), (69, 0.002187), (70, -0.003055), (71, -0.005318), (72, -0.004370), (73, -0.003805), (74, -0.005359), (75, -0.007746), (76, -0.011054), (77, -0.012922), (78, -0.012644), (79, -0.010829), (80, -0.008287), (81, -0.005934), (82, -0.005170), (83, -0.006637), (84, -0.008142), (85, -0.009015), (86, -0.010082), (87, -0.011393), (88, -0.013861), (89, -0.016544), (90, -0.019479), (91, -0.020982), (92, -0.019643), (93, -0.016359), (94, -0.015503), (95, -0.017054), (96, -0.018759), (97, -0.020333), (98, -0.022106), (99, -0.024395), (100, -0.022739), (101, -0.017177), (102, -0.010967), (103, -0.006991), (104, -0.006974), (105, -0.009811), (106, -0.012154), (107, -0.013738), (108, -0.013481), (109, -0.012434), (110, -0.010963), (111, -0.008352), (112, -0.006001), (113, -0.005139), (114, -0.005446), (115, -0.007317), (116, -0.006358), (117, -0.000794), (118, 0.006454), (119, 0.009726), (120, 0.008337), (121, 0.004604), (122, 0.001486), (123, -0.001392), (124, -0.004786), (125, -0.006640), (126, -0.005917), (127, -0.004895), (128, -0.003700), (129, -0.002689), (130, -0.003634), (131, -0.004963), (132, -0.005360), (133, -0.004215), (134, -0.001849), (135, 0.001963), (136, 0.004572), (137, 0.004251), (138, 0.002560), (139, 0.001127), (140, 0.000697), (141, 0.001023), (142, 0.000610), (143, -0.000913), (144, -0.003078), ],
+    }),
+
+    "THE_ZEEK_2D": ("The Zeek (2D)", 24.0, {
+        ('rotation_euler', 0): [(0, 0.000004), (1, 0.000000), (2, -0.000004), (3, 0.000099), (4, 0.000291), (5, 0.000413), (6, 0.000470), (7, 0.000531), (8, 0.000723), (9, 0.000864), (10, 0.000894), (11, 0.000839), (12, 0.000791), (13, 0.000733), (14, 0.000680), (15, 0.000425), (16, -0.000004), (17, -0.000395), (18, -0.000816), (19, -0.001044), (20, -0.001251), (21, -0.001502), (22, -0.001506), (23, -0.001467), (24, -0.001343), (25, -0.001227), (26, -0.001134), (27, -0.001205), (28, -0.001603), (29, -0.001973), (30, -0.002117), (31, -0.002050), (32, -0.001926), (33, -0.001917), (34, -0.002117), (35, -0.002314), (36, -0.002335), (37, -0.002347), (38, -0.002499), (39, -0.002721), (40, -0.002941), (41, -0.002918), (42, -0.002838), (43, -0.002788), (44, -0.002721), (45, -0.002763), (46, -0.002854), (47, -0.002778), (48, -0.002581), (49, -0.002255), (50, -0.002052), (51, -0.002040), (52, -0.002069), (53, -0.002005), (54, -0.001928), (55, -0.001764), (56, -0.001784), (57, -0.001788), (58, -0.001799), (59, -0.001686), (60, -0.001539), (61, -0.001320), (62, -0.001153), (63, -0.001002), (64, -0.000971), (65, -0.000863), (66, -0.000685), (67, -0.000657), (68, -0.000711), (69, -0.000953), (70, -0.001145), (71, -0.001297), (72, -0.001431), (73, -0.001735), (74, -0.002235), (75, -0.002674), (76, -0.002770), (77, -0.002650), (78, -0.002322), (79, -0.002233), (80, -0.002302), (81, -0.002309), (82, -0.002324), (83, -0.002178), (84, -0.001962), (85, -0.001984), (86, -0.002146), (87, -0.002310), (88, -0.002440), (89, -0.002547), (90, -0.002778), (91, -0.002977), (92, -0.003210), (93, -0.003400), (94, -0.003517), (95, -0.003629), (96, -0.003717), (97, -0.003770), (98, -0.003581), (99, -0.003221), (100, -0.002847), (101, -0.002693), (102, -0.002642), (103, -0.002457), (104, -0.002143), (105, -0.001910), (106, -0.001897), (107, -0.002101), (108, -0.002297), (109, -0.002357), (110, -0.002466), (111, -0.002384), (112, -0.002717), (113, -0.003000), (114, -0.002959), (115, -0.002730), (116, -0.002293), (117, -0.001869), (118, -0.001588), (119, -0.001408), (120, -0.001076), (121, -0.000791), (122, -0.000589), (123, -0.000612), (124, -0.000702), (125, -0.000664), (126, -0.000662), (127, -0.000565), (128, -0.000669), (129, -0.000930), (130, -0.001135), (131, -0.001367), (132, -0.001503), (133, -0.001604), (134, -0.001791), (135, -0.001830), (136, -0.001877), (137, -0.001926), (138, -0.002022), (139, -0.002122), (140, -0.002161), (141, -0.002102), (142, -0.001796), (143, -0.001660), (144, -0.001799), (145, -0.002048), (146, -0.001988), (147, -0.001699), (148, -0.001319), (149, -0.001057), (150, -0.001246), (151, -0.001382), (152, -0.001520), (153, -0.001570), (154, -0.001593), (155, -0.001661), (156, -0.001690), (157, -0.001754), (158, -0.001691), (159, -0.001777), (160, -0.001947), (161, -0.001954), (162, -0.001900), (163, -0.001641), (164, -0.001411), (165, -0.001493), (166, -0.001541), (167, -0.001541), (168, -0.001516), (169, -0.001441), (170, -0.001462), (171, -0.001507), (172, -0.001660), (173, -0.001724), (174, -0.001750), (175, -0.001755), (176, -0.001837), (177, -0.001822), (178, -0.001649), (179, -0.001251), (180, -0.000743), (181, -0.000395), (182, -0.000270), (183, 0.000063), (184, 0.000339), (185, 0.000348), (186, 0.000346), (187, 0.000170), (188, 0.000021), (189, -0.000109), (190, -0.000506), (191, -0.001048), (192, -0.001535), (193, -0.001729), (194, -0.001705), (195, -0.001469), (196, -0.001228), (197, -0.001314), (198, -0.001400), (199, -0.001372), (200, -0.001264), (201, -0.001164), (202, -0.001160), (203, -0.001305), (204, -0.001362), (205, -0.001438), (206, -0.001425), (207, -0.001676), (208, -0.002008), (209, -0.002261), (210, -0.002165), (211, -0.001944), (212, -0.001820), (213, -0.001825), (214, -0.001840), (215, -0.001740), (216, -0.001552), (217, -0.001546), (218, -0.001594), (219, -0.001925), (220, -0.002149), (221, -0.002203), (222, -0.002225), (223, -0.002248), (224, -0.002304), (225, -0.002243), (226, -0.002220), (227, -0.002085), (228, -0.001996), (229, -0.001947), (230, -0.001878), (231, -0.001674), (232, -0.001604), (233, -0.001683), (234, -0.001700), (235, -0.001649), (236, -0.001448), (237, -0.001252), (238, -0.001127), (239, -0.001138), (240, -0.001351), (241, -0.001394), (242, -0.001255), (243, -0.001011), (244, -0.000699), (245, -0.000724), (246, -0.000805), (247, -0.000889), (248, -0.001105), (249, -0.001341), (250, -0.001493), (251, -0.001666), (252, -0.001801), (253, -0.001963), (254, -0.002069), (255, -0.002140), (256, -0.002248), (257, -0.002342), (258, -0.002243), (259, -0.002023), (260, -0.001872), (261, -0.001739), (262, -0.001828), (263, -0.001958), (264, -0.002073), (265, -0.002190), (266, -0.002273), (267, -0.002491), (268, -0.002583), (269, -0.002648), (270, -0.002808), (271, -0.002950), (272, -0.003123), (273, -0.003242), (274, -0.003250), (275, -0.003051), (276, -0.002663), (277, -0.002299), (278, -0.002160), (279, -0.002217), (280, -0.002288), (281, -0.002268), (282, -0.002216), (283, -0.002163), (284, -0.002108), (285, -0.002076), (286, -0.002044), (287, -0.002034), (288, -0.002047), (289, -0.002211), (290, -0.002238), (291, -0.001988), (292, -0.001462), (293, -0.000853), (294, -0.000391), (295, -0.000330), (296, -0.000344), (297, -0.000390), (298, -0.000389), (299, -0.000329), (300, -0.000349), (301, -0.000643), (302, -0.000923), (303, -0.001240), (304, -0.001477), (305, -0.001806), (306, -0.002114), (307, -0.002089), (308, -0.001777), (309, -0.001411), (310, -0.001159), (311, -0.001196), (312, -0.001239), (313, -0.001112), (314, -0.000888), (315, -0.000872), (316, -0.000992), (317, -0.001174), (318, -0.001493), (319, -0.001494), (320, -0.001538), (321, -0.001633), (322, -0.001666), (323, -0.001696), (324, -0.001553), (325, -0.001246), (326, -0.001056), (327, -0.001081), (328, -0.001143), (329, -0.001158), (330, -0.001146), (331, -0.001083), (332, -0.001104), (333, -0.001158), (334, -0.001213), (335, -0.001443), (336, -0.001508), (337, -0.001508), (338, -0.001381), (339, -0.001288), (340, -0.001146), (341, -0.001006), (342, -0.000787), (343, -0.000531), (344, -0.000420), (345, -0.000403), (346, -0.000375), (347, -0.000354), (348, -0.000126), (349, -0.000027), (350, 0.000011), (351, 0.000160), (352, 0.000272), (353, 0.000372), (354, 0.000323), (355, 0.000280), (356, 0.000321), (357, 0.000540), (358, 0.000883), (359, 0.001123), (360, 0.001057), (361, 0.000704), (362, 0.000477), (363, 0.000392), (364, 0.000333), (365, 0.000121), (366, -0.000215), (367, -0.000347), (368, -0.000152), (369, 0.000059), (370, 0.000242), (371, 0.000012), (372, -0.000275), (373, -0.000338), (374, -0.000226), (375, -0.000094), (376, 0.000054), (377, -0.000081), (378, -0.000228), (379, -0.000375), (380, -0.000535), (381, -0.000813), (382, -0.001082), (383, -0.001348), (384, -0.001508), (385, -0.001565), (386, -0.001638), (387, -0.001715), (388, -0.001887), (389, -0.001723), (390, -0.001389), (391, -0.000870), (392, -0.000550), (393, -0.000292), (394, -0.000287), (395, -0.000209), (396, -0.000074), (397, 0.000005), (398, 0.000115), (399, 0.000037), (400, -0.000007), ],
+        ('rotation_euler', 1): [(0, -0.000009), (1, 0.000000), (2, 0.000009), (3, 0.000115), (4, 0.000329), (5, 0.000586), (6, 0.000568), (7, 0.000488), (8, 0.000467), (9, 0.000446), (10, 0.000452), (11, 0.000325), (12, 0.000119), (13, -0.000032), (14, -0.000243), (15, -0.000304), (16, -0.000200), (17, -0.000222), (18, -0.000235), (19, -0.000277), (20, -0.000448), (21, -0.000535), (22, -0.000552), (23, -0.000513), (24, -0.000247), (25, 0.000057), (26, 0.000309), (27, 0.000689), (28, 0.000946), (29, 0.000986), (30, 0.001000), (31, 0.001180), (32, 0.001263), (33, 0.001198), (34, 0.000973), (35, 0.000668), (36, 0.000541), (37, 0.000519), (38, 0.000367), (39, 0.000245), (40, 0.000124), (41, 0.000052), (42, 0.000167), (43, 0.000263), (44, 0.000383), (45, 0.000486), (46, 0.000459), (47, 0.000384), (48, 0.000323), (49, 0.000300), (50, 0.000243), (51, 0.000085), (52, -0.000126), (53, -0.000266), (54, -0.000511), (55, -0.000678), (56, -0.000830), (57, -0.000914), (58, -0.000990), (59, -0.001009), (60, -0.001192), (61, -0.001314), (62, -0.001369), (63, -0.001316), (64, -0.001311), (65, -0.001154), (66, -0.000995), (67, -0.000904), (68, -0.000901), (69, -0.001118), (70, -0.001391), (71, -0.001542), (72, -0.001674), (73, -0.001730), (74, -0.001627), (75, -0.001472), (76, -0.001163), (77, -0.000906), (78, -0.000600), (79, -0.000270), (80, -0.000096), (81, 0.000004), (82, 0.000105), (83, 0.000343), (84, 0.000614), (85, 0.000951), (86, 0.000998), (87, 0.000979), (88, 0.000888), (89, 0.000679), (90, 0.000347), (91, 0.000060), (92, -0.000264), (93, -0.000548), (94, -0.000721), (95, -0.000835), (96, -0.000856), (97, -0.000870), (98, -0.000599), (99, -0.000240), (100, 0.000124), (101, 0.000661), (102, 0.001083), (103, 0.001271), (104, 0.001442), (105, 0.001458), (106, 0.001122), (107, 0.000715), (108, 0.000176), (109, -0.000348), (110, -0.000831), (111, -0.001132), (112, -0.001350), (113, -0.001652), (114, -0.001870), (115, -0.001919), (116, -0.001851), (117, -0.001760), (118, -0.001656), (119, -0.001434), (120, -0.001210), (121, -0.000918), (122, -0.000694), (123, -0.000680), (124, -0.000682), (125, -0.000869), (126, -0.001214), (127, -0.001425), (128, -0.001807), (129, -0.002291), (130, -0.002662), (131, -0.002877), (132, -0.002999), (133, -0.003020), (134, -0.002769), (135, -0.002483), (136, -0.002200), (137, -0.001909), (138, -0.001838), (139, -0.001782), (140, -0.001670), (141, -0.001545), (142, -0.001213), (143, -0.000839), (144, -0.000501), (145, -0.000482), (146, -0.000262), (147, -0.000045), (148, 0.000229), (149, 0.000423), (150, 0.000498), (151, 0.000511), (152, 0.000375), (153, 0.000323), (154, 0.000294), (155, 0.000297), (156, 0.000470), (157, 0.000528), (158, 0.000580), (159, 0.000542), (160, 0.000474), (161, 0.000471), (162, 0.000501), (163, 0.000572), (164, 0.000810), (165, 0.000974), (166, 0.001009), (167, 0.001010), (168, 0.000953), (169, 0.000729), (170, 0.000572), (171, 0.000410), (172, 0.000063), (173, -0.000248), (174, -0.000376), (175, -0.000454), (176, -0.000616), (177, -0.000652), (178, -0.000608), (179, -0.000327), (180, 0.000085), (181, 0.000401), (182, 0.000701), (183, 0.000861), (184, 0.001056), (185, 0.001021), (186, 0.000921), (187, 0.000575), (188, 0.000147), (189, -0.000281), (190, -0.000655), (191, -0.000853), (192, -0.000893), (193, -0.000897), (194, -0.000698), (195, -0.000440), (196, -0.000090), (197, 0.000442), (198, 0.000788), (199, 0.001159), (200, 0.001381), (201, 0.001601), (202, 0.001732), (203, 0.001724), (204, 0.001647), (205, 0.001328), (206, 0.001083), (207, 0.000744), (208, 0.000590), (209, 0.000599), (210, 0.000792), (211, 0.001010), (212, 0.001243), (213, 0.001512), (214, 0.001668), (215, 0.002001), (216, 0.002234), (217, 0.002160), (218, 0.002089), (219, 0.001761), (220, 0.001310), (221, 0.001011), (222, 0.000912), (223, 0.000848), (224, 0.000741), (225, 0.000855), (226, 0.000873), (227, 0.000919), (228, 0.000934), (229, 0.000954), (230, 0.000947), (231, 0.000949), (232, 0.000942), (233, 0.000601), (234, 0.000241), (235, -0.000088), (236, -0.000200), (237, -0.000283), (238, -0.000385), (239, -0.000398), (240, -0.000537), (241, -0.000779), (242, -0.000904), (243, -0.001000), (244, -0.001114), (245, -0.001038), (246, -0.001024), (247, -0.001011), (248, -0.000981), (249, -0.000933), (250, -0.000909), (251, -0.000894), (252, -0.000834), (253, -0.000704), (254, -0.000620), (255, -0.000476), (256, -0.000303), (257, -0.000165), (258, -0.000001), (259, 0.000182), (260, 0.000505), (261, 0.000818), (262, 0.001141), (263, 0.001239), (264, 0.001361), (265, 0.001369), (266, 0.001291), (267, 0.001022), (268, 0.000960), (269, 0.000970), (270, 0.000952), (271, 0.001001), (272, 0.001058), (273, 0.001088), (274, 0.001074), (275, 0.001108), (276, 0.001138), (277, 0.001242), (278, 0.001529), (279, 0.001649), (280, 0.001690), (281, 0.001700), (282, 0.001407), (283, 0.001154), (284, 0.000819), (285, 0.000474), (286, 0.000249), (287, 0.000256), (288, 0.000281), (289, 0.000331), (290, 0.000361), (291, 0.000385), (292, 0.000311), (293, 0.000362), (294, 0.000377), (295, 0.000381), (296, 0.000391), (297, 0.000377), (298, 0.000337), (299, 0.000102), (300, -0.000304), (301, -0.000795), (302, -0.001133), (303, -0.001519), (304, -0.001660), (305, -0.001780), (306, -0.001625), (307, -0.001175), (308, -0.000584), (309, -0.000086), (310, 0.000351), (311, 0.000867), (312, 0.001192), (313, 0.001392), (314, 0.001466), (315, 0.001504), (316, 0.001467), (317, 0.001350), (318, 0.001249), (319, 0.001272), (320, 0.001366), (321, 0.001550), (322, 0.001597), (323, 0.001678), (324, 0.001838), (325, 0.002167), (326, 0.002530), (327, 0.002941), (328, 0.003048), (329, 0.003080), (330, 0.003076), (331, 0.003057), (332, 0.002919), (333, 0.002826), (334, 0.002804), (335, 0.002900), (336, 0.003066), (337, 0.003092), (338, 0.002985), (339, 0.002863), (340, 0.002686), (341, 0.002741), (342, 0.002746), (343, 0.002775), (344, 0.002849), (345, 0.002963), (346, 0.003063), (347, 0.003082), (348, 0.002959), (349, 0.002740), (350, 0.002620), (351, 0.002547), (352, 0.002400), (353, 0.002314), (354, 0.002247), (355, 0.002150), (356, 0.002073), (357, 0.002055), (358, 0.002022), (359, 0.002034), (360, 0.002111), (361, 0.002334), (362, 0.002383), (363, 0.002287), (364, 0.002199), (365, 0.002011), (366, 0.001871), (367, 0.001654), (368, 0.001365), (369, 0.001057), (370, 0.000896), (371, 0.000699), (372, 0.000709), (373, 0.000709), (374, 0.000850), (375, 0.001097), (376, 0.001358), (377, 0.001546), (378, 0.001676), (379, 0.001724), (380, 0.001550), (381, 0.001428), (382, 0.001158), (383, 0.000820), (384, 0.000459), (385, 0.000330), (386, 0.000242), (387, 0.000271), (388, 0.000373), (389, 0.000507), (390, 0.000810), (391, 0.001068), (392, 0.001208), (393, 0.001444), (394, 0.001451), (395, 0.001423), (396, 0.001267), (397, 0.001067), (398, 0.000801), (399, 0.000390), (400, 0.000009), ],
+        ('rotation_euler', 2): [(0, -0.000067), (1, 0.000000), (2, 0.000067), (3, 0.000100), (4, -0.000249), (5, -0.000610), (6, -0.000531), (7, -0.000489), (8, -0.000418), (9, -0.000438), (10, -0.000583), (11, -0.000716), (12, -0.000803), (13, -0.000859), (14, -0.000947), (15, -0.001004), (16, -0.001139), (17, -0.000896), (18, -0.000478), (19, -0.000154), (20, 0.000109), (21, -0.000143), (22, -0.000132), (23, -0.000178), (24, 0.000061), (25, 0.000395), (26, 0.000836), (27, 0.001183), (28, 0.001370), (29, 0.001313), (30, 0.001437), (31, 0.001537), (32, 0.001452), (33, 0.001388), (34, 0.001381), (35, 0.001477), (36, 0.001335), (37, 0.001331), (38, 0.001490), (39, 0.001560), (40, 0.001674), (41, 0.001570), (42, 0.001402), (43, 0.001591), (44, 0.001643), (45, 0.001605), (46, 0.001916), (47, 0.001651), (48, 0.001702), (49, 0.001129), (50, 0.000664), (51, 0.000551), (52, 0.000218), (53, 0.000061), (54, -0.000132), (55, -0.000144), (56, -0.000094), (57, -0.000207), (58, -0.000333), (59, -0.000850), (60, -0.000929), (61, -0.000877), (62, -0.001134), (63, -0.001574), (64, -0.001505), (65, -0.001589), (66, -0.001805), (67, -0.001884), (68, -0.002250), (69, -0.002346), (70, -0.002093), (71, -0.001607), (72, -0.001267), (73, -0.001593), (74, -0.001301), (75, -0.001030), (76, -0.000960), (77, -0.000540), (78, -0.000437), (79, -0.000362), (80, -0.000424), (81, -0.000297), (82, -0.000129), (83, 0.000129), (84, 0.000545), (85, 0.000635), (86, 0.000713), (87, 0.000748), (88, 0.000535), (89, 0.000374), (90, 0.000488), (91, -0.000348), (92, -0.000468), (93, -0.000343), (94, -0.000477), (95, -0.000238), (96, -0.000141), (97, 0.000014), (98, 0.000142), (99, 0.000234), (100, 0.000227), (101, 0.000364), (102, 0.000672), (103, 0.000997), (104, 0.001261), (105, 0.001033), (106, 0.000877), (107, 0.000190), (108, -0.000434), (109, -0.001220), (110, -0.001524), (111, -0.002208), (112, -0.002419), (113, -0.002122), (114, -0.002397), (115, -0.002574), (116, -0.002926), (117, -0.003194), (118, -0.003222), (119, -0.002849), (120, -0.002614), (121, -0.002277), (122, -0.002304), (123, -0.002178), (124, -0.002613), (125, -0.002858), (126, -0.002870), (127, -0.003295), (128, -0.003663), (129, -0.003814), (130, -0.004117), (131, -0.004087), (132, -0.004248), (133, -0.003896), (134, -0.003775), (135, -0.003424), (136, -0.003054), (137, -0.002641), (138, -0.002398), (139, -0.002196), (140, -0.002040), (141, -0.001829), (142, -0.001778), (143, -0.001585), (144, -0.001810), (145, -0.001505), (146, -0.001432), (147, -0.000991), (148, -0.000696), (149, -0.000672), (150, -0.000289), (151, -0.000500), (152, -0.000906), (153, -0.001209), (154, -0.001338), (155, -0.001156), (156, -0.001064), (157, -0.000903), (158, -0.001301), (159, -0.001361), (160, -0.001568), (161, -0.001533), (162, -0.001572), (163, -0.001344), (164, -0.001105), (165, -0.001011), (166, -0.001084), (167, -0.001092), (168, -0.000995), (169, -0.000941), (170, -0.000997), (171, -0.001864), (172, -0.002302), (173, -0.002567), (174, -0.002725), (175, -0.002929), (176, -0.002854), (177, -0.002808), (178, -0.002602), (179, -0.002690), (180, -0.003071), (181, -0.002927), (182, -0.002499), (183, -0.002315), (184, -0.002143), (185, -0.002001), (186, -0.001933), (187, -0.001722), (188, -0.002114), (189, -0.002519), (190, -0.002444), (191, -0.002524), (192, -0.002599), (193, -0.002537), (194, -0.002391), (195, -0.002190), (196, -0.002083), (197, -0.001768), (198, -0.001535), (199, -0.001408), (200, -0.001089), (201, -0.000831), (202, -0.000784), (203, -0.000666), (204, -0.000763), (205, -0.000734), (206, -0.001030), (207, -0.001291), (208, -0.001427), (209, -0.001075), (210, -0.001239), (211, -0.001137), (212, -0.000865), (213, -0.000901), (214, -0.000802), (215, -0.000637), (216, -0.000207), (217, -0.000155), (218, -0.000206), (219, -0.000321), (220, -0.000604), (221, -0.000851), (222, -0.001020), (223, -0.001065), (224, -0.000869), (225, -0.001066), (226, -0.001041), (227, -0.001261), (228, -0.001161), (229, -0.001150), (230, -0.001084), (231, -0.001157), (232, -0.001404), (233, -0.001333), (234, -0.001836), (235, -0.002134), (236, -0.002237), (237, -0.002161), (238, -0.001964), (239, -0.001981), (240, -0.002100), (241, -0.002221), (242, -0.002363), (243, -0.002410), (244, -0.002400), (245, -0.002381), (246, -0.002526), (247, -0.002669), (248, -0.002433), (249, -0.002101), (250, -0.002121), (251, -0.002062), (252, -0.002023), (253, -0.001745), (254, -0.001472), (255, -0.001447), (256, -0.001205), (257, -0.001174), (258, -0.000912), (259, -0.000756), (260, -0.000346), (261, -0.000357), (262, -0.000035), (263, 0.000205), (264, 0.000332), (265, 0.000517), (266, 0.000551), (267, 0.000740), (268, 0.000282), (269, 0.000171), (270, 0.000541), (271, 0.000838), (272, 0.001029), (273, 0.000829), (274, 0.000906), (275, 0.000661), (276, 0.000673), (277, 0.000833), (278, 0.000860), (279, 0.001199), (280, 0.001549), (281, 0.001458), (282, 0.001119), (283, 0.000935), (284, 0.000446), (285, 0.000441), (286, 0.000459), (287, 0.000470), (288, 0.000451), (289, 0.000180), (290, 0.000084), (291, -0.000055), (292, -0.000326), (293, -0.000538), (294, -0.000438), (295, -0.000420), (296, -0.000462), (297, -0.000331), (298, -0.000451), (299, -0.000899), (300, -0.000998), (301, -0.001101), (302, -0.001251), (303, -0.001089), (304, -0.001158), (305, -0.000947), (306, -0.000612), (307, -0.000723), (308, -0.000606), (309, -0.000504), (310, 0.000195), (311, 0.000861), (312, 0.001119), (313, 0.001434), (314, 0.001493), (315, 0.001431), (316, 0.001960), (317, 0.001817), (318, 0.001735), (319, 0.001781), (320, 0.001887), (321, 0.002319), (322, 0.002392), (323, 0.002647), (324, 0.002771), (325, 0.002626), (326, 0.002707), (327, 0.003050), (328, 0.003435), (329, 0.003630), (330, 0.003742), (331, 0.003629), (332, 0.003582), (333, 0.003613), (334, 0.003545), (335, 0.003655), (336, 0.003489), (337, 0.003532), (338, 0.003319), (339, 0.003294), (340, 0.002998), (341, 0.003082), (342, 0.002902), (343, 0.002496), (344, 0.002442), (345, 0.002785), (346, 0.003025), (347, 0.003132), (348, 0.002904), (349, 0.002392), (350, 0.002251), (351, 0.002018), (352, 0.002003), (353, 0.002067), (354, 0.002020), (355, 0.001453), (356, 0.001233), (357, 0.000880), (358, 0.000810), (359, 0.000933), (360, 0.001197), (361, 0.001417), (362, 0.001518), (363, 0.001615), (364, 0.001598), (365, 0.001798), (366, 0.001965), (367, 0.001852), (368, 0.001581), (369, 0.001843), (370, 0.001593), (371, 0.001885), (372, 0.001700), (373, 0.002005), (374, 0.002120), (375, 0.002409), (376, 0.002123), (377, 0.002437), (378, 0.002607), (379, 0.002711), (380, 0.002699), (381, 0.002694), (382, 0.002391), (383, 0.002143), (384, 0.001922), (385, 0.001743), (386, 0.001690), (387, 0.001552), (388, 0.001805), (389, 0.001643), (390, 0.001682), (391, 0.001749), (392, 0.001968), (393, 0.001591), (394, 0.001613), (395, 0.001563), (396, 0.001300), (397, 0.001286), (398, 0.000823), (399, 0.000694), (400, 0.000015), ],
+    }),
+}
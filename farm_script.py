@@ -10,9 +10,9 @@ FARM_SCRIPT_CONTENTS = """\
 import bpy
 
 class CameraShakeInstance(bpy.types.PropertyGroup):
-    # Don't include the shake type in this stand-in version of the class, as it's not necessary
-    # for the shakes to animate (only for managing the shakes), and it would require including
-    # a bunch more cruft in this script.
+    # Don't include the shake type (or its source, seed, and auto-normalize setting) in this
+    # stand-in version of the class, as it's not necessary for the shakes to animate (only for
+    # managing the shakes), and it would require including a bunch more cruft in this script.
     #
     # shake_type: bpy.props.EnumProperty(
     #     name = "Shake Type",
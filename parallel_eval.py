@@ -0,0 +1,172 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Multi-process evaluation of camera shakes, for baking many cameras over long
+# frame ranges.
+#
+# Everything that needs Blender (sampling the cameras' shake parameters, and
+# writing the results) happens in the main process.  What's handed to the
+# worker processes is a plain snapshot: per camera, the sampled parameters of
+# each of its shakes (as from `bake.camera_shake_parameters()`), and once per
+# worker, the data of the shakes they play (see `bake.shake_source()`).  Each
+# camera's frames are split into chunks, the chunks of all cameras are
+# evaluated across the pool, and the results are merged back per camera.
+#
+# Note: this module intentionally doesn't depend on bpy.  Worker processes are
+# plain Python processes that can't import the addon package itself (its
+# `__init__.py` needs bpy), so they first stand in empty packages for it (see
+# `_WORKER_BOOTSTRAP`), and then import this module and the ones it uses under
+# their usual package-qualified names.
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from . import shake_eval
+from . import spectral
+
+# How many frames of a camera each task evaluates.
+CHUNK_SIZE = 2048
+
+# Below this many samples (cameras times frames) in total, starting worker
+# processes costs more than it saves, so everything is evaluated in-process.
+PARALLEL_MIN_SAMPLES = 100000
+
+
+#========================================================
+# Worker side.
+
+_sources = {}
+_prepared = {}
+
+
+def _init_worker(sources):
+    _sources.clear()
+    _sources.update(sources)
+    _prepared.clear()
+
+
+# Run by each worker process (with `exec()`, since nothing of the addon can
+# be imported yet) before anything else.  Stands in empty packages for the
+# addon's package and its parents, without running their `__init__.py`, and
+# then initializes the worker.  Expects `package`, `package_path`, and
+# `sources` as globals.
+_WORKER_BOOTSTRAP = """
+import importlib
+import sys
+import types
+
+names = package.split(".")
+for i in range(len(names)):
+    name = ".".join(names[:i + 1])
+    if name not in sys.modules:
+        sys.modules[name] = types.ModuleType(name)
+        sys.modules[name].__path__ = []
+sys.modules[package].__path__ = [package_path]
+importlib.import_module(package + ".parallel_eval")._init_worker(sources)
+"""
+
+
+def _prepared_shake(key):
+    if key not in _prepared:
+        source = _sources[key]
+        if source[0] == 'PROCEDURAL':
+            spectrum = spectral.Spectrum.from_dict(key[0], source[1])
+            _prepared[key] = spectral.ProceduralShake(spectrum, source[2])
+        else:
+            _prepared[key] = shake_eval.prepare_shake(source[1])
+    return _prepared[key]
+
+
+def _evaluate_task(task):
+    camera_index, start, frames, shakes, scene_fps, unit_scale = task
+    results = [
+        shake_eval.evaluate_shake(_prepared_shake(key), frames, scene_fps=scene_fps, unit_scale=unit_scale, **params)
+        for key, params in shakes
+    ]
+    loc, quat = shake_eval.combine_shakes(results, count=len(frames))
+    return (camera_index, start, loc, quat)
+
+
+#========================================================
+# Main process side.
+
+
+def _slice_params(params, start, stop):
+    return {
+        name: value[start:stop] if isinstance(value, np.ndarray) and value.ndim > 0 else value
+        for name, value in params.items()
+    }
+
+
+def _tasks(cameras, frames, chunk_size):
+    for camera_index, (shakes, scene_fps, unit_scale) in enumerate(cameras):
+        for start in range(0, len(frames), chunk_size):
+            stop = min(start + chunk_size, len(frames))
+            chunk_shakes = [(key, _slice_params(params, start, stop)) for key, params in shakes]
+            yield (camera_index, start, frames[start:stop], chunk_shakes, scene_fps, unit_scale)
+
+
+# Evaluates the combined shake offsets of many cameras at the given frames.
+#
+# `cameras` is a list of (shakes, scene fps, unit scale) per camera, where
+# `shakes` is as returned by `bake.camera_shake_parameters()` for `frames`, and
+# `sources` maps every shake key used to the data needed to prepare it.
+# `jobs` is the number of worker processes, or None for one per CPU.
+#
+# Returns a list of (location, rotation) per camera, as in
+# `shake_eval.combine_shakes()`.
+def evaluate_cameras(cameras, frames, sources, jobs=None, chunk_size=CHUNK_SIZE):
+    frames = np.asarray(frames, dtype=np.float64)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    results = [(np.zeros((len(frames), 3)), np.zeros((len(frames), 4))) for _ in cameras]
+
+    def merge(result):
+        camera_index, start, loc, quat = result
+        results[camera_index][0][start:start + len(loc)] = loc
+        results[camera_index][1][start:start + len(quat)] = quat
+
+    task_count = sum(-(-len(frames) // chunk_size) for _ in cameras)
+    if jobs > 1 and task_count > 1 and len(cameras) * len(frames) >= PARALLEL_MIN_SAMPLES:
+        try:
+            # Always spawn fresh processes: forking a process with Blender in
+            # it isn't safe.
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, task_count),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=exec,
+                initargs=(_WORKER_BOOTSTRAP, {
+                    "package": __package__,
+                    "package_path": os.path.dirname(os.path.abspath(__file__)),
+                    "sources": sources,
+                }),
+            ) as pool:
+                for result in pool.map(_evaluate_task, _tasks(cameras, frames, chunk_size)):
+                    merge(result)
+            return results
+        except (OSError, BrokenProcessPool) as e:
+            print("Camera Shakify: couldn't evaluate shakes in parallel ({}), evaluating them in this process instead.".format(e))
+
+    _init_worker(sources)
+    for task in _tasks(cameras, frames, chunk_size):
+        merge(_evaluate_task(task))
+    return results
@@ -0,0 +1,220 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Opt-in profiling of the shake rig building pipeline.
+#
+# When enabled, the functions registered with `set_targets()` are replaced in
+# their module namespace by timing wrappers, and when disabled the original
+# functions are put back.  So there's no cost at all when profiling is off.
+#
+# Each call of a "root" function (e.g. `rebuild_camera_shakes()`) that isn't
+# nested in another root call counts as one rebuild.  For each rebuild the
+# wall time and call count of every profiled function (phase) is recorded, and
+# the same numbers are also aggregated across the whole session.  Phase times
+# are inclusive of any profiled functions they call.
+#
+# Profiling can be enabled from the addon preferences, or by setting the
+# CAMERA_SHAKIFY_PROFILE environment variable to a non-empty value before
+# starting Blender.  Rebuild records can also be appended to a log file, one
+# JSON object per line.
+#
+# Note: this module intentionally doesn't depend on bpy.
+
+import functools
+import json
+import os
+import time
+from collections import deque
+
+ENV_VAR = "CAMERA_SHAKIFY_PROFILE"
+LOG_ENV_VAR = "CAMERA_SHAKIFY_PROFILE_LOG"
+
+# How many of the most recent rebuild records to keep.
+MAX_REBUILD_RECORDS = 100
+
+
+class PhaseStats:
+    __slots__ = ("calls", "seconds", "max_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+    def add(self, seconds):
+        self.calls += 1
+        self.seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def to_dict(self):
+        return {"calls": self.calls, "seconds": self.seconds, "max_seconds": self.max_seconds}
+
+
+_namespace = None
+_phase_names = []
+_root_names = []
+_originals = {}
+
+_log_path = None
+_session = {} # Phase name -> PhaseStats.
+_rebuilds = deque(maxlen=MAX_REBUILD_RECORDS)
+
+# State of the rebuild currently in progress, if any.
+_root_depth = 0
+_current = None
+
+
+def env_enabled():
+    return bool(os.environ.get(ENV_VAR))
+
+
+def env_log_path():
+    return os.environ.get(LOG_ENV_VAR) or None
+
+
+# Sets the functions that are profiled: `phase_names` and `root_names` are
+# names of functions in the `namespace` dict (normally a module's `globals()`).
+def set_targets(namespace, phase_names, root_names):
+    disable()
+    global _namespace, _phase_names, _root_names
+    _namespace = namespace
+    _phase_names = list(phase_names)
+    _root_names = list(root_names)
+
+
+def is_enabled():
+    return len(_originals) > 0
+
+
+# Enables profiling, optionally appending a record of each rebuild to the log
+# file at `log_path`.
+def enable(log_path=None):
+    global _log_path
+    _log_path = log_path
+    if is_enabled() or _namespace is None:
+        return
+    for name in _phase_names + _root_names:
+        function = _namespace[name]
+        _originals[name] = function
+        _namespace[name] = _wrap(name, function, name in _root_names)
+
+
+def disable():
+    global _log_path, _root_depth, _current
+    for name, function in _originals.items():
+        _namespace[name] = function
+    _originals.clear()
+    _log_path = None
+    _root_depth = 0
+    _current = None
+
+
+# Clears all recorded statistics.
+def reset():
+    _session.clear()
+    _rebuilds.clear()
+
+
+# Returns the statistics aggregated across the session, as a dict of
+# phase name -> {"calls", "seconds", "max_seconds"}.
+def session_stats():
+    return {name: stats.to_dict() for name, stats in _session.items()}
+
+
+# Returns the records of the most recent rebuilds, oldest first.  Each is a
+# dict with the root function name ("root"), a description of what was rebuilt
+# ("target"), its total wall time ("seconds"), and per-phase statistics
+# ("phases") in the same form as `session_stats()`.
+def rebuild_records():
+    return list(_rebuilds)
+
+
+# Returns a human-readable report of the session statistics.
+def format_report():
+    lines = []
+    lines += ["Camera Shakify profile: {} rebuilds recorded".format(
+        sum(stats.calls for name, stats in _session.items() if name in _root_names)
+    )]
+    lines += [""]
+    lines += ["{:<36} {:>8} {:>12} {:>12} {:>12}".format("phase", "calls", "total (s)", "mean (ms)", "max (ms)")]
+    for name, stats in sorted(_session.items(), key=lambda item: -item[1].seconds):
+        lines += ["{:<36} {:>8} {:>12.4f} {:>12.3f} {:>12.3f}".format(
+            name,
+            stats.calls,
+            stats.seconds,
+            stats.seconds / stats.calls * 1000.0,
+            stats.max_seconds * 1000.0,
+        )]
+    if len(_rebuilds) > 0:
+        last = _rebuilds[-1]
+        lines += [""]
+        target = " ({})".format(last["target"]) if last["target"] != "" else ""
+        lines += ["Last rebuild: {}{} took {:.4f}s".format(last["root"], target, last["seconds"])]
+    return "\n".join(lines)
+
+
+def _describe_target(args):
+    if len(args) > 0 and hasattr(args[0], "name"):
+        return args[0].name
+    return ""
+
+
+def _wrap(name, function, is_root):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        global _root_depth, _current
+        if is_root:
+            if _root_depth == 0:
+                _current = {}
+            _root_depth += 1
+
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            _session.setdefault(name, PhaseStats()).add(seconds)
+            if _current is not None:
+                _current.setdefault(name, PhaseStats()).add(seconds)
+            if is_root:
+                _root_depth -= 1
+                if _root_depth == 0:
+                    _finish_rebuild(name, _describe_target(args), seconds)
+
+    return wrapper
+
+
+def _finish_rebuild(root, target, seconds):
+    global _current
+    record = {
+        "root": root,
+        "target": target,
+        "time": time.time(),
+        "seconds": seconds,
+        "phases": {name: stats.to_dict() for name, stats in _current.items()},
+    }
+    _current = None
+    _rebuilds.append(record)
+
+    if _log_path is not None:
+        try:
+            with open(_log_path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print("Camera Shakify: couldn't write profiling log '{}': {}".format(_log_path, e))
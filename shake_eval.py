@@ -0,0 +1,466 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Standalone, vectorized evaluation of camera shakes.
+#
+# This computes the same location/rotation offsets that the driver -> Action
+# constraint -> Copy Location/Rotation setup built by `build_single_shake()`
+# produces, but for whole arrays of (sub-)frames at once and without needing
+# Blender's depsgraph.  It reproduces:
+#
+# - Blender's AUTO handle calculation for F-curves (with the CYCLES modifier
+#   making the curves cyclic) and its Bezier segment evaluation.
+# - The eval-time driver, including its wrap to [0, 1) and the single-precision
+#   storage of the constraint's eval time.
+# - The influence drivers and constraint influence clamping of the Copy
+#   Location/Rotation constraints, and how stacked shakes combine.
+#
+# Note: this module intentionally doesn't depend on bpy, so that it can be used
+# outside of Blender and in worker processes.
+
+import math
+
+import numpy as np
+
+# These must match the constants of the same names in `__init__.py`, which
+# can't be imported here because it depends on bpy.
+INFLUENCE_MAX = 4.0
+SCALE_MAX = 100.0
+UNIT_SCALE_MAX = 1000.0
+
+# Magic constant Blender uses for the length of auto handles.
+AUTO_HANDLE_FACTOR = 2.5614
+
+LOCATION_CHANNELS = [("location", 0), ("location", 1), ("location", 2)]
+ROTATION_CHANNELS = [("rotation_euler", 0), ("rotation_euler", 1), ("rotation_euler", 2)]
+
+_FLT_EPSILON = np.finfo(np.float32).eps
+
+
+#========================================================
+# F-curve evaluation.
+
+
+# A Bezier F-curve with AUTO handles on every key, evaluated the same way
+# Blender evaluates it.
+#
+# `cyclic` corresponds to the curve having an unrestricted CYCLES modifier (as
+# all shake curves do), which affects both handle calculation and
+# extrapolation.  Non-cyclic curves use constant extrapolation.
+class BezierCurve:
+    def __init__(self, frames, values, cyclic=True):
+        # Blender stores keyframes in single precision.
+        self.x = np.asarray(frames, dtype=np.float32).astype(np.float64)
+        self.y = np.asarray(values, dtype=np.float32).astype(np.float64)
+        self.cyclic = cyclic and len(self.x) >= 2
+        if len(self.x) == 0:
+            raise ValueError("A curve needs at least one keyframe")
+        self._calc_handles()
+
+    # Equivalent of Blender's `BKE_fcurve_handles_recalc()` for AUTO handles
+    # with auto smoothing set to 'NONE'.
+    def _calc_handles(self):
+        x = self.x
+        y = self.y
+        n = len(x)
+
+        self.left = np.stack([x, y], axis=-1)
+        self.right = np.stack([x, y], axis=-1)
+        if n < 2:
+            return
+
+        p2 = np.stack([x, y], axis=-1)
+        p1 = np.empty_like(p2)
+        p3 = np.empty_like(p2)
+        p1[1:] = p2[:-1]
+        p3[:-1] = p2[1:]
+        if self.cyclic:
+            # The neighbors of the end keys are taken from the other end of
+            # the curve, offset by the cycle.
+            p1[0] = p2[n - 2] + (p2[0] - p2[n - 1])
+            p3[n - 1] = p2[1] + (p2[n - 1] - p2[0])
+        else:
+            p1[0] = 2.0 * p2[0] - p2[1]
+            p3[n - 1] = 2.0 * p2[n - 1] - p2[n - 2]
+
+        dvec_a = p2 - p1
+        dvec_b = p3 - p2
+        len_a = dvec_a[:, 0].copy()
+        len_b = dvec_b[:, 0].copy()
+        len_a[len_a == 0.0] = 1.0
+        len_b[len_b == 0.0] = 1.0
+
+        tvec = dvec_b / len_b[:, None] + dvec_a / len_a[:, None]
+        length = tvec[:, 0] * AUTO_HANDLE_FACTOR
+        ok = length != 0.0
+        safe_length = np.where(ok, length, 1.0)
+
+        left = p2 - tvec * (len_a / safe_length)[:, None]
+        right = p2 + tvec * (len_b / safe_length)[:, None]
+        self.left = np.where(ok[:, None], left, p2)
+        self.right = np.where(ok[:, None], right, p2)
+
+        # Auto handles on the end keys of non-cyclic curves are flattened
+        # for constant extrapolation.
+        if not self.cyclic:
+            for i in (0, n - 1):
+                self.left[i, 1] = y[i]
+                self.right[i, 1] = y[i]
+
+    @property
+    def frame_range(self):
+        return (self.x[0], self.x[-1])
+
+    # Evaluates the curve at the given frames, returning an array of values.
+    def evaluate(self, frames):
+        t = np.asarray(frames, dtype=np.float64)
+        x = self.x
+        y = self.y
+        n = len(x)
+        if n == 1:
+            return np.full(t.shape, y[0])
+
+        x0 = x[0]
+        x1 = x[-1]
+        if self.cyclic:
+            period = x1 - x0
+            t = x0 + np.mod(t - x0, period)
+        result = np.empty(t.shape)
+
+        # Constant extrapolation outside the keyed range.
+        before = t <= x0
+        after = t >= x1
+        result[before] = y[0]
+        result[after] = y[-1]
+        inside = ~(before | after)
+        if not np.any(inside):
+            return result
+        ti = t[inside]
+
+        k = np.clip(np.searchsorted(x, ti, side='right') - 1, 0, n - 2)
+        v1 = np.stack([x[k], y[k]], axis=-1)
+        v2 = self.right[k].copy()
+        v3 = self.left[k + 1].copy()
+        v4 = np.stack([x[k + 1], y[k + 1]], axis=-1)
+
+        # Equivalent of `BKE_fcurve_correct_bezpart()`: keep the handles from
+        # overlapping in time.
+        h1 = v1 - v2
+        h2 = v4 - v3
+        seg_len = v4[:, 0] - v1[:, 0]
+        len1 = np.abs(h1[:, 0])
+        len2 = np.abs(h2[:, 0])
+        too_long = (len1 + len2) > seg_len
+        fac = np.where(too_long, seg_len / np.where(too_long, len1 + len2, 1.0), 1.0)
+        v2 = np.where(too_long[:, None], v1 - fac[:, None] * h1, v2)
+        v3 = np.where(too_long[:, None], v4 - fac[:, None] * h2, v3)
+
+        # Find the curve parameter for each frame.  The x component is
+        # monotonic within a segment, so bisection is robust.
+        cx0, cx1, cx2, cx3 = _bezier_coefficients(v1[:, 0], v2[:, 0], v3[:, 0], v4[:, 0])
+        lo = np.zeros(ti.shape)
+        hi = np.ones(ti.shape)
+        for _ in range(48):
+            mid = (lo + hi) * 0.5
+            xm = ((cx3 * mid + cx2) * mid + cx1) * mid + cx0
+            below = xm < ti
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        u = (lo + hi) * 0.5
+
+        cy0, cy1, cy2, cy3 = _bezier_coefficients(v1[:, 1], v2[:, 1], v3[:, 1], v4[:, 1])
+        values = ((cy3 * u + cy2) * u + cy1) * u + cy0
+
+        # Blender short-circuits flat segments.
+        flat = (np.abs(v1[:, 1] - v4[:, 1]) < _FLT_EPSILON) \
+            & (np.abs(v2[:, 1] - v3[:, 1]) < _FLT_EPSILON) \
+            & (np.abs(v3[:, 1] - v4[:, 1]) < _FLT_EPSILON)
+        values = np.where(flat, v1[:, 1], values)
+
+        result[inside] = values
+        return result
+
+
+def _bezier_coefficients(f1, f2, f3, f4):
+    c0 = f1
+    c1 = 3.0 * (f2 - f1)
+    c2 = 3.0 * (f1 - 2.0 * f2 + f3)
+    c3 = f4 - f1 + 3.0 * (f2 - f3)
+    return c0, c1, c2, c3
+
+
+#========================================================
+# Shake evaluation.
+
+
+# A shake prepared for evaluation, built from a `SHAKE_LIST`-style entry of
+# `(name, fps, {(data_path, array_index): [(frame, value), ...]})`.
+#
+# Like `ensure_shake_in_action()`, the last key of each channel is set to the
+# value of the first one to ensure seamless looping.
+class PreparedShake:
+    def __init__(self, shake):
+        self.name = shake[0]
+        self.fps = float(shake[1])
+        self.curves = {}
+        for channel, points in shake[2].items():
+            frames = [p[0] for p in points]
+            values = [p[1] for p in points]
+            values[-1] = values[0]
+            self.curves[channel] = BezierCurve(frames, values, cyclic=True)
+
+        # The frame range of the keys, rounded out to whole frames, as the
+        # shake rigs use it.
+        start = min(curve.frame_range[0] for curve in self.curves.values())
+        end = max(curve.frame_range[1] for curve in self.curves.values())
+        self.frame_start = math.floor(start)
+        self.frame_end = math.ceil(end)
+
+    @property
+    def length(self):
+        return self.frame_end - self.frame_start
+
+    # Evaluates the raw (unscaled) shake channels at the given shake-local
+    # frames.  Returns (location, rotation_euler) arrays of shape (N, 3).
+    def evaluate_channels(self, shake_frames):
+        shake_frames = np.asarray(shake_frames, dtype=np.float64)
+        loc = np.zeros(shake_frames.shape + (3,))
+        rot = np.zeros(shake_frames.shape + (3,))
+        for i, channel in enumerate(LOCATION_CHANNELS):
+            if channel in self.curves:
+                loc[..., i] = self.curves[channel].evaluate(shake_frames)
+        for i, channel in enumerate(ROTATION_CHANNELS):
+            if channel in self.curves:
+                rot[..., i] = self.curves[channel].evaluate(shake_frames)
+        return loc, rot
+
+
+# Prepares a shake in `SHAKE_LIST` form for evaluation.  Anything that's
+# already evaluable (a `PreparedShake`, or e.g. a `spectral.ProceduralShake`)
+# is returned as is.
+def prepare_shake(shake):
+    if hasattr(shake, "evaluate_channels"):
+        return shake
+    return PreparedShake(shake)
+
+
+# Computes the shake-local frame that the rig's eval-time driver and Action
+# constraint evaluate the shake action at, for each of the given scene frames.
+def shake_local_frames(shake, frames, speed=1.0, offset=0.0, use_manual_timing=False, time=0.0, scene_fps=24.0):
+    shake = prepare_shake(shake)
+    frames = np.asarray(frames, dtype=np.float64)
+
+    loop_duration = shake.length * (scene_fps / shake.fps)
+    t = np.where(use_manual_timing, time, (frames - offset) * speed) / loop_duration
+    eval_time = t - np.floor(t)
+
+    # The constraint stores the eval time in single precision, and clamps it.
+    eval_time = np.clip(eval_time.astype(np.float32), 0.0, 1.0)
+    local = eval_time * np.float32(shake.length) + np.float32(shake.frame_start)
+    return np.broadcast_to(local.astype(np.float64), frames.shape)
+
+
+# Evaluates a single shake instance at an array of scene frames (sub-frames
+# are fine).
+#
+# The parameters correspond to the properties of `CameraShakeInstance`, plus
+# the scene's frame rate (`fps / fps_base`) and unit scale.  Any of them may
+# also be arrays broadcastable against `frames`, e.g. for animated properties.
+#
+# Returns `(location, rotation)`, where `location` is an (N, 3) array of
+# location offsets and `rotation` is an (N, 4) array of (w, x, y, z)
+# quaternions applied after the camera's own rotation.
+#
+# The location offsets are in the space that the rig's Copy Location
+# constraints add them in, which depends on the camera: for a camera with a
+# parent, that's the parent's space (the space of the camera's `location`),
+# but for a camera without one, Blender first rotates them by the camera's own
+# rotation, i.e. by its delta rotation followed by its rotation (without its
+# scale).  That's up to the caller.
+def evaluate_shake(shake, frames, influence=1.0, scale=1.0, speed=1.0, offset=0.0, use_manual_timing=False, time=0.0, scene_fps=24.0, unit_scale=1.0):
+    shake = prepare_shake(shake)
+    frames = np.asarray(frames, dtype=np.float64)
+
+    local = shake_local_frames(shake, frames, speed, offset, use_manual_timing, time, scene_fps)
+    loc, rot = shake.evaluate_channels(local)
+
+    # The location is stored pre-multiplied by the maximum possible factor,
+    # and the constraint influence (clamped to [0, 1]) scales it back down.
+    loc_factor = INFLUENCE_MAX * SCALE_MAX * UNIT_SCALE_MAX
+    loc_influence = np.clip(
+        np.asarray(influence, dtype=np.float64) * scale / unit_scale / loc_factor,
+        0.0, 1.0,
+    )
+    loc = loc * (loc_factor * np.broadcast_to(loc_influence, frames.shape))[..., None]
+
+    # The rotation is stored pre-multiplied by the maximum influence, and the
+    # constraint influence interpolates towards it.
+    rot_influence = np.clip(np.asarray(influence, dtype=np.float64) / INFLUENCE_MAX, 0.0, 1.0)
+    quat = quat_power(euler_to_quat(rot * INFLUENCE_MAX, 'XYZ'), np.broadcast_to(rot_influence, frames.shape))
+
+    return loc, quat
+
+
+# Combines the results of several `evaluate_shake()` calls, in stack order,
+# the same way the camera's constraints do: locations add up, and each
+# rotation is applied after the previous ones.
+def combine_shakes(results, count=None):
+    loc = None
+    quat = None
+    for shake_loc, shake_quat in results:
+        if loc is None:
+            loc = np.array(shake_loc, dtype=np.float64)
+            quat = np.array(shake_quat, dtype=np.float64)
+        else:
+            loc = loc + shake_loc
+            quat = quat_multiply(quat, shake_quat)
+    if loc is None:
+        if count is None:
+            raise ValueError("Need either at least one result or a count")
+        loc = np.zeros((count, 3))
+        quat = np.zeros((count, 4))
+        quat[:, 0] = 1.0
+    return loc, quat
+
+
+#========================================================
+# Rotation utilities, matching Blender's conventions.  Quaternions are
+# (w, x, y, z), and euler orders are strings like 'XYZ', meaning X is applied
+# first and Z last.
+
+_AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2}
+
+# (i, j, k, parity) per euler order, as in Blender's `rotOrders` table.
+_EULER_ORDER_INFO = {
+    'XYZ': (0, 1, 2, False),
+    'XZY': (0, 2, 1, True),
+    'YXZ': (1, 0, 2, True),
+    'YZX': (1, 2, 0, False),
+    'ZXY': (2, 0, 1, False),
+    'ZYX': (2, 1, 0, True),
+}
+
+
+def quat_multiply(a, b):
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ], axis=-1)
+
+
+def quat_conjugate(q):
+    q = np.array(q, dtype=np.float64)
+    q[..., 1:] *= -1.0
+    return q
+
+
+# Interpolates from the identity rotation to `q` by `t` along the shortest
+# path, like Blender's constraint influence blending does.
+def quat_power(q, t):
+    q = np.asarray(q, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    q = np.where(q[..., 0:1] < 0.0, -q, q)
+    w = np.clip(q[..., 0], -1.0, 1.0)
+    angle = np.arccos(w)
+    sin_angle = np.sin(angle)
+    small = sin_angle < 1e-12
+    scale = np.where(small, t, np.sin(t * angle) / np.where(small, 1.0, sin_angle))
+    result = np.empty(q.shape)
+    result[..., 0] = np.cos(t * angle)
+    result[..., 1:] = q[..., 1:] * scale[..., None]
+    return result
+
+
+def euler_to_quat(euler, order='XYZ'):
+    euler = np.asarray(euler, dtype=np.float64)
+    result = np.zeros(euler.shape[:-1] + (4,))
+    result[..., 0] = 1.0
+    for axis in order:
+        i = _AXIS_INDEX[axis]
+        half = euler[..., i] * 0.5
+        axis_quat = np.zeros(result.shape)
+        axis_quat[..., 0] = np.cos(half)
+        axis_quat[..., 1 + i] = np.sin(half)
+        # Each later axis is applied on top of (i.e. to the left of) the
+        # earlier ones.
+        result = quat_multiply(axis_quat, result)
+    return result
+
+
+def quat_to_matrix(q):
+    q = np.asarray(q, dtype=np.float64)
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    m = np.empty(q.shape[:-1] + (3, 3))
+    m[..., 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    m[..., 0, 1] = 2.0 * (x * y - w * z)
+    m[..., 0, 2] = 2.0 * (x * z + w * y)
+    m[..., 1, 0] = 2.0 * (x * y + w * z)
+    m[..., 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    m[..., 1, 2] = 2.0 * (y * z - w * x)
+    m[..., 2, 0] = 2.0 * (x * z - w * y)
+    m[..., 2, 1] = 2.0 * (y * z + w * x)
+    m[..., 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return m
+
+
+# Converts quaternions to eulers of the given order.
+#
+# If `compat` is given (an array of eulers broadcastable to the result), the
+# equivalent euler closest to it is chosen for each rotation, like Blender's
+# `to_euler(order, compat)`.  This keeps baked rotation curves continuous.
+def quat_to_euler(q, order='XYZ', compat=None):
+    i, j, k, parity = _EULER_ORDER_INFO[order]
+    # Blender's matrices are column-major, so its `mat[a][b]` is `m[b, a]` here.
+    m = quat_to_matrix(q)
+    mat = lambda a, b: m[..., b, a]
+
+    cy = np.hypot(mat(i, i), mat(i, j))
+    regular = cy > 16.0 * _FLT_EPSILON
+
+    eul1 = np.empty(m.shape[:-2] + (3,))
+    eul2 = np.empty(m.shape[:-2] + (3,))
+    eul1[..., i] = np.where(regular, np.arctan2(mat(j, k), mat(k, k)), np.arctan2(-mat(k, j), mat(j, j)))
+    eul1[..., j] = np.arctan2(-mat(i, k), cy)
+    eul1[..., k] = np.where(regular, np.arctan2(mat(i, j), mat(i, i)), 0.0)
+    eul2[..., i] = np.where(regular, np.arctan2(-mat(j, k), -mat(k, k)), eul1[..., i])
+    eul2[..., j] = np.where(regular, np.arctan2(-mat(i, k), -cy), eul1[..., j])
+    eul2[..., k] = np.where(regular, np.arctan2(-mat(i, j), -mat(i, i)), eul1[..., k])
+    if parity:
+        eul1 = -eul1
+        eul2 = -eul2
+
+    if compat is None:
+        use_2 = np.sum(np.abs(eul2), axis=-1) < np.sum(np.abs(eul1), axis=-1)
+        return np.where(use_2[..., None], eul2, eul1)
+
+    compat = np.broadcast_to(np.asarray(compat, dtype=np.float64), eul1.shape)
+    eul1 = compat + _wrap_angle(eul1 - compat)
+    eul2 = compat + _wrap_angle(eul2 - compat)
+    use_2 = np.sum(np.abs(eul2 - compat), axis=-1) < np.sum(np.abs(eul1 - compat), axis=-1)
+    return np.where(use_2[..., None], eul2, eul1)
+
+
+def _wrap_angle(angle):
+    return np.mod(angle + math.pi, 2.0 * math.pi) - math.pi
@@ -0,0 +1,178 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Per-shake statistics: frame range, loop length, and per-channel amplitude and
+# frequency, plus an overall intensity used to normalize shakes against each
+# other.
+#
+# The statistics of the built-in shakes are precomputed (by
+# `dev/build_shake_stats.py`) into `shake_stats.json` next to this module.
+# Those of other shakes (e.g. imported ones) are computed the first time
+# they're needed.
+#
+# A shake's intensity is the RMS of its rotation (over all three axes,
+# in radians), since that's what dominates how much a shake moves the image.
+#
+# Note: this module intentionally doesn't depend on bpy, or on any of the
+# addon's other modules, so that it can also be used from tools outside of
+# Blender.
+
+import json
+import math
+import os
+
+import numpy as np
+
+STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shake_stats.json")
+
+# Normalization factors are kept within this range of 1, so that normalizing
+# an almost motionless shake doesn't blow it up.
+MAX_NORMALIZATION = 16.0
+
+
+def _round(value, digits=6):
+    return float("{:.{}g}".format(value, digits))
+
+
+def _channel_name(data_path, index):
+    return "{}[{}]".format(data_path, index)
+
+
+# Computes the statistics of a shake given in `SHAKE_LIST` form:
+# `(name, fps, {(data_path, array_index): [(frame, value), ...]})`.
+#
+# As with the shake rigs, the last value of each channel is taken to be a
+# repeat of the first, so the rest is treated as one loop.
+def compute_shake_stats(shake):
+    _, fps, data = shake
+    frame_start = min(points[0][0] for points in data.values())
+    frame_end = max(points[-1][0] for points in data.values())
+    length = frame_end - frame_start
+
+    channels = {}
+    rotation_variance = 0.0
+    for (data_path, index), points in data.items():
+        values = np.array([value for _, value in points][:-1], dtype=np.float64)
+        deviation = values - values.mean()
+        rms = math.sqrt(float(np.mean(deviation ** 2)))
+        peak = float(np.abs(deviation).max()) if len(deviation) > 0 else 0.0
+        spectrum = np.abs(np.fft.rfft(deviation))
+        if len(spectrum) > 1:
+            # Skip the constant (zero frequency) bin.
+            dominant_frequency = (int(np.argmax(spectrum[1:])) + 1) / len(deviation) * fps
+        else:
+            dominant_frequency = 0.0
+        channels[_channel_name(data_path, index)] = {
+            "rms": _round(rms),
+            "peak": _round(peak),
+            "dominant_frequency": _round(dominant_frequency),
+        }
+        if data_path.startswith("rotation"):
+            rotation_variance += rms * rms
+
+    return {
+        "fps": fps,
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "loop_length": length,
+        "loop_seconds": _round(length / fps),
+        "intensity": _round(math.sqrt(rotation_variance)),
+        "channels": channels,
+    }
+
+
+# The intensity that normalized shakes are scaled to: the median intensity of
+# the given shakes' statistics.
+def reference_intensity(stats):
+    intensities = sorted(s["intensity"] for s in stats if s["intensity"] > 0.0)
+    if len(intensities) == 0:
+        return 0.0
+    return _round(float(np.median(intensities)))
+
+
+def write_stats(path, stats):
+    with open(path, "w") as f:
+        json.dump({
+            "reference_intensity": reference_intensity(stats.values()),
+            "shakes": stats,
+        }, f, indent=1, sort_keys=False)
+        f.write("\n")
+
+
+def read_stats(path=STATS_PATH):
+    if not os.path.isfile(path):
+        return {"reference_intensity": 0.0, "shakes": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+_stats = None
+
+# Statistics computed on demand, for shakes not in the stats file.
+_computed = {}
+
+
+def _stats_file():
+    global _stats
+    if _stats is None:
+        _stats = read_stats()
+    return _stats
+
+
+# Returns the statistics of the shake with the given id, calling `get_shake`
+# to get its data if they aren't precomputed.
+def shake_stats(id, get_shake):
+    stats = _stats_file()["shakes"].get(id)
+    if stats is None:
+        stats = _computed.get(id)
+        if stats is None:
+            stats = compute_shake_stats(get_shake())
+            _computed[id] = stats
+    return stats
+
+
+# Forgets the statistics computed on demand, e.g. after a shake was
+# re-imported.
+def clear_computed_stats():
+    _computed.clear()
+
+
+# Returns the factor to scale a shake's influence by so that it's about as
+# intense as the reference.
+def normalization(stats):
+    reference = _stats_file()["reference_intensity"]
+    if reference <= 0.0 or stats["intensity"] <= 0.0:
+        return 1.0
+    factor = reference / stats["intensity"]
+    return _round(min(max(factor, 1.0 / MAX_NORMALIZATION), MAX_NORMALIZATION), 4)
+
+
+# A short human-readable summary of a shake's statistics, for the UI.
+def describe(stats):
+    rotation = [c for name, c in stats["channels"].items() if name.startswith("rotation")]
+    location = [c for name, c in stats["channels"].items() if name.startswith("location")]
+    text = "{:.1f}s loop, {:.2f}° rot RMS".format(
+        stats["loop_seconds"],
+        math.degrees(stats["intensity"]),
+    )
+    if len(location) > 0:
+        text += ", {:.3g} loc RMS".format(math.sqrt(sum(c["rms"] ** 2 for c in location)))
+    frequencies = [c["dominant_frequency"] for c in rotation if c["rms"] > 0.0]
+    if len(frequencies) > 0:
+        text += ", ~{:.1f} Hz".format(float(np.median(frequencies)))
+    return text
@@ -0,0 +1,293 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Procedural (spectral) shakes.
+#
+# The captured shakes are short loops, so on long takes their repetition can
+# become visible.  As an alternative, each shake can be described by a small
+# spectral model fitted from its capture, from which a statistically matching
+# signal that doesn't visibly repeat is synthesized.
+#
+# The model of a shake (see `fit_spectrum()`) consists of, per channel, its
+# mean, and per frequency band:
+#
+# - the RMS amplitude of each channel within the band, and
+# - the correlation between the channels within the band.
+#
+# From a model and a seed, `synthesize()` deterministically picks a few
+# sinusoids per band, with random frequencies within the band and random
+# phases, mixed across channels to give the band's correlations.  Each channel
+# is then just a sum of sinusoids, so it can be evaluated at any time in
+# constant time, both here (see `ProceduralShake`) and in Blender, where each
+# sinusoid is a generator F-modifier.
+#
+# Frequencies are quantized to whole cycles per `PERIOD` frames, so the signal
+# is exactly periodic over `PERIOD` frames (over 20 minutes at 24 fps), which
+# lets the shake rigs loop it the same way as the captured shakes, without a
+# seam.
+#
+# Note: this module intentionally doesn't depend on bpy, or on any of the
+# addon's other modules, so that it can also be used from tools outside of
+# Blender.
+
+import json
+import math
+import os
+import zlib
+
+import numpy as np
+
+SPECTRA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shake_spectra.json")
+
+# Length, in shake frames, after which procedural shakes repeat.  Kept fairly
+# small so that the single-precision evaluation time of the shake rigs still
+# resolves small fractions of a frame.
+PERIOD = 32768
+
+BAND_COUNT = 6
+COMPONENTS_PER_BAND = 4
+
+# Lowest frequency (in cycles per frame) that is modeled, in case a capture is
+# very long.
+MIN_FREQUENCY = 1.0 / 512.0
+
+
+# The spectral model of a shake.
+class Spectrum:
+    def __init__(self, id, fps, channels, means, band_edges, band_rms, band_correlations):
+        self.id = id
+        self.fps = fps
+        self.channels = channels # List of (data_path, array_index).
+        self.means = means # Per channel.
+        self.band_edges = band_edges # BAND_COUNT + 1 frequencies, in cycles per frame.
+        self.band_rms = band_rms # Per band, per channel.
+        # Per band, the lower triangle (without diagonal) of the correlation
+        # matrix, row by row.
+        self.band_correlations = band_correlations
+
+    def correlation_matrix(self, band):
+        n = len(self.channels)
+        matrix = np.eye(n)
+        values = iter(self.band_correlations[band])
+        for i in range(n):
+            for j in range(i):
+                matrix[i, j] = matrix[j, i] = next(values)
+        return matrix
+
+    def to_dict(self):
+        return {
+            "fps": self.fps,
+            "channels": [[data_path, index] for data_path, index in self.channels],
+            "means": self.means,
+            "band_edges": self.band_edges,
+            "band_rms": self.band_rms,
+            "band_correlations": self.band_correlations,
+        }
+
+    @staticmethod
+    def from_dict(id, d):
+        return Spectrum(
+            id,
+            d["fps"],
+            [(data_path, index) for data_path, index in d["channels"]],
+            d["means"],
+            d["band_edges"],
+            d["band_rms"],
+            d["band_correlations"],
+        )
+
+
+#========================================================
+# Fitting.
+
+
+def _round(value, digits=6):
+    return float("{:.{}g}".format(value, digits))
+
+
+# Fits the spectral model of a shake, given in `SHAKE_LIST` form:
+# `(name, fps, {(data_path, array_index): [(frame, value), ...]})`.
+#
+# The last value of each channel is taken to be a repeat of the first (as the
+# shake rigs treat it), so the rest is treated as one period of a loop.
+def fit_spectrum(id, shake):
+    _, fps, data = shake
+    channels = list(data.keys())
+    values = np.array([[value for _, value in data[channel]][:-1] for channel in channels], dtype=np.float64)
+    n = values.shape[1]
+
+    means = values.mean(axis=1)
+    spectra = np.fft.rfft(values - means[:, None], axis=1)
+    frequencies = np.fft.rfftfreq(n)
+
+    low = max(1.0 / n, MIN_FREQUENCY)
+    edges = np.geomspace(low, 0.5, BAND_COUNT + 1)
+    edges[0] = 0.0
+    edges[-1] = 0.5 + 1e-9
+
+    band_rms = []
+    band_correlations = []
+    for band in range(BAND_COUNT):
+        in_band = (frequencies > edges[band]) & (frequencies < edges[band + 1])
+        x = spectra[:, in_band]
+        # Parseval: each (non-DC) rfft bin contributes 2 |X|^2 / n^2 to the
+        # variance.
+        cross = 2.0 * np.real(x @ np.conj(x).T) / (n * n)
+        variance = np.diag(cross)
+        rms = np.sqrt(np.maximum(variance, 0.0))
+        band_rms += [[_round(v) for v in rms]]
+
+        correlations = []
+        for i in range(len(channels)):
+            for j in range(i):
+                denominator = math.sqrt(variance[i] * variance[j])
+                correlations += [round(cross[i, j] / denominator, 2) if denominator > 0.0 else 0.0]
+        band_correlations += [correlations]
+
+    return Spectrum(
+        id,
+        float(fps),
+        channels,
+        [_round(m) for m in means],
+        [_round(e) for e in edges[:-1].tolist()] + [0.5],
+        band_rms,
+        band_correlations,
+    )
+
+
+def write_spectra(path, spectra):
+    with open(path, "w") as f:
+        json.dump({id: spectrum.to_dict() for id, spectrum in spectra.items()}, f, separators=(",", ":"))
+        f.write("\n")
+
+
+def read_spectra(path=SPECTRA_PATH):
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return {id: Spectrum.from_dict(id, d) for id, d in json.load(f).items()}
+
+
+_spectra = None
+
+# Returns the spectral models of all shakes that have one, as a dict of
+# shake id -> Spectrum.
+def spectra():
+    global _spectra
+    if _spectra is None:
+        _spectra = read_spectra()
+    return _spectra
+
+
+# Whether a shake item (a `CameraShakeInstance`) plays its shake type's
+# procedural variant rather than the looped capture.  Shake types without a
+# spectral model (e.g. imported shakes) always play the capture.
+def is_procedural(shake):
+    return shake.source == 'PROCEDURAL' and shake.shake_type in spectra()
+
+
+#========================================================
+# Synthesis.
+
+
+# Returns a symmetric positive semi-definite matrix close to `matrix`, so that
+# correlations rounded for storage can still be factored.
+def _nearest_psd(matrix):
+    w, v = np.linalg.eigh(matrix)
+    return (v * np.maximum(w, 0.0)) @ v.T
+
+
+# Synthesizes the sinusoids of a procedural shake.
+#
+# Returns a dict of (data_path, array_index) -> (mean, components), where
+# `components` is a list of (amplitude, angular frequency in radians per frame,
+# phase) tuples.  The channel's value at frame `t` is
+# `mean + sum(amplitude * sin(frequency * t + phase))`.
+def synthesize(spectrum, seed):
+    rng = np.random.default_rng([zlib.crc32(spectrum.id.encode("utf-8")), seed & 0xffffffff])
+    channel_count = len(spectrum.channels)
+    components = [[] for _ in range(channel_count)]
+
+    for band in range(BAND_COUNT):
+        rms = np.array(spectrum.band_rms[band])
+        mixing = np.linalg.cholesky(_nearest_psd(spectrum.correlation_matrix(band)) + np.eye(channel_count) * 1e-9)
+        low = max(spectrum.band_edges[band], 1.0 / PERIOD)
+        high = spectrum.band_edges[band + 1]
+        frequencies = []
+        phasors = []
+        for _ in range(COMPONENTS_PER_BAND):
+            cycles = max(1, int(round(rng.uniform(low, high) * PERIOD)))
+            frequencies += [2.0 * math.pi * cycles / PERIOD]
+            # Random unit phasors for independent sources, mixed so that the
+            # channels get the band's correlations.
+            sources = np.exp(1j * rng.uniform(0.0, 2.0 * math.pi, channel_count))
+            phasors += [mixing @ sources]
+        phasors = np.array(phasors)
+
+        # Scale each channel so that its sinusoids' combined RMS is exactly
+        # the band's.  With only a few sinusoids, the random mixing can
+        # otherwise be quite far off.
+        power = (np.abs(phasors) ** 2).sum(axis=0) / 2.0
+        phasors *= np.divide(rms, np.sqrt(power), out=np.zeros(channel_count), where=power > 0.0)
+
+        for frequency, band_phasors in zip(frequencies, phasors):
+            for c in range(channel_count):
+                amplitude = abs(band_phasors[c])
+                if amplitude > 0.0:
+                    components[c] += [(float(amplitude), frequency, float(np.angle(band_phasors[c])))]
+
+    return {
+        channel: (float(spectrum.means[c]), components[c])
+        for c, channel in enumerate(spectrum.channels)
+    }
+
+
+# Evaluates synthesized channels (as returned by `synthesize()`) at the given
+# frames.
+def evaluate_channel(mean, components, frames):
+    frames = np.asarray(frames, dtype=np.float64)
+    result = np.full(frames.shape, mean)
+    for amplitude, frequency, phase in components:
+        result += amplitude * np.sin(frequency * frames + phase)
+    return result
+
+
+# A procedural shake, with the same interface as `shake_eval.PreparedShake`,
+# so that it can be evaluated the same way.
+class ProceduralShake:
+    def __init__(self, spectrum, seed):
+        self.name = spectrum.id
+        self.fps = spectrum.fps
+        self.frame_start = 0
+        self.frame_end = PERIOD
+        self.channels = synthesize(spectrum, seed)
+
+    @property
+    def length(self):
+        return self.frame_end - self.frame_start
+
+    def evaluate_channels(self, shake_frames):
+        shake_frames = np.asarray(shake_frames, dtype=np.float64)
+        loc = np.zeros(shake_frames.shape + (3,))
+        rot = np.zeros(shake_frames.shape + (3,))
+        for (data_path, index), (mean, components) in self.channels.items():
+            if data_path == "location":
+                loc[..., index] = evaluate_channel(mean, components, shake_frames)
+            elif data_path == "rotation_euler":
+                rot[..., index] = evaluate_channel(mean, components, shake_frames)
+        return loc, rot
@@ -0,0 +1,83 @@
+# Unit tests of `capture_import`.  These don't need Blender:
+#
+#     python3 -m pytest tests/test_capture_import.py
+
+import math
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dev"))
+from addon_modules import import_module
+
+capture_import = import_module("capture_import")
+
+
+class CaptureImportTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def write_csv(self, header, rows):
+        path = os.path.join(self.temp_dir.name, "capture.csv")
+        with open(path, "w") as f:
+            f.write(",".join(header) + "\n")
+            for row in rows:
+                f.write(",".join(repr(float(value)) for value in row) + "\n")
+        return path
+
+    def test_csv(self):
+        frames = range(120)
+        path = self.write_csv(
+            ["frame", "tx", "ty", "tz", "rx", "ry", "rz"],
+            [(frame, 0.01 * frame, math.sin(frame * 0.3), 0.0, 2.0 * math.sin(frame * 0.2), 0.0, 0.0) for frame in frames],
+        )
+        data, sample_count = capture_import.import_capture(path, loop_blend_frames=10)
+        self.assertEqual(sample_count, 120)
+        self.assertEqual(len(data), 6)
+        for channel, points in data.items():
+            with self.subTest(channel=channel):
+                self.assertEqual(len(points), 120 - 10 + 1)
+                self.assertEqual(points[0][0], 0)
+                self.assertEqual(points[-1][1], points[0][1])
+
+        # Linear drift is removed, and rotations are converted to radians.
+        tx = np.array([value for _, value in data[('location', 0)]])
+        np.testing.assert_allclose(tx, 0.0, atol=1e-6)
+        rx = np.array([value for _, value in data[('rotation_euler', 0)]])
+        self.assertLess(np.abs(rx).max(), math.radians(2.5))
+        self.assertGreater(np.abs(rx).max(), math.radians(1.5))
+
+    def test_resample(self):
+        path = self.write_csv(["time", "x"], [(t / 10.0, t / 10.0) for t in range(21)])
+        data, _ = capture_import.import_capture(path, target_fps=20.0, detrend=False, loop_blend_frames=0)
+        values = [value for _, value in data[('location', 0)]]
+        np.testing.assert_allclose(values[:-1], np.arange(41) / 20.0)
+
+    def test_no_channels(self):
+        path = self.write_csv(["frame", "focal_length"], [(0, 50.0), (1, 50.0)])
+        with self.assertRaises(ValueError):
+            capture_import.import_capture(path)
+
+    def test_detect_format(self):
+        self.assertEqual(capture_import.detect_format("shake.CSV"), 'CSV')
+        self.assertEqual(capture_import.detect_format("shake.ndjson"), 'JSON')
+        with self.assertRaises(ValueError):
+            capture_import.detect_format("shake.fbx")
+
+    def test_blend_loop_seam(self):
+        values = np.arange(30, dtype=np.float64)
+        blended = capture_import.blend_loop_seam(values, 5)
+        self.assertEqual(len(blended), 25)
+        np.testing.assert_array_equal(blended[:20], values[5:25])
+        # The end fades into what came right before the new start.
+        self.assertLess(abs(blended[-1] - values[4]), abs(values[-1] - values[4]))
+        with self.assertRaises(ValueError):
+            capture_import.blend_loop_seam(values[:11], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# Unit tests of `decimate`.  These don't need Blender:
+#
+#     python3 -m pytest tests/test_decimate.py
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dev"))
+from addon_modules import import_module
+
+decimate = import_module("decimate")
+shake_eval = import_module("shake_eval")
+shake_data = import_module("shake_data")
+
+
+class DecimateTest(unittest.TestCase):
+    def setUp(self):
+        self.data = shake_data.SHAKE_LIST['INVESTIGATION'][2]
+
+    def test_within_tolerance(self):
+        location_tolerance = decimate.DEFAULT_LOCATION_TOLERANCE
+        rotation_tolerance = decimate.DEFAULT_ROTATION_TOLERANCE
+        decimated, stats = decimate.decimate_shake(self.data, location_tolerance, rotation_tolerance)
+        for channel, points in self.data.items():
+            with self.subTest(channel=channel):
+                tolerance = rotation_tolerance if channel[0].startswith("rotation") else location_tolerance
+                frames = np.array([p[0] for p in points], dtype=np.float64)
+                values = np.array([p[1] for p in points], dtype=np.float64)
+                values[-1] = values[0]
+                # As stored by Blender.
+                kept = np.array(decimated[channel], dtype=np.float32).astype(np.float64)
+                curve = shake_eval.BezierCurve(kept[:, 0], kept[:, 1], cyclic=True)
+                error = np.abs(curve.evaluate(frames) - values).max()
+
+                original_count, kept_count, max_error = stats[channel]
+                self.assertEqual(original_count, len(points))
+                self.assertEqual(kept_count, len(kept))
+                self.assertLess(kept_count, original_count)
+                self.assertLessEqual(error, tolerance)
+                self.assertAlmostEqual(error, max_error, delta=1e-9)
+
+    def test_loop_seam(self):
+        decimated, _ = decimate.decimate_shake(self.data, 0.01, 0.01)
+        for channel, points in decimated.items():
+            with self.subTest(channel=channel):
+                self.assertEqual(points[0][0], self.data[channel][0][0])
+                self.assertEqual(points[-1][0], self.data[channel][-1][0])
+                self.assertEqual(points[-1][1], points[0][1])
+
+                # The curve flows across the seam the same as the original.
+                kept = np.array(points)
+                curve = shake_eval.BezierCurve(kept[:, 0], kept[:, 1], cyclic=True)
+                period = kept[-1, 0] - kept[0, 0]
+                frames = kept[-1, 0] + np.linspace(-3.0, 3.0, 13)
+                np.testing.assert_allclose(curve.evaluate(frames), curve.evaluate(frames - period), atol=1e-9)
+
+    def test_short_channels_are_kept(self):
+        for n in range(1, 4):
+            indices, error = decimate.decimate_channel(np.arange(n), np.zeros(n), 1.0)
+            np.testing.assert_array_equal(indices, np.arange(n))
+            self.assertEqual(error, 0.0)
+
+    def test_zero_tolerance_keeps_everything(self):
+        frames = np.arange(20.0)
+        values = np.random.default_rng(2).normal(size=20)
+        values[-1] = values[0]
+        indices, _ = decimate.decimate_channel(frames, values, 0.0)
+        np.testing.assert_array_equal(indices, np.arange(20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# Unit tests of `parallel_eval`.  These don't need Blender:
+#
+#     python3 -m pytest tests/test_parallel_eval.py
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dev"))
+from addon_modules import import_module
+
+parallel_eval = import_module("parallel_eval")
+shake_data = import_module("shake_data")
+shake_eval = import_module("shake_eval")
+spectral = import_module("spectral")
+
+
+class ParallelEvalTest(unittest.TestCase):
+    def setUp(self):
+        self.frames = np.arange(0.0, 300.0, 0.5)
+        self.sources = {
+            'INVESTIGATION': ('CAPTURE', shake_data.SHAKE_LIST['INVESTIGATION']),
+            ('HANDYCAM_RUN', 3): ('PROCEDURAL', spectral.spectra()['HANDYCAM_RUN'].to_dict(), 3),
+        }
+        influence = np.linspace(0.0, 2.0, len(self.frames))
+        self.cameras = [
+            ([('INVESTIGATION', {"influence": influence, "offset": 10.0})], 24.0, 1.0),
+            ([('INVESTIGATION', {"speed": 2.0}), (('HANDYCAM_RUN', 3), {"scale": 0.5})], 30.0, 0.1),
+        ]
+
+    def expected(self):
+        prepared = {
+            'INVESTIGATION': shake_eval.prepare_shake(shake_data.SHAKE_LIST['INVESTIGATION']),
+            ('HANDYCAM_RUN', 3): spectral.ProceduralShake(spectral.spectra()['HANDYCAM_RUN'], 3),
+        }
+        return [
+            shake_eval.combine_shakes([
+                shake_eval.evaluate_shake(prepared[key], self.frames, scene_fps=scene_fps, unit_scale=unit_scale, **params)
+                for key, params in shakes
+            ])
+            for shakes, scene_fps, unit_scale in self.cameras
+        ]
+
+    def check(self, results):
+        for (loc, quat), (expected_loc, expected_quat) in zip(results, self.expected()):
+            np.testing.assert_allclose(loc, expected_loc, atol=1e-12)
+            np.testing.assert_allclose(quat, expected_quat, atol=1e-12)
+
+    def test_in_process(self):
+        self.check(parallel_eval.evaluate_cameras(self.cameras, self.frames, self.sources, jobs=1, chunk_size=128))
+
+    def test_worker_processes(self):
+        path = list(sys.path)
+        with mock.patch.object(parallel_eval, "PARALLEL_MIN_SAMPLES", 0):
+            results = parallel_eval.evaluate_cameras(self.cameras, self.frames, self.sources, jobs=2, chunk_size=128)
+        self.check(results)
+        self.assertEqual(sys.path, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
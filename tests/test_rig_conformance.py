@@ -0,0 +1,146 @@
+# Conformance test of `shake_eval` against Blender's own evaluation of the
+# shake rigs, in a headless Blender:
+#
+#     blender -b --factory-startup --python-exit-code 1 --python tests/test_rig_conformance.py
+#
+# Builds a set of shaken cameras covering the various shake parameters, steps
+# through a range of frames and sub-frames, and compares each camera's
+# evaluated transform with what `shake_eval` computes.
+
+import math
+import os
+import sys
+import unittest
+
+import bpy
+import numpy as np
+from mathutils import Euler, Vector
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_DIR), "dev"))
+from blender_util import load_addon, addon_submodule
+
+addon = load_addon()
+shake_eval = addon_submodule("shake_eval")
+shake_data = addon_submodule("shake_data")
+
+LOCATION_TOLERANCE = 1e-5
+# Radians.  The per-shake layout blends each shake rotation in through its
+# Copy Rotation constraint's influence, which Blender does in single precision
+# with a matrix interpolation, so it's a few 1e-5 off on a rotated camera.
+ROTATION_TOLERANCE = 1e-4
+
+# (scene fps, fps base, unit scale, rig layout, share shake empties)
+# combinations to check.
+SCENE_SETTINGS = [
+    (24, 1.0, 1.0, 'PER_SHAKE', False),
+    (30, 1.001, 0.5, 'PER_SHAKE', False),
+    (24, 1.0, 1.0, 'PER_SHAKE', True),
+    (24, 1.0, 1.0, 'PER_CAMERA', False),
+    (30, 1.001, 0.5, 'PER_CAMERA', False),
+    (24, 1.0, 1.0, 'CACHED', False),
+    (30, 1.001, 0.5, 'CACHED', False),
+]
+
+# Per camera: a list of shakes, each a dict of CameraShakeInstance properties.
+CAMERAS = [
+    [dict(shake_type='HANDYCAM_RUN')],
+    [dict(shake_type='INVESTIGATION', influence=0.7, scale=1.5, speed=1.3, offset=12.5)],
+    [dict(shake_type='THE_WEDDING', use_manual_timing=True, time=37.25, influence=2.5)],
+    [
+        dict(shake_type='WALK_TO_THE_STORE', influence=0.4, speed=0.5),
+        dict(shake_type='BIKE_ON_GRAVEL_2D', influence=1.2, offset=-40.0),
+        dict(shake_type='OUT_CAR_WINDOW', scale=3.0, speed=2.0, offset=3.3),
+    ],
+    # Same timing as shakes on other cameras, to exercise shared shake empties.
+    [
+        dict(shake_type='HANDYCAM_RUN', influence=0.5),
+        dict(shake_type='INVESTIGATION', scale=2.0, speed=1.3, offset=12.5),
+    ],
+]
+
+BASE_LOCATION = Vector((3.0, -2.0, 1.5))
+BASE_ROTATION = Euler((1.2, 0.1, 0.5), 'XYZ')
+
+FRAMES = np.arange(-20.0, 400.0, 1.37)
+
+
+def setup_scene(scene, fps, fps_base, unit_scale, rig_layout, share_empties):
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    scene.render.fps = fps
+    scene.render.fps_base = fps_base
+    scene.unit_settings.scale_length = unit_scale
+    scene.camera_shakify_rig_layout = rig_layout
+    scene.camera_shakify_share_empties = share_empties
+
+    cameras = []
+    for i, shakes in enumerate(CAMERAS):
+        camera = bpy.data.objects.new("check_camera_{}".format(i), bpy.data.cameras.new("check_camera_{}".format(i)))
+        scene.collection.objects.link(camera)
+        camera.location = BASE_LOCATION
+        camera.rotation_euler = BASE_ROTATION
+        for params in shakes:
+            shake = camera.camera_shakes.add()
+            for name, value in params.items():
+                setattr(shake, name, value)
+        cameras += [(camera, shakes)]
+    addon.rebuild_cameras([camera for camera, _ in cameras], bpy.context)
+    return cameras
+
+
+def expected_offsets(shakes, fps, unit_scale):
+    results = []
+    for params in shakes:
+        shake = shake_data.SHAKE_LIST[params['shake_type']]
+        kwargs = {k: v for k, v in params.items() if k != 'shake_type'}
+        results += [shake_eval.evaluate_shake(shake, FRAMES, scene_fps=fps, unit_scale=unit_scale, **kwargs)]
+    return shake_eval.combine_shakes(results)
+
+
+# The shake offsets of a camera as evaluated by Blender.  The cameras have no
+# parent, so the rig adds the location offset rotated by the camera's own
+# rotation (see `shake_eval.evaluate_shake()`), which is undone here.
+def blender_offsets(scene, camera):
+    base_quat = BASE_ROTATION.to_quaternion()
+    base_matrix_inverse = BASE_ROTATION.to_matrix().transposed()
+    loc = np.empty((len(FRAMES), 3))
+    quat = np.empty((len(FRAMES), 4))
+    for i, frame in enumerate(FRAMES):
+        whole = math.floor(frame)
+        scene.frame_set(whole, subframe=frame - whole)
+        matrix = camera.matrix_world
+        loc[i] = base_matrix_inverse @ (matrix.translation - BASE_LOCATION)
+        quat[i] = base_quat.inverted() @ matrix.to_quaternion()
+    return loc, quat
+
+
+def rotation_difference(a, b):
+    dot = np.abs(np.sum(a * b, axis=-1)) / (np.linalg.norm(a, axis=-1) * np.linalg.norm(b, axis=-1))
+    return 2.0 * np.arccos(np.clip(dot, 0.0, 1.0))
+
+
+class RigConformanceTest(unittest.TestCase):
+    def test_rigs_match_shake_eval(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        scene = bpy.context.scene
+        for fps, fps_base, unit_scale, rig_layout, share_empties in SCENE_SETTINGS:
+            cameras = setup_scene(scene, fps, fps_base, unit_scale, rig_layout, share_empties)
+            for camera, shakes in cameras:
+                with self.subTest(
+                    fps=fps / fps_base,
+                    unit_scale=unit_scale,
+                    layout=rig_layout,
+                    shared=share_empties,
+                    shakes=", ".join(s['shake_type'] for s in shakes),
+                ):
+                    exp_loc, exp_quat = expected_offsets(shakes, fps / fps_base, unit_scale)
+                    got_loc, got_quat = blender_offsets(scene, camera)
+                    self.assertLessEqual(np.abs(exp_loc - got_loc).max(), LOCATION_TOLERANCE)
+                    self.assertLessEqual(rotation_difference(exp_quat, got_quat).max(), ROTATION_TOLERANCE)
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=[sys.argv[0]], exit=False).result
+    if not result.wasSuccessful():
+        sys.exit(1)
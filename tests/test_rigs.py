@@ -0,0 +1,325 @@
+# Tests that build, verify, and bake camera shake rigs in a headless Blender:
+#
+#     blender -b --factory-startup --python-exit-code 1 --python tests/test_rigs.py
+#
+# The addon is loaded straight from the repository (see
+# `dev/blender_util.py`), so it doesn't need to be installed or enabled.
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import bpy
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_DIR), "dev"))
+from blender_util import load_addon
+
+SHAKE_TYPE = 'INVESTIGATION'
+LAYOUTS = ['PER_SHAKE', 'PER_CAMERA', 'CACHED']
+
+addon = load_addon()
+
+
+def new_camera(name="Camera"):
+    camera = bpy.data.objects.new(name, bpy.data.cameras.new(name))
+    bpy.context.scene.collection.objects.link(camera)
+    return camera
+
+
+def add_shakes(camera, shake_types, normalize=False):
+    with addon.batch_edit():
+        for shake_type in shake_types:
+            shake = camera.camera_shakes.add()
+            shake.shake_type = shake_type
+            shake.normalize = normalize
+
+
+def verify(camera):
+    action = bpy.data.actions.get((addon.ACTION_NAME, None))
+    return addon.verify_camera_shakes(camera, bpy.context.scene, action)
+
+
+class RigTest(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_empty=True)
+        self.scene = bpy.context.scene
+
+    def test_build_and_verify(self):
+        for layout in LAYOUTS:
+            for normalize in [False, True]:
+                with self.subTest(layout=layout, normalize=normalize):
+                    bpy.ops.wm.read_homefile(use_empty=True)
+                    bpy.context.scene.camera_shakify_rig_layout = layout
+                    camera = new_camera()
+                    add_shakes(camera, [SHAKE_TYPE, SHAKE_TYPE], normalize)
+                    addon.rebuild_cameras([camera], bpy.context)
+                    self.assertEqual(verify(camera), [])
+
+    def test_normalize_changes_influence_driver(self):
+        camera = new_camera()
+        add_shakes(camera, [SHAKE_TYPE], normalize=True)
+        addon.rebuild_cameras([camera], bpy.context)
+        normalization = addon.shake_normalization(camera.camera_shakes[0])
+        self.assertNotEqual(normalization, 1.0)
+        driver = addon.find_driver(camera.constraints[addon.rot_constraint_name(0)], "influence")
+        self.assertEqual(driver.driver.expression, addon.rot_influence_expression(normalization))
+
+        camera.camera_shakes[0].normalize = False
+        self.assertEqual(verify(camera), [])
+        driver = addon.find_driver(camera.constraints[addon.rot_constraint_name(0)], "influence")
+        self.assertEqual(driver.driver.expression, addon.ROT_INFLUENCE_EXPRESSION)
+
+    def test_batch_add_normalize(self):
+        camera = new_camera()
+        camera.select_set(True)
+        bpy.context.view_layer.objects.active = camera
+        bpy.ops.object.camera_shakes_batch_add(shake_type=SHAKE_TYPE, normalize=True)
+        self.assertTrue(camera.camera_shakes[0].normalize)
+        self.assertEqual(verify(camera), [])
+
+    def test_non_shake_constraints(self):
+        camera = new_camera()
+        add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras([camera], bpy.context)
+        self.assertEqual(addon.non_shake_constraints(camera), [])
+        track = camera.constraints.new('TRACK_TO')
+        self.assertEqual(addon.non_shake_constraints(camera), [track])
+
+    def test_cached_layout_falls_back_with_other_constraints(self):
+        self.scene.camera_shakify_rig_layout = 'CACHED'
+        camera = new_camera()
+        camera.constraints.new('TRACK_TO')
+        add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras([camera], bpy.context)
+        self.assertEqual(addon.camera_rig_layout(camera, self.scene), 'PER_CAMERA')
+        self.assertNotIn(addon.BASE_DELTA_PROP, camera)
+        self.assertEqual(verify(camera), [])
+
+    def test_shared_empty_survives_duplicate(self):
+        self.scene.camera_shakify_share_empties = True
+        camera = new_camera()
+        add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras([camera], bpy.context)
+
+        # Duplicating copies the constraints behind the addon's back.
+        duplicate = camera.copy()
+        self.scene.collection.objects.link(duplicate)
+        duplicate.camera_shakes.clear()
+        addon.rebuild_cameras([duplicate], bpy.context)
+
+        self.assertEqual(verify(camera), [])
+        self.assertTrue(addon.is_shake_object_used(camera.constraints[addon.loc_constraint_name(0)].target))
+
+    def test_shared_empty_users(self):
+        self.scene.camera_shakify_share_empties = True
+        cameras = [new_camera("A"), new_camera("B")]
+        for camera in cameras:
+            add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras(cameras, bpy.context)
+        shared = cameras[0].constraints[addon.loc_constraint_name(0)].target
+        shared_name = shared.name
+        self.assertEqual(sorted(shared[addon.SHARED_USERS_PROP].keys()), ["A", "B"])
+
+        # A renamed camera is found by searching all cameras once its recorded
+        # name no longer checks out.
+        cameras[1].name = "C"
+        cameras[0].camera_shakes.clear()
+        addon.rebuild_cameras([cameras[0]], bpy.context)
+        self.assertEqual(verify(cameras[1]), [])
+        self.assertEqual(list(shared[addon.SHARED_USERS_PROP].keys()), ["C"])
+
+        cameras[1].camera_shakes.clear()
+        addon.rebuild_cameras([cameras[1]], bpy.context)
+        self.assertIsNone(bpy.data.objects.get(shared_name))
+
+    def test_repair_replaces_old_shake_curves(self):
+        camera = new_camera()
+        add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras([camera], bpy.context)
+
+        # Play the shake from a slot named as before its curves were keyed
+        # without auto smoothing.
+        action = bpy.data.actions.get((addon.ACTION_NAME, None))
+        old_slot = action.slots.new('OBJECT', SHAKE_TYPE.lower())
+        action.layers[0].strips[0].channelbags.new(old_slot)
+        action_constraint = camera.constraints[addon.loc_constraint_name(0)].target.constraints[0]
+        action_constraint.action_slot = old_slot
+        self.assertNotEqual(verify(camera), [])
+
+        addon.repair_camera_shakes_globally(bpy.context)
+        self.assertEqual(verify(camera), [])
+        self.assertNotIn("OB" + SHAKE_TYPE.lower(), [slot.identifier for slot in action.slots])
+
+    def test_only_repair_links_shake_library(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, "shake_library.blend")
+        addon.write_shake_library(path)
+
+        camera = new_camera()
+        add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras([camera], bpy.context)
+        with mock.patch.object(addon, "shake_library_path", return_value=path):
+            self.assertEqual(verify(camera), [])
+            self.assertEqual(len(bpy.data.libraries), 0)
+
+            addon.repair_camera_shakes_globally(bpy.context)
+            self.assertEqual(len(bpy.data.libraries), 1)
+            self.assertEqual(verify(camera), [])
+            shake_empty = camera.constraints[addon.loc_constraint_name(0)].target
+            self.assertEqual(shake_empty.constraints[0].action.library, bpy.data.libraries[0])
+
+    def test_rebuild_all_scenes(self):
+        cameras = [new_camera("A")]
+        other_scene = bpy.data.scenes.new("Other")
+        camera = bpy.data.objects.new("B", bpy.data.cameras.new("B"))
+        other_scene.collection.objects.link(camera)
+        cameras += [camera]
+        for camera in cameras:
+            add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras(cameras[:1], bpy.context)
+
+        bpy.ops.object.camera_shakes_fix_global(mode='REBUILD')
+        action = bpy.data.actions.get((addon.ACTION_NAME, None))
+        self.assertEqual(addon.verify_camera_shakes(cameras[0], self.scene, action), [])
+        self.assertEqual(addon.verify_camera_shakes(cameras[1], other_scene, action), [])
+
+    def test_scene_settings_on_load(self):
+        other_scene = bpy.data.scenes.new("Other")
+        camera = bpy.data.objects.new("B", bpy.data.cameras.new("B"))
+        other_scene.collection.objects.link(camera)
+        add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras([camera], bpy.context)
+
+        # A frame rate change in a scene that isn't active gets picked up on
+        # load, without writing anything to the scenes.
+        other_scene.render.fps = 30
+        action = bpy.data.actions.get((addon.ACTION_NAME, None))
+        self.assertNotEqual(addon.verify_camera_shakes(camera, other_scene, action), [])
+        addon.repair_camera_shakes_on_load()
+        self.assertEqual(addon.verify_camera_shakes(camera, other_scene, action), [])
+        for scene in [self.scene, other_scene]:
+            self.assertIn(scene.session_uid, addon._scene_settings)
+            self.assertEqual(list(scene.keys()), [])
+
+        # Even with repairing on load disabled.
+        addon._scene_settings.clear()
+        prefs = mock.Mock(repair_on_load=False)
+        with mock.patch.object(addon, "addon_preferences", return_value=prefs):
+            addon.repair_camera_shakes_on_load()
+        for scene in [self.scene, other_scene]:
+            self.assertIn(scene.session_uid, addon._scene_settings)
+
+    def test_bake_copy(self):
+        camera = new_camera()
+        add_shakes(camera, [SHAKE_TYPE], normalize=True)
+        addon.rebuild_cameras([camera], bpy.context)
+        frames = addon.bake_frames(1, 10)
+        addon.bake_cameras([camera], bpy.context, frames, target='COPY')
+        baked = bpy.data.objects[camera.name + "_baked"]
+        self.assertEqual(len(baked.camera_shakes), 0)
+        self.assertFalse(any(addon.starts_with_any_base_name(c.name) for c in baked.constraints))
+        self.assertEqual(verify(camera), [])
+
+    def test_bake_copy_again_replaces_copy(self):
+        camera = new_camera()
+        add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras([camera], bpy.context)
+        frames = addon.bake_frames(1, 10)
+        first = addon.bake_cameras([camera], bpy.context, frames, target='COPY')[0]
+        self.scene.camera = first
+
+        second = addon.bake_cameras([camera], bpy.context, frames, target='COPY')[0]
+        self.assertEqual(second.name, camera.name + "_baked")
+        self.assertEqual(self.scene.camera, second)
+        self.assertEqual(len([obj for obj in bpy.data.objects if obj.type == 'CAMERA']), 2)
+
+    def test_batch_bake(self):
+        import batch_worker
+        cameras = [new_camera("A"), new_camera("B")]
+        cameras[1].constraints.new('TRACK_TO')
+        other_scene = bpy.data.scenes.new("Other")
+        other_scene.collection.objects.link(cameras[0])
+        for camera in cameras:
+            add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras(cameras, bpy.context)
+        for scene in [self.scene, other_scene]:
+            scene.camera = cameras[0]
+        args = mock.Mock(bake_target='COPY', bake_samples=1, bake_jobs=1)
+
+        for _ in range(2):
+            ok, details = batch_worker.op_bake(addon, args)
+            self.assertFalse(ok)
+            self.assertEqual(details, {"baked": ["A"], "constrained": ["B"]})
+            self.assertEqual([obj.name for obj in bpy.data.objects if obj.name.endswith("_baked")], ["A_baked"])
+            for scene in [self.scene, other_scene]:
+                self.assertEqual(scene.camera.name, "A_baked")
+
+    def test_bake_keeps_keys_outside_range(self):
+        camera = new_camera()
+        for frame, x in [(-10, 1.0), (0, 2.0), (100, 3.0), (200, 4.0)]:
+            camera.location.x = x
+            camera.keyframe_insert("location", index=0, frame=frame)
+        add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras([camera], bpy.context)
+        addon.bake_cameras([camera], bpy.context, addon.bake_frames(1, 50), target='CAMERA')
+
+        keys = [tuple(point.co) for point in addon.find_id_fcurve(camera, "location", 0).keyframe_points]
+        self.assertEqual(len(keys), 4 + 50)
+        self.assertEqual([frame for frame, _ in keys], sorted(frame for frame, _ in keys))
+        for key in [(-10.0, 1.0), (0.0, 2.0), (100.0, 3.0), (200.0, 4.0)]:
+            self.assertIn(key, keys)
+
+    def test_bake_matches_rig(self):
+        for layout in LAYOUTS:
+            for parented in [False, True]:
+                with self.subTest(layout=layout, parented=parented):
+                    bpy.ops.wm.read_homefile(use_empty=True)
+                    scene = bpy.context.scene
+                    scene.camera_shakify_rig_layout = layout
+                    camera = new_camera()
+                    if parented:
+                        parent = bpy.data.objects.new("Parent", None)
+                        scene.collection.objects.link(parent)
+                        parent.location = (1.0, 2.0, 3.0)
+                        parent.rotation_euler = (0.3, -0.4, 0.8)
+                        camera.parent = parent
+                    camera.rotation_euler = (1.2, 0.1, 0.5)
+                    camera.delta_rotation_euler = (0.1, 0.2, -0.3)
+                    for frame, location in [(1, (3.0, -2.0, 1.5)), (20, (4.0, -1.0, 2.0))]:
+                        camera.location = location
+                        camera.keyframe_insert("location", frame=frame)
+                    add_shakes(camera, [SHAKE_TYPE, 'HANDYCAM_RUN'])
+                    camera.camera_shakes[0].influence = 2.0
+                    addon.rebuild_cameras([camera], bpy.context)
+
+                    addon.bake_cameras([camera], bpy.context, addon.bake_frames(1, 20), target='COPY')
+                    baked = bpy.data.objects[camera.name + "_baked"]
+                    for frame in range(1, 21):
+                        scene.frame_set(frame)
+                        expected = camera.matrix_world
+                        got = baked.matrix_world
+                        self.assertLess((expected.translation - got.translation).length, 1e-4)
+                        self.assertLess(expected.to_quaternion().rotation_difference(got.to_quaternion()).angle, 1e-4)
+
+    def test_bake_copy_keeps_shared_empties(self):
+        self.scene.camera_shakify_share_empties = True
+        cameras = [new_camera("A"), new_camera("B")]
+        for camera in cameras:
+            add_shakes(camera, [SHAKE_TYPE])
+        addon.rebuild_cameras(cameras, bpy.context)
+        addon.bake_cameras(cameras, bpy.context, addon.bake_frames(1, 10), target='COPY')
+
+        # Removing one camera's shakes mustn't take the other's empty with it.
+        cameras[0].camera_shakes.clear()
+        addon.rebuild_cameras([cameras[0]], bpy.context)
+        self.assertEqual(verify(cameras[1]), [])
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=[sys.argv[0]], exit=False).result
+    if not result.wasSuccessful():
+        sys.exit(1)
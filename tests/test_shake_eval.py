@@ -0,0 +1,108 @@
+# Unit tests of `shake_eval`.  These don't need Blender:
+#
+#     python3 -m pytest tests/test_shake_eval.py
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dev"))
+from addon_modules import import_module
+
+shake_eval = import_module("shake_eval")
+shake_data = import_module("shake_data")
+
+EULER_ORDERS = ['XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX']
+
+
+class BezierCurveTest(unittest.TestCase):
+    def test_passes_through_keys(self):
+        frames = [0.0, 3.0, 7.0, 12.0]
+        values = [0.5, -1.0, 2.0, 0.5]
+        for cyclic in [False, True]:
+            with self.subTest(cyclic=cyclic):
+                curve = shake_eval.BezierCurve(frames, values, cyclic=cyclic)
+                np.testing.assert_allclose(curve.evaluate(frames), values, atol=1e-6)
+
+    def test_cyclic_curve_repeats(self):
+        curve = shake_eval.BezierCurve([0.0, 4.0, 9.0, 16.0], [1.0, 3.0, -2.0, 1.0], cyclic=True)
+        frames = np.linspace(0.0, 16.0, 57)
+        np.testing.assert_allclose(curve.evaluate(frames + 16.0), curve.evaluate(frames), atol=1e-6)
+        np.testing.assert_allclose(curve.evaluate(frames - 48.0), curve.evaluate(frames), atol=1e-6)
+
+    def test_non_cyclic_curve_extrapolates_constant(self):
+        curve = shake_eval.BezierCurve([0.0, 4.0, 9.0], [1.0, 3.0, -2.0], cyclic=False)
+        np.testing.assert_allclose(curve.evaluate([-5.0, 20.0]), [1.0, -2.0])
+
+
+class RotationTest(unittest.TestCase):
+    def setUp(self):
+        self.eulers = np.random.default_rng(1).uniform(-1.4, 1.4, (50, 3))
+
+    def test_euler_round_trip(self):
+        for order in EULER_ORDERS:
+            with self.subTest(order=order):
+                quat = shake_eval.euler_to_quat(self.eulers, order)
+                np.testing.assert_allclose(shake_eval.quat_to_euler(quat, order), self.eulers, atol=1e-9)
+
+    def test_euler_compat_stays_continuous(self):
+        eulers = self.eulers + 2.0 * np.pi
+        quat = shake_eval.euler_to_quat(eulers, 'XYZ')
+        np.testing.assert_allclose(shake_eval.quat_to_euler(quat, 'XYZ', compat=eulers), eulers, atol=1e-9)
+
+    def test_quat_power(self):
+        quat = shake_eval.euler_to_quat(self.eulers, 'XYZ')
+        np.testing.assert_allclose(shake_eval.quat_power(quat, 0.0), np.broadcast_to([1.0, 0.0, 0.0, 0.0], quat.shape), atol=1e-12)
+        self.assertTrue(np.allclose(shake_eval.quat_power(quat, 1.0), quat) or np.allclose(shake_eval.quat_power(quat, 1.0), -quat))
+        half = shake_eval.quat_power(quat, 0.5)
+        squared = shake_eval.quat_multiply(half, half)
+        sign = np.sign(np.sum(squared * quat, axis=-1))[:, None]
+        np.testing.assert_allclose(squared * sign, quat, atol=1e-9)
+
+
+class EvaluateShakeTest(unittest.TestCase):
+    def setUp(self):
+        self.shake = shake_eval.prepare_shake(shake_data.SHAKE_LIST['INVESTIGATION'])
+        self.frames = np.arange(-10.0, 300.0, 0.75)
+
+    def test_zero_influence(self):
+        loc, quat = shake_eval.evaluate_shake(self.shake, self.frames, influence=0.0)
+        np.testing.assert_array_equal(loc, 0.0)
+        np.testing.assert_allclose(quat, np.broadcast_to([1.0, 0.0, 0.0, 0.0], quat.shape))
+
+    def test_shake_loops(self):
+        loop = self.shake.length * (24.0 / self.shake.fps)
+        loc_a, quat_a = shake_eval.evaluate_shake(self.shake, self.frames)
+        loc_b, quat_b = shake_eval.evaluate_shake(self.shake, self.frames + loop)
+        np.testing.assert_allclose(loc_a, loc_b, atol=1e-5)
+        np.testing.assert_allclose(quat_a, quat_b, atol=1e-5)
+
+    def test_manual_timing_is_constant(self):
+        loc, quat = shake_eval.evaluate_shake(self.shake, self.frames, use_manual_timing=True, time=12.0)
+        np.testing.assert_array_equal(loc, np.broadcast_to(loc[0], loc.shape))
+        np.testing.assert_array_equal(quat, np.broadcast_to(quat[0], quat.shape))
+
+    def test_location_scales_with_scale_and_unit_scale(self):
+        loc, _ = shake_eval.evaluate_shake(self.shake, self.frames)
+        scaled, _ = shake_eval.evaluate_shake(self.shake, self.frames, scale=2.0, unit_scale=0.5)
+        np.testing.assert_allclose(scaled, loc * 4.0, atol=1e-9)
+
+    def test_combine_applies_rotations_in_order(self):
+        a = shake_eval.evaluate_shake(self.shake, self.frames)
+        b = shake_eval.evaluate_shake(self.shake, self.frames, offset=33.0, influence=2.0)
+        loc, quat = shake_eval.combine_shakes([a, b])
+        np.testing.assert_allclose(loc, a[0] + b[0])
+        np.testing.assert_allclose(quat, shake_eval.quat_multiply(a[1], b[1]))
+
+    def test_combine_nothing(self):
+        loc, quat = shake_eval.combine_shakes([], count=3)
+        np.testing.assert_array_equal(loc, np.zeros((3, 3)))
+        np.testing.assert_array_equal(quat, [[1.0, 0.0, 0.0, 0.0]] * 3)
+        with self.assertRaises(ValueError):
+            shake_eval.combine_shakes([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+# Unit tests of `shake_stats`.  These don't need Blender:
+#
+#     python3 -m pytest tests/test_shake_stats.py
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dev"))
+from addon_modules import import_module
+
+shake_stats = import_module("shake_stats")
+shake_data = import_module("shake_data")
+
+
+class ShakeStatsTest(unittest.TestCase):
+    # The stats file must be rebuilt (with `dev/build_shake_stats.py`) whenever
+    # the built-in shakes change.
+    def test_stats_file_is_up_to_date(self):
+        stats_file = shake_stats.read_stats()
+        shakes = shake_data.ShakeList()
+        self.assertEqual(sorted(stats_file["shakes"]), sorted(shakes))
+        stats = {}
+        for id in shakes:
+            with self.subTest(shake=id):
+                stats[id] = shake_stats.compute_shake_stats(shakes[id])
+                self.assertEqual(stats[id], stats_file["shakes"][id])
+        self.assertEqual(shake_stats.reference_intensity(stats.values()), stats_file["reference_intensity"])
+
+    def test_normalization(self):
+        reference = shake_stats.read_stats()["reference_intensity"]
+        self.assertEqual(shake_stats.normalization({"intensity": reference}), 1.0)
+        self.assertEqual(shake_stats.normalization({"intensity": reference * 2.0}), 0.5)
+        self.assertEqual(shake_stats.normalization({"intensity": reference * 1000.0}), 1.0 / shake_stats.MAX_NORMALIZATION)
+        self.assertEqual(shake_stats.normalization({"intensity": reference / 1000.0}), shake_stats.MAX_NORMALIZATION)
+        self.assertEqual(shake_stats.normalization({"intensity": 0.0}), 1.0)
+
+    def test_computed_on_demand(self):
+        shake = shake_data.SHAKE_LIST['INVESTIGATION']
+        stats = shake_stats.shake_stats('NOT_PRECOMPUTED', lambda: shake)
+        self.addCleanup(shake_stats.clear_computed_stats)
+        self.assertEqual(stats, shake_stats.compute_shake_stats(shake))
+        self.assertIsInstance(shake_stats.describe(stats), str)
+
+
+if __name__ == "__main__":
+    unittest.main()
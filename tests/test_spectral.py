@@ -0,0 +1,67 @@
+# Unit tests of `spectral`.  These don't need Blender:
+#
+#     python3 -m pytest tests/test_spectral.py
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dev"))
+from addon_modules import import_module
+
+spectral = import_module("spectral")
+shake_eval = import_module("shake_eval")
+
+
+class SpectralTest(unittest.TestCase):
+    def setUp(self):
+        self.spectrum = spectral.spectra()['INVESTIGATION']
+        self.frames = np.arange(0.0, 500.0, 0.5)
+
+    def test_every_spectrum_synthesizes(self):
+        for id, spectrum in spectral.spectra().items():
+            with self.subTest(shake=id):
+                loc, rot = spectral.ProceduralShake(spectrum, 0).evaluate_channels(self.frames)
+                self.assertTrue(np.all(np.isfinite(loc)))
+                self.assertTrue(np.all(np.isfinite(rot)))
+
+    def test_deterministic(self):
+        a = spectral.ProceduralShake(self.spectrum, 7).evaluate_channels(self.frames)
+        b = spectral.ProceduralShake(self.spectrum, 7).evaluate_channels(self.frames)
+        np.testing.assert_array_equal(a[0], b[0])
+        np.testing.assert_array_equal(a[1], b[1])
+
+    def test_seed_changes_shake(self):
+        a = spectral.ProceduralShake(self.spectrum, 7).evaluate_channels(self.frames)
+        b = spectral.ProceduralShake(self.spectrum, 8).evaluate_channels(self.frames)
+        self.assertGreater(np.abs(a[1] - b[1]).max(), 1e-4)
+
+    def test_periodic(self):
+        shake = spectral.ProceduralShake(self.spectrum, 3)
+        a = shake.evaluate_channels(self.frames)
+        b = shake.evaluate_channels(self.frames + spectral.PERIOD)
+        np.testing.assert_allclose(a[0], b[0], atol=1e-9)
+        np.testing.assert_allclose(a[1], b[1], atol=1e-9)
+
+    def test_band_rms(self):
+        shake = spectral.ProceduralShake(self.spectrum, 5)
+        frames = np.arange(spectral.PERIOD, dtype=np.float64)
+        for c, channel in enumerate(self.spectrum.channels):
+            with self.subTest(channel=channel):
+                mean, components = shake.channels[channel]
+                values = spectral.evaluate_channel(mean, components, frames)
+                expected_rms = np.sqrt(sum(band[c] ** 2 for band in self.spectrum.band_rms))
+                self.assertAlmostEqual(values.mean(), self.spectrum.means[c], delta=1e-6 + expected_rms * 1e-3)
+                self.assertAlmostEqual(values.std(), expected_rms, delta=expected_rms * 0.05 + 1e-9)
+
+    def test_evaluates_like_a_captured_shake(self):
+        shake = spectral.ProceduralShake(self.spectrum, 0)
+        loc, quat = shake_eval.evaluate_shake(shake, self.frames, influence=0.5)
+        self.assertEqual(loc.shape, (len(self.frames), 3))
+        self.assertEqual(quat.shape, (len(self.frames), 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# Unit tests of the `track_export` writers.  These don't need Blender:
+#
+#     python3 -m pytest tests/test_track_export.py
+
+import math
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dev"))
+from addon_modules import import_module
+
+track_export = import_module("track_export")
+
+
+class TrackWriterTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = temp_dir.name
+        self.samples = np.array([
+            [1.0, 0.125, -0.5, 0.0, math.pi / 2.0, 0.0, -math.pi],
+            [1.5, 1e-7, 2.0, 3.0, 0.0, math.radians(1.5), 0.0],
+        ])
+
+    def write(self, format, chunks=1):
+        path = os.path.join(self.dir, "track" + track_export.FORMATS[format])
+        writer = track_export._open_writer(path, format)
+        for chunk in np.array_split(self.samples, chunks):
+            writer.write(chunk)
+        writer.close()
+        return path
+
+    def test_csv(self):
+        with open(self.write('CSV')) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], ",".join(track_export.COLUMNS))
+        self.assertEqual(lines[1], "1,0.125,-0.5,0,90,0,-180")
+        np.testing.assert_allclose([float(v) for v in lines[2].split(",")], [1.5, 1e-7, 2.0, 3.0, 0.0, 1.5, 0.0])
+
+    def test_chan(self):
+        with open(self.write('CHAN', chunks=2)) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0], "1 0.125 -0.5 0 90 0 -180")
+
+    def test_float32(self):
+        path = self.write('FLOAT32', chunks=2)
+        values = np.fromfile(path, dtype="<f4").reshape(-1, len(track_export.COLUMNS))
+        np.testing.assert_array_equal(values, self.samples.astype(np.float32))
+
+    def test_writers_leave_samples_alone(self):
+        samples = self.samples.copy()
+        self.write('CSV')
+        np.testing.assert_array_equal(self.samples, samples)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            track_export._open_writer(os.path.join(self.dir, "track.txt"), 'TXT')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Exporting of cameras' evaluated shake offsets, for use in compositing and
+# other applications.
+#
+# Only the combined offset of a camera's shakes is exported, separate from the
+# camera's own animation: the location offset (as returned by
+# `shake_eval.evaluate_shake()`) and the rotation applied after the camera's
+# own rotation, as XYZ euler angles.  The offsets are computed with `shake_eval`, the same way as for
+# baking, so the timeline is never stepped through.
+#
+# Formats:
+#
+# - CSV: a header row, then "frame,tx,ty,tz,rx,ry,rz" with rotations in
+#   degrees.  This can be imported again as a capture.
+# - CHAN: Nuke `.chan` files, "frame tx ty tz rx ry rz" with rotations in
+#   degrees.
+# - FLOAT32: a flat, headerless array of little-endian float32 values, 7 per
+#   sample (frame, tx, ty, tz, rx, ry, rz), with rotations in radians, that can
+#   be memory-mapped directly (e.g. `numpy.memmap(path, "<f4").reshape(-1, 7)`).
+#   A JSON file describing the layout is written next to it.
+#
+# Samples are evaluated and written in fixed-size chunks, so memory use is the
+# same however long the frame range is.
+
+import json
+
+import numpy as np
+
+from . import shake_eval
+
+FORMATS = {
+    'CSV': ".csv",
+    'CHAN': ".chan",
+    'FLOAT32': ".f32",
+}
+
+COLUMNS = ["frame", "tx", "ty", "tz", "rx", "ry", "rz"]
+
+# How many samples are evaluated and written at a time.
+CHUNK_SIZE = 4096
+
+
+class _TextTrackWriter:
+    def __init__(self, path, separator, header):
+        self.f = open(path, "w", newline="")
+        self.separator = separator
+        if header:
+            self.f.write(separator.join(COLUMNS) + "\n")
+
+    def write(self, samples):
+        samples = samples.copy()
+        samples[:, 4:7] = np.degrees(samples[:, 4:7])
+        lines = [
+            self.separator.join("{:.9g}".format(value) for value in row)
+            for row in samples.tolist()
+        ]
+        self.f.write("\n".join(lines) + "\n")
+
+    def close(self):
+        self.f.close()
+
+
+class _Float32TrackWriter:
+    def __init__(self, path):
+        self.f = open(path, "wb")
+
+    def write(self, samples):
+        self.f.write(samples.astype("<f4").tobytes())
+
+    def close(self):
+        self.f.close()
+
+
+def _open_writer(path, format):
+    if format == 'CSV':
+        return _TextTrackWriter(path, ",", header=True)
+    if format == 'CHAN':
+        return _TextTrackWriter(path, " ", header=False)
+    if format == 'FLOAT32':
+        return _Float32TrackWriter(path)
+    raise ValueError("Unknown track export format '{}'".format(format))
+
+
+# Writes the evaluated shake offsets of `camera` in `scene` to `path`, for the
+# frames from `frame_start` to `frame_end` (inclusive), with
+# `samples_per_frame` evenly spaced samples per frame.
+#
+# `prepared` is as for `bake.evaluate_camera_shakes()`.
+#
+# Returns the number of samples written.
+def export_shake_track(camera, scene, path, format, frame_start, frame_end, samples_per_frame=1, prepared=None):
+    # Imported here rather than at the top, since `bake` needs bpy, and the
+    # track writers don't.
+    from .bake import evaluate_camera_shakes
+
+    if prepared is None:
+        prepared = {}
+    count = (frame_end - frame_start) * samples_per_frame + 1
+    writer = _open_writer(path, format)
+    try:
+        for chunk_start in range(0, count, CHUNK_SIZE):
+            indices = np.arange(chunk_start, min(chunk_start + CHUNK_SIZE, count), dtype=np.float64)
+            frames = frame_start + indices / samples_per_frame
+            loc, quat = evaluate_camera_shakes(camera, scene, frames, prepared)
+            euler = shake_eval.quat_to_euler(quat, 'XYZ')
+            writer.write(np.concatenate([frames[:, None], loc, euler], axis=-1))
+    finally:
+        writer.close()
+
+    if format == 'FLOAT32':
+        with open(path + ".json", "w") as f:
+            json.dump({
+                "camera": camera.name,
+                "columns": COLUMNS,
+                "dtype": "<f4",
+                "samples": count,
+                "frame_start": frame_start,
+                "frame_end": frame_end,
+                "samples_per_frame": samples_per_frame,
+                "fps": scene.render.fps / scene.render.fps_base,
+                "rotation_units": "radians",
+            }, f, indent=2)
+            f.write("\n")
+
+    return count
@@ -0,0 +1,223 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Driver-free evaluation of camera shakes.
+#
+# Instead of a rig of drivers and constraints, a camera's combined shake offset
+# is computed with `shake_eval` (the same way as for baking) and written to the
+# camera's delta transforms whenever the frame changes.  So nothing of the
+# shakes is in the depsgraph at all.
+#
+# Offsets are cached per camera, indexed by frame (sub-frames, e.g. for motion
+# blur, get their own entries).  Whole blocks of frames are evaluated at once
+# when a frame isn't in the cache yet, so playing or scrubbing over a shot
+# mostly costs a cache lookup.  A camera's cache is only thrown away when
+# something the offsets depend on changes: the shake parameters (including
+# their animation), the scene frame rate, or the unit scale.  That's only
+# checked when the camera or the scene settings were updated (see
+# `refresh_camera_cache()`), not on every frame change.
+#
+# The camera's own delta transforms, from before the shakes took them over,
+# are kept in an ID property on the camera, and the shake is applied on top of
+# them.  The shake rotation is applied after the camera's own rotation, as
+# with the shake rigs.  Since Blender applies the delta rotation *before* the
+# rotation, that means the delta rotation is the shake rotation conjugated by
+# the camera's rotation at that frame.
+#
+# The delta location is added to the location as is, whereas the shake rigs
+# rotate the shake's location offset by the camera's rotation if it has no
+# parent (see `shake_eval.evaluate_shake()`), so that's done here as well.
+#
+# Blender also applies the delta transforms before the camera's constraints,
+# whereas the shake rigs apply the shake after them.  On a camera with other
+# constraints (e.g. Track To or Child Of), those would change or cancel out
+# the shake, so such cameras fall back to the per-camera rig layout (see
+# `camera_rig_layout()` in `__init__.py`).
+
+import numpy as np
+
+from .action_utils import find_id_fcurve
+from .bake import ANIMATABLE_SHAKE_PROPERTIES, EULER_ROTATION_MODES, shake_key, shake_normalization, evaluate_camera_shakes, object_base_transform
+from . import shake_eval
+
+# The camera's own delta transforms.  The leading underscore keeps the
+# property out of the camera's Custom Properties panel.
+BASE_DELTA_PROP = "_camera_shakify_base_delta"
+
+# Cache entries are keyed by frame, rounded to this many steps per frame.
+SUBFRAME_STEPS = 10000
+
+# How many whole frames are evaluated at once on a cache miss.
+BLOCK_SIZE = 256
+
+
+class _CameraCache:
+    __slots__ = ("signature", "entries")
+
+    def __init__(self, signature):
+        self.signature = signature
+        self.entries = {} # Frame key -> (location, rotation quaternion).
+
+
+# Camera `session_uid` -> _CameraCache.
+_caches = {}
+
+# Prepared shakes, shared by all cameras.  See `bake.evaluate_camera_shakes()`.
+_prepared = {}
+
+
+def clear_transform_caches():
+    _caches.clear()
+    _prepared.clear()
+
+
+def _fcurve_signature(fcurve):
+    points = fcurve.keyframe_points
+    co = np.empty(len(points) * 2, dtype=np.float32)
+    left = np.empty(len(points) * 2, dtype=np.float32)
+    right = np.empty(len(points) * 2, dtype=np.float32)
+    points.foreach_get("co", co)
+    points.foreach_get("handle_left", left)
+    points.foreach_get("handle_right", right)
+    interpolation = np.empty(len(points), dtype=np.int32)
+    points.foreach_get("interpolation", interpolation)
+    return hash((co.tobytes(), left.tobytes(), right.tobytes(), interpolation.tobytes(), len(fcurve.modifiers), fcurve.extrapolation))
+
+
+# Everything a camera's shake offsets depend on.
+def shake_signature(camera, scene):
+    signature = [scene.render.fps / scene.render.fps_base, scene.unit_settings.scale_length]
+    for i, shake in enumerate(camera.camera_shakes):
+        signature += [shake_key(shake), shake_normalization(shake), shake.influence, shake.scale, shake.use_manual_timing, shake.time, shake.speed, shake.offset]
+        for name in ANIMATABLE_SHAKE_PROPERTIES:
+            fcurve = find_id_fcurve(camera, "camera_shakes[{}].{}".format(i, name))
+            if fcurve is not None:
+                signature += [name, _fcurve_signature(fcurve)]
+    return tuple(signature)
+
+
+def frame_key(frame):
+    return int(round(frame * SUBFRAME_STEPS))
+
+
+# Throws a camera's cached offsets away if anything they depend on changed
+# since they were cached.  Call this when the camera or its scene's settings
+# were updated.
+def refresh_camera_cache(camera, scene):
+    cache = _caches.get(camera.session_uid)
+    if cache is not None and cache.signature != shake_signature(camera, scene):
+        del _caches[camera.session_uid]
+
+
+# Returns the combined shake offset of a camera at the given (sub-)frame, as
+# (location, rotation quaternion), from the cache if possible.
+def camera_shake_offset(camera, scene, frame):
+    cache = _caches.get(camera.session_uid)
+    if cache is None:
+        cache = _CameraCache(shake_signature(camera, scene))
+        _caches[camera.session_uid] = cache
+
+    key = frame_key(frame)
+    entry = cache.entries.get(key)
+    if entry is not None:
+        return entry
+
+    if key % SUBFRAME_STEPS == 0:
+        # Fill in the whole block of frames around this one.
+        start = (key // SUBFRAME_STEPS) // BLOCK_SIZE * BLOCK_SIZE
+        frames = np.arange(start, start + BLOCK_SIZE, dtype=np.float64)
+    else:
+        frames = np.array([key / SUBFRAME_STEPS])
+    loc, quat = evaluate_camera_shakes(camera, scene, frames, _prepared)
+    for frame, frame_loc, frame_quat in zip(frames, loc, quat):
+        cache.entries[frame_key(frame)] = (frame_loc, frame_quat)
+    return cache.entries[key]
+
+
+# Takes over the camera's delta transforms for its shakes, remembering their
+# current values.
+def store_base_delta(camera):
+    if BASE_DELTA_PROP in camera:
+        return
+    camera[BASE_DELTA_PROP] = {
+        "location": tuple(camera.delta_location),
+        "rotation_euler": tuple(camera.delta_rotation_euler),
+        "rotation_quaternion": tuple(camera.delta_rotation_quaternion),
+    }
+
+
+# Sets the camera's delta transforms back to its own, without its shake, while
+# its shakes keep them taken over.  E.g. so that files are saved without the
+# shake offset of whatever frame was current.
+def reset_base_delta(camera):
+    base = camera.get(BASE_DELTA_PROP)
+    if base is None:
+        return
+    _set_if_changed(camera, "delta_location", base["location"])
+    _set_if_changed(camera, "delta_rotation_euler", base["rotation_euler"])
+    _set_if_changed(camera, "delta_rotation_quaternion", base["rotation_quaternion"])
+
+
+# Gives the camera its own delta transforms back, if its shakes took them over.
+def restore_base_delta(camera):
+    if BASE_DELTA_PROP not in camera:
+        return
+    reset_base_delta(camera)
+    del camera[BASE_DELTA_PROP]
+    _caches.pop(camera.session_uid, None)
+
+
+def _set_if_changed(owner, prop, value):
+    value = np.asarray(value, dtype=np.float32)
+    if not np.array_equal(np.asarray(getattr(owner, prop), dtype=np.float32), value):
+        setattr(owner, prop, value.tolist())
+
+
+# Applies the camera's shake offset at the given (sub-)frame to its delta
+# transforms.  Properties are only written when they change, so that this
+# doesn't trigger needless depsgraph updates.
+def apply_camera_shake(camera, scene, frame):
+    base = camera.get(BASE_DELTA_PROP)
+    if base is None:
+        return
+    mode = camera.rotation_mode
+    if mode not in EULER_ROTATION_MODES and mode != 'QUATERNION':
+        # There's no delta rotation for axis-angle rotations.
+        return
+
+    shake_loc, shake_quat = camera_shake_offset(camera, scene, frame)
+    _, rotation, _ = object_base_transform(camera, np.array([frame]))
+    rotation = rotation[0]
+    if mode in EULER_ROTATION_MODES:
+        base_rotation = shake_eval.euler_to_quat(np.array(base["rotation_euler"]), mode)
+    else:
+        base_rotation = np.array(base["rotation_quaternion"])
+        base_rotation = base_rotation / np.linalg.norm(base_rotation)
+    delta_rotation = shake_eval.quat_multiply(
+        base_rotation,
+        shake_eval.quat_multiply(shake_eval.quat_multiply(rotation, shake_quat), shake_eval.quat_conjugate(rotation)),
+    )
+
+    if camera.parent is None:
+        shake_loc = shake_eval.quat_to_matrix(shake_eval.quat_multiply(base_rotation, rotation)) @ shake_loc
+    _set_if_changed(camera, "delta_location", np.array(base["location"]) + shake_loc)
+    if mode in EULER_ROTATION_MODES:
+        euler = shake_eval.quat_to_euler(delta_rotation, mode, compat=np.array(base["rotation_euler"]))
+        _set_if_changed(camera, "delta_rotation_euler", euler)
+    else:
+        _set_if_changed(camera, "delta_rotation_quaternion", delta_rotation)